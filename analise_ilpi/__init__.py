@@ -1,6 +1,102 @@
-from .core import (
-    gerar_grafico_binario,
-    processar_multiplas_colunas,
-    extrair_profissionais,
-    gerar_barh
-)
+"""
+Pacote analise_ilpi.
+
+Os submódulos são importados sob demanda: `import analise_ilpi` não carrega pandas,
+matplotlib nem outras dependências, e não altera opções globais. Cada nome abaixo é
+importado do seu submódulo no primeiro acesso (ex: `analise_ilpi.plot_barh`).
+"""
+import importlib
+
+# nome exportado -> submódulo
+_EXPORTACOES = {
+    'gerar_grafico_binario': 'core',
+    'processar_multiplas_colunas': 'core',
+    'extrair_profissionais': 'core',
+    'gerar_barh': 'core',
+    'normalizar_nome': 'vinculacao',
+    'preparar_registros': 'vinculacao',
+    'vincular_registros': 'vinculacao',
+    'atribuir_id_residente': 'vinculacao',
+    'Consulta': 'consulta',
+    'ExecutorConsultas': 'consulta',
+    'ler_fonte': 'consulta',
+    'frequencia': 'agregacao',
+    'gravar_particionado': 'particoes',
+    'listar_particoes': 'particoes',
+    'ler_particionado': 'particoes',
+    'classificar_risco': 'fragilidade',
+    'nivel_risco_por_residente': 'fragilidade',
+    'pseudonimizar_cpf': 'longitudinal',
+    'HistoricoResidentes': 'longitudinal',
+    'separar_unidades': 'geoespacial',
+    'carregar_referencia': 'geoespacial',
+    'geocodificar_unidades': 'geoespacial',
+    'IndiceEspacial': 'geoespacial',
+    'unidade_mais_proxima': 'geoespacial',
+    'tabela_equipe': 'equipe',
+    'verificar_razoes': 'equipe',
+    'minimo_cuidador_por_ilpi': 'equipe',
+    'RegistroFamilias': 'familias',
+    'criar_df_com_soma_por_prefixo': 'familias',
+    'plot_barh': 'graficos',
+    'plot_percentual_por_ilpi': 'graficos',
+    'plot_bar_flex_auto': 'graficos',
+    'plot_bar_flex_unificado': 'graficos',
+    'plot_barh_contagens': 'graficos',
+    'plot_dias_por_profissao': 'graficos',
+    'plot_idade_com_media': 'graficos',
+    'plot_idade_por_ilpi': 'graficos',
+    'salvar_tabela_como_imagem': 'tabelas',
+    'RenderizadorLote': 'renderizacao',
+    'RelatorioPDF': 'relatorio_pdf',
+    'relatorios_por_ilpi': 'relatorio_pdf',
+    'Painel': 'dashboard',
+    'processa_uma_variavel': 'perfil',
+    'processa_binario': 'perfil',
+    'processa_uma_variavel_com_opcoes': 'perfil',
+    'processa_multiresposta': 'perfil',
+    'extrair_morbidades': 'perfil',
+    'extrair_medicamentos': 'perfil',
+    'Tarefa': 'tarefas',
+    'GrafoTarefas': 'tarefas',
+    'grafo_perfil': 'relatorio_perfil',
+    'grafo_monitoramento': 'relatorio_monitoramento',
+    'etl_df_redcap': 'etl',
+    'preparar_base_perfil': 'etl',
+    'ingerir': 'etl',
+    'Perfil': 'instrumentacao',
+    'etapa': 'instrumentacao',
+    'esparsificar': 'esparso',
+    'densificar': 'esparso',
+    'matriz_indicadores': 'esparso',
+    'contagem_por_grupo': 'esparso',
+    'coocorrencia': 'esparso',
+    'SaidaAssincrona': 'saida_assincrona',
+    'ErroGravacao': 'saida_assincrona',
+    'ArmazemResultados': 'resultados',
+    'memoizar': 'memoizacao',
+    'ativar_memoizacao': 'memoizacao',
+    'limpar_memoizacao': 'memoizacao',
+    'atualizar_hash': 'hashing',
+    'exportacao_perfil': 'sintetico',
+    'blocos_perfil': 'sintetico',
+    'gravar_perfil': 'sintetico',
+    'exportacao_monitoramento': 'sintetico',
+    'gravar_monitoramento': 'sintetico',
+    'residentes_para_linhas': 'sintetico',
+}
+
+__all__ = list(_EXPORTACOES)
+
+
+def __getattr__(nome):
+    modulo = _EXPORTACOES.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module 'analise_ilpi' has no attribute '{nome}'")
+    valor = getattr(importlib.import_module(f'.{modulo}', __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,62 @@
+from .consulta import ler_fonte
+
+# ------------------------------
+# Frequências e proporções (tabelas 'total' / 'proporcao' dos relatórios)
+# ------------------------------
+
+BACKENDS = ('pandas', 'duckdb')
+
+
+def frequencia(fonte, coluna, por=None, mapa=None, sep=',', backend='pandas', casas_decimais=2):
+    """
+    Conta os residentes por categoria e calcula a proporção, no formato usado nas
+    tabelas dos relatórios (colunas 'total' e 'proporcao').
+
+    Sem `por`, a proporção é sobre o total geral (ex: df_raca_grouped).
+    Com `por` (ex: 'institution_name'), a proporção é dentro de cada grupo (ex: df_raca_inst).
+
+    Parâmetros:
+    - fonte: DataFrame ou caminho de CSV/Parquet.
+    - coluna: coluna categórica a contar (ex: 'race').
+    - por: coluna de agrupamento (opcional).
+    - mapa: dict código -> texto aplicado à coluna no resultado (opcional).
+    - sep: separador do CSV.
+    - backend: 'pandas' (em memória) ou 'duckdb' (SQL embarcado, paralelo e fora da memória).
+    - casas_decimais: arredondamento da proporção.
+
+    Retorna:
+    - DataFrame com [por], coluna, 'total' e 'proporcao'.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend '{backend}' não suportado. Use um de: {BACKENDS}")
+
+    if backend == 'duckdb':
+        from .backend_duckdb import frequencia_duckdb
+        resultado = frequencia_duckdb(fonte, coluna, por=por, sep=sep, casas_decimais=casas_decimais)
+    else:
+        resultado = _frequencia_pandas(fonte, coluna, por=por, sep=sep, casas_decimais=casas_decimais)
+
+    if mapa:
+        resultado[coluna] = resultado[coluna].replace(mapa)
+    return resultado
+
+
+def _frequencia_pandas(fonte, coluna, por=None, sep=',', casas_decimais=2):
+    chaves = [por, coluna] if por else [coluna]
+    df = ler_fonte(fonte, sep=sep, colunas=chaves, filtros=[(coluna, 'notna', None)])
+
+    resultado = df.groupby(chaves).size().reset_index(name='total')
+    return adicionar_proporcao(resultado, por, casas_decimais)
+
+
+def adicionar_proporcao(resultado, por=None, casas_decimais=2):
+    """
+    Adiciona a coluna 'proporcao' (total / soma do grupo `por`, ou do total geral) a uma tabela
+    de contagens. Usada pelos dois backends, para que arredondem da mesma forma.
+    """
+    if por:
+        soma = resultado.groupby(por)['total'].transform('sum')
+    else:
+        soma = resultado['total'].sum()
+    resultado['proporcao'] = (resultado['total'] / soma).round(casas_decimais)
+    return resultado
@@ -0,0 +1,102 @@
+import os
+
+import pandas as pd
+
+from .agregacao import adicionar_proporcao
+
+# ------------------------------
+# Backend DuckDB para as agregações dos relatórios
+# ------------------------------
+
+
+def _importar_duckdb():
+    try:
+        import duckdb
+    except ImportError as erro:
+        raise ImportError(
+            "O backend 'duckdb' requer o pacote duckdb. Instale com: pip install -e .[duckdb]"
+        ) from erro
+    return duckdb
+
+
+def _citar(nome):
+    """Coloca o identificador entre aspas duplas (nomes de colunas do REDCap)."""
+    return '"' + str(nome).replace('"', '""') + '"'
+
+
+def _relacao(conexao, fonte, sep=','):
+    """
+    Retorna a expressão SQL da tabela de origem.
+    DataFrames são registrados na conexão; arquivos são lidos diretamente pelo DuckDB.
+    """
+    if not isinstance(fonte, str):
+        conexao.register('fonte_df', fonte)
+        return 'fonte_df'
+
+    caminho = fonte.replace("'", "''")
+    if os.path.splitext(fonte)[1].lower() == '.parquet' or os.path.isdir(fonte):
+        padrao = os.path.join(caminho, '**', '*.parquet') if os.path.isdir(fonte) else caminho
+        return f"read_parquet('{padrao}', hive_partitioning = true)"
+    return f"read_csv_auto('{caminho}', delim = '{sep}', header = true)"
+
+
+def conectar(threads=None, limite_memoria=None):
+    """
+    Abre uma conexão DuckDB em memória.
+
+    Parâmetros:
+    - threads: número de threads (None = todos os núcleos).
+    - limite_memoria: ex: '4GB'. Acima do limite o DuckDB usa disco (execução fora da memória).
+    """
+    duckdb = _importar_duckdb()
+    conexao = duckdb.connect(database=':memory:')
+    if threads:
+        conexao.execute(f'SET threads = {int(threads)}')
+    if limite_memoria:
+        conexao.execute(f"SET memory_limit = '{limite_memoria}'")
+    return conexao
+
+
+def frequencia_duckdb(fonte, coluna, por=None, sep=',', casas_decimais=2, conexao=None):
+    """
+    Mesma tabela de `agregacao.frequencia`, calculada em SQL no DuckDB.
+
+    Parâmetros:
+    - fonte: DataFrame ou caminho de CSV/Parquet (ou pasta com Parquet particionado).
+    - coluna: coluna categórica a contar.
+    - por: coluna de agrupamento (opcional).
+    - sep: separador do CSV.
+    - casas_decimais: arredondamento da proporção.
+    - conexao: conexão existente (opcional; reaproveita configurações de threads/memória).
+
+    Retorna:
+    - pd.DataFrame com [por], coluna, 'total' e 'proporcao', com os mesmos tipos e valores do
+      backend pandas: o DuckDB só conta; chaves ausentes são descartadas e a proporção é
+      arredondada depois, no pandas (arredondamento do NumPy, metade para o par).
+    """
+    propria = conexao is None
+    conexao = conexao or conectar()
+
+    chaves = [por, coluna] if por else [coluna]
+    colunas = ', '.join(_citar(c) for c in chaves)
+
+    # Sem WHERE: os grupos com chave NULL fazem a coluna inteira vir como float64 (NaN),
+    # como no pandas quando a coluna lida tem valores ausentes
+    sql = f"""
+        SELECT {colunas}, COUNT(*) AS total
+        FROM {_relacao(conexao, fonte, sep)}
+        GROUP BY {colunas}
+        ORDER BY {colunas}
+    """
+    try:
+        resultado = conexao.execute(sql).df()
+    finally:
+        if propria:
+            conexao.close()
+
+    resultado = resultado.dropna(subset=chaves).reset_index(drop=True)
+    if isinstance(fonte, pd.DataFrame):
+        resultado = resultado.astype({c: fonte[c].dtype for c in chaves})
+    else:
+        resultado = resultado.infer_objects()
+    return adicionar_proporcao(resultado, por, casas_decimais)
@@ -0,0 +1,193 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+
+import matplotlib
+
+from .hashing import atualizar_hash
+from .saida_assincrona import saida_ativa
+
+# ------------------------------
+# Cache incremental de figuras: não redesenha PNGs cujas entradas não mudaram
+# ------------------------------
+
+# Pasta (ao lado das figuras) com um arquivo de assinatura por figura
+PASTA_CACHE = '.cache_figuras'
+
+# Defina ANALISE_ILPI_SEM_CACHE=1 para sempre redesenhar
+VARIAVEL_DESATIVAR = 'ANALISE_ILPI_SEM_CACHE'
+
+# Parâmetros que não alteram o arquivo gerado
+_PARAMETROS_IGNORADOS = {'mostrar'}
+
+
+def _assinatura_estilo():
+    """Versão do matplotlib + rcParams (estilo, fontes, dpi...), exceto as chaves de backend."""
+    parametros = sorted(
+        (chave, repr(valor)) for chave, valor in matplotlib.rcParams.items()
+        if not chave.startswith('backend') and chave != 'interactive'
+    )
+    return repr((matplotlib.__version__, parametros))
+
+
+def assinatura_figura(funcao, argumentos):
+    """
+    Hash SHA-256 das entradas de uma figura: função (nome e código), parâmetros
+    (incluindo o conteúdo dos DataFrames) e versão/estilo do matplotlib.
+    """
+    h = hashlib.sha256()
+    original = inspect.unwrap(funcao)
+    h.update(f'{original.__module__}.{original.__qualname__}'.encode())
+    codigo = getattr(original, '__code__', None)
+    if codigo is not None:
+        atualizar_hash(h, codigo)
+    atualizar_hash(h, {k: v for k, v in argumentos.items() if k not in _PARAMETROS_IGNORADOS})
+    h.update(_assinatura_estilo().encode())
+    return h.hexdigest()
+
+
+def _caminho_assinatura(caminho):
+    pasta, nome = os.path.split(os.path.abspath(caminho))
+    return os.path.join(pasta, PASTA_CACHE, nome + '.sha256')
+
+
+def _ler_registro(caminho):
+    """Registro (JSON) da última geração de `caminho`, ou None."""
+    try:
+        with open(_caminho_assinatura(caminho), encoding='utf-8') as f:
+            registro = json.load(f)
+    except (OSError, ValueError):
+        # Ausente ou no formato antigo (só o hash): a figura é refeita
+        return None
+    return registro if isinstance(registro, dict) else None
+
+
+def figura_atualizada(caminho, assinatura):
+    """
+    Registro da última geração se ela teve a mesma assinatura e todos os arquivos gerados
+    (ex: todas as páginas de uma tabela) ainda existem; senão None.
+    """
+    registro = _ler_registro(caminho)
+    if registro is None or registro.get('assinatura') != assinatura:
+        return None
+    if not all(os.path.exists(a) for a in registro.get('arquivos') or [caminho]):
+        return None
+    return registro
+
+
+def registrar_figura(caminho, assinatura, arquivos=None, resultado=None):
+    """
+    Grava a assinatura da figura recém-gerada (escrita atômica, segura entre processos), com os
+    arquivos gerados e o que a função retornou, para ser devolvido quando a figura não for refeita.
+    """
+    registro = {'assinatura': assinatura, 'arquivos': list(arquivos or [caminho])}
+    # (matplotlib.axes só está carregado se algum gráfico foi desenhado)
+    eixos = sys.modules.get('matplotlib.axes')
+    if eixos is not None and isinstance(resultado, eixos.Axes):
+        registro['axes'] = True
+    else:
+        try:
+            registro['resultado'] = json.loads(json.dumps(resultado))
+        except (TypeError, ValueError):
+            pass
+    arquivo = _caminho_assinatura(caminho)
+    os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+    temporario = f'{arquivo}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(registro, f)
+    os.replace(temporario, arquivo)
+
+
+def _axes_da_imagem(caminho):
+    """Axes (de uma figura já fechada) com a imagem salva, no lugar do Axes de um gráfico não refeito."""
+    import matplotlib.pyplot as plt
+
+    imagem = plt.imread(caminho)
+    fig = plt.figure(figsize=(imagem.shape[1] / 100, imagem.shape[0] / 100))
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.imshow(imagem)
+    ax.set_axis_off()
+    plt.close(fig)
+    return ax
+
+
+def _arquivos_gerados(caminho, resultado):
+    """Arquivos gerados pela chamada: a lista retornada (ex: páginas de uma tabela) ou o próprio caminho."""
+    if isinstance(resultado, (list, tuple)) and resultado and all(isinstance(a, str) for a in resultado):
+        return list(resultado)
+    return [caminho]
+
+
+def em_cache(parametro_caminho):
+    """
+    Decorador para funções que salvam uma figura em `parametro_caminho`.
+    Se os arquivos gerados existem e as entradas são as mesmas da última execução, a função não é
+    executada (nem o `plt.show()`), os arquivos existentes são mantidos e é devolvido o mesmo
+    retorno da execução que os gerou: valores simples (ex: a lista de páginas de uma tabela) são
+    guardados junto com a assinatura; um Axes é refeito a partir da imagem salva.
+
+    Uma chamada que recebe um Axes (`ax=`) sempre desenha, pois o gráfico vai para a figura de
+    quem chamou. A chamada aceita `usar_cache=False` para forçar o redesenho.
+
+    Exemplo de uso:
+    @em_cache('filename')
+    def plot_barh(data, title, xlabel, ylabel, filename, ...):
+        ...
+    """
+    def decorador(funcao):
+        assinatura_funcao = inspect.signature(funcao)
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, usar_cache=True, **kwargs):
+            if not usar_cache or os.environ.get(VARIAVEL_DESATIVAR):
+                return funcao(*args, **kwargs)
+
+            argumentos = assinatura_funcao.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            caminho = argumentos.arguments[parametro_caminho]
+            if not caminho or argumentos.arguments.get('ax') is not None:
+                return funcao(*args, **kwargs)
+            assinatura = assinatura_figura(funcao, argumentos.arguments)
+            registro = figura_atualizada(caminho, assinatura)
+            if registro is not None:
+                if not registro.get('axes'):
+                    return registro.get('resultado')
+                try:
+                    return _axes_da_imagem(caminho)
+                except (OSError, ValueError, SyntaxError):
+                    pass  # Formato que o matplotlib não lê (ex: SVG, PDF): refaz o gráfico
+
+            resultado = funcao(*args, **kwargs)
+            arquivos = _arquivos_gerados(caminho, resultado)
+
+            def registrar():
+                registrar_figura(caminho, assinatura, arquivos, resultado)
+
+            saida = saida_ativa()
+            pendentes = [a for a in arquivos if saida is not None and saida.pendente(a) is not None]
+            if pendentes:
+                # Gravação assíncrona: a assinatura só é registrada depois que todos os arquivos existirem
+                faltando = [len(pendentes)]
+                trava = threading.Lock()
+
+                def concluido():
+                    with trava:
+                        faltando[0] -= 1
+                        ultimo = faltando[0] == 0
+                    if ultimo:
+                        registrar()
+
+                for arquivo in pendentes:
+                    saida.ao_concluir(arquivo, concluido)
+            elif all(os.path.exists(a) for a in arquivos):
+                registrar()
+            return resultado
+
+        # Propagado pelos decoradores externos (functools.wraps), ex: para o RelatorioPDF forçar o desenho
+        envoltorio.parametro_cache = parametro_caminho
+        return envoltorio
+    return decorador
@@ -0,0 +1,273 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from .instrumentacao import VARIAVEL_PERFIL, Perfil, etapa
+
+# ------------------------------
+# Linha de comando: analise-ilpi ingest|report|bench|synth
+# ------------------------------
+
+# Arquivo de configuração procurado no diretório atual quando --config não é informado
+CONFIG_PADRAO = 'analise_ilpi.toml'
+
+# Chaves aceitas no arquivo de configuração (seção -> chave -> padrão)
+PADROES = {
+    'entrada': {'bruto': None, 'base': None, 'sep': ';'},
+    'saida': {'pasta': 'output', 'resultados': 'parquet'},
+    'execucao': {'workers': 1, 'escritores': 4, 'secoes': None, 'ilpis': None, 'por_ilpi': False},
+}
+
+# Chaves com caminhos (relativos ao diretório do arquivo de configuração)
+CAMINHOS = {('entrada', 'bruto'), ('entrada', 'base'), ('saida', 'pasta')}
+
+
+def ler_config(caminho=None):
+    """
+    Lê a configuração em TOML ou JSON (pela extensão) e completa com os padrões.
+    Caminhos relativos são resolvidos a partir da pasta do arquivo de configuração.
+
+    Exemplo de arquivo (analise_ilpi.toml):
+    [entrada]
+    bruto = "data/SMSAp/PerfilEpidemiolgicos_DATA_2025-06-24_1507.csv"
+    base = "data/SMSAp/base_perfil_epidemiologico.csv"
+
+    [saida]
+    pasta = "output"
+    resultados = "sqlite"
+
+    [execucao]
+    workers = 4
+    """
+    if caminho is None and os.path.exists(CONFIG_PADRAO):
+        caminho = CONFIG_PADRAO
+
+    dados = {}
+    if caminho is not None:
+        if caminho.endswith('.json'):
+            with open(caminho, encoding='utf-8') as f:
+                dados = json.load(f)
+        else:
+            import tomllib
+            with open(caminho, 'rb') as f:
+                dados = tomllib.load(f)
+
+    desconhecidas = [f'{s}.{c}' for s, chaves in dados.items() for c in chaves
+                     if c not in PADROES.get(s, {})]
+    if desconhecidas:
+        raise ValueError(f'Chaves desconhecidas em {caminho}: {desconhecidas}')
+
+    pasta_config = os.path.dirname(os.path.abspath(caminho)) if caminho else os.getcwd()
+    config = {s: {**padroes, **dados.get(s, {})} for s, padroes in PADROES.items()}
+    for secao, chave in CAMINHOS:
+        valor = config[secao][chave]
+        if valor is not None:
+            config[secao][chave] = os.path.join(pasta_config, os.path.expanduser(valor))
+    return config
+
+
+def _aplicar_argumentos(config, args):
+    """Opções da linha de comando têm prioridade sobre o arquivo de configuração."""
+    for secao, chave, valor in [
+        ('entrada', 'bruto', getattr(args, 'bruto', None)),
+        ('entrada', 'base', getattr(args, 'base', None)),
+        ('saida', 'pasta', getattr(args, 'saida', None)),
+        ('saida', 'resultados', getattr(args, 'resultados', None)),
+        ('execucao', 'workers', getattr(args, 'workers', None)),
+        ('execucao', 'escritores', getattr(args, 'escritores', None)),
+        ('execucao', 'secoes', getattr(args, 'secao', None)),
+        ('execucao', 'ilpis', getattr(args, 'ilpi', None)),
+    ]:
+        if valor is not None:
+            config[secao][chave] = os.path.abspath(valor) if (secao, chave) in CAMINHOS else valor
+    if getattr(args, 'por_ilpi', False):
+        config['execucao']['por_ilpi'] = True
+    # 0 usa todos os núcleos
+    config['execucao']['workers'] = config['execucao']['workers'] or None
+    return config
+
+
+def _exigir(config, secao, chave, opcao):
+    valor = config[secao][chave]
+    if valor is None:
+        raise SystemExit(f'Informe {opcao} ou [{secao}] {chave} no arquivo de configuração.')
+    return valor
+
+
+def _backend_nao_interativo():
+    # Antes de qualquer import do pyplot: nenhuma janela é aberta e plt.show() não bloqueia
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+# ----------------------------------------
+
+def comando_ingest(config):
+    """Exportação bruta do REDCap -> base do perfil epidemiológico."""
+    from .etl import ingerir
+
+    bruto = _exigir(config, 'entrada', 'bruto', '--bruto')
+    base = _exigir(config, 'entrada', 'base', '--base')
+    os.makedirs(os.path.dirname(base) or '.', exist_ok=True)
+    df = ingerir(bruto, base, sep=config['entrada']['sep'])
+    print(f'✅ Base gravada em {base} ({len(df)} linhas, {df.shape[1]} colunas)')
+    return 0
+
+
+def comando_report(config, forcar=False):
+    """Executa o grafo de tarefas do perfil epidemiológico."""
+    _backend_nao_interativo()
+    from .relatorio_perfil import grafo_perfil
+
+    execucao = config['execucao']
+    grafo = grafo_perfil(
+        _exigir(config, 'entrada', 'base', '--base'),
+        config['saida']['pasta'],
+        sep=config['entrada']['sep'],
+        secoes=execucao['secoes'],
+        ilpis=execucao['ilpis'],
+        por_ilpi=execucao['por_ilpi'],
+        resultados=None if config['saida']['resultados'] == 'nenhum' else config['saida']['resultados'],
+    )
+    situacao = grafo.executar(workers=execucao['workers'], forcar=forcar, escritores=execucao['escritores'])
+
+    contagem = {}
+    for resultado in situacao.values():
+        contagem[resultado] = contagem.get(resultado, 0) + 1
+    print(', '.join(f'{n} {r}' for r, n in sorted(contagem.items())))
+    for nome, erro in grafo.erros.items():
+        print(f'\n❌ {nome}\n{erro}', file=sys.stderr)
+    return 1 if grafo.erros else 0
+
+
+def comando_bench(config, repeticoes=3):
+    """
+    Mede o tempo de `ingest` (se houver exportação bruta configurada) e de `report` completo
+    (forçando todas as tarefas e sem o cache de figuras), em uma pasta temporária.
+    """
+    from .cache_figuras import VARIAVEL_DESATIVAR
+
+    # A variável é herdada pelos processos do grafo; o valor anterior é restaurado ao final
+    anterior = os.environ.get(VARIAVEL_DESATIVAR)
+    os.environ[VARIAVEL_DESATIVAR] = '1'
+    try:
+        with tempfile.TemporaryDirectory(prefix='analise_ilpi_bench_') as pasta:
+            config = {s: dict(v) for s, v in config.items()}
+            config['saida']['pasta'] = pasta
+            if config['entrada']['bruto'] is not None:
+                config['entrada']['base'] = os.path.join(pasta, 'base.csv')
+                etapas = [('ingest', comando_ingest), ('report', lambda c: comando_report(c, forcar=True))]
+            else:
+                etapas = [('report', lambda c: comando_report(c, forcar=True))]
+
+            tempos = {nome: [] for nome, _ in etapas}
+            for _ in range(repeticoes):
+                for nome, comando in etapas:
+                    inicio = time.perf_counter()
+                    if comando(config):
+                        return 1
+                    tempos[nome].append(time.perf_counter() - inicio)
+    finally:
+        if anterior is None:
+            os.environ.pop(VARIAVEL_DESATIVAR, None)
+        else:
+            os.environ[VARIAVEL_DESATIVAR] = anterior
+
+    print(f"\n{'etapa':<8} {'mínimo (s)':>11} {'mediana (s)':>12}  (workers={config['execucao']['workers']})")
+    for nome, valores in tempos.items():
+        valores = sorted(valores)
+        print(f'{nome:<8} {valores[0]:>11.2f} {valores[len(valores) // 2]:>12.2f}')
+    return 0
+
+
+def comando_synth(caminho, residentes=None, linhas=None, ilpis=5, semente=0, monitoramento=None, workers=1):
+    """Grava exportações sintéticas do REDCap (perfil e, opcionalmente, monitoramento) para testes de carga."""
+    from .sintetico import gravar_monitoramento, gravar_perfil, residentes_para_linhas
+
+    if residentes is None:
+        residentes = residentes_para_linhas(linhas or 1_000)
+    inicio = time.perf_counter()
+    n = gravar_perfil(caminho, residentes, n_ilpis=ilpis, semente=semente, workers=workers)
+    print(f'✅ {caminho}: {n} linhas, {residentes} residentes, {ilpis} ILPIs ({time.perf_counter() - inicio:.1f} s)')
+    if monitoramento:
+        gravar_monitoramento(monitoramento, ilpis, semente=semente)
+        print(f'✅ {monitoramento}: {ilpis} ILPIs')
+    return 0
+
+# ----------------------------------------
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='analise-ilpi',
+        description='Execução em lote (sem interface gráfica) das análises das ILPIs.',
+    )
+    parser.add_argument('--config', help=f'arquivo TOML ou JSON (padrão: ./{CONFIG_PADRAO}, se existir)')
+    parser.add_argument('--perfil', help='pasta onde gravar perfil.json e perfil.folded (tempo, CPU, memória '
+                                         f'e linhas por etapa; padrão: ${VARIAVEL_PERFIL})')
+    parser.add_argument('--perfil-sem-memoria', action='store_true',
+                        help='não mede memória no perfil (o tracemalloc deixa a execução mais lenta)')
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    ingest = comandos.add_parser('ingest', help='gera a base a partir da exportação do REDCap')
+    ingest.add_argument('--bruto', help='CSV exportado do REDCap')
+    ingest.add_argument('--base', help='CSV da base gerada')
+
+    for nome, ajuda in [('report', 'gera tabelas e gráficos do perfil epidemiológico'),
+                        ('bench', 'mede o tempo de ingest e report')]:
+        sub = comandos.add_parser(nome, help=ajuda)
+        sub.add_argument('--base', help='CSV da base')
+        sub.add_argument('--workers', type=int, help='número de processos (0 usa todos os núcleos)')
+        sub.add_argument('--escritores', type=int,
+                         help='threads que gravam figuras e tabelas em segundo plano (padrão: 4; 0 grava na hora)')
+        sub.add_argument('--ilpi', action='append', help='ILPI a incluir (pode repetir)')
+        sub.add_argument('--por-ilpi', action='store_true', help='um relatório por ILPI, em subpastas')
+        sub.add_argument('--secao', action='append', help='seção a gerar (pode repetir)')
+        if nome == 'report':
+            sub.add_argument('--saida', help='pasta de saída (subpastas tables/ e plots/)')
+            sub.add_argument('--forcar', action='store_true', help='refaz todas as tarefas')
+            sub.add_argument('--resultados', choices=['parquet', 'sqlite', 'nenhum'],
+                             help='formato das tabelas calculadas gravadas em <saida>/resultados (padrão: parquet)')
+        else:
+            sub.add_argument('--bruto', help='CSV exportado do REDCap (inclui o ingest na medição)')
+            sub.add_argument('--repeticoes', type=int, default=3)
+
+    synth = comandos.add_parser('synth', help='gera exportações sintéticas do REDCap (testes de carga)')
+    synth.add_argument('arquivo', help='CSV do perfil epidemiológico a gerar')
+    tamanho = synth.add_mutually_exclusive_group()
+    tamanho.add_argument('--residentes', type=int, help='número de residentes')
+    tamanho.add_argument('--linhas', type=int, help='número aproximado de linhas (padrão: 1000)')
+    synth.add_argument('--ilpis', type=int, default=5, help='número de ILPIs')
+    synth.add_argument('--semente', type=int, default=0)
+    synth.add_argument('--monitoramento', help='CSV do monitoramento (UFG) a gerar, uma linha por ILPI')
+    synth.add_argument('--workers', type=int, default=1, help='número de processos (0 usa todos os núcleos)')
+    return parser
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    config = _aplicar_argumentos(ler_config(args.config), args)
+
+    if args.comando == 'ingest':
+        executar = lambda: comando_ingest(config)
+    elif args.comando == 'report':
+        executar = lambda: comando_report(config, forcar=args.forcar)
+    elif args.comando == 'synth':
+        executar = lambda: comando_synth(args.arquivo, args.residentes, args.linhas, args.ilpis, args.semente,
+                                         args.monitoramento, workers=args.workers or None)
+    else:
+        executar = lambda: comando_bench(config, repeticoes=args.repeticoes)
+
+    pasta_perfil = args.perfil or os.environ.get(VARIAVEL_PERFIL)
+    if not pasta_perfil:
+        return executar()
+    with Perfil(memoria=not args.perfil_sem_memoria) as perfil, etapa(args.comando):
+        codigo = executar()
+    caminho_json, caminho_pilhas = perfil.salvar(pasta_perfil)
+    print(f'📊 Perfil gravado em {caminho_json} e {caminho_pilhas}')
+    return codigo
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import os
+
+import pandas as pd
+
+# ------------------------------
+# Consultas preguiçosas (lazy) sobre as bases dos surveys
+# ------------------------------
+
+_OPERADORES = {
+    '==': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '>': lambda s, v: s > v,
+    '>=': lambda s, v: s >= v,
+    '<': lambda s, v: s < v,
+    '<=': lambda s, v: s <= v,
+    'in': lambda s, v: s.isin(v),
+    'not in': lambda s, v: ~s.isin(v),
+    'notna': lambda s, v: s.notna(),
+    'isna': lambda s, v: s.isna(),
+}
+
+# Operadores que o leitor de Parquet (pyarrow) aceita no argumento `filters`
+_OPERADORES_PARQUET = {'==', '!=', '>', '>=', '<', '<=', 'in', 'not in'}
+
+
+def _congelar(valor):
+    """Converte listas/conjuntos em tuplas para o filtro poder ser comparado e usado como chave."""
+    if isinstance(valor, (list, set, frozenset, tuple)):
+        return tuple(sorted(valor, key=str))
+    return valor
+
+
+class Consulta:
+    """
+    Descreve uma consulta (selecionar/filtrar/agrupar) sobre uma fonte de dados sem executá-la.
+    A execução lê apenas as colunas usadas e aplica os filtros já durante a leitura.
+
+    Parâmetros:
+    - fonte: caminho de um CSV/Parquet ou um DataFrame já carregado.
+    - sep: separador do CSV (ex: ';' para a base do perfil epidemiológico).
+
+    Exemplo de uso:
+    raca_por_ilpi = (
+        Consulta('../../../data/SMSAp/base_perfil_epidemiologico.csv', sep=';')
+        .filtrar('race', 'notna')
+        .agrupar('institution_name', 'race')
+    )
+    df_raca_inst = raca_por_ilpi.executar()
+    """
+
+    def __init__(self, fonte, sep=',', passos=()):
+        self.fonte = fonte
+        self.sep = sep
+        self.passos = tuple(passos)
+
+    def _com(self, passo):
+        return Consulta(self.fonte, self.sep, self.passos + (passo,))
+
+    def selecionar(self, *colunas):
+        return self._com(('selecionar', tuple(colunas)))
+
+    def filtrar(self, coluna, operador, valor=None):
+        if operador not in _OPERADORES:
+            raise ValueError(f"Operador '{operador}' não suportado. Use um de: {list(_OPERADORES)}")
+        return self._com(('filtrar', (coluna, operador, _congelar(valor))))
+
+    def agrupar(self, *colunas, nome='total'):
+        """Agrupa pelas colunas e conta as linhas (equivalente a groupby().size())."""
+        return self._com(('agrupar', (tuple(colunas), nome)))
+
+    # --------------------------
+    # Plano
+    # --------------------------
+
+    @property
+    def chave_leitura(self):
+        """Identifica a leitura base; consultas com a mesma chave compartilham a leitura."""
+        fonte = self.fonte if isinstance(self.fonte, str) else id(self.fonte)
+        return (fonte, self.sep)
+
+    def filtros_empurrados(self):
+        """Filtros anteriores a qualquer agrupamento: podem ser aplicados na leitura."""
+        filtros = []
+        for tipo, args in self.passos:
+            if tipo == 'agrupar':
+                break
+            if tipo == 'filtrar':
+                filtros.append(args)
+        return tuple(filtros)
+
+    def colunas_necessarias(self):
+        """
+        Colunas que precisam ser lidas da fonte, ou None se a consulta usa todas
+        (nenhuma seleção nem agrupamento antes do fim).
+        """
+        colunas = []
+        for tipo, args in self.passos:
+            if tipo == 'filtrar':
+                colunas.append(args[0])
+            elif tipo == 'selecionar':
+                return tuple(dict.fromkeys(colunas + list(args)))
+            elif tipo == 'agrupar':
+                return tuple(dict.fromkeys(colunas + list(args[0])))
+        return None
+
+    def plano(self):
+        """Resumo legível do que será lido e do que será executado em memória."""
+        empurrados = self.filtros_empurrados()
+        restantes = list(self.passos)
+        for filtro in empurrados:
+            restantes.remove(('filtrar', filtro))
+        return {
+            'fonte': self.chave_leitura[0],
+            'colunas': self.colunas_necessarias(),
+            'filtros_na_leitura': empurrados,
+            'passos_em_memoria': restantes,
+        }
+
+    # --------------------------
+    # Execução
+    # --------------------------
+
+    def _aplicar_passos(self, df, ignorar_filtros=()):
+        ignorar = list(ignorar_filtros)
+        for tipo, args in self.passos:
+            if tipo == 'filtrar':
+                if args in ignorar:
+                    ignorar.remove(args)
+                    continue
+                coluna, operador, valor = args
+                df = df[_OPERADORES[operador](df[coluna], valor)]
+            elif tipo == 'selecionar':
+                df = df[list(args)]
+            elif tipo == 'agrupar':
+                colunas, nome = args
+                df = df.groupby(list(colunas)).size().reset_index(name=nome)
+        return df
+
+    def executar(self, tamanho_bloco=100_000):
+        return ExecutorConsultas(tamanho_bloco).executar({'resultado': self})['resultado']
+
+
+def _mascara(df, filtros):
+    mascara = pd.Series(True, index=df.index)
+    for coluna, operador, valor in filtros:
+        mascara &= _OPERADORES[operador](df[coluna], valor).fillna(False).astype(bool)
+    return mascara
+
+
+def ler_fonte(fonte, sep=',', colunas=None, filtros=(), tamanho_bloco=100_000):
+    """
+    Lê a fonte aplicando projeção de colunas e filtros na leitura.
+
+    - DataFrame: projeta as colunas antes de filtrar (sem copiar as demais).
+    - Parquet: usa `columns` e `filters` do leitor (exige pyarrow).
+    - CSV: usa `usecols` e lê em blocos, filtrando cada bloco antes de concatenar.
+
+    Parâmetros:
+    - fonte: caminho ou DataFrame.
+    - sep: separador do CSV.
+    - colunas: colunas a ler (None = todas).
+    - filtros: tuplas (coluna, operador, valor).
+    - tamanho_bloco: número de linhas por bloco na leitura do CSV.
+
+    Retorna:
+    - DataFrame filtrado e projetado.
+    """
+    colunas = list(colunas) if colunas is not None else None
+
+    if isinstance(fonte, pd.DataFrame):
+        df = fonte if colunas is None else fonte[colunas]
+        return df[_mascara(df, filtros)] if filtros else df
+
+    if os.path.splitext(fonte)[1].lower() == '.parquet':
+        nativos = [(c, op, list(v) if isinstance(v, tuple) else v)
+                   for c, op, v in filtros if op in _OPERADORES_PARQUET]
+        df = pd.read_parquet(fonte, columns=colunas, filters=nativos or None)
+        restantes = [f for f in filtros if f[1] not in _OPERADORES_PARQUET]
+        return df[_mascara(df, restantes)] if restantes else df
+
+    blocos = []
+    for bloco in pd.read_csv(fonte, sep=sep, usecols=colunas, chunksize=tamanho_bloco):
+        blocos.append(bloco[_mascara(bloco, filtros)] if filtros else bloco)
+    if not blocos:
+        return pd.read_csv(fonte, sep=sep, usecols=colunas, nrows=0)
+    return pd.concat(blocos, ignore_index=True)
+
+
+class ExecutorConsultas:
+    """
+    Executa várias consultas de uma vez, compartilhando subplanos:
+    consultas sobre a mesma fonte fazem uma única leitura (com a união das colunas
+    necessárias e os filtros comuns a todas) e consultas com os mesmos filtros
+    reutilizam o mesmo DataFrame filtrado.
+
+    Exemplo de uso:
+    base = Consulta('../../../data/SMSAp/base_perfil_epidemiologico.csv', sep=';')
+    resultados = ExecutorConsultas().executar({
+        'genero': base.filtrar('sex', 'in', [1, 2]).agrupar('institution_name', 'sex'),
+        'raca': base.filtrar('race', 'notna').agrupar('race'),
+    })
+    """
+
+    def __init__(self, tamanho_bloco=100_000):
+        self.tamanho_bloco = tamanho_bloco
+
+    def executar(self, consultas):
+        resultados = {}
+        por_leitura = {}
+        for nome, consulta in consultas.items():
+            por_leitura.setdefault(consulta.chave_leitura, []).append((nome, consulta))
+
+        for grupo in por_leitura.values():
+            # União das colunas (None se alguma consulta precisa de todas)
+            necessarias = [c.colunas_necessarias() for _, c in grupo]
+            if any(n is None for n in necessarias):
+                colunas = None
+            else:
+                colunas = tuple(dict.fromkeys(col for n in necessarias for col in n))
+
+            # Filtros presentes em todas as consultas do grupo vão para a leitura
+            conjuntos = [set(c.filtros_empurrados()) for _, c in grupo]
+            comuns = tuple(f for f in grupo[0][1].filtros_empurrados() if all(f in s for s in conjuntos))
+
+            primeira = grupo[0][1]
+            base = ler_fonte(primeira.fonte, primeira.sep, colunas, comuns, self.tamanho_bloco)
+
+            # Subplanos compartilhados: mesmo conjunto de filtros -> mesmo DataFrame filtrado
+            filtrados = {}
+            for nome, consulta in grupo:
+                proprios = tuple(f for f in consulta.filtros_empurrados() if f not in comuns)
+                if proprios not in filtrados:
+                    filtrados[proprios] = base[_mascara(base, proprios)] if proprios else base
+                resultados[nome] = consulta._aplicar_passos(
+                    filtrados[proprios], ignorar_filtros=comuns + proprios
+                )
+        return resultados
@@ -1,11 +1,14 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
-import seaborn as sns
 
-pd.set_option('display.max_colwidth', None)
+from .instrumentacao import etapa
+
+# matplotlib é importado dentro das funções de gráfico, apenas quando usadas
 
 def gerar_grafico_binario(df, coluna_original, nome_coluna_final, titulo, nome_arquivo):
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
     df_temp = (
         df[['institution_name', coluna_original]]
         .assign(df_filtered=df[coluna_original].map({1: 'Sim', 2: 'Não'}))
@@ -25,6 +28,7 @@ def gerar_grafico_binario(df, coluna_original, nome_coluna_final, titulo, nome_a
     plt.tight_layout()
     plt.savefig(nome_arquivo)
     plt.show()
+    plt.close()
 
     return df_temp
 
@@ -45,26 +49,42 @@ def processar_multiplas_colunas(df, colunas_opcoes, mapeamento_texto, nova_colun
     )
     return df_resultado
 
+@etapa()
 def extrair_profissionais(df, mapeamento):
-    return pd.concat([
-        df[df[col_prof] >= 1][['institution_name', col_dias]]
-        .assign(profissional=prof)
-        .rename(columns={'institution_name': 'ILPI', col_dias: 'Dias_por_mes'})
-        .assign(Dias_por_mes=lambda x: x['Dias_por_mes'].round(1))
-        [['ILPI', 'profissional', 'Dias_por_mes']]
-        for prof, col_prof, col_dias in mapeamento
-    ]).dropna().sort_values(by=['ILPI', 'profissional']).reset_index(drop=True)
+    profissionais, cols_prof, cols_dias = zip(*mapeamento)
+    n, k = len(df), len(mapeamento)
+    # Uma única reorganização (ILPI x profissional) em vez de um filtro + concat por profissão
+    quantidade = df[list(cols_prof)].to_numpy(dtype=float, na_value=np.nan).ravel()
+    dias = df[list(cols_dias)].to_numpy(dtype=float, na_value=np.nan).ravel()
+    longo = pd.DataFrame({
+        'ILPI': np.repeat(df['institution_name'].to_numpy(), k),
+        'profissional': np.tile(np.asarray(profissionais, dtype=object), n),
+        'Dias_por_mes': dias.round(1)
+    })
+    return longo[quantidade >= 1].dropna().sort_values(by=['ILPI', 'profissional']).reset_index(drop=True)
 
-def gerar_barh(df, coluna, titulo, nome_arquivo, cor=['blue', 'orange']):
-    plt.figure(figsize=(10, 6))
-    df.groupby(coluna).size().plot(kind='barh', color=cor)
-    plt.gca().spines[['top', 'right']].set_visible(False)
-    plt.gca().xaxis.set_major_locator(MaxNLocator(integer=True))
-    plt.title(titulo)
-    plt.xlabel('Número de Instituições')
-    plt.text(0.02, 1.3, '* Uma das instituições é composta por unidades de moradia',
-             color='red', ha='left', va='bottom', wrap=True)
-    plt.ylabel('')
-    plt.tight_layout()
-    plt.savefig(nome_arquivo)
-    plt.show()
+def gerar_barh(df, coluna, titulo, nome_arquivo, cor=['blue', 'orange'], ax=None, mostrar=True):
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
+    criada = ax is None
+    if criada:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    else:
+        fig = ax.figure
+    df.groupby(coluna).size().plot(kind='barh', color=cor, ax=ax)
+    ax.spines[['top', 'right']].set_visible(False)
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.set_title(titulo)
+    ax.set_xlabel('Número de Instituições')
+    ax.text(0.02, 1.3, '* Uma das instituições é composta por unidades de moradia',
+            color='red', ha='left', va='bottom', wrap=True)
+    ax.set_ylabel('')
+    fig.tight_layout()
+    if nome_arquivo:
+        fig.savefig(nome_arquivo)
+    if mostrar:
+        plt.show()
+    if criada:
+        plt.close(fig)
+    return ax
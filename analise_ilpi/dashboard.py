@@ -0,0 +1,211 @@
+import json
+import os
+
+import pandas as pd
+
+from .agregacao import frequencia
+
+# ------------------------------
+# Painel HTML estático (gráficos desenhados no navegador a partir de agregados em JSON)
+# ------------------------------
+
+CORES_PAINEL = ['#4E79A7', '#F28E2B', '#E15759', '#76B7B2', '#59A14F', '#EDC948',
+                '#B07AA1', '#FF9DA7', '#9C755F', '#BAB0AC']
+
+
+class Painel:
+    """
+    Gera um painel HTML único (abre offline) com os gráficos desenhados no navegador.
+    Cada variável é agregada uma única vez (contagens categoria x ILPI) e exportada em JSON
+    compacto; as visões absoluto/percentual e geral/por ILPI são alternadas no próprio HTML,
+    em vez de renderizar um PNG por visão (ex: 06_grafico_suporte_familiar_absoluto,
+    _por_ILPI e _por_ILPI_percent).
+
+    Parâmetros:
+    - titulo: título do painel.
+    - col_ilpi: coluna da ILPI.
+
+    Exemplo de uso:
+    painel = Painel('Perfil epidemiológico das ILPIs')
+    painel.adicionar_variavel(df, 'race', titulo='Raça/cor', mapa=race_dict)
+    painel.adicionar_variavel(df, 'family_support', titulo='Suporte familiar', mapa=family_support_dict)
+    painel.salvar('../output/painel')
+    """
+
+    def __init__(self, titulo, col_ilpi='institution_name'):
+        self.titulo = titulo
+        self.col_ilpi = col_ilpi
+        self.variaveis = []
+
+    def adicionar_tabela(self, identificador, contagens, titulo=None):
+        """
+        Adiciona uma tabela já agregada.
+
+        Parâmetros:
+        - identificador: nome curto da variável (ex: 'raca').
+        - contagens: DataFrame com categorias nas linhas e ILPIs nas colunas (ou Series, sem ILPIs).
+        - titulo: título do gráfico.
+        """
+        if isinstance(contagens, pd.Series):
+            contagens = contagens.to_frame(name='Total')
+        contagens = contagens.fillna(0)
+        self.variaveis.append({
+            'id': identificador,
+            'titulo': titulo or identificador,
+            'categorias': [str(c) for c in contagens.index],
+            'ilpis': [str(c) for c in contagens.columns],
+            # Matriz categorias x ILPIs
+            'contagens': contagens.astype('int64').to_numpy().tolist(),
+        })
+
+    def adicionar_variavel(self, fonte, coluna, titulo=None, mapa=None, backend='pandas', sep=','):
+        """
+        Agrega a coluna por ILPI com `frequencia` (backend 'pandas' ou 'duckdb') e adiciona ao painel.
+        """
+        tabela = frequencia(fonte, coluna, por=self.col_ilpi, mapa=mapa, sep=sep, backend=backend)
+        contagens = tabela.pivot_table(index=coluna, columns=self.col_ilpi, values='total',
+                                       aggfunc='sum', fill_value=0, sort=False)
+        self.adicionar_tabela(coluna, contagens, titulo)
+
+    def dados(self):
+        return {'titulo': self.titulo, 'variaveis': self.variaveis}
+
+    def salvar(self, pasta, nome='painel'):
+        """
+        Grava <nome>.json (agregados) e <nome>.html (painel com os mesmos dados embutidos,
+        para abrir direto do disco, sem servidor).
+
+        Retorna:
+        - caminho do HTML.
+        """
+        os.makedirs(pasta, exist_ok=True)
+        dados = json.dumps(self.dados(), ensure_ascii=False, separators=(',', ':'))
+
+        with open(os.path.join(pasta, f'{nome}.json'), 'w', encoding='utf-8') as f:
+            f.write(dados)
+
+        caminho_html = os.path.join(pasta, f'{nome}.html')
+        with open(caminho_html, 'w', encoding='utf-8') as f:
+            f.write(
+                MODELO_HTML
+                .replace('__TITULO__', _escapar_html(self.titulo))
+                .replace('__CORES__', json.dumps(CORES_PAINEL))
+                .replace('__DADOS__', dados.replace('</', '<\\/'))
+            )
+        return caminho_html
+
+
+def _escapar_html(texto):
+    return str(texto).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+MODELO_HTML = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>__TITULO__</title>
+<style>
+body { font-family: "DejaVu Sans", Arial, sans-serif; margin: 24px; color: #222; }
+h1 { font-size: 20px; }
+.controles { margin: 12px 0 20px; }
+.controles button { margin-right: 6px; padding: 4px 10px; border: 1px solid #40466e; background: white; cursor: pointer; }
+.controles button.ativo { background: #40466e; color: white; }
+.variavel { margin-bottom: 32px; page-break-inside: avoid; }
+.variavel h2 { font-size: 16px; margin-bottom: 8px; }
+.linha { display: flex; align-items: center; margin: 3px 0; font-size: 12px; }
+.rotulo { width: 260px; text-align: right; padding-right: 8px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+.barra { flex: 1; display: flex; height: 18px; background: #f1f1f2; }
+.segmento { height: 100%; color: white; font-size: 10px; line-height: 18px; text-align: center; overflow: hidden; white-space: nowrap; }
+.valor { width: 70px; padding-left: 6px; }
+.legenda span { display: inline-block; margin: 6px 12px 0 0; font-size: 12px; }
+.legenda i { display: inline-block; width: 10px; height: 10px; margin-right: 4px; }
+</style>
+</head>
+<body>
+<h1>__TITULO__</h1>
+<div class="controles">
+  <button data-modo="absoluto" class="ativo">Absoluto</button>
+  <button data-modo="percentual">Percentual</button>
+  &nbsp;
+  <button data-visao="geral" class="ativo">Geral</button>
+  <button data-visao="ilpi">Por ILPI</button>
+</div>
+<div id="graficos"></div>
+<script>
+const DADOS = __DADOS__;
+const CORES = __CORES__;
+const estado = { modo: 'absoluto', visao: 'geral' };
+
+function formatar(valor, total) {
+  if (estado.modo === 'percentual') return total ? (100 * valor / total).toFixed(1) + '%' : '0%';
+  return String(valor);
+}
+
+function elemento(tag, classe, texto) {
+  const e = document.createElement(tag);
+  if (classe) e.className = classe;
+  if (texto !== undefined) e.textContent = texto;
+  return e;
+}
+
+// partes: [valor, cor]; base: denominador da largura; referencia: denominador dos percentuais
+function linha(rotulo, partes, base, referencia, textoValor) {
+  const l = elemento('div', 'linha');
+  l.appendChild(elemento('div', 'rotulo', rotulo)).title = rotulo;
+  const barra = l.appendChild(elemento('div', 'barra'));
+  partes.forEach(([valor, cor]) => {
+    if (!valor || !base) return;
+    const s = barra.appendChild(elemento('div', 'segmento', partes.length > 1 ? formatar(valor, referencia) : ''));
+    s.style.width = (100 * valor / base) + '%';
+    s.style.background = cor;
+  });
+  l.appendChild(elemento('div', 'valor', textoValor));
+  return l;
+}
+
+function soma(valores) { return valores.reduce((a, b) => a + b, 0); }
+
+function desenhar(variavel) {
+  const bloco = elemento('div', 'variavel');
+  bloco.appendChild(elemento('h2', null, variavel.titulo));
+  const cats = variavel.categorias, ilpis = variavel.ilpis, m = variavel.contagens;
+  const percentual = estado.modo === 'percentual';
+  if (estado.visao === 'geral' || ilpis.length < 2) {
+    const totais = m.map(soma), geral = soma(totais), maximo = Math.max(...totais, 0);
+    cats.forEach((c, i) => bloco.appendChild(
+      linha(c, [[totais[i], CORES[i % CORES.length]]], percentual ? geral : maximo, geral, formatar(totais[i], geral))
+    ));
+  } else {
+    const totais = ilpis.map((_, j) => soma(m.map(l => l[j]))), maximo = Math.max(...totais, 0);
+    ilpis.forEach((nome, j) => {
+      const partes = cats.map((_, i) => [m[i][j], CORES[i % CORES.length]]);
+      bloco.appendChild(linha(nome, partes, percentual ? totais[j] : maximo, totais[j], 'n=' + totais[j]));
+    });
+    const legenda = bloco.appendChild(elemento('div', 'legenda'));
+    cats.forEach((c, i) => {
+      const item = legenda.appendChild(elemento('span'));
+      item.appendChild(elemento('i')).style.background = CORES[i % CORES.length];
+      item.appendChild(document.createTextNode(c));
+    });
+  }
+  return bloco;
+}
+
+function atualizar() {
+  const alvo = document.getElementById('graficos');
+  alvo.replaceChildren(...DADOS.variaveis.map(desenhar));
+  document.querySelectorAll('.controles button').forEach(b => {
+    b.classList.toggle('ativo', b.dataset.modo === estado.modo || b.dataset.visao === estado.visao);
+  });
+}
+
+document.querySelectorAll('.controles button').forEach(b => b.addEventListener('click', () => {
+  if (b.dataset.modo) estado.modo = b.dataset.modo;
+  if (b.dataset.visao) estado.visao = b.dataset.visao;
+  atualizar();
+}));
+atualizar();
+</script>
+</body>
+</html>
+"""
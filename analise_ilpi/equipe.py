@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Intensidade de equipe (horas de profissionais por residente)
+# ------------------------------
+
+# (profissional, coluna de quantidade, coluna de horas semanais, coluna de dias por mês)
+MAPEAMENTO_PROFISSIONAIS = [
+    ('Aux.Enfermagem', 'nurse_aux', 'weekly_hours_na', 'days_per_month_na'),
+    ('Téc.Enfermagem', 'nurse_tech', 'weekly_hours_nt', 'days_per_month_nt'),
+    ('Enfermeiro(a)', 'nurse', 'weekly_hours_n', 'days_per_month_n'),
+    ('Fisio', 'physiotherapist', 'weekly_hours_physio', 'days_per_month_physio'),
+    ('Nutricionista', 'nutritionist', 'weekly_hours_nutrit', 'days_per_month_nutrit'),
+    ('Psicologo(a)', 'psicologist', 'weekly_hours_psicol', 'days_per_month_psicol'),
+    ('Médico(a)', 'physician', 'weekly_hours_physician', 'days_per_month_physician'),
+    ('Ter.Ocupacional', 'occup_therapist', 'weekly_hours_occup', 'days_per_month_occup'),
+    ('Cuidador(a)', 'caregiver', 'weekly_hours_caregiver', 'days_per_month_caregiver'),
+    ('Outros_prof_saúde', 'other_health_prof', 'w_h_other_health_prof', 'd_p_month_oth_health_prof'),
+    ('Serv.Gerais', 'housekeeping', 'weekly_hours_housekeep', 'days_per_month_housekeep'),
+    ('Administrativo', 'staff', 'weekly_hours_staff', 'days_per_month_staff')
+]
+
+# Horas semanais mínimas de cada profissional por residente.
+# Cuidadores segundo a RDC ANVISA nº 502/2021 (antiga RDC 283/2005):
+# - Grau I: 1 cuidador para cada 20 idosos, 8 horas/dia  -> 56 h / 20
+# - Grau II: 1 cuidador para cada 10 idosos, por turno   -> 168 h / 10
+# - Grau III: 1 cuidador para cada 6 idosos, por turno   -> 168 h / 6
+HORAS_CUIDADOR_POR_GRAU = {1: 56 / 20, 2: 168 / 10, 3: 168 / 6}
+
+# Sem o grau de dependência dos residentes (a base UFG não o informa), o mínimo de cuidadores
+# usa o Grau I: é um limite inferior, e ILPIs com residentes de Grau II/III podem "atender" sem
+# cumprir a norma. Passe `dependencia` a `verificar_razoes` para usar a composição de cada ILPI.
+RAZOES_REGULATORIAS = {
+    'Cuidador(a)': HORAS_CUIDADOR_POR_GRAU[1],
+}
+
+
+def _matriz_numerica(df, colunas):
+    """Colunas -> matriz float (n_linhas x n_colunas); colunas ausentes viram NaN."""
+    return df.reindex(columns=list(colunas)).apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+
+def tabela_equipe(df, mapeamento=MAPEAMENTO_PROFISSIONAIS, col_ilpi='institution_name',
+                  col_residentes='residents_number'):
+    """
+    Reorganiza todas as triplas quantidade/horas semanais/dias por mês em formato longo
+    em uma única operação (sem filtrar e concatenar profissão por profissão) e calcula
+    as horas de profissionais por residente.
+
+    Parâmetros:
+    - df: base UFG (uma linha por ILPI).
+    - mapeamento: lista de tuplas (profissional, col_quantidade, col_horas_semanais, col_dias_mes).
+    - col_ilpi: coluna da ILPI.
+    - col_residentes: coluna com o número de residentes.
+
+    Retorna:
+    - DataFrame com uma linha por ILPI e profissional presente (quantidade >= 1):
+      'ILPI', 'profissional', 'quantidade', 'horas_semanais', 'Dias_por_mes', 'residentes',
+      'horas_semana_total' e 'horas_por_residente'.
+    """
+    profissionais, cols_qtd, cols_horas, cols_dias = zip(*mapeamento)
+    n, k = len(df), len(mapeamento)
+
+    quantidade = _matriz_numerica(df, cols_qtd).ravel()
+    horas = _matriz_numerica(df, cols_horas).ravel()
+    residentes = np.repeat(pd.to_numeric(df[col_residentes], errors='coerce').to_numpy(dtype=float), k)
+
+    longo = pd.DataFrame({
+        'ILPI': np.repeat(df[col_ilpi].to_numpy(), k),
+        'profissional': np.tile(np.asarray(profissionais, dtype=object), n),
+        'quantidade': quantidade,
+        'horas_semanais': horas,
+        'Dias_por_mes': _matriz_numerica(df, cols_dias).ravel().round(1),
+        'residentes': residentes,
+        'horas_semana_total': quantidade * horas,
+    })
+    longo['horas_por_residente'] = (longo['horas_semana_total'] / longo['residentes']).round(2)
+
+    return (
+        longo[longo['quantidade'] >= 1]
+        .sort_values(by=['ILPI', 'profissional'])
+        .reset_index(drop=True)
+    )
+
+
+def minimo_cuidador_por_ilpi(dependencia, horas_por_grau=HORAS_CUIDADOR_POR_GRAU):
+    """
+    Horas semanais mínimas de cuidador por residente de cada ILPI, ponderadas pela composição
+    de graus de dependência dos seus residentes.
+
+    Parâmetros:
+    - dependencia: DataFrame ILPI x grau (1, 2, 3) com o número de residentes de cada grau
+      (ex: `pd.crosstab(perfil['institution_name'], perfil['dependence_degree'])`).
+    - horas_por_grau: dict grau -> horas semanais mínimas por residente.
+
+    Retorna:
+    - Series indexada pela ILPI (ILPIs sem residentes com grau informado ficam de fora).
+    """
+    contagens = dependencia.reindex(columns=list(horas_por_grau), fill_value=0).fillna(0)
+    total = contagens.sum(axis=1)
+    minimo = contagens.to_numpy(dtype=float) @ np.array(list(horas_por_grau.values()), dtype=float)
+    return pd.Series(minimo, index=contagens.index)[total > 0] / total[total > 0]
+
+
+def verificar_razoes(tabela, razoes=RAZOES_REGULATORIAS, residentes=None, dependencia=None):
+    """
+    Compara as horas por residente com os mínimos regulatórios, de forma vetorizada.
+
+    Parâmetros:
+    - tabela: DataFrame de `tabela_equipe` (todas as ILPIs de uma vez).
+    - razoes: dict profissional -> horas semanais mínimas por residente.
+    - residentes: Series ILPI -> número de residentes, com todas as ILPIs a verificar
+      (ex: `base.set_index('institution_name')['residents_number']`). None: só as ILPIs
+      presentes em `tabela`, ou seja, ILPIs sem nenhum profissional cadastrado ficam de fora.
+    - dependencia: DataFrame ILPI x grau de dependência (ver `minimo_cuidador_por_ilpi`); o
+      mínimo de cuidadores dessas ILPIs segue a sua composição em vez do Grau I de `razoes`.
+
+    Retorna:
+    - DataFrame com 'ILPI', 'profissional', 'horas_por_residente', 'minimo_por_residente',
+      'atende' e 'deficit_horas_semana' (horas semanais faltantes na ILPI).
+      ILPIs sem nenhum profissional de uma categoria exigida aparecem com 0 horas.
+
+    Exemplo de uso:
+    verificar_razoes(tabela_equipe(base), residentes=base.set_index('institution_name')['residents_number'],
+                     dependencia=pd.crosstab(perfil['institution_name'], perfil['dependence_degree']))
+    """
+    minimos = pd.Series(razoes, name='minimo_por_residente').rename_axis('profissional').reset_index()
+
+    # Todas as combinações ILPI x profissional exigido, inclusive quando a ILPI não tem o profissional
+    if residentes is None:
+        residentes = tabela.groupby('ILPI')['residentes'].first()
+    else:
+        residentes = pd.to_numeric(residentes, errors='coerce').groupby(level=0).first()
+    grade = pd.MultiIndex.from_product([residentes.index, minimos['profissional']], names=['ILPI', 'profissional'])
+    horas = (
+        tabela.groupby(['ILPI', 'profissional'])['horas_semana_total'].sum()
+        .reindex(grade, fill_value=0)
+        .reset_index()
+        .merge(minimos, on='profissional')
+    )
+    if dependencia is not None and 'Cuidador(a)' in razoes:
+        cuidador = horas['profissional'] == 'Cuidador(a)'
+        ponderado = horas.loc[cuidador, 'ILPI'].map(minimo_cuidador_por_ilpi(dependencia))
+        horas.loc[cuidador, 'minimo_por_residente'] = ponderado.fillna(horas.loc[cuidador, 'minimo_por_residente'])
+    horas['residentes'] = horas['ILPI'].map(residentes)
+    horas['horas_por_residente'] = (horas['horas_semana_total'] / horas['residentes']).round(2)
+
+    necessario = horas['minimo_por_residente'] * horas['residentes']
+    horas['atende'] = horas['horas_semana_total'] >= necessario
+    horas['deficit_horas_semana'] = (necessario - horas['horas_semana_total']).clip(lower=0).round(1)
+
+    return horas[['ILPI', 'profissional', 'residentes', 'horas_por_residente',
+                  'minimo_por_residente', 'atende', 'deficit_horas_semana']]
@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import etapa
+
+# ------------------------------
+# Blocos de checkbox esparsos (morbidities___*, physical_desabilities___*)
+# ------------------------------
+
+# Famílias guardadas como colunas esparsas por `esparsificar` (e por preparar_base_perfil(..., esparso=True))
+PREFIXOS_ESPARSOS = ('morbidities___', 'physical_desabilities___')
+
+# Só as marcações ficam guardadas; 0 e ausente (linha de outro instrumento) são o valor de preenchimento
+TIPO_ESPARSO = pd.SparseDtype('int8', fill_value=0)
+
+
+def _importar_scipy():
+    try:
+        import scipy.sparse
+    except ImportError as erro:
+        raise ImportError(
+            "As matrizes esparsas requerem o pacote scipy. Instale com: pip install -e .[esparso]"
+        ) from erro
+    return scipy.sparse
+
+
+def colunas_por_prefixo(df, prefixos=PREFIXOS_ESPARSOS):
+    """Colunas do DataFrame que começam com algum dos prefixos, na ordem do DataFrame."""
+    if isinstance(prefixos, str):
+        prefixos = (prefixos,)
+    return [c for c in df.columns if str(c).startswith(tuple(prefixos))]
+
+
+def _linhas_com_valor(serie, valor=1):
+    """Posições das linhas iguais a `valor`; em colunas esparsas, lê só os valores guardados."""
+    valores = serie.array
+    if isinstance(valores, pd.arrays.SparseArray) and valores.fill_value != valor:
+        return valores.sp_index.indices[valores.sp_values == valor]
+    return np.flatnonzero(serie.eq(valor).fillna(False).to_numpy(dtype=bool))
+
+
+@etapa()
+def esparsificar(df, prefixos=PREFIXOS_ESPARSOS):
+    """
+    Converte as famílias de checkbox para colunas esparsas (`TIPO_ESPARSO`), guardando só as marcações.
+    Valores ausentes viram 0: nas linhas de outros instrumentos (medicamentos, residente) a ausência
+    só indica que a linha não é de morbidades, o que continua em 'redcap_repeat_instrument'.
+
+    Com a maioria dos residentes marcando 1 a 3 das 21 morbidades, os blocos ocupam
+    cerca de 100 vezes menos memória que as colunas Int64 densas.
+
+    Parâmetros:
+    - df: DataFrame (ex: base do perfil epidemiológico).
+    - prefixos: prefixos das famílias a converter.
+
+    Retorna:
+    - Novo DataFrame com as colunas das famílias esparsas (as demais não são copiadas).
+
+    Exemplo de uso:
+    base = esparsificar(pd.read_csv('base_perfil_epidemiologico.csv', sep=';'))
+    """
+    colunas = colunas_por_prefixo(df, prefixos)
+    return df.assign(**{
+        coluna: pd.arrays.SparseArray(
+            df[coluna].to_numpy(dtype='float64', na_value=0).astype('int8'), fill_value=0
+        )
+        for coluna in colunas
+    })
+
+
+def densificar(df):
+    """Converte de volta as colunas esparsas do DataFrame para colunas densas do mesmo tipo."""
+    return df.astype({c: t.subtype for c, t in df.dtypes.items() if isinstance(t, pd.SparseDtype)})
+
+
+def linhas_marcadas(df, colunas, valor=1):
+    """
+    Máscara booleana das linhas com pelo menos uma das colunas igual a `valor`
+    (equivale a `df[colunas].eq(valor).any(axis=1)`, sem densificar colunas esparsas).
+    """
+    marcadas = np.zeros(len(df), dtype=bool)
+    for coluna in colunas:
+        marcadas[_linhas_com_valor(df[coluna], valor)] = True
+    return marcadas
+
+# ----------------------------------------
+
+def matriz_indicadores(df, prefixo, valor=1):
+    """
+    Matriz esparsa (SciPy, CSR) linhas x colunas da família, com 1 onde a coluna é igual a `valor`.
+    Aceita colunas densas ou esparsas.
+
+    Parâmetros:
+    - df: DataFrame.
+    - prefixo: prefixo da família (ex: 'morbidities___') ou lista de colunas.
+    - valor: valor que conta como marcado.
+
+    Retorna:
+    - (matriz, colunas): scipy.sparse.csr_array (int64) e nomes das colunas.
+    """
+    sparse = _importar_scipy()
+    colunas = list(prefixo) if not isinstance(prefixo, str) else colunas_por_prefixo(df, prefixo)
+    linhas = [_linhas_com_valor(df[coluna], valor) for coluna in colunas]
+    posicoes_colunas = [np.full(len(indices), j) for j, indices in enumerate(linhas)]
+    linhas = np.concatenate(linhas) if linhas else np.empty(0, dtype=int)
+    posicoes_colunas = np.concatenate(posicoes_colunas) if posicoes_colunas else np.empty(0, dtype=int)
+    matriz = sparse.csr_array(
+        (np.ones(len(linhas), dtype=np.int64), (linhas, posicoes_colunas)), shape=(len(df), len(colunas))
+    )
+    return matriz, colunas
+
+
+def _indicadora(codigos, n_categorias):
+    """Matriz esparsa (len(codigos) x n_categorias) com um 1 por linha; códigos negativos ficam de fora."""
+    sparse = _importar_scipy()
+    validos = np.flatnonzero(codigos >= 0)
+    return sparse.csr_array(
+        (np.ones(len(validos), dtype=np.int64), (validos, codigos[validos])), shape=(len(codigos), n_categorias)
+    )
+
+
+def _por_residente(df, matriz, residente, grupos=None):
+    """
+    Agrega as linhas da matriz por residente (marcado se marcado em alguma de suas linhas).
+    Com `grupos`, a chave é (grupo, residente) e retorna também o grupo de cada chave.
+    """
+    chaves = [grupos, residente] if grupos is not None else [residente]
+    codigos = df.groupby(chaves, sort=False).ngroup().to_numpy()
+    n_chaves = codigos.max() + 1 if len(codigos) else 0
+    agregada = (_indicadora(codigos, n_chaves).T @ matriz).tocsr()
+    agregada.data = np.minimum(agregada.data, 1)
+    return agregada, codigos
+
+
+@etapa()
+def contagem_por_grupo(df, prefixo, grupos='institution_name', residente='cpf', valor=1):
+    """
+    Contagem de cada opção da família por grupo (ex: residentes com cada morbidade por ILPI),
+    como produto esparso indicadora(grupos).T @ indicadores.
+
+    Parâmetros:
+    - df: DataFrame (colunas da família densas ou esparsas).
+    - prefixo: prefixo da família (ex: 'morbidities___') ou lista de colunas.
+    - grupos: coluna dos grupos.
+    - residente: coluna que identifica o residente; cada residente conta uma vez por opção, mesmo com a
+      marcação em mais de uma linha. Se None, conta as linhas marcadas.
+    - valor: valor que conta como marcado.
+
+    Retorna:
+    - DataFrame (grupos x colunas da família), grupos ordenados.
+
+    Exemplo de uso:
+    contagem_por_grupo(base, 'morbidities___').rename(columns=MORBIDADES_DICT)
+    """
+    matriz, colunas = matriz_indicadores(df, prefixo, valor)
+    codigos_grupo, categorias = pd.factorize(df[grupos], sort=True)
+
+    if residente is not None:
+        matriz, chaves = _por_residente(df, matriz, residente, grupos)
+        # Grupo de cada chave (grupo, residente)
+        grupo_da_chave = np.full(matriz.shape[0], -1)
+        validas = chaves >= 0
+        grupo_da_chave[chaves[validas]] = codigos_grupo[validas]
+        codigos_grupo = grupo_da_chave
+
+    contagens = (_indicadora(codigos_grupo, len(categorias)).T @ matriz).toarray()
+    return pd.DataFrame(contagens, index=pd.Index(categorias, name=grupos), columns=colunas)
+
+
+@etapa()
+def coocorrencia(df, prefixo, residente='cpf', valor=1):
+    """
+    Matriz de coocorrência das opções da família: quantos residentes têm as duas opções marcadas
+    (diagonal: residentes com a opção), como produto esparso indicadores.T @ indicadores.
+
+    Parâmetros:
+    - df: DataFrame.
+    - prefixo: prefixo da família ou lista de colunas.
+    - residente: coluna que identifica o residente (None: coocorrência na mesma linha).
+    - valor: valor que conta como marcado.
+
+    Retorna:
+    - DataFrame (colunas x colunas da família).
+    """
+    matriz, colunas = matriz_indicadores(df, prefixo, valor)
+    if residente is not None:
+        matriz, _ = _por_residente(df, matriz, residente)
+    return pd.DataFrame((matriz.T @ matriz).toarray(), index=colunas, columns=colunas)
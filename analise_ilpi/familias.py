@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Registro de famílias de colunas (checkbox do REDCap: prefixo___N)
+# ------------------------------
+
+SEPARADOR_CHECKBOX = '___'
+
+
+class RegistroFamilias:
+    """
+    Índice das famílias de colunas de um DataFrame, calculado uma única vez:
+    prefixo -> posições das colunas, com os valores já convertidos para número.
+
+    As famílias de checkbox (ex: 'morbidities___', 'link_type___', 'medical_record___') são
+    detectadas automaticamente e guardadas em blocos contíguos de um único array NumPy;
+    somas e contagens por família são reduções sobre esse bloco, sem varrer os nomes das
+    colunas nem chamar `pd.to_numeric` a cada chamada.
+
+    O registro é uma cópia dos valores no momento em que é criado: depois de alterar o
+    DataFrame, crie um novo registro.
+
+    Parâmetros:
+    - df: DataFrame original.
+    - prefixos: outras famílias a registrar: lista de prefixos (ex: ['combination_']) ou
+      dict nome -> lista de colunas (ex: {'morbidades': list(MORBIDADES_DICT)}).
+    - checkbox: se False, não detecta as famílias de checkbox (só registra `prefixos`).
+
+    Exemplo de uso:
+    registro = RegistroFamilias(df)
+    registro.soma('morbidities___')        # array com a soma por linha
+    registro.soma_por_grupo('link_type___', df['institution_name'])
+    """
+
+    def __init__(self, df, prefixos=(), checkbox=True):
+        self.index = df.index
+        self._nomes = [str(c) for c in df.columns]
+
+        familias = {}
+        if checkbox:
+            for posicao, nome in enumerate(self._nomes):
+                if SEPARADOR_CHECKBOX in nome:
+                    prefixo = nome.rsplit(SEPARADOR_CHECKBOX, 1)[0] + SEPARADOR_CHECKBOX
+                    familias.setdefault(prefixo, []).append(posicao)
+        if isinstance(prefixos, dict):
+            posicao_nome = {nome: posicao for posicao, nome in enumerate(self._nomes)}
+            for familia, colunas in prefixos.items():
+                familias[familia] = [posicao_nome[str(c)] for c in colunas]
+        else:
+            for prefixo in prefixos:
+                familias[prefixo] = [i for i, nome in enumerate(self._nomes) if nome.startswith(prefixo)]
+
+        # Colunas agrupadas por família -> cada família é uma fatia contígua (view) do bloco
+        ordem = [posicao for posicoes in familias.values() for posicao in posicoes]
+        self.valores = _para_numerico(df.iloc[:, ordem]) if ordem else np.empty((len(df), 0))
+
+        self.posicoes = {}
+        self._fatias = {}
+        inicio = 0
+        for prefixo, posicoes in familias.items():
+            self.posicoes[prefixo] = np.asarray(posicoes, dtype=int)
+            self._fatias[prefixo] = slice(inicio, inicio + len(posicoes))
+            inicio += len(posicoes)
+
+    @property
+    def prefixos(self):
+        return list(self.posicoes)
+
+    def _verificar(self, prefixo):
+        if prefixo not in self.posicoes:
+            raise KeyError(f"Família '{prefixo}' não registrada. Use RegistroFamilias(df, prefixos=['{prefixo}']).")
+
+    def colunas(self, prefixo):
+        """Nomes das colunas da família, na ordem do DataFrame."""
+        self._verificar(prefixo)
+        return [self._nomes[i] for i in self.posicoes[prefixo]]
+
+    def bloco(self, prefixo):
+        """Matriz float (linhas x colunas da família); NaN onde o valor não é numérico."""
+        self._verificar(prefixo)
+        return self.valores[:, self._fatias[prefixo]]
+
+    def soma(self, prefixo):
+        """Soma por linha (NaN ignorado)."""
+        return np.nansum(self.bloco(prefixo), axis=1)
+
+    def contagem(self, prefixo, valor=1):
+        """Quantas colunas da família têm `valor` em cada linha (ex: checkboxes marcados)."""
+        return (self.bloco(prefixo) == valor).sum(axis=1)
+
+    def algum(self, prefixo, valor=1):
+        """True nas linhas com pelo menos uma coluna da família igual a `valor`."""
+        return (self.bloco(prefixo) == valor).any(axis=1)
+
+    def frame(self, prefixo, nome_coluna_soma=None):
+        """
+        DataFrame com as colunas da família (numéricas) e a coluna de soma,
+        no mesmo formato de `criar_df_com_soma_por_prefixo`.
+        """
+        if nome_coluna_soma is None:
+            nome_coluna_soma = f'soma_{prefixo.rstrip("_")}'
+        bloco = self.bloco(prefixo)
+        resultado = pd.DataFrame(bloco, index=self.index, columns=self.colunas(prefixo))
+        resultado[nome_coluna_soma] = np.nansum(bloco, axis=1)
+        # Colunas sem ausentes e só com inteiros ficam int64, como o pd.to_numeric faria;
+        # a soma só é inteira se todas as colunas forem
+        inteiras = ~np.isnan(bloco).any(axis=0) & (bloco == np.trunc(bloco)).all(axis=0)
+        for coluna in resultado.columns[:-1][inteiras]:
+            resultado[coluna] = resultado[coluna].astype('int64')
+        if inteiras.all():
+            resultado[nome_coluna_soma] = resultado[nome_coluna_soma].astype('int64')
+        return resultado
+
+    def soma_por_grupo(self, prefixo, grupos):
+        """
+        Soma de cada coluna da família por grupo (ex: marcações por ILPI).
+
+        Parâmetros:
+        - prefixo: prefixo da família.
+        - grupos: pd.Series/array alinhado às linhas (ex: df['institution_name']).
+
+        Retorna:
+        - DataFrame (grupos x colunas da família).
+        """
+        codigos, categorias = pd.factorize(np.asarray(grupos), sort=True)
+        bloco = np.nan_to_num(self.bloco(prefixo))
+        validos = codigos >= 0
+        somas = np.zeros((len(categorias), bloco.shape[1]))
+        for j in range(bloco.shape[1]):
+            somas[:, j] = np.bincount(codigos[validos], weights=bloco[validos, j], minlength=len(categorias))
+        return pd.DataFrame(somas, index=categorias, columns=self.colunas(prefixo))
+
+
+def _para_numerico(df):
+    """Converte o bloco para float de uma vez; valores não numéricos viram NaN."""
+    try:
+        return df.to_numpy(dtype=float, na_value=np.nan)
+    except (TypeError, ValueError):
+        return df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+
+def criar_df_com_soma_por_prefixo(df, prefixo, nome_coluna_soma=None, registro=None):
+    """
+    Retorna um novo DataFrame com as colunas que começam com o prefixo e uma coluna de soma.
+
+    Parâmetros:
+    - df: DataFrame original.
+    - prefixo: Prefixo das colunas a incluir.
+    - nome_coluna_soma: Nome da nova coluna de soma. Se None, será 'soma_' + prefixo.
+    - registro: `RegistroFamilias(df)` já calculado, para várias famílias do mesmo DataFrame
+      sem repetir a conversão. Se None, só as colunas do prefixo são lidas (sempre os valores atuais).
+
+    Retorna:
+    - Novo DataFrame com as colunas selecionadas + coluna de soma.
+
+    Exemplo de uso:
+    registro = RegistroFamilias(verif_reg)
+    prontuario = criar_df_com_soma_por_prefixo(verif_reg, 'medical_record___', registro=registro)
+    banho = criar_df_com_soma_por_prefixo(verif_reg, 'patient_bath___', registro=registro)
+    """
+    if registro is None:
+        registro = RegistroFamilias(df, prefixos=[prefixo], checkbox=False)
+    return registro.frame(prefixo, nome_coluna_soma)
@@ -0,0 +1,139 @@
+import pandas as pd
+
+from .instrumentacao import etapa
+from .memoizacao import memoizar
+
+# ------------------------------
+# Componentes de fragilidade e score de risco
+# ------------------------------
+
+#amount_weight_loss_dict ={1: "de 1 a 3 kg",2: "mais de 3 kg",}
+#elder_strenght_dict = {1:"Sim",2:"Não"}
+#elder_hospitalized_dict = {1: "nenhuma", 2: "1 a 2 vezes", 3: "3 vezes", 4: "4 ou mais",}
+#elder_difficulties_dict = {1:"nenhuma", 2: "alguma",3: "não consegue",}
+#elder_mobility_dict = {1: "Sim",2: "Não"}
+#basic_activities_diffic_dict = 	{1:	"Sim",2: "Não"}
+#falls_number_dict = {1: " nenhuma", 2: "1 a 3 quedas", 3: "4 e mais",}
+
+CONDICAO_ATENCAO = {
+    'amount_weight_loss':(lambda x: x == 1),
+    'elder_strenght':(lambda x: x == 2),
+    'elder_hospitalized':(lambda x: x ==1),
+    'elder_difficulties':(lambda x: x == 1),
+    'elder_mobility':(lambda x: x == 2),
+    'basic_activities_diffic':(lambda x: x ==1),
+    'falls_number':(lambda x: x ==1)
+}
+
+CONDICAO_ALERTA = {
+    'amount_weight_loss':(lambda x: x == 1),
+    'elder_strenght':(lambda x: x == 1),
+    'elder_hospitalized':(lambda x: x in [2, 3] ),
+    'elder_difficulties':(lambda x: x == 2),
+    'elder_mobility':(lambda x: x == 1),
+    'basic_activities_diffic':(lambda x: x == 1),
+    'falls_number':(lambda x: x == 2)
+}
+
+CONDICAO_CRITICA = {
+    'amount_weight_loss':(lambda x: x == 2),
+    'elder_strenght':(lambda x: x == 1),
+    'elder_hospitalized':(lambda x: x in [3, 4]),
+    'elder_difficulties':(lambda x: x == 1),
+    'elder_mobility':(lambda x: x == 1),
+    'basic_activities_diffic':(lambda x: x ==1),
+    'falls_number':(lambda x: x == 3)
+}
+
+# Define a ordem de severidade
+ORDEM_PRIORIDADE = {'Crítico': 0, 'Alerta': 1, 'Atenção': 2, 'Sem Risco': 3}
+
+CORES_POR_RISCO = {
+    'Crítico': 'red',
+    'Alerta': 'orange',
+    'Atenção': 'yellow',
+    'Sem Risco': 'green'
+}
+
+
+def nivel_risco_por_residente(df, condicoes_critico=CONDICAO_CRITICA, condicoes_alerta=CONDICAO_ALERTA,
+                              condicoes_atencao=CONDICAO_ATENCAO, incluir_sem_risco=True):
+    """
+    Aplica as condições de risco e retorna o nível mais severo de cada residente (por 'cpf').
+
+    Parâmetros:
+    - df: DataFrame original
+    - condicoes_critico, condicoes_alerta, condicoes_atencao: dicionários de condições
+    - incluir_sem_risco: se True, classifica como 'Sem Risco' os registros que não se encaixam em nenhuma categoria
+
+    Retorna:
+    - DataFrame com institution_name, cpf, full_name e risco (rótulo sem HTML)
+    """
+    df_copia = df.copy()
+
+    df_copia['risco'] = None
+
+    def aplicar_classificacao(df_local, condicoes_dict, label):
+        cond = pd.Series(True, index=df_local.index)
+        for col, func in condicoes_dict.items():
+            cond &= df_local[col].apply(func)
+        return cond.replace({True: label, False: None})
+
+    for condicoes, label in [
+        (condicoes_critico, 'Crítico'),
+        (condicoes_alerta, 'Alerta'),
+        (condicoes_atencao, 'Atenção')
+    ]:
+        mask = aplicar_classificacao(df_copia, condicoes, label)
+        condicao_vazia = df_copia['risco'].isna()
+        df_copia.loc[mask.notna() & condicao_vazia, 'risco'] = label
+
+    # Preencher com "Sem Risco", se solicitado
+    if incluir_sem_risco:
+        df_copia.loc[df_copia['risco'].isna(), 'risco'] = 'Sem Risco'
+
+    df_copia['prioridade'] = df_copia['risco'].map(ORDEM_PRIORIDADE)
+
+    return (
+        df_copia
+        .sort_values('prioridade')
+        .groupby('cpf', as_index=False)
+        .first()[['institution_name', 'cpf', 'full_name', 'risco']]
+    )
+
+
+@etapa()
+@memoizar()
+def classificar_risco(df, condicoes_critico, condicoes_alerta, condicoes_atencao, incluir_sem_risco=True):
+    """
+    Aplica condições de risco e retorna:
+    - DataFrame agrupado por 'cpf' com colunas: institution_name, cpf, full_name, risco (colorido em HTML)
+    - Resumo com contagem por nível de risco (rótulos limpos, sem HTML)
+
+     Parâmetros:
+    - df: DataFrame original
+    - condicoes_critico, condicoes_alerta, condicoes_atencao: dicionários de condições
+
+    - incluir_sem_risco: se True, classifica como 'Sem Risco' os registros que não se encaixam em nenhuma categoria
+    OBS: Para visualizar cores no Jupyter, usar `display(HTML(resultado.to_html(escape=False)))`
+    """
+    agrupado = nivel_risco_por_residente(
+        df, condicoes_critico, condicoes_alerta, condicoes_atencao, incluir_sem_risco
+    )
+
+    # Aplica cor HTML na coluna 'risco'
+    def colorir(valor):
+        cor = CORES_POR_RISCO.get(valor, 'black')
+        return f'<span style="color: {cor}; font-weight: bold;">{valor}</span>'
+
+    agrupado['Score_Fragilidade'] = agrupado['risco'].apply(colorir)
+
+    # Resumo por grupo de risco
+    resumo = (
+        agrupado
+        .groupby(['institution_name', 'risco'], as_index=False)
+        .size()
+        .rename(columns={'size': 'total'})
+    )
+
+    return agrupado.drop(columns=['risco']), resumo
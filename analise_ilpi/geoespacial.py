@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+
+from .vinculacao import normalizar_nome, similaridade_nomes
+
+# ------------------------------
+# Índice espacial ILPI -> unidades de saúde (UBS/UPA)
+# ------------------------------
+
+RAIO_TERRA_KM = 6371.0088
+
+
+def separar_unidades(serie):
+    """
+    Divide os textos livres de UBS/UPA (ex: 'UPA Buriti/ UPA Brasicom; UPA Flamboyant')
+    em uma lista de nomes por linha. Versão vetorizada do antigo `split_upa`, com uma diferença:
+    partes vazias (ex: o final de 'UPA Buriti/') são descartadas em vez de virarem '' (o que criava
+    colunas UPA_n vazias na tabela 51).
+
+    Parâmetros:
+    - serie: pd.Series com os textos.
+
+    Retorna:
+    - pd.Series de listas (lista vazia onde não há valor).
+    """
+    partes = serie.astype('string').str.split(r'\s*[;/]\s*', regex=True)
+    return partes.map(lambda itens: [i.strip() for i in itens if i.strip()] if isinstance(itens, list) else [])
+
+
+def carregar_referencia(caminho, sep=','):
+    """
+    Lê o arquivo local de referência das unidades de saúde.
+
+    O arquivo deve ter as colunas 'nome', 'tipo' (ex: UBS, UPA), 'latitude' e 'longitude'.
+
+    Retorna:
+    - DataFrame com as colunas do arquivo e 'nome_norm'.
+    """
+    referencia = pd.read_csv(caminho, sep=sep)
+    faltando = {'nome', 'tipo', 'latitude', 'longitude'} - set(referencia.columns)
+    if faltando:
+        raise KeyError(f'Colunas ausentes no arquivo de referência: {sorted(faltando)}')
+    referencia = referencia.dropna(subset=['latitude', 'longitude']).reset_index(drop=True)
+    referencia['nome_norm'] = normalizar_nome(referencia['nome'])
+    return referencia
+
+
+def geocodificar_unidades(nomes, referencia, limiar=0.85):
+    """
+    Associa nomes de unidades citados nos surveys às coordenadas da referência.
+    Primeiro por nome normalizado idêntico; os demais por maior similaridade acima do limiar.
+
+    Parâmetros:
+    - nomes: pd.Series com nomes de unidades.
+    - referencia: DataFrame de `carregar_referencia`.
+    - limiar: similaridade mínima (0 a 1).
+
+    Retorna:
+    - DataFrame com 'nome', 'nome_referencia', 'tipo', 'latitude', 'longitude' (NaN se não encontrado).
+    """
+    unicos = pd.Series(pd.unique(nomes.dropna()), dtype='string')
+    normalizados = normalizar_nome(unicos)
+    indice_ref = dict(zip(referencia['nome_norm'], referencia.index))
+
+    posicoes = normalizados.map(indice_ref).astype('float')
+    pendentes = posicoes.isna() & normalizados.notna()
+    if pendentes.any() and len(referencia):
+        matriz = np.asarray(similaridade_nomes(normalizados[pendentes].tolist(), referencia['nome_norm'].tolist()))
+        melhores = matriz.argmax(axis=1)
+        aceitos = matriz[np.arange(len(melhores)), melhores] >= limiar
+        posicoes.loc[pendentes] = np.where(aceitos, melhores, np.nan)
+
+    encontrados = referencia.reindex(posicoes.to_numpy())
+    return pd.DataFrame({
+        'nome': unicos.to_numpy(),
+        'nome_referencia': encontrados['nome'].to_numpy(),
+        'tipo': encontrados['tipo'].to_numpy(),
+        'latitude': encontrados['latitude'].to_numpy(),
+        'longitude': encontrados['longitude'].to_numpy(),
+    })
+
+
+def distancia_haversine(lat1, lon1, lat2, lon2):
+    """
+    Distância em km entre pontos (graus), vetorizada com broadcasting do NumPy.
+    Ex: lat1[:, None] contra lat2[None, :] gera a matriz de distâncias.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * RAIO_TERRA_KM * np.arcsin(np.sqrt(a))
+
+
+class IndiceEspacial:
+    """
+    Índice sobre as coordenadas das unidades de saúde para consultas em lote.
+    Usa BallTree com métrica haversine (scikit-learn) quando disponível; caso contrário
+    calcula as distâncias com NumPy em blocos, sem laços por ponto. Sem nenhuma unidade,
+    as consultas não encontram nada (distância NaN, posição -1).
+
+    Parâmetros:
+    - latitude, longitude: arrays com as coordenadas das unidades (graus).
+    - tamanho_bloco: número de pontos de consulta por bloco no modo NumPy.
+
+    Exemplo de uso:
+    ref = carregar_referencia('../../../data/unidades_saude.csv')
+    indice = IndiceEspacial(ref['latitude'], ref['longitude'])
+    dist_km, pos = indice.mais_proximas(ilpis['latitude'], ilpis['longitude'], k=1)
+    """
+
+    def __init__(self, latitude, longitude, tamanho_bloco=2048):
+        self.latitude = np.asarray(latitude, dtype=float)
+        self.longitude = np.asarray(longitude, dtype=float)
+        self.tamanho_bloco = tamanho_bloco
+        self.arvore = None
+        if len(self.latitude):
+            # BallTree não aceita zero pontos
+            try:
+                from sklearn.neighbors import BallTree
+            except ImportError:
+                pass
+            else:
+                self.arvore = BallTree(np.radians(np.column_stack([self.latitude, self.longitude])), metric='haversine')
+
+    def __len__(self):
+        return len(self.latitude)
+
+    def _consulta(self, latitude, longitude):
+        return np.asarray(latitude, dtype=float), np.asarray(longitude, dtype=float)
+
+    def matriz_distancias(self, latitude, longitude):
+        """Matriz (n_consultas x n_unidades) de distâncias em km."""
+        lat, lon = self._consulta(latitude, longitude)
+        return distancia_haversine(lat[:, None], lon[:, None], self.latitude[None, :], self.longitude[None, :])
+
+    def mais_proximas(self, latitude, longitude, k=1):
+        """
+        As k unidades mais próximas de cada ponto.
+
+        Retorna:
+        - (distancias_km, posicoes): arrays (n_consultas x k), ordenados da mais próxima à mais distante
+          (sem unidades no índice: NaN e -1).
+        """
+        lat, lon = self._consulta(latitude, longitude)
+        if not len(self):
+            return np.full((len(lat), k), np.nan), np.full((len(lat), k), -1)
+        k = min(k, len(self))
+        if self.arvore is not None:
+            dist, pos = self.arvore.query(np.radians(np.column_stack([lat, lon])), k=k)
+            return dist * RAIO_TERRA_KM, pos
+
+        distancias, posicoes = [], []
+        for inicio in range(0, len(lat), self.tamanho_bloco):
+            fim = inicio + self.tamanho_bloco
+            matriz = self.matriz_distancias(lat[inicio:fim], lon[inicio:fim])
+            pos = np.argpartition(matriz, k - 1, axis=1)[:, :k]
+            dist = np.take_along_axis(matriz, pos, axis=1)
+            ordem = np.argsort(dist, axis=1)
+            distancias.append(np.take_along_axis(dist, ordem, axis=1))
+            posicoes.append(np.take_along_axis(pos, ordem, axis=1))
+        return np.vstack(distancias), np.vstack(posicoes)
+
+    def dentro_do_raio(self, latitude, longitude, raio_km):
+        """
+        Unidades a até `raio_km` de cada ponto.
+
+        Retorna:
+        - lista (uma entrada por ponto) de arrays com as posições das unidades.
+        """
+        lat, lon = self._consulta(latitude, longitude)
+        if not len(self):
+            return [np.array([], dtype=int) for _ in range(len(lat))]
+        if self.arvore is not None:
+            return list(self.arvore.query_radius(np.radians(np.column_stack([lat, lon])), r=raio_km / RAIO_TERRA_KM))
+
+        resultado = []
+        for inicio in range(0, len(lat), self.tamanho_bloco):
+            fim = inicio + self.tamanho_bloco
+            matriz = self.matriz_distancias(lat[inicio:fim], lon[inicio:fim])
+            resultado.extend(np.flatnonzero(linha <= raio_km) for linha in matriz)
+        return resultado
+
+
+def unidade_mais_proxima(ilpis, referencia, tipo=None, k=1, col_ilpi='institution_name'):
+    """
+    Para cada ILPI com coordenadas, a(s) unidade(s) de saúde mais próxima(s).
+
+    Parâmetros:
+    - ilpis: DataFrame com col_ilpi, 'latitude' e 'longitude' (ex: base_perfil_epidemiologico).
+    - referencia: DataFrame de `carregar_referencia`.
+    - tipo: filtra a referência (ex: 'UPA' ou 'UBS').
+    - k: número de unidades por ILPI.
+
+    Retorna:
+    - DataFrame com 'ILPI', 'ordem', 'unidade', 'tipo' e 'distancia_km' (NaN quando a referência
+      não tem nenhuma unidade com coordenadas).
+    """
+    if tipo is not None:
+        referencia = referencia[referencia['tipo'] == tipo]
+    referencia = referencia.dropna(subset=['latitude', 'longitude']).reset_index(drop=True)
+
+    pontos = (
+        ilpis[[col_ilpi, 'latitude', 'longitude']]
+        .dropna()
+        .groupby(col_ilpi, as_index=False)
+        .first()
+    )
+    indice = IndiceEspacial(referencia['latitude'], referencia['longitude'])
+    dist, pos = indice.mais_proximas(pontos['latitude'], pontos['longitude'], k=k)
+
+    n_k = pos.shape[1]
+    # reindex: a posição -1 (nenhuma unidade) vira NaN
+    encontradas = referencia.reindex(pos.ravel())
+    return pd.DataFrame({
+        'ILPI': np.repeat(pontos[col_ilpi].to_numpy(), n_k),
+        'ordem': np.tile(np.arange(1, n_k + 1), len(pontos)),
+        'unidade': encontradas['nome'].to_numpy(),
+        'tipo': encontradas['tipo'].to_numpy(),
+        'distancia_km': dist.ravel().round(2),
+    })
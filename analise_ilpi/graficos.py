@@ -0,0 +1,664 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
+
+from .cache_figuras import em_cache
+from .instrumentacao import etapa
+from .saida_assincrona import gravar_figura
+
+# ------------------------------
+# Gráficos dos relatórios
+# ------------------------------
+
+NOTA_UNIDADES_MORADIA = '* Uma das instituições é composta por unidades de moradia'
+
+
+def _eixo(ax, figsize=None):
+    """Usa o Axes recebido ou cria uma nova figura. Retorna (fig, ax, criada)."""
+    if ax is not None:
+        return ax.figure, ax, False
+    fig, ax = plt.subplots(figsize=figsize)
+    return fig, ax, True
+
+
+def _finalizar(fig, criada, filename, mostrar, **opcoes_savefig):
+    """Salva, exibe (opcional) e fecha a figura criada pela função; figuras de um `ax` recebido ficam com quem chamou."""
+    fig.tight_layout()
+    if filename:
+        gravar_figura(fig, filename, **opcoes_savefig)
+    if mostrar:
+        plt.show()
+    if criada:
+        plt.close(fig)
+
+
+def _rotular_barras(ax, container, rotulos, tamanhos=9):
+    """
+    Rótulos brancos em negrito no centro de todas as barras de um container, com uma
+    única chamada a `bar_label` (em vez de um `ax.text` por barra).
+    `tamanhos` pode ser um número ou um array com o tamanho da fonte de cada barra.
+    """
+    unico = np.ndim(tamanhos) == 0
+    anotacoes = ax.bar_label(container, labels=list(rotulos), label_type='center', color='white',
+                             fontweight='bold', fontsize=tamanhos if unico else 9)
+    if not unico:
+        for anotacao, tamanho in zip(anotacoes, tamanhos):
+            anotacao.set_fontsize(tamanho)
+    return anotacoes
+
+
+def _tamanho_fonte(valores):
+    """Fonte proporcional ao tamanho da barra, entre 8 e 12."""
+    return np.clip(np.nan_to_num(np.asarray(valores, dtype=float)) * 0.25, 8, 12)
+
+
+def _formatar(valores, mascara, formato):
+    return [formato.format(v) if m else '' for v, m in zip(valores, mascara)]
+
+# ----------------------------------------
+
+@etapa()
+@em_cache('filename')
+def plot_barh(data, title, xlabel, ylabel, filename, obs=2, show_text=True, show_values=True, mostrar=True,
+              ax=None):
+    """
+    Gera um gráfico de barras horizontal com valores percentuais centralizados nas barras
+    e o eixo X em valores absolutos.
+
+    Parâmetros:
+    - data: DataFrame do pandas (colunas devem corresponder às categorias).
+    - title: string com o título do gráfico.
+    - xlabel: string com o rótulo do eixo X.
+    - ylabel: string com o rótulo do eixo Y.
+    - filename: string com o caminho e nome do arquivo (ex: 'plots/exemplo.png'); None não salva.
+    - obs: número de observações (define quantas cores usar).
+    - show_text: se True, exibe observação adicional no gráfico.
+    - show_values: se True, exibe os percentuais nas barras.
+    - mostrar: se True, exibe o gráfico com plt.show().
+    - ax: Axes existente para desenhar (a figura não é fechada); se None, cria e fecha uma figura própria.
+
+    Retorna:
+    - o Axes do gráfico.
+    """
+    # Paleta de cores personalizada
+    all_colors = ["#4E5EA7", '#F28E2B', "#AF3739", '#76B7B2', '#59A14F', '#EDC948']
+    color = all_colors[:obs] if isinstance(all_colors, list) else all_colors
+
+    # Cálculo dos percentuais por linha (ILPI)
+    percent_df = data.div(data.sum(axis=1), axis=0) * 100
+
+    # Plot
+    fig, ax, criada = _eixo(ax, figsize=(10, 6))
+    data.plot(kind='barh', color=color, ax=ax)
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+    # Inserção dos percentuais nas barras (um bar_label por coluna)
+    if show_values:
+        for container, col_name in zip(ax.containers, data.columns):
+            larguras = container.datavalues
+            percent = percent_df[col_name].to_numpy(dtype=float)
+            mascara = ~np.isnan(percent) & (larguras > 0)
+            _rotular_barras(ax, container, _formatar(percent, mascara, '{:.1f}%'), _tamanho_fonte(larguras))
+
+    # Observação adicional opcional
+    if show_text:
+        ax.text(0.075, 0.3, NOTA_UNIDADES_MORADIA,
+                color='red', ha='left', va='bottom', transform=fig.transFigure, wrap=True)
+
+    _finalizar(fig, criada, filename, mostrar, dpi=300)
+    return ax
+# ----------------------------------------
+
+@etapa()
+@em_cache('output_path')
+def plot_percentual_por_ilpi(pivot_df: pd.DataFrame, output_path: str, mostrar: bool = True, ax=None):
+    """
+    Gera um gráfico de barras empilhadas mostrando o percentual de faixas de tempo de instituição por ILPI.
+
+    Parâmetros:
+    - pivot_df: pd.DataFrame
+        DataFrame com contagem de residentes por faixa de tempo e por ILPI (ILPIs como índices).
+    - output_path: str
+        Caminho do arquivo para salvar a imagem do gráfico (ex: '../plots/nome_do_arquivo.png'); None não salva.
+    - mostrar: bool
+        Se True, exibe o gráfico com plt.show().
+    - ax: matplotlib Axes
+        Axes existente para desenhar (a figura não é fechada); se None, cria e fecha uma figura própria.
+
+    Retorna:
+    - o Axes do gráfico.
+    """
+
+    # Calcula os percentuais por ILPI (linha)
+    pivot_percent = pivot_df.div(pivot_df.sum(axis=1), axis=0) * 100
+
+    # Paleta de cores personalizada (1 cor por faixa etária — total 8 faixas)
+    custom_colors = [
+        '#4E79A7',  # Azul escuro
+        "#092436",  # Azul claro
+        "#A7794C",  # Laranja
+        "#E6811C",  # Laranja claro
+        "#24D20D",  # Verde
+        '#8CD17D',  # Verde claro
+        "#9D7E0E",  # Amarelo escuro
+        "#B72A56"   # Rosa claro
+    ]
+
+    # Criação do gráfico empilhado
+    fig, ax, criada = _eixo(ax, figsize=(12, 6))
+    pivot_df.plot(
+        kind='bar',
+        stacked=True,
+        color=custom_colors,
+        ax=ax
+    )
+
+    # Adiciona rótulos nos segmentos de barra (um bar_label por faixa de tempo)
+    for bars, col in zip(ax.containers, pivot_df.columns):
+        alturas = bars.datavalues
+        percent = pivot_percent[col].to_numpy(dtype=float)
+        mascara = (alturas > 0) & ~np.isnan(percent)
+        _rotular_barras(ax, bars, _formatar(percent, mascara, '{: .1f}%'), _tamanho_fonte(alturas))
+
+    # Eixos e legenda
+    ax.set_xlabel('ILPI')
+    ax.set_ylabel('Número de Residentes')
+    ax.set_title('Distribuição de Faixa Tempo de Instituição por ILPI (% por ILPI)')
+    ax.tick_params(axis='x', labelrotation=0)
+    ax.legend(title='Faixa Tempo Instituição', bbox_to_anchor=(1.0, 1), loc='upper left')
+
+    # Salvar, exibir e fechar
+    _finalizar(fig, criada, output_path, mostrar, dpi=300, bbox_inches='tight')
+    if output_path:
+        print(f"✅ Gráfico salvo como imagem: {output_path}")
+    return ax
+# ----------------------------------------
+
+@etapa()
+@em_cache('filename')
+def plot_bar_flex_auto(data, title, xlabel, ylabel, filename,
+                       orientation='h', value_format='percent',
+                       show_values=True, show_text=True,
+                       col_categoria=None, col_valor=None, col_percent=None,
+                       xtick_rotation=0, mostrar=True, ax=None):
+    """
+    Gera gráfico de barras (horizontal ou vertical) com valor absoluto no eixo
+    e valor percentual ou absoluto no centro da barra.
+
+    A função detecta automaticamente se deve calcular o percentual ou usar uma coluna existente.
+
+    Parâmetros:
+    - data: DataFrame original (com ou sem percentuais)
+    - title: título do gráfico
+    - xlabel / ylabel: rótulos dos eixos
+    - filename: caminho para salvar o gráfico (None não salva)
+    - orientation: 'h' ou 'v'
+    - value_format: 'percent' ou 'absolute'
+    - show_values: exibe texto nas barras
+    - show_text: mostra anotação adicional
+    - col_categoria / col_valor / col_percent: nomes das colunas (ou None para auto)
+    - xtick_rotation: ângulo de rotação dos rótulos do eixo X (ex: 0, 45, 90)
+    - mostrar: se True, exibe o gráfico com plt.show()
+    - ax: Axes existente para desenhar (a figura não é fechada); se None, cria e fecha uma figura própria
+
+    Retorna:
+    - o Axes do gráfico.
+    """
+
+      # Paleta de cores personalizada (1 cor por faixa etária — total 8 faixas)
+    custom_colors = [
+        '#4E79A7',  # Azul escuro
+        "#092436",  # Azul claro
+        "#A7794C",  # Laranja
+        "#E6811C",  # Laranja claro
+        "#24D20D",  # Verde
+        '#8CD17D',  # Verde claro
+        "#9D7E0E",  # Amarelo escuro
+        "#B72A56"   # Rosa claro
+    ]
+
+    is_horizontal = orientation == 'h'
+    kind = 'barh' if is_horizontal else 'bar'
+    
+    df = data.copy()
+
+    # --- Autoidentificação das colunas numéricas ---
+    if col_valor is None:
+        col_valor = df.select_dtypes(include='number').columns[0]
+
+    if col_categoria is None:
+        if df.index.name is not None and df.index.name != col_valor:
+            col_categoria = df.index.name
+            df = df.reset_index()
+        else:
+            col_categoria = df.columns[0]
+
+    if col_percent is None:
+        percent_candidates = [c for c in df.columns if 'propor' in c.lower() or '%' in c]
+        if percent_candidates:
+            col_percent = percent_candidates[0]
+
+    # --- Base para plotagem ---
+    df_plot = df[[col_categoria, col_valor]].copy()
+    df_plot.set_index(col_categoria, inplace=True)
+
+    # --- Percentuais ---
+    if value_format == 'percent':
+        if col_percent and col_percent in df.columns:
+            df_plot['percent'] = df.set_index(col_categoria)[col_percent] * 100
+        else:
+            total = df_plot[col_valor].sum()
+            df_plot['percent'] = (df_plot[col_valor] / total) * 100
+
+    # --- Plot ---
+    fig, ax, criada = _eixo(ax, figsize=(10, 6))
+    df_plot[col_valor].plot(kind=kind, color=custom_colors, ax=ax)
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+    # --- Texto nas barras (um único bar_label) ---
+    if show_values:
+        container = ax.containers[0]
+        valores = container.datavalues
+        todos = np.ones(len(valores), dtype=bool)
+        if value_format == 'percent':
+            rotulos = _formatar(df_plot['percent'].to_numpy(dtype=float), todos, '{:.1f}%')
+        else:
+            rotulos = _formatar(valores.astype(int), todos, '{}')
+        _rotular_barras(ax, container, rotulos, _tamanho_fonte(valores))
+
+    # --- Texto extra opcional ---
+    if show_text:
+        ax.text(0.02, 0.3, NOTA_UNIDADES_MORADIA,
+                color='red', ha='left', va='bottom', transform=fig.transFigure, wrap=True)
+
+    # --- Rotação dos rótulos do eixo X ---
+    if not is_horizontal:
+        ax.tick_params(axis='x', labelrotation=xtick_rotation)
+
+    _finalizar(fig, criada, filename, mostrar, dpi=300, bbox_inches='tight')
+    if filename:
+        print(f"✅ Gráfico salvo como imagem: {filename}")
+    return ax
+############################################
+
+@etapa()
+@em_cache('filename')
+def plot_bar_flex_unificado(data, title, xlabel, ylabel, filename,
+                            orientation='h', value_format='percent',
+                            show_values=True, show_text=True,
+                            col_categoria=None, col_valor=None,
+                            col_percent=None, col_grupo=None,
+                            xtick_rotation=0, mostrar=True, ax=None):
+    """
+    Gera gráfico de barras (horizontal/vertical), simples ou empilhado, com suporte a percentuais ou absolutos.
+
+    Parâmetros:
+    - data: DataFrame
+    - title, xlabel, ylabel: Títulos e rótulos dos eixos
+    - filename: caminho para salvar o gráfico (None não salva)
+    - orientation: 'h' ou 'v'
+    - value_format: 'percent' ou 'absolute'
+    - show_values: mostra valores nas barras
+    - show_text: insere anotação adicional
+    - col_categoria: coluna de categorias (auto se None)
+    - col_valor: coluna de valores numéricos (auto se None)
+    - col_percent: coluna com percentuais (auto se None)
+    - col_grupo: coluna de agrupamento (para gráfico empilhado)
+    - xtick_rotation: rotação dos rótulos no eixo X
+    - mostrar: se True, exibe o gráfico com plt.show()
+    - ax: Axes existente para desenhar (a figura não é fechada); se None, cria e fecha uma figura própria
+
+    Retorna:
+    - o Axes do gráfico.
+    """
+
+    custom_colors = [
+        '#4E79A7', "#092436", "#A7794C", "#E6811C",
+        "#24D20D", '#8CD17D', "#9D7E0E", "#B72A56"
+    ]
+
+    df = data.copy()
+    # Define o tipo do gráfico com base na orientação ('h' para horizontal, 'v' para vertical).
+    is_horizontal = orientation == 'h'
+    kind = 'barh' if is_horizontal else 'bar'
+
+    # --- Autoidentificação das colunas ---
+    # Numéricas
+    # Seleciona a última coluna numérica do DataFrame como valor se não for passada explicitamente.
+    if col_valor is None:
+        col_valor = df.select_dtypes(include='number').columns[-1]
+
+    # Categóricas
+    # Procura a primeira coluna com número de categorias menor que o número de linhas (boa heurística para identificar categorias).
+    if col_categoria is None:
+        for c in df.columns:
+            if c != col_valor and df[c].nunique() < len(df):
+                col_categoria = c
+                break
+    # Para empilhamento das colunas        
+    # Tenta encontrar uma coluna extra para servir como agrupador (como "raça", "sexo" etc.)
+    if col_grupo is None:
+        possible_groups = [c for c in df.columns if c not in [col_valor, col_categoria]]
+        if possible_groups:
+            col_grupo = possible_groups[0]
+        else:
+            col_grupo = None
+
+    # --- Preparar dados ---
+    # Se houver agrupamento (col_grupo): gráfico empilhado
+    if col_grupo:
+        # reorganiza os dados em formato de tabela dinâmica (linhas = categorias, colunas = grupos).
+        df_pivot = df.pivot_table(index=col_categoria, columns=col_grupo, values=col_valor, aggfunc='sum').fillna(0)
+        df_plot = df_pivot.copy()
+
+        # Para mostrar percentuais no centro das barras
+        # divide cada linha pelo total da linha para obter percentuais (100% por categoria).
+        percent_df = df_plot.div(df_plot.sum(axis=1), axis=0) * 100
+    else:
+        # Se não houver agrupamento: gráfico de barras simples
+        # Define df_plot com a categoria no índice.
+        df_plot = df[[col_categoria, col_valor]].copy()
+        df_plot.set_index(col_categoria, inplace=True)
+
+        # Se value_format == 'percent', calcula os percentuais a serem exibidos.
+        if value_format == 'percent':
+            if col_percent and col_percent in df.columns:
+                df_plot['display_value'] = df.set_index(col_categoria)[col_percent] * 100
+            else:
+                total = df_plot[col_valor].sum()
+                df_plot['display_value'] = (df_plot[col_valor] / total) * 100
+        else:
+            df_plot['display_value'] = df_plot[col_valor]
+
+    # --- Plotagem ---
+    fig, ax, criada = _eixo(ax, figsize=(10, 6))
+    df_plot.plot(kind=kind, stacked=bool(col_grupo),
+                 color=custom_colors[:len(df_plot.columns)], ax=ax)
+
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+    # --- Inserção de valores (um bar_label por container) ---
+    if show_values:
+        # Para gráfico empilhado
+        if col_grupo:
+            # ax.containers: grupos de barras no gráfico (um por coluna do pivot)
+            for bars, col in zip(ax.containers, df_plot.columns):
+                if value_format == 'percent':
+                    percent = percent_df[col].to_numpy(dtype=float)
+                    rotulos = _formatar(percent, percent > 0, '{:.1f}%')
+                else:
+                    absolutos = df_plot[col].to_numpy(dtype=float)
+                    rotulos = _formatar(np.nan_to_num(absolutos).astype(int), absolutos > 0, '{}')
+                _rotular_barras(ax, bars, rotulos)
+        else:
+            # Para gráfico simples
+            display_value = df_plot['display_value'].to_numpy(dtype=float)
+            todos = np.ones(len(display_value), dtype=bool)
+            if value_format == 'percent':
+                rotulos = _formatar(display_value, todos, '{:.1f}%')
+            else:
+                rotulos = _formatar(display_value.astype(int), todos, '{}')
+            _rotular_barras(ax, ax.containers[0], rotulos)
+
+    # --- Texto adicional opcional ---
+    if show_text:
+        ax.text(0.02, 0.3, NOTA_UNIDADES_MORADIA,
+                color='red', ha='left', va='bottom',
+                transform=fig.transFigure, wrap=True)
+
+    # --- Rotação dos rótulos ---
+    if not is_horizontal:
+        ax.tick_params(axis='x', labelrotation=xtick_rotation)
+
+    _finalizar(fig, criada, filename, mostrar, dpi=300, bbox_inches='tight')
+    if filename:
+        print(f"✅ Gráfico salvo como imagem: {filename}")
+    return ax
+# ----------------------------------------
+
+@etapa()
+@em_cache('filename')
+def plot_barh_contagens(data, title, xlabel, filename, color=['#4E79A7', '#F28E2B'], nota=True, mostrar=True,
+                        ax=None):
+    """Gera um gráfico de barras horizontal a partir de contagens (ex: value_counts()).
+    Parâmetros:
+    - data: DataFrame do pandas.
+    - title: string com o título da tabela.
+    - xlabel: string com a legenda eixo x
+    - filename: string com o caminho e nome do arquivo (ex: 'plots/exemplo.png ); None não salva.
+    - mostrar: se True, exibe o gráfico com plt.show()
+    - ax: Axes existente para desenhar (a figura não é fechada); se None, cria e fecha uma figura própria
+    """
+    fig, ax, criada = _eixo(ax)
+    data.plot(kind='barh', color=color, ax=ax)
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.set_title(title)
+    if nota:
+        ax.text(0.02, 0.3, NOTA_UNIDADES_MORADIA,
+                color='red', ha='left', va='bottom', wrap=True)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('')
+    _finalizar(fig, criada, filename, mostrar)
+    return ax
+
+# ----------------------------------------
+
+@etapa()
+@em_cache('filename')
+def plot_dias_por_profissao(data, filename, col_profissional='profissional', col_dias='Dias_por_mes',
+                            nota=True, mostrar=True, ax=None):
+    """
+    Média de dias trabalhados por mês de cada profissão (uma barra por profissão, na ordem alfabética).
+
+    Parâmetros:
+    - data: DataFrame de `extrair_profissionais` (uma linha por ILPI e profissão).
+    - filename: caminho do arquivo; None não salva.
+    - col_profissional, col_dias: colunas da profissão e dos dias por mês.
+    - mostrar: se True, exibe o gráfico com plt.show()
+    - ax: Axes existente para desenhar (a figura não é fechada); se None, cria e fecha uma figura própria
+
+    Exemplo de uso:
+    plot_dias_por_profissao(extrair_profissionais(df, mapeamento), '../plots/03_profissionais.png')
+    """
+    fig, ax, criada = _eixo(ax, figsize=(10, 6))
+    medias = data.groupby(col_profissional)[col_dias].mean()
+    ax.bar(medias.index.astype(str), medias.to_numpy(), color='#4E79A7')
+    ax.tick_params(axis='x', labelrotation=45)
+    for rotulo in ax.get_xticklabels():
+        rotulo.set_horizontalalignment('right')
+    if nota:
+        ax.text(0.02, 0.95, NOTA_UNIDADES_MORADIA, transform=ax.transAxes,
+                color='red', ha='left', va='bottom', wrap=True)
+    ax.set_xlabel('Profissão')
+    ax.set_ylabel('Dias por Mês')
+    ax.set_title('Dias Trabalhados por Mês por Profissão')
+    _finalizar(fig, criada, filename, mostrar)
+    return ax
+
+
+# ------------------------------
+# Idade dos residentes: pontos individuais ou visões agregadas em grande escala
+# ------------------------------
+
+# Acima deste número de residentes os gráficos de idade deixam de desenhar um ponto por residente
+LIMIAR_PONTOS = 5000
+
+# Largura (anos) das faixas do histograma de idade
+LARGURA_FAIXA_IDADE = 1
+
+
+def _modo_idade(n, modo, limiar, padrao_agregado):
+    if modo is not None:
+        return modo
+    return 'pontos' if n <= limiar else padrao_agregado
+
+
+def _faixas_idade(idades, bins=None):
+    """
+    Limites das faixas do histograma, sem descartar ninguém (a média conta todos):
+    - bins=None: faixas de LARGURA_FAIXA_IDADE anos do menor ao maior valor dos dados;
+    - bins informados: se houver idades fora deles, são acrescentadas faixas da mesma largura da
+      primeira/última até o menor/maior valor (cada idade fica na sua faixa real, nada é cortado).
+    """
+    if bins is None:
+        inicio, fim = (np.floor(idades.min()), idades.max()) if len(idades) else (60.0, 60.0)
+        # O último limite passa do maior valor (np.arange não inclui o final)
+        return np.arange(inicio, fim + LARGURA_FAIXA_IDADE * 1.5, LARGURA_FAIXA_IDADE)
+    bins = np.asarray(bins, dtype=float)
+    if not len(idades) or len(bins) < 2:
+        return bins
+    largura_inicio, largura_fim = bins[1] - bins[0], bins[-1] - bins[-2]
+    antes = np.ceil((bins[0] - idades.min()) / largura_inicio)
+    depois = np.ceil((idades.max() - bins[-1]) / largura_fim)
+    return np.concatenate([
+        bins[0] - largura_inicio * np.arange(max(antes, 0), 0, -1),
+        bins,
+        bins[-1] + largura_fim * np.arange(1, max(depois, 0) + 1),
+    ])
+
+
+@etapa()
+def plot_idade_com_media(idades, filename, limiar=LIMIAR_PONTOS, modo=None, bins=None,
+                         mostrar=True, ax=None):
+    """
+    Idade dos residentes com a linha de média.
+    Até `limiar` residentes desenha um ponto por residente (gráfico original); acima disso
+    desenha o histograma calculado antes do plot com `np.histogram` (número fixo de barras,
+    tempo de renderização e tamanho do arquivo não crescem com o número de residentes).
+
+    Parâmetros:
+    - idades: pd.Series/array com as idades.
+    - filename: caminho do arquivo (None não salva).
+    - limiar: número de residentes a partir do qual o gráfico é agregado.
+    - modo: 'pontos' ou 'histograma' (None escolhe pelo limiar).
+    - bins: limites das faixas do histograma (None: faixas de 1 ano do menor ao maior valor; idades
+      fora das faixas informadas ganham faixas extras da mesma largura, sem descartar residentes).
+    - mostrar: se True, exibe o gráfico com plt.show().
+    - ax: Axes existente para desenhar (a figura não é fechada).
+
+    Retorna:
+    - o Axes do gráfico.
+    """
+    idades = np.asarray(idades, dtype=float)
+    idades = idades[~np.isnan(idades)]
+    media_idade = round(idades.mean(), 1) if len(idades) else np.nan
+    modo = _modo_idade(len(idades), modo, limiar, 'histograma')
+
+    fig, ax, criada = _eixo(ax, figsize=(12, 6))
+    if modo == 'pontos':
+        ax.scatter(range(len(idades)), idades, color='gray', alpha=0.6, label='Residentes')
+        ax.axhline(y=media_idade, color='red', linestyle='--', linewidth=1.5, label=f'Média: {media_idade:.1f}')
+        ax.set_xlabel('Idade')
+        ax.set_ylabel('Idade')
+    elif modo == 'histograma':
+        contagens, limites = np.histogram(idades, bins=_faixas_idade(idades, bins))
+        ax.bar(limites[:-1], contagens, width=np.diff(limites), align='edge', color='gray', alpha=0.8,
+               label='Residentes')
+        ax.axvline(x=media_idade, color='red', linestyle='--', linewidth=1.5, label=f'Média: {media_idade:.1f}')
+        ax.set_xlabel('Idade')
+        ax.set_ylabel('Número de Residentes')
+    else:
+        raise ValueError(f"modo deve ser 'pontos' ou 'histograma', recebido: '{modo}'")
+
+    ax.set_title('Idade dos Residentes com Linha de Média')
+    ax.legend()
+    _finalizar(fig, criada, filename, mostrar, dpi=300, bbox_inches='tight')
+    return ax
+
+
+def resumo_boxplot(df, col_grupo, col_valor):
+    """
+    Estatísticas de boxplot por grupo calculadas de forma vetorizada (groupby), no formato
+    aceito por `Axes.bxp`: mediana, quartis e bigodes (menor/maior valor dentro de 1,5 x IQR).
+
+    Retorna:
+    - DataFrame indexado pelo grupo com 'med', 'q1', 'q3', 'whislo', 'whishi', 'mean' e 'n'.
+    """
+    grupos = df.groupby(col_grupo)[col_valor]
+    resumo = grupos.quantile([0.25, 0.5, 0.75]).unstack()
+    resumo.columns = ['q1', 'med', 'q3']
+    resumo['mean'] = grupos.mean()
+    resumo['n'] = grupos.size()
+
+    iqr = resumo['q3'] - resumo['q1']
+    limites = pd.DataFrame({'inferior': resumo['q1'] - 1.5 * iqr, 'superior': resumo['q3'] + 1.5 * iqr})
+    valores = df[[col_grupo, col_valor]].join(limites, on=col_grupo)
+    dentro = valores[valores[col_valor].between(valores['inferior'], valores['superior'])]
+    extremos = dentro.groupby(col_grupo)[col_valor].agg(['min', 'max'])
+    resumo['whislo'] = extremos['min']
+    resumo['whishi'] = extremos['max']
+    return resumo
+
+
+@etapa()
+def plot_idade_por_ilpi(df, filename, col_ilpi='institution_name', col_idade='elder_age',
+                        limiar=LIMIAR_PONTOS, modo=None, bins=None, mostrar=True, ax=None):
+    """
+    Idade dos residentes por ILPI com a média de cada ILPI destacada.
+    Até `limiar` residentes desenha um ponto por residente (gráfico original). Acima disso
+    usa uma visão agregada calculada antes do plot:
+    - 'boxplot' (padrão): quartis e bigodes por ILPI (`resumo_boxplot` + `Axes.bxp`);
+    - 'histograma': mapa de calor ILPI x faixa de idade (`np.histogram2d`).
+
+    Parâmetros:
+    - df: DataFrame com col_ilpi e col_idade.
+    - filename: caminho do arquivo (None não salva).
+    - limiar: número de residentes a partir do qual o gráfico é agregado.
+    - modo: 'pontos', 'boxplot' ou 'histograma' (None escolhe pelo limiar).
+    - bins: faixas de idade do modo 'histograma' (como em `plot_idade_com_media`).
+    - mostrar: se True, exibe o gráfico com plt.show().
+    - ax: Axes existente para desenhar (a figura não é fechada).
+
+    Retorna:
+    - o Axes do gráfico.
+    """
+    df_idade = df[[col_ilpi, col_idade]].dropna()
+    media_idade = df_idade.groupby(col_ilpi)[col_idade].mean()
+    modo = _modo_idade(len(df_idade), modo, limiar, 'boxplot')
+
+    fig, ax, criada = _eixo(ax, figsize=(12, 6))
+    if modo == 'pontos':
+        ilpis = sorted(df_idade[col_ilpi].unique())
+        ax.scatter(df_idade[col_ilpi], df_idade[col_idade], color='gray', alpha=0.6, label='Residentes')
+        ax.scatter(media_idade.index, media_idade.to_numpy(), color='red', s=100, marker='D', label='Média por ILPI')
+        ax.set_xticks(ilpis)
+    elif modo == 'boxplot':
+        resumo = resumo_boxplot(df_idade, col_ilpi, col_idade)
+        posicoes = np.arange(len(resumo))
+        estatisticas = [
+            {'label': str(ilpi), 'med': r.med, 'q1': r.q1, 'q3': r.q3, 'whislo': r.whislo, 'whishi': r.whishi,
+             'fliers': []}
+            for ilpi, r in resumo.iterrows()
+        ]
+        ax.bxp(estatisticas, positions=posicoes, showfliers=False, patch_artist=True,
+               boxprops={'facecolor': 'lightgray'}, medianprops={'color': 'black'})
+        ax.scatter(posicoes, resumo['mean'], color='red', s=100, marker='D', label='Média por ILPI', zorder=3)
+    elif modo == 'histograma':
+        codigos, ilpis = pd.factorize(df_idade[col_ilpi], sort=True)
+        idades = df_idade[col_idade].to_numpy(dtype=float)
+        limites = _faixas_idade(idades, bins)
+        contagens, _, limites = np.histogram2d(codigos, idades, bins=[np.arange(len(ilpis) + 1) - 0.5, limites])
+        malha = ax.pcolormesh(np.arange(len(ilpis) + 1) - 0.5, limites, contagens.T, cmap='Greys')
+        fig.colorbar(malha, ax=ax, label='Número de Residentes')
+        ax.scatter(np.arange(len(ilpis)), media_idade.reindex(ilpis).to_numpy(), color='red', s=100, marker='D',
+                   label='Média por ILPI', zorder=3)
+        ax.set_xticks(np.arange(len(ilpis)), [str(i) for i in ilpis])
+    else:
+        raise ValueError(f"modo deve ser 'pontos', 'boxplot' ou 'histograma', recebido: '{modo}'")
+
+    ax.set_xlabel('ILPI')
+    ax.set_ylabel('Idade dos Residentes')
+    ax.set_title('Idade dos Residentes por ILPI com Média Destacada')
+    ax.legend()
+    _finalizar(fig, criada, filename, mostrar, dpi=300, bbox_inches='tight')
+    return ax
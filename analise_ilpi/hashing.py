@@ -0,0 +1,75 @@
+import types
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Hash do conteúdo de entradas (DataFrames, parâmetros e código), usado pelos caches
+# (cache_figuras, memoizacao) e pelas assinaturas das tarefas
+# ------------------------------
+
+
+def atualizar_hash(h, valor):
+    """
+    Alimenta o hash `h` (ex: `hashlib.sha256()`) com o conteúdo de `valor`: DataFrames/Series
+    (colunas, dtypes e valores), arrays, dicts (em ordem estável), listas/tuplas, código e funções
+    Python (bytecode, constantes, nomes usados e closure); os demais valores entram pelo repr.
+
+    Parâmetros:
+    - h: objeto de hash com o método `update`.
+    - valor: valor a incluir.
+
+    Exemplo de uso:
+    h = hashlib.sha256()
+    atualizar_hash(h, {'df': df, 'regras': CONDICAO_CRITICA})
+    h.hexdigest()
+    """
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        h.update(type(valor).__name__.encode())
+        if isinstance(valor, pd.DataFrame):
+            h.update(repr(list(valor.columns)).encode())
+            h.update(repr(valor.dtypes.astype(str).tolist()).encode())
+        else:
+            h.update(repr((valor.name, str(valor.dtype))).encode())
+        h.update(repr(list(valor.index.names)).encode())
+        try:
+            h.update(pd.util.hash_pandas_object(valor, index=True).to_numpy().tobytes())
+        except TypeError:
+            # Células não hasheáveis (ex: listas)
+            h.update(repr(valor.to_dict()).encode())
+    elif isinstance(valor, np.ndarray):
+        h.update(repr((valor.dtype.str, valor.shape)).encode())
+        h.update(np.ascontiguousarray(valor).tobytes() if valor.dtype != object else repr(valor.tolist()).encode())
+    elif isinstance(valor, dict):
+        h.update(b'{')
+        for chave in sorted(valor, key=repr):
+            atualizar_hash(h, chave)
+            atualizar_hash(h, valor[chave])
+        h.update(b'}')
+    elif isinstance(valor, (list, tuple)):
+        h.update(b'[' if isinstance(valor, list) else b'(')
+        for item in valor:
+            atualizar_hash(h, item)
+        h.update(b']')
+    elif isinstance(valor, types.CodeType):
+        # Bytecode, constantes (incluindo o código de funções internas) e nomes usados: o bytecode só
+        # guarda índices, então `ax.set_xlabel` e `ax.set_ylabel` diferem apenas em co_names
+        h.update(valor.co_code)
+        atualizar_hash(h, valor.co_consts)
+        atualizar_hash(h, valor.co_names)
+    elif isinstance(valor, types.FunctionType):
+        # Funções Python (ex: as lambdas dos dicts de regras): nome, código, padrões e variáveis do closure
+        h.update(f'{valor.__module__}.{valor.__qualname__}'.encode())
+        atualizar_hash(h, valor.__code__)
+        atualizar_hash(h, valor.__defaults__)
+        for celula in valor.__closure__ or ():
+            try:
+                conteudo = celula.cell_contents
+            except ValueError:
+                conteudo = None
+            atualizar_hash(h, valor.__qualname__ if conteudo is valor else conteudo)
+    elif callable(valor):
+        h.update(f'{getattr(valor, "__module__", "")}.{getattr(valor, "__qualname__", repr(valor))}'.encode())
+    else:
+        h.update(repr(valor).encode())
+    h.update(b'|')
@@ -0,0 +1,269 @@
+import functools
+import json
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+# ------------------------------
+# Instrumentação opcional por etapa: tempo, CPU, pico de memória e número de linhas
+# ------------------------------
+
+# Defina ANALISE_ILPI_PERFIL=<pasta> para gravar o perfil das execuções do `analise-ilpi`
+VARIAVEL_PERFIL = 'ANALISE_ILPI_PERFIL'
+
+# Coletor ativo no processo (None: as etapas não medem nada)
+_coletor = None
+
+
+def _linhas(valor):
+    """Número de linhas de um DataFrame/Series (ou do primeiro de uma tupla), ou None."""
+    if isinstance(valor, tuple) and valor:
+        valor = valor[0]
+    if hasattr(valor, 'shape') and hasattr(valor, 'index'):
+        return len(valor)
+    return None
+
+
+class _Quadro:
+    """Etapa em andamento."""
+
+    __slots__ = ('nome', 'caminho', 'linhas_entrada', 'linhas_saida', 'inicio_wall', 'inicio_cpu',
+                 'inicio_memoria', 'pico_filhos', 'wall_filhos')
+
+    def __init__(self, nome, caminho, linhas_entrada):
+        self.nome = nome
+        self.caminho = caminho
+        self.linhas_entrada = linhas_entrada
+        self.linhas_saida = None
+        self.pico_filhos = 0
+        self.wall_filhos = 0.0
+
+    @property
+    def linhas(self):
+        return self.linhas_saida
+
+    @linhas.setter
+    def linhas(self, valor):
+        # Para uso com `with etapa(...) as e: e.linhas = len(df)`
+        self.linhas_saida = valor
+
+
+class Perfil:
+    """
+    Coleta as medições das etapas executadas enquanto está ativo (`with Perfil() as perfil:`).
+
+    Para cada etapa registra tempo de parede, tempo de CPU, pico de memória alocada pelo Python
+    (tracemalloc, acima do que já estava alocado no início da etapa) e número de linhas de
+    entrada/saída. Etapas aninhadas formam uma pilha (ex: 'report;genero;plot_barh').
+
+    Parâmetros:
+    - memoria: se False, não liga o tracemalloc (que deixa a execução mais lenta).
+
+    Exemplo de uso:
+    with Perfil() as perfil:
+        base = preparar_base_perfil(bruto)
+        with etapa('medicamentos') as e:
+            medicamentos = extrair_medicamentos(base)
+            e.linhas = len(medicamentos)
+    perfil.salvar('../output/perfil')
+    """
+
+    def __init__(self, memoria=True):
+        self.memoria = memoria
+        self.registros = []
+        self._pilha = []
+        self._anterior = None
+        self._iniciou_tracemalloc = False
+        self.inicio = None
+
+    def __enter__(self):
+        global _coletor
+        self._anterior, _coletor = _coletor, self
+        self.inicio = datetime.now().isoformat(timespec='seconds')
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+        return self
+
+    def __exit__(self, *excecao):
+        global _coletor
+        _coletor = self._anterior
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+
+    # --- medição ---
+
+    def _entrar(self, nome, linhas_entrada):
+        caminho = tuple(q.nome for q in self._pilha) + (nome,)
+        quadro = _Quadro(nome, caminho, linhas_entrada)
+        if self.memoria and tracemalloc.is_tracing():
+            atual, pico = tracemalloc.get_traced_memory()
+            if self._pilha:
+                # O reset abaixo apaga o pico da etapa externa; ele é guardado no quadro dela
+                self._pilha[-1].pico_filhos = max(self._pilha[-1].pico_filhos, pico)
+            tracemalloc.reset_peak()
+            quadro.inicio_memoria = atual
+        else:
+            quadro.inicio_memoria = None
+        self._pilha.append(quadro)
+        quadro.inicio_cpu = time.process_time()
+        quadro.inicio_wall = time.perf_counter()
+        return quadro
+
+    def _sair(self, quadro, erro=None):
+        wall = time.perf_counter() - quadro.inicio_wall
+        cpu = time.process_time() - quadro.inicio_cpu
+        self._pilha.pop()
+
+        pico = None
+        if quadro.inicio_memoria is not None and tracemalloc.is_tracing():
+            pico_absoluto = max(tracemalloc.get_traced_memory()[1], quadro.pico_filhos)
+            pico = max(pico_absoluto - quadro.inicio_memoria, 0)
+            if self._pilha:
+                self._pilha[-1].pico_filhos = max(self._pilha[-1].pico_filhos, pico_absoluto)
+        if self._pilha:
+            self._pilha[-1].wall_filhos += wall
+
+        self.registros.append({
+            'etapa': quadro.nome,
+            'pilha': ';'.join(quadro.caminho),
+            'wall_s': round(wall, 6),
+            'cpu_s': round(cpu, 6),
+            'proprio_s': round(max(wall - quadro.wall_filhos, 0.0), 6),
+            'pico_memoria_bytes': pico,
+            'linhas_entrada': quadro.linhas_entrada,
+            'linhas_saida': quadro.linhas_saida,
+            'pid': os.getpid(),
+            'erro': erro,
+        })
+
+    def incorporar(self, registros, prefixo=None):
+        """
+        Adiciona registros coletados em outro processo (ex: tarefas do GrafoTarefas), sob `prefixo`.
+        Sob a etapa em andamento (prefixo padrão), o tempo das etapas de primeiro nível incorporadas
+        sai do tempo próprio dela (até zerá-lo, já que tarefas paralelas podem somar mais que o tempo
+        de parede), como acontece com as etapas filhas do próprio processo.
+        """
+        atual = ';'.join(q.nome for q in self._pilha)
+        prefixo = prefixo or atual
+        for registro in registros:
+            registro = dict(registro)
+            if prefixo:
+                registro['pilha'] = f"{prefixo};{registro['pilha']}"
+            self.registros.append(registro)
+        if self._pilha and prefixo == atual:
+            self._pilha[-1].wall_filhos += sum(r['wall_s'] for r in registros if ';' not in r['pilha'])
+
+    # --- exportação ---
+
+    def resumo(self):
+        """Totais por etapa: chamadas, tempos somados, maior pico de memória e linhas."""
+        totais = {}
+        for r in self.registros:
+            t = totais.setdefault(r['etapa'], {'chamadas': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'proprio_s': 0.0,
+                                               'pico_memoria_bytes': None, 'linhas_saida': 0})
+            t['chamadas'] += 1
+            for chave in ('wall_s', 'cpu_s', 'proprio_s'):
+                t[chave] = round(t[chave] + r[chave], 6)
+            if r['pico_memoria_bytes'] is not None:
+                t['pico_memoria_bytes'] = max(t['pico_memoria_bytes'] or 0, r['pico_memoria_bytes'])
+            t['linhas_saida'] += r['linhas_saida'] or 0
+        return dict(sorted(totais.items(), key=lambda item: -item[1]['wall_s']))
+
+    def dados(self):
+        return {'inicio': self.inicio, 'resumo': self.resumo(), 'etapas': self.registros}
+
+    def pilhas_dobradas(self):
+        """
+        Perfil no formato de pilhas dobradas ('a;b;c <microssegundos>'), com o tempo próprio
+        de cada etapa; aceito por flamegraph.pl, speedscope e inferno.
+        """
+        totais = {}
+        for r in self.registros:
+            totais[r['pilha']] = totais.get(r['pilha'], 0) + int(round(r['proprio_s'] * 1e6))
+        return ''.join(f'{pilha} {micros}\n' for pilha, micros in sorted(totais.items()) if micros > 0)
+
+    def salvar(self, pasta, nome='perfil'):
+        """
+        Grava <nome>.json (etapas e resumo) e <nome>.folded (pilhas dobradas).
+
+        Retorna:
+        - (caminho do JSON, caminho do .folded)
+        """
+        os.makedirs(pasta, exist_ok=True)
+        caminho_json = os.path.join(pasta, f'{nome}.json')
+        caminho_pilhas = os.path.join(pasta, f'{nome}.folded')
+        with open(caminho_json, 'w', encoding='utf-8') as f:
+            json.dump(self.dados(), f, ensure_ascii=False, indent=1)
+        with open(caminho_pilhas, 'w', encoding='utf-8') as f:
+            f.write(self.pilhas_dobradas())
+        return caminho_json, caminho_pilhas
+
+
+def perfil_ativo():
+    """Coletor ativo neste processo, ou None."""
+    return _coletor
+
+
+class _Etapa:
+    """
+    Marca uma etapa medida pelo `Perfil` ativo; sem `Perfil` ativo não mede nada.
+    Pode ser usada como decorador (`@etapa()` ou `@etapa('nome')`) ou gerenciador de contexto.
+
+    Como decorador, as linhas de entrada são as do primeiro DataFrame/Series recebido e as
+    de saída, as do DataFrame/Series retornado (ou do primeiro item de uma tupla retornada).
+
+    Exemplo de uso:
+    @etapa()
+    def extrair_medicamentos(df):
+        ...
+
+    with etapa('graficos', linhas=len(df)):
+        ...
+    """
+
+    def __init__(self, nome, linhas):
+        self.nome = nome
+        self.linhas_entrada = linhas
+        self._quadros = []
+
+    def __enter__(self):
+        if _coletor is None:
+            quadro = _Quadro(self.nome, (), self.linhas_entrada)
+        else:
+            quadro = _coletor._entrar(self.nome, self.linhas_entrada)
+        self._quadros.append((_coletor, quadro))
+        return quadro
+
+    def __exit__(self, tipo, valor, rastro):
+        coletor, quadro = self._quadros.pop()
+        if coletor is not None:
+            coletor._sair(quadro, erro=None if tipo is None else f'{tipo.__name__}: {valor}')
+
+    def __call__(self, funcao):
+        nome = self.nome or funcao.__qualname__
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            coletor = _coletor
+            if coletor is None:
+                return funcao(*args, **kwargs)
+            entrada = next((n for n in map(_linhas, list(args) + list(kwargs.values())) if n is not None), None)
+            quadro = coletor._entrar(nome, entrada)
+            try:
+                resultado = funcao(*args, **kwargs)
+            except BaseException as erro:
+                coletor._sair(quadro, erro=f'{type(erro).__name__}: {erro}')
+                raise
+            quadro.linhas_saida = _linhas(resultado)
+            coletor._sair(quadro)
+            return resultado
+
+        return envoltorio
+
+
+def etapa(nome=None, linhas=None):
+    """Decorador/gerenciador de contexto de uma etapa (ver `_Etapa`)."""
+    return _Etapa(nome, linhas)
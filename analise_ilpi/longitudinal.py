@@ -0,0 +1,212 @@
+import hashlib
+import os
+
+import pandas as pd
+
+from .fragilidade import (
+    CONDICAO_ALERTA,
+    CONDICAO_ATENCAO,
+    CONDICAO_CRITICA,
+    ORDEM_PRIORIDADE,
+    nivel_risco_por_residente
+)
+
+# ------------------------------
+# Acompanhamento longitudinal dos residentes entre exportações (snapshots)
+# ------------------------------
+
+# Componentes de fragilidade acompanhados ao longo do tempo
+COLUNAS_ACOMPANHADAS = [
+    'institution_name', 'weight_loss', 'amount_weight_loss', 'elder_strenght', 'elder_hospitalized',
+    'elder_difficulties', 'elder_mobility', 'basic_activities_diffic', 'falls_number'
+]
+
+COLUNAS_ESTADO = ['id_residente', 'snapshot', 'hash'] + COLUNAS_ACOMPANHADAS + ['risco']
+COLUNAS_EVENTOS = ['id_residente', 'institution_name', 'snapshot', 'evento', 'de', 'para']
+
+# Código "nenhuma" de falls_number e elder_hospitalized (nunca gera evento)
+CODIGO_NENHUMA = 1
+
+# Variável de ambiente com o sal usado na pseudonimização do CPF
+VARIAVEL_SAL = 'VIDAEPAUTA_SAL_CPF'
+
+
+def pseudonimizar_cpf(serie, sal=None):
+    """
+    Substitui o CPF por um identificador irreversível (SHA-256 com sal), estável entre exportações.
+
+    Parâmetros:
+    - serie: pd.Series com os CPFs (com ou sem pontuação).
+    - sal: texto secreto; se None, usa a variável de ambiente VIDAEPAUTA_SAL_CPF.
+      É obrigatório: sem sal, o SHA-256 de um CPF (11 dígitos) é revertido por força bruta.
+
+    Retorna:
+    - pd.Series com os identificadores (NaN onde não há CPF).
+    """
+    sal = sal if sal is not None else os.environ.get(VARIAVEL_SAL, '')
+    if not sal:
+        raise ValueError(
+            f"Sal da pseudonimização do CPF não definido. Passe `sal=` ou defina a variável de ambiente {VARIAVEL_SAL}."
+        )
+    digitos = serie.astype('string').str.replace(r'\D', '', regex=True).str.zfill(11)
+    return digitos.map(
+        lambda cpf: hashlib.sha256(f'{sal}{cpf}'.encode()).hexdigest()[:16] if isinstance(cpf, str) and cpf.strip('0') else pd.NA
+    )
+
+
+def _estado_residentes(df, sal=None):
+    """
+    Uma linha por residente com os componentes de fragilidade do instrumento principal
+    (as linhas de medicamentos, com campos-chave vazios, são ignoradas).
+    """
+    if 'redcap_repeat_instrument' in df.columns:
+        df = df[df['redcap_repeat_instrument'].isna()]
+    estado = df[['cpf'] + COLUNAS_ACOMPANHADAS].copy()
+    estado.insert(0, 'id_residente', pseudonimizar_cpf(estado.pop('cpf'), sal))
+    estado = estado.dropna(subset=['id_residente']).drop_duplicates('id_residente', keep='last')
+    estado['hash'] = pd.util.hash_pandas_object(estado[COLUNAS_ACOMPANHADAS].apply(_normalizar), index=False).astype('uint64')
+    return estado.reset_index(drop=True)
+
+
+def _normalizar(serie):
+    """
+    Tipo fixo para o hash, que depende do dtype: valores numéricos viram Float64 (um residente novo
+    com NaN faria int64 virar float64 e mudaria o hash de todos) e os demais viram texto.
+    """
+    numerica = pd.to_numeric(serie, errors='coerce')
+    if numerica.isna().sum() == serie.isna().sum():
+        return numerica.astype('Float64')
+    return serie.astype('string')
+
+
+def _aumentou(antes, depois):
+    """Faixa aumentou entre dois valores conhecidos (um valor antes ausente não é um evento)."""
+    antes = pd.to_numeric(antes, errors='coerce').astype('Float64')
+    depois = pd.to_numeric(depois, errors='coerce').astype('Float64')
+    return antes.notna() & depois.notna() & (depois != CODIGO_NENHUMA) & (depois > antes)
+
+
+class HistoricoResidentes:
+    """
+    Histórico por residente (chave: CPF pseudonimizado) persistido em uma pasta com dois CSVs:
+    - estado.csv: último estado conhecido de cada residente;
+    - eventos.csv: eventos detectados em cada snapshot (transição de risco, novas quedas,
+      novas hospitalizações, perda de peso, novo residente).
+
+    A atualização é incremental: só os residentes novos ou cujos componentes mudaram desde o
+    último snapshot são reclassificados e comparados, em vez de recalcular o histórico inteiro.
+
+    O sal da pseudonimização (`sal=` ou a variável de ambiente VIDAEPAUTA_SAL_CPF) é obrigatório
+    e deve ser o mesmo em todas as atualizações.
+
+    Exemplo de uso:
+    historico = HistoricoResidentes('../../../data/SMSAp/historico', sal=os.environ['VIDAEPAUTA_SAL_CPF'])
+    eventos = historico.atualizar(df, snapshot='2025-06-24')
+    historico.transicoes_risco()
+    """
+
+    def __init__(self, pasta, sal=None, condicoes=(CONDICAO_CRITICA, CONDICAO_ALERTA, CONDICAO_ATENCAO)):
+        self.pasta = pasta
+        self.sal = sal
+        self.condicoes = condicoes
+        os.makedirs(pasta, exist_ok=True)
+        self.caminho_estado = os.path.join(pasta, 'estado.csv')
+        self.caminho_eventos = os.path.join(pasta, 'eventos.csv')
+
+        if os.path.exists(self.caminho_estado):
+            self.estado = pd.read_csv(self.caminho_estado, dtype={'id_residente': 'string', 'snapshot': 'string'})
+            self.estado['hash'] = self.estado['hash'].astype('uint64')
+        else:
+            self.estado = pd.DataFrame(columns=COLUNAS_ESTADO)
+
+    def eventos(self):
+        """Todos os eventos registrados até agora."""
+        if not os.path.exists(self.caminho_eventos):
+            return pd.DataFrame(columns=COLUNAS_EVENTOS)
+        return pd.read_csv(self.caminho_eventos, dtype={'id_residente': 'string', 'snapshot': 'string'})
+
+    def atualizar(self, df, snapshot):
+        """
+        Incorpora uma nova exportação ao histórico.
+
+        Parâmetros:
+        - df: base do perfil epidemiológico (após o ETL, com 'cpf' propagado).
+        - snapshot: identificação da exportação (ex: '2025-06-24').
+
+        Retorna:
+        - DataFrame com os eventos detectados neste snapshot.
+        """
+        snapshot = str(snapshot)
+        atual = _estado_residentes(df, self.sal)
+
+        anterior = self.estado.set_index('id_residente')
+        hash_anterior = atual['id_residente'].map(anterior['hash'])
+        alterados = atual[hash_anterior.isna() | (hash_anterior != atual['hash'])].copy()
+
+        if alterados.empty:
+            return pd.DataFrame(columns=COLUNAS_EVENTOS)
+
+        # Reclassifica apenas os residentes alterados
+        riscos = nivel_risco_por_residente(
+            alterados.rename(columns={'id_residente': 'cpf'}).assign(full_name=None), *self.condicoes
+        ).set_index('cpf')['risco']
+        alterados['risco'] = alterados['id_residente'].map(riscos)
+        alterados['snapshot'] = snapshot
+
+        antes = anterior.reindex(alterados['id_residente'])
+        antes.index = alterados.index
+        eventos = self._detectar_eventos(alterados, antes, snapshot)
+
+        # Atualiza o estado apenas das linhas alteradas
+        self.estado = pd.concat([
+            self.estado[~self.estado['id_residente'].isin(alterados['id_residente'])],
+            alterados[COLUNAS_ESTADO]
+        ], ignore_index=True)
+        self.estado.to_csv(self.caminho_estado, index=False)
+
+        if not eventos.empty:
+            eventos.to_csv(self.caminho_eventos, mode='a', index=False,
+                           header=not os.path.exists(self.caminho_eventos))
+        return eventos
+
+    def _detectar_eventos(self, alterados, antes, snapshot):
+        novo = antes['hash'].isna()
+        regras = [
+            ('novo_residente', novo, None, alterados['risco']),
+            ('transicao_risco', ~novo & (antes['risco'] != alterados['risco']),
+             antes['risco'], alterados['risco']),
+            # Códigos ordinais: aumento da faixa = novas quedas/hospitalizações
+            ('nova_queda', ~novo & _aumentou(antes['falls_number'], alterados['falls_number']),
+             antes['falls_number'], alterados['falls_number']),
+            ('nova_hospitalizacao', ~novo & _aumentou(antes['elder_hospitalized'], alterados['elder_hospitalized']),
+             antes['elder_hospitalized'], alterados['elder_hospitalized']),
+            ('perda_peso', ~novo & (alterados['weight_loss'] == 1) & (antes['weight_loss'] != 1),
+             antes['amount_weight_loss'], alterados['amount_weight_loss']),
+        ]
+
+        partes = []
+        for evento, mascara, de, para in regras:
+            mascara = mascara.fillna(False).astype(bool)
+            if not mascara.any():
+                continue
+            partes.append(pd.DataFrame({
+                'id_residente': alterados.loc[mascara, 'id_residente'],
+                'institution_name': alterados.loc[mascara, 'institution_name'],
+                'snapshot': snapshot,
+                'evento': evento,
+                'de': de[mascara] if de is not None else None,
+                'para': para[mascara],
+            }))
+        if not partes:
+            return pd.DataFrame(columns=COLUNAS_EVENTOS)
+        return pd.concat(partes, ignore_index=True)[COLUNAS_EVENTOS]
+
+    def transicoes_risco(self):
+        """Matriz de transições entre níveis de risco (linhas: de, colunas: para)."""
+        eventos = self.eventos()
+        transicoes = eventos[eventos['evento'] == 'transicao_risco']
+        ordem = sorted(ORDEM_PRIORIDADE, key=ORDEM_PRIORIDADE.get)
+        return (
+            pd.crosstab(transicoes['de'], transicoes['para'])
+            .reindex(index=ordem, columns=ordem, fill_value=0)
+        )
@@ -0,0 +1,258 @@
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import threading
+
+import pandas as pd
+
+from .cache_figuras import VARIAVEL_DESATIVAR
+from .hashing import atualizar_hash
+
+# ------------------------------
+# Memoização em disco das funções caras (ETL e extratores), pelo conteúdo das entradas
+# ------------------------------
+
+# Pasta padrão de `ativar_memoizacao`
+PASTA_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'analise_ilpi')
+
+# Tamanho máximo padrão da pasta; acima dele os resultados usados há mais tempo são apagados
+TAMANHO_MAXIMO = 2 * 1024 ** 3
+
+# Defina ANALISE_ILPI_MEMO=<pasta> para memoizar sem chamar `ativar_memoizacao`
+# (ANALISE_ILPI_SEM_CACHE=1 desliga a memoização, como o cache de figuras)
+VARIAVEL_MEMO = 'ANALISE_ILPI_MEMO'
+
+# Configuração ativa no processo: None ou (pasta, tamanho_maximo)
+_memoizacao = None
+
+# Serializa a limpeza da pasta entre threads do processo
+_trava = threading.Lock()
+
+# Tamanho estimado de cada pasta (bytes): uma contagem na primeira gravação do processo mais o
+# tamanho de cada arquivo gravado depois; a pasta só é percorrida de novo quando passa do máximo
+_tamanhos = {}
+
+
+def ativar_memoizacao(pasta=PASTA_PADRAO, tamanho_maximo=TAMANHO_MAXIMO):
+    """
+    Liga a memoização das funções decoradas com `memoizar` neste processo.
+
+    Parâmetros:
+    - pasta: pasta dos resultados (uma subpasta por função).
+    - tamanho_maximo: bytes que a pasta pode ocupar (None: sem limite).
+
+    Exemplo de uso:
+    ativar_memoizacao()
+    base = etl_df_redcap(bruto, CAMPOS_PROPAGADOS)   # 1ª vez: calcula e grava
+    base = etl_df_redcap(bruto, CAMPOS_PROPAGADOS)   # mesma entrada: lê do disco
+    """
+    global _memoizacao
+    _memoizacao = (pasta, tamanho_maximo)
+
+
+def desativar_memoizacao():
+    """Desliga a memoização ligada por `ativar_memoizacao` (os arquivos são mantidos)."""
+    global _memoizacao
+    _memoizacao = None
+
+
+def _configuracao():
+    """(pasta, tamanho_maximo) em uso, ou None se a memoização estiver desligada."""
+    if os.environ.get(VARIAVEL_DESATIVAR):
+        return None
+    if _memoizacao is not None:
+        return _memoizacao
+    pasta = os.environ.get(VARIAVEL_MEMO)
+    return (pasta, TAMANHO_MAXIMO) if pasta else None
+
+
+def _nome_funcao(funcao):
+    original = inspect.unwrap(funcao)
+    return f'{original.__module__}.{original.__qualname__}'
+
+
+def chave_memoizacao(funcao, argumentos):
+    """
+    Hash SHA-256 de uma chamada: função (nome e código), argumentos já com os valores padrão
+    (conteúdo dos DataFrames; dicts de regras em ordem estável, com o código das lambdas)
+    e versão do pandas.
+    """
+    h = hashlib.sha256()
+    original = inspect.unwrap(funcao)
+    h.update(_nome_funcao(funcao).encode())
+    codigo = getattr(original, '__code__', None)
+    if codigo is not None:
+        atualizar_hash(h, codigo)
+    atualizar_hash(h, argumentos)
+    h.update(pd.__version__.encode())
+    return h.hexdigest()
+
+
+def _ler(caminho):
+    """Resultado gravado em `caminho`, ou None se não existir (ou estiver corrompido)."""
+    try:
+        with open(caminho, 'rb') as f:
+            resultado = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Arquivo truncado ou de outra versão das bibliotecas: descarta e recalcula
+        os.remove(caminho)
+        return None
+    # Marca o uso: a limpeza apaga primeiro os arquivos com mtime mais antigo
+    os.utime(caminho)
+    return resultado
+
+
+def _gravar(caminho, resultado):
+    """Grava `resultado` em `caminho` (via arquivo temporário) e retorna o tamanho gravado, em bytes."""
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f'{caminho}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temporario, 'wb') as f:
+            pickle.dump((resultado,), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tamanho = f.tell()
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    return tamanho
+
+
+def _arquivos(pasta):
+    """(mtime, tamanho, caminho) de cada resultado gravado na pasta."""
+    arquivos = []
+    for raiz, _, nomes in os.walk(pasta):
+        for nome in nomes:
+            if nome.endswith('.pkl'):
+                caminho = os.path.join(raiz, nome)
+                try:
+                    estado = os.stat(caminho)
+                except FileNotFoundError:
+                    continue
+                arquivos.append((estado.st_mtime, estado.st_size, caminho))
+    return arquivos
+
+
+def _podar(pasta, tamanho_maximo):
+    """Como `podar`, retornando também o tamanho que sobrou na pasta."""
+    arquivos = _arquivos(pasta)
+    total = sum(tamanho for _, tamanho, _ in arquivos)
+    apagados = 0
+    for _, tamanho, caminho in sorted(arquivos):
+        if total <= tamanho_maximo:
+            break
+        try:
+            os.remove(caminho)
+        except FileNotFoundError:
+            pass
+        total -= tamanho
+        apagados += 1
+    return apagados, total
+
+
+def podar(pasta, tamanho_maximo):
+    """
+    Apaga os resultados usados há mais tempo (menor mtime) até a pasta caber em `tamanho_maximo`.
+
+    Retorna:
+    - número de arquivos apagados.
+    """
+    with _trava:
+        apagados, _tamanhos[os.path.abspath(pasta)] = _podar(pasta, tamanho_maximo)
+    return apagados
+
+
+def _registrar_gravacao(pasta, tamanho, tamanho_maximo):
+    """
+    Soma `tamanho` ao tamanho estimado da pasta e poda só quando ele passa de `tamanho_maximo`
+    (gravações de outros processos entram na próxima contagem).
+    """
+    chave = os.path.abspath(pasta)
+    with _trava:
+        if chave not in _tamanhos:
+            _tamanhos[chave] = sum(t for _, t, _ in _arquivos(pasta))
+        else:
+            _tamanhos[chave] += tamanho
+        if _tamanhos[chave] > tamanho_maximo:
+            _, _tamanhos[chave] = _podar(pasta, tamanho_maximo)
+
+
+def limpar_memoizacao(pasta=None, funcao=None):
+    """
+    Apaga os resultados memoizados.
+
+    Parâmetros:
+    - pasta: pasta da memoização (None: a ativa ou, sem nenhuma ativa, PASTA_PADRAO).
+    - funcao: apaga só os resultados desta função decorada (None: todos).
+    """
+    if pasta is None:
+        configuracao = _configuracao()
+        pasta = configuracao[0] if configuracao is not None else PASTA_PADRAO
+    if funcao is not None:
+        pasta = os.path.join(pasta, _nome_funcao(funcao))
+    shutil.rmtree(pasta, ignore_errors=True)
+    with _trava:
+        # A pasta (ou parte dela) foi apagada: recontar na próxima gravação
+        _tamanhos.clear()
+
+# ----------------------------------------
+
+def memoizar(ignorar=()):
+    """
+    Decorador que guarda em disco o resultado da função, indexado pelo hash do conteúdo das
+    entradas (`chave_memoizacao`): com os mesmos dados e parâmetros, a próxima chamada, inclusive
+    em outra sessão ou script, lê o resultado em vez de recalcular.
+
+    Só tem efeito com a memoização ligada (`ativar_memoizacao` ou ANALISE_ILPI_MEMO=<pasta>).
+    A chamada aceita `usar_cache=False` para recalcular (o novo resultado substitui o gravado);
+    `funcao.limpar()` apaga os resultados da função. Mudanças em funções auxiliares chamadas
+    pela função decorada não entram na chave; nesse caso use `limpar_memoizacao()`.
+
+    Só deve ser usado em funções cujo resultado depende apenas dos argumentos. Alterações que a
+    função faça nos objetos recebidos não acontecem quando o resultado vem do disco.
+
+    Parâmetros:
+    - ignorar: nomes de parâmetros que não alteram o resultado.
+
+    Exemplo de uso:
+    @etapa()
+    @memoizar()
+    def extrair_medicamentos(df):
+        ...
+    """
+    def decorador(funcao):
+        assinatura_funcao = inspect.signature(funcao)
+        nome = _nome_funcao(funcao)
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, usar_cache=True, **kwargs):
+            configuracao = _configuracao()
+            if configuracao is None:
+                return funcao(*args, **kwargs)
+            pasta, tamanho_maximo = configuracao
+
+            argumentos = assinatura_funcao.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            chave = chave_memoizacao(
+                funcao, {k: v for k, v in argumentos.arguments.items() if k not in ignorar}
+            )
+            caminho = os.path.join(pasta, nome, f'{chave}.pkl')
+            if usar_cache:
+                gravado = _ler(caminho)
+                if gravado is not None:
+                    return gravado[0]
+
+            resultado = funcao(*args, **kwargs)
+            tamanho = _gravar(caminho, resultado)
+            if tamanho_maximo is not None:
+                _registrar_gravacao(pasta, tamanho, tamanho_maximo)
+            return resultado
+
+        envoltorio.limpar = lambda pasta=None: limpar_memoizacao(pasta, envoltorio)
+        return envoltorio
+    return decorador
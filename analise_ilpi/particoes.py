@@ -0,0 +1,155 @@
+import os
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from .consulta import ler_fonte
+
+# ------------------------------
+# Base particionada no estilo Hive: municipality=/ilpi=/snapshot=
+# ------------------------------
+
+CHAVES_PARTICAO = ('municipality', 'ilpi', 'snapshot')
+
+# Nomes de colunas dos surveys aceitos como filtro de partição
+ALIASES_PARTICAO = {
+    'institution_name': 'ilpi',
+    'municipio': 'municipality',
+    'municipality': 'municipality',
+    'ilpi': 'ilpi',
+    'snapshot': 'snapshot',
+}
+
+# Pasta das linhas sem valor na chave (mesmo nome usado pelo Hive/Spark/pyarrow)
+PARTICAO_NULA = '__HIVE_DEFAULT_PARTITION__'
+
+
+def _valor_particao(valor):
+    """Padroniza o valor usado no nome da pasta (2.0 -> '2'; vazio -> PARTICAO_NULA)."""
+    if pd.isna(valor):
+        return PARTICAO_NULA
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    return quote(str(valor).strip(), safe='')
+
+
+def gravar_particionado(df, raiz, municipio, snapshot, col_ilpi='institution_name',
+                        formato='csv', sep=';'):
+    """
+    Grava a base em pastas raiz/municipality=<m>/ilpi=<i>/snapshot=<s>/, um arquivo por ILPI.
+    Linhas sem ILPI ou município vão para a partição `PARTICAO_NULA` (nenhuma linha é descartada).
+
+    Parâmetros:
+    - df: DataFrame (ex: base_perfil_epidemiologico já tratada pelo ETL).
+    - raiz: pasta raiz da base particionada.
+    - municipio: nome do município ou nome de uma coluna do df com o município.
+    - snapshot: identificação da exportação (ex: '2025-06-24').
+    - col_ilpi: coluna da ILPI.
+    - formato: 'csv' ou 'parquet' (parquet exige pyarrow).
+    - sep: separador do CSV.
+
+    Retorna:
+    - lista com os caminhos gravados.
+    """
+    if formato not in ('csv', 'parquet'):
+        raise ValueError("formato deve ser 'csv' ou 'parquet'")
+
+    municipios = df[municipio] if municipio in df.columns else pd.Series(municipio, index=df.index)
+    caminhos = []
+    for (mun, ilpi), grupo in df.groupby([municipios, df[col_ilpi]], sort=True, dropna=False):
+        pasta = os.path.join(
+            raiz,
+            f'municipality={_valor_particao(mun)}',
+            f'ilpi={_valor_particao(ilpi)}',
+            f'snapshot={_valor_particao(snapshot)}'
+        )
+        os.makedirs(pasta, exist_ok=True)
+        caminho = os.path.join(pasta, f'part-0.{formato}')
+        if formato == 'csv':
+            grupo.to_csv(caminho, index=False, sep=sep)
+        else:
+            grupo.to_parquet(caminho, index=False)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def listar_particoes(raiz):
+    """
+    Lista as partições existentes a partir dos nomes das pastas, sem abrir os arquivos.
+
+    Retorna:
+    - DataFrame com 'municipality', 'ilpi', 'snapshot' e 'caminho'.
+    """
+    registros = []
+    for pasta, _, arquivos in os.walk(raiz):
+        chaves = {}
+        for parte in os.path.relpath(pasta, raiz).split(os.sep):
+            if '=' in parte:
+                chave, valor = parte.split('=', 1)
+                chaves[chave] = unquote(valor)
+        if set(CHAVES_PARTICAO) - set(chaves):
+            continue
+        for arquivo in sorted(arquivos):
+            if arquivo.endswith(('.csv', '.parquet')):
+                registros.append({**chaves, 'caminho': os.path.join(pasta, arquivo)})
+    return pd.DataFrame(registros, columns=list(CHAVES_PARTICAO) + ['caminho'])
+
+
+def podar_particoes(particoes, filtros):
+    """
+    Mantém apenas as partições compatíveis com os filtros.
+
+    Parâmetros:
+    - particoes: DataFrame de `listar_particoes`.
+    - filtros: dict {chave: valor ou lista de valores}. Aceita 'institution_name' como 'ilpi'
+      e snapshot='ultimo' para a exportação mais recente de cada ILPI.
+
+    Retorna:
+    - DataFrame de partições filtrado.
+    """
+    for chave, valor in (filtros or {}).items():
+        if chave not in ALIASES_PARTICAO:
+            raise KeyError(f"'{chave}' não é uma chave de partição: {sorted(ALIASES_PARTICAO)}")
+        chave = ALIASES_PARTICAO[chave]
+        if chave == 'snapshot' and valor == 'ultimo':
+            ultimo = particoes.groupby(['municipality', 'ilpi'])['snapshot'].transform('max')
+            particoes = particoes[particoes['snapshot'] == ultimo]
+            continue
+        valores = valor if isinstance(valor, (list, tuple, set)) else [valor]
+        particoes = particoes[particoes[chave].isin([unquote(_valor_particao(v)) for v in valores])]
+    return particoes
+
+
+def ler_particionado(raiz, filtros=None, colunas=None, sep=';', incluir_chaves=True):
+    """
+    Lê somente as partições selecionadas pelos filtros (poda de partições).
+    Um relatório de uma ILPI lê apenas a pasta dessa ILPI.
+
+    Parâmetros:
+    - raiz: pasta raiz da base particionada.
+    - filtros: dict de filtros de partição (ver `podar_particoes`).
+    - colunas: colunas a ler (None = todas).
+    - sep: separador dos CSVs.
+    - incluir_chaves: se True, adiciona as colunas 'municipality' e 'snapshot'.
+
+    Retorna:
+    - DataFrame com as linhas das partições selecionadas.
+
+    Exemplo de uso:
+    df_ilpi = ler_particionado('../../../data/particionado', {'institution_name': 2, 'snapshot': 'ultimo'})
+    """
+    particoes = podar_particoes(listar_particoes(raiz), filtros)
+
+    partes = []
+    for particao in particoes.itertuples(index=False):
+        parte = ler_fonte(particao.caminho, sep=sep, colunas=colunas)
+        if incluir_chaves:
+            parte = parte.assign(**{
+                chave: None if getattr(particao, chave) == PARTICAO_NULA else getattr(particao, chave)
+                for chave in ('municipality', 'snapshot')
+            })
+        partes.append(parte)
+
+    if not partes:
+        return pd.DataFrame(columns=list(colunas or []))
+    return pd.concat(partes, ignore_index=True)
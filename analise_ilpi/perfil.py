@@ -0,0 +1,286 @@
+import numpy as np
+import pandas as pd
+
+from .esparso import densificar, linhas_marcadas
+from .familias import RegistroFamilias
+from .instrumentacao import etapa
+from .memoizacao import memoizar
+
+# ------------------------------
+# Funções de Processamento do perfil epidemiológico (SMSAp)
+# ------------------------------
+
+def processa_uma_variavel(df, colunas_dict):
+    """
+    Extrai e renomeia colunas de um DataFrame.
+
+    Parâmetros:
+    - df: DataFrame original.
+    - colunas_dict: dicionário com colunas originais como chave e novo nome como valor.
+
+    Retorna:
+    - Um novo DataFrame com as colunas renomeadas.
+    """
+    return df[list(colunas_dict.keys())].rename(columns=colunas_dict)
+
+# ----------------------------------------
+
+def processa_binario(df, coluna, legenda, rename_dict):
+    """
+    Processa variáveis binárias para análise.
+
+    Parâmetros:
+    - df: Data Frame
+    - coluna: coluna da variável
+    - legenda: str, nome da nova coluna de saída
+    - rename_dict: dict, ex: {1: 'Sim', 0: 'Não'}
+    
+    Exemplo de uso:
+    tabela_camas = processa_binario(
+        df,
+        'residents_bedroom',
+        'Camas segundo a Norma',
+        rename_dict)
+    """
+    temp = (df[['institution_name', coluna]]
+                # Cria uma coluna cujo nome é o valor da variável legenda 
+                # populacionando com o mapeamento
+                .assign(**{legenda: df[coluna].map(rename_dict)}) 
+                .rename(columns={'institution_name': 'ILPI'})
+                .drop(columns=coluna)
+                )
+    return temp
+
+# ----------------------------------------
+
+def processa_uma_variavel_com_opcoes(df, coluna_original, nome_saida, mapa_valores):
+    """
+    Processa códigos inteiros para uma string descritiva (concatenada) com base em um dicionário de mapeamento.
+
+    Parâmetros:
+    - df: DataFrame original.
+    - coluna_original: str, nome da coluna com códigos.
+    - nome_saida: str, nome da nova coluna de saída.
+    - mapa_valores: dict, mapeamento de código -> texto.
+
+    Retorna:
+    - DataFrame com 'ILPI' e a nova coluna.
+    """
+    temp = df[["institution_name", coluna_original]].copy()
+    
+    # Concatena textos com base nos valores
+    def construir_texto(valor):
+        partes = [txt for cod, txt in mapa_valores.items() if valor == cod]
+        return ', '.join(partes) if partes else 'Não informado'
+    
+    temp[nome_saida] = temp[coluna_original].map(construir_texto)
+    temp = temp.rename(columns={"institution_name": "ILPI"})[["ILPI", nome_saida]]
+    
+    return temp
+
+# ----------------------------------------
+@etapa()
+def processa_multiresposta(df, colunas_dict, legenda):
+    """
+    Processa variáveis de múltiplas respostas (checkbox), criando uma nova coluna com
+    descrições combinadas, e remove linhas sem nenhuma seleção.
+
+    Parâmetros:
+    -----------
+    df : pd.DataFrame
+        O DataFrame contendo os dados originais com variáveis de múltiplas respostas.
+    colunas_dict : dict
+        Um dicionário onde as chaves são nomes de colunas de checkbox e os valores são
+        as descrições associadas a cada resposta.
+    legenda : str
+        Nome da nova coluna que irá conter a descrição concatenada das respostas.
+
+    Retorno:
+    --------
+    pd.DataFrame
+        Um novo DataFrame com as colunas 'ILPI' e a nova coluna de legenda,
+        sem linhas onde nenhuma resposta foi marcada (ou seja, todas eram 0).
+    """
+
+    # Cria nova coluna com as descrições concatenadas
+    # (família de checkbox convertida de uma vez; marcadas = valor 1)
+    colunas = [col for col in colunas_dict if col in df.columns]
+    marcadas = RegistroFamilias(df, {legenda: colunas}, checkbox=False).bloco(legenda) == 1
+    descricoes = np.array([colunas_dict[col] for col in colunas], dtype=object)
+    df[legenda] = [', '.join(descricoes[linha]) if linha.any() else np.nan for linha in marcadas]
+
+    # Seleciona apenas as colunas relevantes
+    resultado = df[['institution_name', legenda]].rename(columns={'institution_name': 'ILPI'})
+
+    # Remove linhas onde a nova coluna é NaN
+    resultado = resultado.dropna(subset=[legenda])
+
+    return resultado
+
+# ----------------------------------------
+
+@etapa()
+@memoizar()
+def extrair_morbidades(df, morbidade_dict, nome_coluna_soma=None):
+    """
+    Filtra e retorna os dados de morbidades legíveis,
+    agrupados por institution_name, full_name, cpf.
+    A coluna 'other_morbidities' é normalizada (minúsculas, sem espaços),
+    separando múltiplas entradas por vírgula, ponto e vírgula ou barra vertical.
+    Soma final inclui morbidades binárias + textuais distintas.
+
+    Parâmetros:
+    - df: DataFrame.
+    - morbidade_dict: dict, mapeamento de código -> texto.
+    - nome_coluna_soma: str, nome da coluna soma (Se None, usa 'soma_morbidities').
+
+    Retorna:
+    - DataFrame com as morbidades processadas, incluindo:
+      - 'Morbidades': lista de morbidades binárias e textuais.
+      - 'other_morbidities': morbidades textuais normalizadas.
+      - 'soma_morbidities': soma total de morbidades (binárias + textuais).
+    """
+
+    import re
+
+    morbidities_cols = list(morbidade_dict.keys())
+    #df[morbidities_cols] = df[morbidities_cols].apply(pd.to_numeric, errors='coerce')
+
+    # Propaga em uma cópia: o DataFrame recebido não é alterado (a função é memoizada)
+    campos_para_propagacao = ['institution_name', 'full_name', 'cpf']
+    df = df.assign(**{campo: df[campo].ffill() for campo in campos_para_propagacao})
+
+    # Inclui linhas que tenham morbidades binárias OU outras textuais
+    # (colunas esparsas só são densificadas nas linhas filtradas)
+    df_filtrado = densificar(df[linhas_marcadas(df, morbidities_cols) | df['other_morbidities'].notna()])
+
+    if nome_coluna_soma is None:
+        nome_coluna_soma = 'soma_morbidities'
+
+    # Morbidades binárias marcadas (valor 1), sobre o bloco numérico da família
+    registro = RegistroFamilias(df_filtrado, {'morbidades': morbidities_cols}, checkbox=False)
+    df_filtrado['soma_binarias'] = registro.contagem('morbidades')
+
+    nomes = np.array([morbidade_dict[col] for col in morbidities_cols], dtype=object)
+    df_filtrado['Morbidades'] = [', '.join(nomes[linha]) for linha in registro.bloco('morbidades') == 1]
+
+    # Padroniza a coluna 'other_morbidities'
+    df_filtrado['other_morbidities'] = (
+        df_filtrado['other_morbidities']
+        .fillna('')
+        .astype(str)
+        .str.lower()
+        .replace('nan', '')
+    )
+
+    # Agrupamento
+    df_resultado = df_filtrado.groupby(['institution_name', 'full_name', 'cpf'], as_index=False).agg({
+        'Morbidades': lambda x: ', '.join(sorted(set(', '.join(x).split(', ')))),
+        'other_morbidities': lambda x: ', '.join(sorted(set(filter(None, map(str.strip, x))))),
+        'soma_binarias': 'sum'
+    })
+
+    # Conta as morbidades textuais, com separadores: , ; |
+    def contar_textuais(texto):
+        if not texto:
+            return 0
+        itens = re.split(r'[;,|]', texto)  # divide por vírgula, ponto e vírgula ou barra vertical
+        return len([item.strip() for item in itens if item.strip()])
+
+    df_resultado['soma_other'] = df_resultado['other_morbidities'].apply(contar_textuais)
+    df_resultado[nome_coluna_soma] = df_resultado['soma_binarias'] + df_resultado['soma_other']
+
+    # Limpa colunas auxiliares
+    df_resultado = df_resultado.drop(columns=['soma_binarias', 'soma_other'])
+    df_resultado = df_resultado.sort_values(by=['institution_name', 'full_name', 'cpf'])
+
+    return df_resultado
+
+# ----------------------------------------
+
+# Frequência das tomadas (taken_daily)
+TOMADAS_DIA = {
+    "1": "1 x ao dia",
+    "2": "2 x ao dia",
+    "3": "3 x ao dia",
+    "4": "4 x ao dia",
+    "5": "semanalmente",
+    "6": "mensalmente",
+    "7": "quinzenalmente"
+}
+
+# Família combination_: (medicamento, dose) de cada combinação; a dose da 1ª não tem sufixo
+PARES_COMBINACAO = [('combination_1', 'combination_dosage')] + [
+    (f'combination_{i}', f'combination_dosage_{i}') for i in range(2, 7)
+]
+
+
+def _tomadas_ao_dia(valor):
+    if pd.isnull(valor):
+        return None
+    chave = str(int(valor)) if not isinstance(valor, str) else valor.strip()
+    return TOMADAS_DIA.get(chave)
+
+
+@etapa()
+@memoizar()
+def extrair_medicamentos(df):
+    """
+    Extrai os medicamentos usados por residente, incluindo combinações, com colunas:
+    med_name, dosage, taken_daily. Cada linha representa 1 medicamento.
+    """
+    # Filtra apenas registros do instrumento medicamentos_em_uso
+    df_meds = df[df['redcap_repeat_instrument'] == 'medicamentos_em_uso'].copy()
+
+    # Propaga os campos-chave
+    campos_chave = ['institution_name', 'full_name', 'cpf']
+    for campo in campos_chave:
+        if df_meds[campo].dtype == object:
+            df_meds[campo] = df_meds[campo].ffill().str.upper()
+        else:
+            df_meds[campo] = df_meds[campo].ffill()
+
+    # Medicamento principal e combinações em formato longo: um bloco por par (nome, dose),
+    # na ordem (linha, posição do par) em que eram listados
+    partes = []
+    for posicao, (coluna_nome, coluna_dose) in enumerate([('med_name', 'dosage'), *PARES_COMBINACAO]):
+        if coluna_nome not in df_meds:
+            continue
+        nomes = df_meds[coluna_nome]
+        texto = nomes.astype(str).str.strip()
+        validos = (nomes.notna() & (texto != '')).to_numpy()
+
+        parte = df_meds.loc[validos, campos_chave].reset_index(drop=True)
+        parte['med_name'] = texto[validos].str.lower().to_numpy()
+        parte['dosage'] = df_meds.loc[validos, coluna_dose].to_numpy() if coluna_dose in df_meds else None
+        if coluna_nome == 'med_name' and 'taken_daily' in df_meds:
+            parte['taken_daily'] = df_meds.loc[validos, 'taken_daily'].map(_tomadas_ao_dia).to_numpy()
+        else:
+            parte['taken_daily'] = None
+        parte['_linha'] = np.flatnonzero(validos)
+        parte['_posicao'] = posicao
+        partes.append(parte)
+
+    # Cria DataFrame final
+    df_resultado = (
+        pd.concat(partes, ignore_index=True)
+        .sort_values(['_linha', '_posicao'], kind='stable')
+        .drop(columns=['_linha', '_posicao'])
+        .reset_index(drop=True)
+        .infer_objects()
+    )
+
+    # Ordena para melhor leitura
+    df_resultado = df_resultado.sort_values(by=['institution_name', 'full_name', 'cpf'])
+
+    # Renomear colunas
+    df_resultado = df_resultado.rename(columns={
+        "institution_name": "ILPI",
+        "full_name": "Nome Completo",	
+        "cpf": "CPF",	
+        "med_name": "Medicamento",	
+        "dosage": "Dose",	
+        "taken_daily": "Tomadas ao dia"
+    })
+
+    return df_resultado
@@ -0,0 +1,415 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .core import extrair_profissionais
+from .equipe import MAPEAMENTO_PROFISSIONAIS, tabela_equipe, verificar_razoes
+from .familias import RegistroFamilias, criar_df_com_soma_por_prefixo
+from .geoespacial import separar_unidades
+from .graficos import plot_barh_contagens, plot_dias_por_profissao
+from .perfil import processa_binario, processa_uma_variavel, processa_uma_variavel_com_opcoes
+from .relatorio_perfil import carregar_base
+from .tabelas import salvar_tabela_como_imagem
+from .tarefas import GrafoTarefas
+
+# ------------------------------
+# Seções do monitoramento das ILPIs (UFG, uma linha por ILPI) como tarefas do GrafoTarefas
+# ------------------------------
+
+SIM_NAO = {1: 'Sim', 2: 'Não'}
+
+FREQUENCIA = {1: 'diário', 2: 'semanal', 3: 'quinzenal', 4: 'mensal'}
+
+ACESSIBILIDADE = ['Portas largas para cadeirante', 'Rampas', 'Corrimão para apoio']
+
+
+def _binaria(nome, coluna, legenda, tabela, grafico, titulo, xlabel='ILPI', titulo_tabela=None):
+    return {'nome': nome, 'tipo': 'binaria', 'coluna': coluna, 'legenda': legenda, 'tabela': tabela,
+            'grafico': grafico, 'titulo': titulo, 'xlabel': xlabel, 'titulo_tabela': titulo_tabela}
+
+
+def _opcoes(nome, coluna, legenda, mapa, tabela, grafico, titulo, xlabel='ILPI'):
+    return {'nome': nome, 'tipo': 'opcoes', 'coluna': coluna, 'legenda': legenda, 'mapa': mapa,
+            'tabela': tabela, 'grafico': grafico, 'titulo': titulo, 'xlabel': xlabel, 'titulo_tabela': None}
+
+
+def _checkbox(nome, prefixo, opcoes, legenda, tabela, grafico, titulo, xlabel='ILPI', titulo_tabela=None):
+    mapa = {f'{prefixo}{i}': texto for i, texto in enumerate(opcoes, start=1)}
+    return {'nome': nome, 'tipo': 'checkbox', 'mapa': mapa, 'legenda': legenda, 'tabela': tabela,
+            'grafico': grafico, 'titulo': titulo, 'xlabel': xlabel, 'titulo_tabela': titulo_tabela}
+
+
+def _texto(nome, coluna, legenda, tabela, grafico, titulo, xlabel='ILPI'):
+    return {'nome': nome, 'tipo': 'texto', 'coluna': coluna, 'legenda': legenda, 'tabela': tabela,
+            'grafico': grafico, 'titulo': titulo, 'xlabel': xlabel, 'titulo_tabela': None}
+
+
+# Perguntas de cada seção: uma tabela (ILPI x resposta) e um gráfico de contagem das respostas
+QUESTOES = {
+    'estrutura': [
+        _binaria('camas', 'residents_bedroom', 'Camas segundo a Norma?', '01_tabela_camas.png',
+                 '01_tabela_cama.png', 'Distribuição de Camas segundo a Norma', xlabel='ILPIs',
+                 titulo_tabela='Camas segundo a Norma nas ILPIs'),
+        _binaria('veiculo', 'vehicle', 'Existe veículo à disposição?', '02_tabela_veiculo.png',
+                 '02_veiculo.png', 'Existe veículo à disposição nas ILPIs', xlabel='ILPIs',
+                 titulo_tabela='Existe veículo à disposição da ILPI?'),
+    ],
+    'profissionais': [
+        _checkbox('vinculo', 'employment_relatioship___', ['CLT', 'Contrato', 'Voluntário'],
+                  'Vinculo_empregaticio', '04_tabela_vinculo.png', '04_vinculo_empreg.png',
+                  'Vínculo Empregatício dos Profissionais das ILPIs', xlabel='ILPIs',
+                  titulo_tabela='Vínculo Empregatício dos Profissionais das ILPIs?'),
+    ],
+    'reabilitacao': [
+        _checkbox('plano', 'physio_program___',
+                  ['Melhoria do tônus muscular', 'Equilíbrio funcionalidade motora',
+                   'Bem-estar geral com indicação do destinatário', 'Não existe plano'],
+                  'Plano_Reabilitacao', '05_tab_plano_reab.png', '05_plano_reabilitacao.png',
+                  'Plano/programa semanal de atividade física e reabilitação funcional', xlabel='ILPIs',
+                  titulo_tabela='Plano/programa semanal de atividade física e reabilitação funcional'),
+        _binaria('instr_fisio', 'physio_instructions', 'Instrucao_fisioterapeuta', '06_tab_instr_fisio.png',
+                 '06_instrucao_fisioterapeuta.png', 'Instruções do fisioterapeuta ao cuidador está documentada?',
+                 xlabel='ILPIs'),
+    ],
+    'seguranca': [
+        _binaria('sist_seg', 'secutiry_system', 'Sistemas_segurança', '07_tab_sist_seg.png',
+                 '07_sistema_seguranca.png', 'Existe Sistema de Segurança na ILPI?', xlabel='ILPIs'),
+        _checkbox('tipos_sist', 'security_device_type___',
+                  ['Alarme (incêndio/violação)', 'Câmeras internas', 'Câmeras externas',
+                   'Segurança (indivíduo)', 'Segurança armada (indivíduo)'],
+                  'Tipos_Sist_Seguranca', '08_tab_tipos_sist_seg.png', '08_tipos_sist_seg.png',
+                  'Contagem por Tipo de Sistema de Segurança', xlabel='ILPIs'),
+        _binaria('disp_chamada', 'safety_device_availability', 'Disponibilidade_disp_chamada',
+                 '09_tab_disp_chamada.png', '09_disp_chamada.png',
+                 'Dispositivo/mecanismo (digital/analógico) de chamada', xlabel='ILPIs'),
+        _binaria('iluminacao', 'lighting', 'Iluminacao_adequada', '10_tab_iluminacao.png', '10_iluminacao.png',
+                 'A iluminação é adequada?', xlabel='ILPIs'),
+        _binaria('ventilacao', 'ventilation', 'ventilacao_adequada', '11_tab_ventilacao.png', '11_ventilacao.png',
+                 'A ventilação é adequada?', xlabel='ILPIs'),
+        _binaria('pintura_quartos', 'painting_color', 'pintura_tons_pastel', '12_tab_pintura.png',
+                 '12_pintura.png', 'Quartos pintados em tons pastel'),
+    ],
+    'acessibilidade': [
+        _checkbox('acessib_quarto', 'room_access___', ACESSIBILIDADE, 'Acessibildade_quarto',
+                  '13_tab_acessib_quarto.png', '13_acessib_quarto.png',
+                  'Tipo de acessibilidade ao quarto do residente', xlabel='ILPIs'),
+        _checkbox('acessib_banheiro', 'bathroom_access___', ACESSIBILIDADE, 'Acessibildade_banheiro',
+                  '14_tab_acessib_banheiro.png', '14_acessib_banheiro.png',
+                  'Tipo de acessibilidade ao banheiro do residente', xlabel='ILPIs'),
+        _checkbox('acessib_refeitorio', 'cafeteria___', ACESSIBILIDADE, 'Acessibildade_refeitorio',
+                  '15_tab_acessib_refeitorio.png', '15_acessib_refeitorio.png',
+                  'Tipo de acessibilidade ao refeitorio do residente', xlabel='ILPIs'),
+        _checkbox('acessib_outras_areas', 'other_areas___', ACESSIBILIDADE, 'Acessibildade_outras_areas',
+                  '16_tab_acessib_outras_areas.png', '16_acessib_outras_areas.png',
+                  'Tipo de acessibilidade ao outras_areas do residente', xlabel='ILPIs'),
+        _binaria('uso_epi', 'epi_use', 'Uso_equip_seguranca', '17_tab_uso_epi.png', '17_uso_epi.png',
+                 'Uso de Equipamentos de Segurança'),
+    ],
+    'medicamentos': [
+        _binaria('medic_prazo_val', 'medication_val_date', 'Medicamento_prazo_validade',
+                 '18_tab_medic_prazo.png', '18_medic_prazo.png', 'Medicamento dentro do prazo de validade'),
+        _binaria('emb_viol', 'violeted_pakage', 'Embalagem_violada', '19_tab_medic_emb_violada.png',
+                 '19_medic_emb_violada.png', 'Medicação com embalagem violada'),
+        _binaria('geladeira_medic', 'medicine_refrigerator', 'Geladeira_exclusiva_medicamento',
+                 '20_tab_geladeira.png', '20_geladeira.png', 'Geladeira exclusiva para medicamentos'),
+        _binaria('reg_temp_geladeira', 'refrigerator_temp_log', 'Registro_temperatura_geladeira',
+                 '21_tab_reg_temp_geladeira.png', '21_reg_temp_geladeira.png',
+                 'Registro controle de temperatura da geladeira'),
+        _binaria('reg_medic', 'medication_register', 'Registro_uso_medicacao', '22_tab_reg_uso_medicamento.png',
+                 '22_reg_uso_medicamentos.png', 'Registro do uso de medicação'),
+        _checkbox('tipo_reg_medic', 'medication_register_type___',
+                  ['Livro ata', 'Registro individual em papel', 'Registro individual digital'],
+                  'Tipo_registro_medicacao', '23_tab_tipo_reg_medicacao.png', '23_tipo_reg_medicacao.png',
+                  'Tipo de registro de medicamentos'),
+        _binaria('med_psico_separado', 'psico_drugs_segregation', 'Subst_psico_segregada',
+                 '24_tab_subst_psico_segregada.png', '24_subst_psico_segregada.png',
+                 'Substância psicoativa são segregadas'),
+        _texto('psico_armaz', 'psico_drugs_storage', 'Onde_sao_armazenados_psicoativos',
+               '25_tab_psico_armazenagem.png', '25_psico_armazenagem.png', 'Onde são armazenados os psicoativos'),
+        _checkbox('prof_manip_medic', 'medication_manipulation___',
+                  ['técnico da farmácia', 'farmacêutico(a)', 'auxiliar de enfermagem', 'técnico de enfermagem',
+                   'enfermeiro(a)', 'cuidador(a)', 'outro'],
+                  'Prof_manipula_medic_residente', '26_tab_prof_manipula_medic.png', '26_prof_dispensa_medic.png',
+                  'Profissional que faz a dispensação da medicação'),
+        _texto('outro_profis', 'other_meditation_manip', 'Outro_prof_dispensa_medicamento',
+               '27_tab_outros_prof_dispensa.png', '27_outro_prof_dispensa_medic.png',
+               'Outro Profissional que faz a dispensação da medicação'),
+    ],
+    'lavanderia_residuos': [
+        _binaria('roupa_segreg', 'dirty_clothing_segregation', 'Separacao_roupas_sujas_limpas',
+                 '29_tab_roupa_segregada.png', '29_roupa_segregada.png', 'Segregação de roupas limpas/sujas'),
+        _opcoes('freq_troca_roupa_cama', 'dirty_clothing_change', 'freq_troca_roupa_cama_list', FREQUENCIA,
+                '30_tab_freq_troca_roupa.png', '30_freq_troca_roupa.png', 'Frequência da troca de roupa de cama'),
+        _binaria('reciclagem_lixo', 'trash_recicling', 'Reciclagem_lixo', '31_tab_reciclagem_lixo.png',
+                 '31_reciclagem de lixo.png', 'Reciclagem de lixo'),
+        _checkbox('container_adequados', 'trash_container___',
+                  ['Resíduo infectante', 'Resíduo químico', 'Resíduo radioativo', 'Resíduo perfurocortante',
+                   'Resíduo comum'],
+                  'container_adequados_list', '32_tab_container_adeq.png', '32_container_adequado.png',
+                  'Os conteiners de lixo são adequados'),
+    ],
+    'cuidado': [
+        _binaria('banho_sol', 'sunbathing', 'Area_banho_sol', '33_tab_banho_sol.png', '33_banho_sol.png',
+                 'Area de banho de sol'),
+        _binaria('area_vis_familia', 'visiting_area', 'Area_visitacao_familia', '34_tab_visit_familia.png',
+                 '34_visit_familia.png', 'Area para visitação familiar'),
+        _binaria('area_ativ_social', 'social_area', 'Area_ativ_social', '35_tab_area_social.png',
+                 '35_area_social.png', 'Area para atividades sociais'),
+        _binaria('musica_ambiente', 'ambient_music', 'Musica_ambiente', '36_tab_musica_ambiente.png',
+                 '36_musica_ambiente.png', 'Musica ambiente'),
+        _binaria('cardapio_visivel', 'menu', 'Cardapio_visivel', '37_tab_cardapio_visivel.png',
+                 '37_cardapio_visivel.png', 'Cardápio está visível'),
+        _opcoes('freq_atualiz_cardapio', 'semanal_menu', 'freq_atualiz_cadapio_list', FREQUENCIA,
+                '38_tab_freq_atual_cardapio.png', '38_freq_atualiz_cardapio.png',
+                'Frequência de atualização do cardápio'),
+        _checkbox('oficinas_atividades', 'recreation_type___',
+                  ['Oficina de jardinagem', 'Oficina de costura', 'Oficina de artesanato', 'Oficina de marcenaria',
+                   'Dança de salão', 'Datas comemorativas', 'Missas/Cultos Ecumênicos'],
+                  'Oficinas_ atividades', '39_tab_oficinas_atividades.png', '39_oficinas_atividades.png',
+                  'Existência oficinas ou atividades para os residentes'),
+    ],
+    'estagio': [
+        _binaria('estagio', 'internship', 'Campo_estagio', '53_tab_campo_estagio.png', '53_campo_estagio.png',
+                 'A ILPI é campo de estágio'),
+    ],
+}
+
+# Verificação aleatória de prontuários/fichas: (família de checkbox ___1..6, tabela); a opção 1 é "Não se aplica"
+PRONTUARIOS = [
+    ('medical_record___', '40_tab_verif_reg_medic.png'),
+    ('admission_file_signed___', '41_tab_verif_ficha_admissao.png'),
+    ('patient_bath___', '42_tab_verif_banho_resid.png'),
+    ('imc_index___', '43_tab_verif_imc_index_resid.png'),
+    ('physical_cont_record___', '44_tab_verif_reg_fisico_resid.png'),
+    ('mem_scale___', '45_tab_verif_escala_mem.png'),
+    ('mem_prev_actions___', '45_tab_verif__mem_ac_prev.png'),
+    ('pain_register___', '46_tab_verif_reg_dor.png'),
+    ('meem_care_actions___', '47_tab_verif_mem_acao_cuid.png'),
+    ('rehab_activities_register___', '48_tab_verif_reg_ativ_reab.png'),
+    ('rehab_activities___', '49_tab_verif_ativ_reab.png'),
+]
+
+# Arquivos das seções com tabelas próprias, além dos das QUESTOES: (tabelas, gráficos)
+SAIDAS_EXTRAS = {
+    'profissionais': (['03_tabela_profissionais.png'], ['03_profissionais.png']),
+    'medicamentos': (['28_tab_geral_outro_prof.png'], []),
+    'prontuarios': ([tabela for _, tabela in PRONTUARIOS], []),
+    'regulacao': (['50_tab_ubs.png', '51_tab_upa.png', '52_tab_quadro_geral_ubs_upa.png'], []),
+    'estagio': (['54_tab_inst_cursos.png'], []),
+}
+
+# Instituições de ensino e cursos dos estágios
+ESTAGIO_COLUNAS = {
+    'institution_name': 'ILPI',
+    'internship_institution': 'Instituíção A',
+    'internship_institution_2': 'Instituíção B',
+    'internship_institution_3': 'Instituíção C',
+    'internship_institution_4': 'Instituíção D',
+    'internship_course': 'Curso A',
+    'internship_course_2': 'Curso B',
+    'internship_course_3': 'Curso C',
+    'internship_course_4': 'Curso D',
+}
+
+# (profissional, coluna de quantidade, coluna de dias por mês), para `extrair_profissionais`
+PROFISSIONAIS = [(prof, quantidade, dias) for prof, quantidade, _, dias in MAPEAMENTO_PROFISSIONAIS]
+
+
+def _extras(secao, pasta_tabelas, pasta_graficos):
+    tabelas, graficos = SAIDAS_EXTRAS.get(secao, ([], []))
+    return ([os.path.join(pasta_tabelas, t) for t in tabelas],
+            [os.path.join(pasta_graficos, g) for g in graficos])
+
+
+def saidas_secao(secao, pasta_tabelas, pasta_graficos):
+    """Caminhos (tabelas, gráficos) gerados por uma seção, declarados como saídas da sua tarefa."""
+    questoes = QUESTOES.get(secao, [])
+    extras_tabelas, extras_graficos = _extras(secao, pasta_tabelas, pasta_graficos)
+    return ([os.path.join(pasta_tabelas, q['tabela']) for q in questoes] + extras_tabelas,
+            [os.path.join(pasta_graficos, q['grafico']) for q in questoes] + extras_graficos)
+
+# ----------------------------------------
+
+def processa_multiresposta_com_nenhum(df, colunas_dict, legenda):
+    """
+    Variáveis de múltiplas respostas (checkbox) do monitoramento: mantém todas as ILPIs e usa
+    'Nenhum' quando nenhuma opção foi marcada (diferente de `perfil.processa_multiresposta`, que
+    descarta essas linhas). O DataFrame recebido não é alterado.
+
+    Parâmetros:
+    - df: DataFrame com 'institution_name' e as colunas de `colunas_dict`.
+    - colunas_dict: dict coluna de checkbox -> descrição.
+    - legenda: nome da coluna de saída.
+
+    Retorna:
+    - DataFrame com 'ILPI' e `legenda`.
+
+    Exemplo de uso:
+    vinculo = processa_multiresposta_com_nenhum(df, {'employment_relatioship___1': 'CLT'}, 'Vinculo')
+    """
+    colunas = list(colunas_dict)
+    marcadas = RegistroFamilias(df, {legenda: colunas}, checkbox=False).bloco(legenda) == 1
+    descricoes = np.array([colunas_dict[col] for col in colunas], dtype=object)
+    textos = [', '.join(descricoes[linha]) if linha.any() else 'Nenhum' for linha in marcadas]
+    return pd.DataFrame({'ILPI': df['institution_name'].to_numpy(), legenda: textos}, index=df.index)
+
+
+def tabela_questao(df, questao):
+    """Tabela ILPI x resposta de uma pergunta de QUESTOES."""
+    tipo, legenda = questao['tipo'], questao['legenda']
+    if tipo == 'binaria':
+        return processa_binario(df, questao['coluna'], legenda, SIM_NAO)
+    if tipo == 'opcoes':
+        return processa_uma_variavel_com_opcoes(df, questao['coluna'], legenda, questao['mapa'])
+    if tipo == 'checkbox':
+        return processa_multiresposta_com_nenhum(df, questao['mapa'], legenda)
+    if tipo == 'texto':
+        return processa_uma_variavel(df, {'institution_name': 'ILPI', questao['coluna']: legenda})
+    raise ValueError(f'Tipo de pergunta desconhecido: {tipo!r}')
+
+
+def _gravar_questoes(base, questoes, pasta_tabelas, pasta_graficos):
+    resultados = {}
+    for questao in questoes:
+        tabela = tabela_questao(base, questao)
+        opcoes_tabela = {'titulo': questao['titulo_tabela']} if questao['titulo_tabela'] else {}
+        salvar_tabela_como_imagem(tabela, os.path.join(pasta_tabelas, questao['tabela']), **opcoes_tabela)
+        plot_barh_contagens(tabela[questao['legenda']].value_counts(), questao['titulo'], questao['xlabel'],
+                            os.path.join(pasta_graficos, questao['grafico']), mostrar=False)
+        resultados[questao['nome']] = tabela
+    return resultados
+
+# ----------------------------------------
+
+def secao_questoes(base, pasta_tabelas, pasta_graficos, questoes=()):
+    """Seções formadas só por perguntas (binárias, com opções, checkbox ou texto livre)."""
+    return _gravar_questoes(base, questoes, pasta_tabelas, pasta_graficos)
+
+
+def secao_profissionais(base, pasta_tabelas, pasta_graficos, questoes=()):
+    """03 - Dias trabalhados por profissão, horas por residente e razões mínimas; 04 - vínculo empregatício."""
+    tabelas, graficos = _extras('profissionais', pasta_tabelas, pasta_graficos)
+
+    df_profissionais = extrair_profissionais(base, PROFISSIONAIS)
+    equipe = tabela_equipe(base)
+    salvar_tabela_como_imagem(df_profissionais, tabelas[0])
+    plot_dias_por_profissao(df_profissionais, graficos[0], mostrar=False)
+
+    resultados = _gravar_questoes(base, questoes, pasta_tabelas, pasta_graficos)
+    # Todas as ILPIs da base, inclusive as que não informaram nenhum profissional
+    razoes = verificar_razoes(equipe, residentes=base.set_index('institution_name')['residents_number'])
+    resultados.update({'profissionais': df_profissionais, 'equipe': equipe, 'razoes': razoes})
+    return resultados
+
+
+def secao_medicamentos(base, pasta_tabelas, pasta_graficos, questoes=()):
+    """18 a 27 - Medicamentos; 28 - quadro geral de quem faz a dispensação."""
+    tabelas, _ = _extras('medicamentos', pasta_tabelas, pasta_graficos)
+
+    resultados = _gravar_questoes(base, questoes, pasta_tabelas, pasta_graficos)
+    quadro = resultados['prof_manip_medic'].merge(resultados['outro_profis'], on='ILPI', how='right')
+    salvar_tabela_como_imagem(quadro, tabelas[0])
+    resultados['quadro_geral_disp'] = quadro
+    return resultados
+
+
+def secao_prontuarios(base, pasta_tabelas, pasta_graficos, questoes=()):
+    """40 a 49 - Verificação aleatória de prontuários/fichas: marcações de cada família por ILPI."""
+    tabelas, _ = _extras('prontuarios', pasta_tabelas, pasta_graficos)
+
+    # Famílias de checkbox convertidas uma única vez para todas as tabelas
+    registro = RegistroFamilias(base, prefixos=[prefixo for prefixo, _ in PRONTUARIOS], checkbox=False)
+    resultados = {}
+    for (prefixo, _), caminho in zip(PRONTUARIOS, tabelas):
+        tabela = (base[['institution_name']]
+                  .join(criar_df_com_soma_por_prefixo(base, prefixo, registro=registro))
+                  .rename(columns={'institution_name': 'ILPI', f'{prefixo}1': 'Não se aplica'}))
+        salvar_tabela_como_imagem(tabela, caminho)
+        resultados[prefixo.rstrip('_')] = tabela
+    return resultados
+
+
+def secao_regulacao(base, pasta_tabelas, pasta_graficos, questoes=()):
+    """50 a 52 - UBS e UPA para onde os residentes são encaminhados."""
+    tabelas, _ = _extras('regulacao', pasta_tabelas, pasta_graficos)
+
+    ubs = (base[['institution_name', 'ubs', 'ubs_1', 'ubs_2']]
+           .rename(columns={'institution_name': 'ILPI', 'ubs': 'UBS', 'ubs_1': 'UBS_1', 'ubs_2': 'UBS_2'})
+           .dropna(axis=1, how='all'))
+    salvar_tabela_como_imagem(ubs, tabelas[0])
+
+    # Um nome de UPA por coluna (o texto livre separa várias por ';' ou '/')
+    partes = separar_unidades(base['upa'])
+    colunas = [f'UPA_{i}' for i in range(partes.map(len).max() if len(partes) else 0)]
+    upa = pd.concat([base[['institution_name']].rename(columns={'institution_name': 'ILPI'}),
+                     pd.DataFrame(partes.tolist(), columns=colunas, index=base.index)], axis=1)
+    salvar_tabela_como_imagem(upa, tabelas[1])
+
+    quadro = ubs.merge(upa, on='ILPI', how='right')
+    salvar_tabela_como_imagem(quadro, tabelas[2])
+    return {'ubs': ubs, 'upa': upa, 'quadro_geral_ubs_upa': quadro}
+
+
+def secao_estagio(base, pasta_tabelas, pasta_graficos, questoes=()):
+    """53 - A ILPI é campo de estágio; 54 - instituições de ensino e cursos."""
+    tabelas, _ = _extras('estagio', pasta_tabelas, pasta_graficos)
+
+    resultados = _gravar_questoes(base, questoes, pasta_tabelas, pasta_graficos)
+    inst_curso = (base[list(ESTAGIO_COLUNAS)].rename(columns=ESTAGIO_COLUNAS)
+                  .replace({'Não se aplica': '-', 'NaN': '-', 'nan': '-', 'NAN': '-'})
+                  .fillna('-'))
+    salvar_tabela_como_imagem(inst_curso, tabelas[0])
+    resultados['inst_curso'] = inst_curso
+    return resultados
+
+
+SECOES = {
+    'estrutura': secao_questoes,
+    'profissionais': secao_profissionais,
+    'reabilitacao': secao_questoes,
+    'seguranca': secao_questoes,
+    'acessibilidade': secao_questoes,
+    'medicamentos': secao_medicamentos,
+    'lavanderia_residuos': secao_questoes,
+    'cuidado': secao_questoes,
+    'prontuarios': secao_prontuarios,
+    'regulacao': secao_regulacao,
+    'estagio': secao_estagio,
+}
+
+# ----------------------------------------
+
+def grafo_monitoramento(caminho_base, pasta_saida, sep=',', secoes=None):
+    """
+    Monta o grafo de tarefas do monitoramento das ILPIs (base UFG): a tarefa 'base' lê o CSV e
+    cada seção depende apenas dela. As perguntas de cada seção (QUESTOES) são parâmetros da
+    tarefa, então alterar uma pergunta refaz só a sua seção.
+
+    Parâmetros:
+    - caminho_base: CSV da base (uma linha por ILPI).
+    - pasta_saida: pasta com as subpastas 'tables' e 'plots' (e '.tarefas', com o estado).
+    - sep: separador do CSV.
+    - secoes: nomes das seções (padrão: todas as de SECOES).
+
+    Retorna:
+    - GrafoTarefas pronto para `executar`.
+
+    Exemplo de uso:
+    grafo = grafo_monitoramento('../../../data/UFG/base_ilpi.csv', '..')
+    situacao = grafo.executar(workers=None)
+    """
+    pasta_tabelas = os.path.join(pasta_saida, 'tables')
+    pasta_graficos = os.path.join(pasta_saida, 'plots')
+    os.makedirs(pasta_tabelas, exist_ok=True)
+    os.makedirs(pasta_graficos, exist_ok=True)
+
+    grafo = GrafoTarefas(os.path.join(pasta_saida, '.tarefas'))
+    grafo.adicionar('base', carregar_base, arquivos=[caminho_base],
+                    parametros={'caminho': caminho_base, 'sep': sep})
+    for nome in secoes or SECOES:
+        tabelas, graficos = saidas_secao(nome, pasta_tabelas, pasta_graficos)
+        grafo.adicionar(nome, SECOES[nome], entradas={'base': 'base'}, saidas=tabelas + graficos,
+                        parametros={'pasta_tabelas': pasta_tabelas, 'pasta_graficos': pasta_graficos,
+                                    'questoes': QUESTOES.get(nome, [])})
+    return grafo
@@ -0,0 +1,156 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_pdf import PdfPages
+
+from .renderizacao import _inicializar_processo, parametros_estilo
+from .tabelas import figura_tabela
+
+# ------------------------------
+# Relatório em PDF (várias páginas, gravado à medida que é produzido)
+# ------------------------------
+
+# Tamanho A4 em polegadas (retrato)
+TAMANHO_A4 = (8.27, 11.69)
+
+
+class RelatorioPDF:
+    """
+    Relatório em um único PDF de várias páginas. Cada gráfico ou tabela é gravado no
+    arquivo assim que é produzido e a figura é fechada logo em seguida, de modo que a
+    memória não cresce com o número de páginas (nenhum PNG intermediário é gerado).
+
+    Parâmetros:
+    - caminho: arquivo PDF de saída.
+    - titulo: título gravado nos metadados do PDF.
+
+    Exemplo de uso:
+    with RelatorioPDF('../output/relatorio.pdf', titulo='Perfil epidemiológico') as relatorio:
+        relatorio.adicionar_texto('Perfil epidemiológico das ILPIs')
+        relatorio.adicionar_grafico(plot_barh, df_sexo, 'Sexo', 'Quantidade', '', None)
+        relatorio.adicionar_tabela(tabela_sexo, titulo='Sexo por ILPI')
+    """
+
+    def __init__(self, caminho, titulo=None):
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self.caminho = caminho
+        self.paginas = 0
+        metadados = {'Title': titulo} if titulo else None
+        self._pdf = PdfPages(caminho, metadata=metadados)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    def adicionar_figura(self, fig=None):
+        """Grava a figura (padrão: a figura atual) como uma nova página e a fecha."""
+        fig = fig if fig is not None else plt.gcf()
+        try:
+            self._pdf.savefig(fig, bbox_inches='tight')
+            self.paginas += 1
+        finally:
+            plt.close(fig)
+
+    def adicionar_grafico(self, funcao, *args, **kwargs):
+        """
+        Executa uma função de plot (ex: as de `analise_ilpi.graficos`) sem `plt.show()` e grava
+        em páginas todas as figuras que ela criou. Passe None como nome de arquivo para não gerar PNG.
+        O cache de figuras é ignorado (`usar_cache=False`): a figura precisa ser desenhada para entrar no PDF.
+        """
+        kwargs.setdefault('mostrar', False)
+        if getattr(funcao, 'parametro_cache', None):
+            kwargs['usar_cache'] = False
+        antes = set(plt.get_fignums())
+        try:
+            resultado = funcao(*args, **kwargs)
+        except Exception:
+            for numero in set(plt.get_fignums()) - antes:
+                plt.close(numero)
+            raise
+        # As funções de `graficos` fecham a própria figura e retornam o Axes
+        figuras = [plt.figure(numero) for numero in sorted(set(plt.get_fignums()) - antes)]
+        if isinstance(resultado, Axes) and resultado.figure not in figuras:
+            figuras.insert(0, resultado.figure)
+        if not figuras:
+            raise RuntimeError(f'{getattr(funcao, "__name__", funcao)} não criou nenhuma figura para o relatório.')
+        for fig in figuras:
+            self.adicionar_figura(fig)
+
+    def adicionar_tabela(self, df, titulo=None, largura_max_coluna=30, linhas_por_pagina=25):
+        """Grava a tabela (vetorial) em uma ou mais páginas, `linhas_por_pagina` linhas por página."""
+        total = max(1, -(-len(df) // linhas_por_pagina))
+        for numero, inicio in enumerate(range(0, max(len(df), 1), linhas_por_pagina), start=1):
+            titulo_pagina = f'{titulo} ({numero}/{total})' if titulo and total > 1 else titulo
+            self.adicionar_figura(
+                figura_tabela(df.iloc[inicio:inicio + linhas_por_pagina], titulo_pagina, largura_max_coluna)
+            )
+
+    def adicionar_texto(self, texto, subtitulo=None):
+        """Página de texto (ex: capa com o nome da ILPI)."""
+        fig = plt.figure(figsize=TAMANHO_A4)
+        fig.text(0.5, 0.6, texto, ha='center', va='center', fontsize=20, weight='bold', wrap=True)
+        if subtitulo:
+            fig.text(0.5, 0.52, subtitulo, ha='center', va='center', fontsize=12, wrap=True)
+        self.adicionar_figura(fig)
+
+
+def _nome_arquivo(valor):
+    """Nome da ILPI -> nome de arquivo seguro."""
+    return re.sub(r'[^\w\-]+', '_', str(valor)).strip('_') or 'sem_nome'
+
+
+def _gerar_relatorio_ilpi(argumentos):
+    ilpi, df_ilpi, caminho, secoes, titulo = argumentos
+    with RelatorioPDF(caminho, titulo=f'{titulo} - {ilpi}' if titulo else str(ilpi)) as relatorio:
+        relatorio.adicionar_texto(str(ilpi), subtitulo=titulo)
+        for secao in secoes:
+            secao(relatorio, df_ilpi)
+    return caminho
+
+
+def relatorios_por_ilpi(df, pasta, secoes, col_ilpi='institution_name', titulo=None, workers=1):
+    """
+    Gera um PDF por ILPI. Cada seção é uma função `secao(relatorio, df_ilpi)` que adiciona
+    gráficos/tabelas ao `RelatorioPDF` da ILPI.
+
+    Parâmetros:
+    - df: DataFrame com todas as ILPIs.
+    - pasta: pasta de saída (um arquivo <ILPI>.pdf por ILPI).
+    - secoes: lista de funções de seção (importáveis, se workers > 1).
+    - col_ilpi: coluna da ILPI.
+    - titulo: subtítulo da capa e dos metadados.
+    - workers: número de processos (1 gera no próprio processo).
+
+    Retorna:
+    - dict ILPI -> caminho do PDF.
+
+    Exemplo de uso:
+    def secao_sexo(relatorio, df_ilpi):
+        relatorio.adicionar_tabela(df_ilpi['sex'].value_counts().reset_index(), titulo='Sexo')
+
+    relatorios_por_ilpi(df, '../output/ilpis', [secao_sexo], titulo='Perfil epidemiológico')
+    """
+    os.makedirs(pasta, exist_ok=True)
+    tarefas = [
+        (ilpi, df_ilpi, os.path.join(pasta, f'{_nome_arquivo(ilpi)}.pdf'), list(secoes), titulo)
+        for ilpi, df_ilpi in df.groupby(col_ilpi, sort=True)
+    ]
+    if workers == 1:
+        caminhos = [_gerar_relatorio_ilpi(tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_processo,
+                                 initargs=(parametros_estilo(),)) as executor:
+            caminhos = list(executor.map(_gerar_relatorio_ilpi, tarefas))
+    return {tarefa[0]: caminho for tarefa, caminho in zip(tarefas, caminhos)}
@@ -0,0 +1,557 @@
+import os
+
+import pandas as pd
+
+from .fragilidade import CONDICAO_ALERTA, CONDICAO_ATENCAO, CONDICAO_CRITICA, classificar_risco
+from .graficos import (
+    plot_bar_flex_auto,
+    plot_bar_flex_unificado,
+    plot_barh,
+    plot_idade_com_media,
+    plot_idade_por_ilpi,
+    plot_percentual_por_ilpi,
+)
+from .instrumentacao import etapa
+from .perfil import extrair_medicamentos, extrair_morbidades, processa_multiresposta
+from .relatorio_pdf import _nome_arquivo
+from .resultados import ArmazemResultados, gravar_resultados_secoes
+from .tabelas import salvar_tabela_como_imagem
+from .tarefas import GrafoTarefas
+
+# ------------------------------
+# Seções do perfil epidemiológico (SMSAp) como tarefas do GrafoTarefas
+# ------------------------------
+
+# Arquivos gerados por seção: (tabelas, gráficos). Usado pelas seções e para declarar as saídas no grafo.
+SAIDAS = {
+    'genero': (
+        ['01_tabela_genero_abs_prop.png'],
+        ['01_grafico_genero_perc.png'],
+    ),
+    'idade': (
+        ['02_tabela_idade.png'],
+        ['02_grafico_idades_residentes_com_media.png', '02_grafico_idades_residentes_por_ilpi.png',
+         '02_grafico_faixa_etaria_por_ilpi.png'],
+    ),
+    'raca': (
+        ['03_tabela_raca_geral.png', '03_tabela_raca_por_ILPI.png'],
+        ['03_grafico_raca_geral.png', '03_grafico_raca_geral_percentual.png',
+         '03_grafico_raca_por_ilpi_absoluto.png', '03_grafico_raca_por_ilpi_percentual.png'],
+    ),
+    'escolaridade': (
+        ['04_tabela_escolaridade_geral.png', '04_tabela_escolaridade_por_ILPI.png'],
+        ['04_grafico_escolaridade_residente_por_ILPI.png',
+         '04_grafico_escolaridade_residente_por_ILPI_percentual.png',
+         '04_grafico_escolaridade_por_ILPI_absoluto.png', '04_grafico_proporcao_escolaridade_por_ILPI.png'],
+    ),
+    'tempo_institucionalizacao': (
+        ['05_tabela_tempo _institucionalização.png', '05_tabela_faixa_tempo_institucionalização.png'],
+        ['05_grafico_tempo_instit.png', '05_grafico_proporcao_tempo_instit.png',
+         '05_grafico_tempo_instit_por_ILPI.png', '05_grafico_proporcao_tempo_instit_por_ILPI.png'],
+    ),
+    'suporte_familiar': (
+        ['06_tabela_suporte_famil_geral.png', '06_tabela_suporte_famil_por_ILPI.png'],
+        ['06_grafico_suporte_familiar_absoluto.png', '06_grafico_suporte_familiar_por_ILPI.png',
+         '06_grafico_suporte_familiar_por_ILPI_percent.png'],
+    ),
+    'grau_dependencia': (
+        ['07_tabela_grau_dependencia_geral.png', '07_tabela_grau_dependencia_famil_por_ILPI.png'],
+        ['07_grafico_grau_dependencia_familiar_absoluto.png', '07_grafico_grau_dependencia_familiar_por_ILPI.png',
+         '07_grafico_grau_dependencia_familiar_por_ILPI_percent.png'],
+    ),
+    'vinculo': (
+        ['08_tabela_vinculo_instit_geral.png', '08_tabela_vinculo_famil_por_ILPI.png'],
+        ['08_grafico_tipos_vinculo_absoluto.png', '08_grafico_vinculo_familiar_por_ILPI.png',
+         '08_grafico_vinculo_familiar_por_ILPI_percent.png'],
+    ),
+    'fonte_renda': (
+        ['09_tabela_fonte_renda_geral.png', '09_tabela_fonte_renda_famil_por_ILPI.png'],
+        ['09_grafico_fonte_renda_absoluto.png', '09_grafico_fonte_renda_familiar_por_ILPI.png',
+         '09_grafico_fonte_renda_familiar_por_ILPI_percent.png'],
+    ),
+    'medicamentos': (
+        ['10_tabela_registro_medic.png', '10_tabela_registro_medic_por_ILPI.png'],
+        ['10_gráfico_registro_medicamentos.png', '10_grafico_registro_medic_por_ILPI_percent.png'],
+    ),
+    'morbidades': ([], []),
+    'fragilidade': (
+        ['12_tabela_resummo_score_fragilidade.png'],
+        [],
+    ),
+}
+
+# Faixas etárias (limite inferior exclusivo, superior inclusivo no rótulo)
+FAIXAS_IDADE = {
+    '61 a 65 anos': (60, 65),
+    '66 a 70 anos': (65, 70),
+    '71 a 75 anos': (70, 75),
+    '76 a 80 anos': (75, 80),
+    '81 a 85 anos': (80, 85),
+    '86 a 90 anos': (85, 90),
+    '91 a 95 anos': (90, 95),
+    '96 a 100 anos': (95, 100),
+}
+
+RACA_DICT = {1: 'Branca', 2: 'Preta', 3: 'Parda', 4: 'Amarela', 5: 'Indígena', 6: 'Não Informado'}
+
+ESCOLARIDADE_DICT = {1: 'nenhuma', 2: '1 a 3 anos', 3: '4 a 7 anos', 4: '8 anos ou mais', 5: 'não há registro'}
+
+# Faixas de tempo de institucionalização em anos (limite inferior inclusivo, superior exclusivo)
+FAIXAS_TEMPO_INSTITUCIONALIZACAO = {
+    '0 a 5 anos': (0, 5),
+    '6 a 10 anos': (5, 10),
+    '11 a 15 anos': (10, 15),
+    '16 a 20 anos': (15, 20),
+    '21 a 25 anos': (20, 25),
+    '26 a 30 anos': (25, 30),
+    'mais de 31 anos': (30, 50),
+}
+
+SUPORTE_FAMILIAR_DICT = {1: 'Sim', 2: 'Não', 3: 'Não consta no prontuário'}
+
+GRAU_DEPENDENCIA_DICT = {1: 'Independente', 2: 'Parcialmente dependente', 3: 'Totalmente dependente'}
+
+VINCULO_DICT = {
+    'link_type___1': 'Privado',
+    'link_type___2': 'Filantrópico',
+    'link_type___3': 'Convênio com a Prefeitura',
+}
+
+FONTE_RENDA_DICT = {
+    1: 'Aposentadoria/pensão',
+    2: 'Benefíco de Prestação',
+    3: 'Bolsa Família',
+    4: 'Nenhum',
+    5: 'Não sabe',
+}
+
+MORBIDADES_DICT = {
+    "morbidities___1": "Hipertensão Arterial",
+    "morbidities___2": "Diabetes Mellitus",
+    "morbidities___3": "Hipercolesterolemia",
+    "morbidities___4": "Doença na coluna",
+    "morbidities___5": "Insuficiência cardíaco",
+    "morbidities___6": "Infarto",
+    "morbidities___7": "Insuficiência renal",
+    "morbidities___8": "Câncer",
+    "morbidities___9": "Enfisema pulmonar",
+    "morbidities___10": "Asma",
+    "morbidities___11": "Bronquite",
+    "morbidities___12": "Transtorno Mental",
+    "morbidities___13": "Osteoporose",
+    "morbidities___14": "Artrite",
+    "morbidities___15": "Demência",
+    "morbidities___16": "Alzheimer",
+    "morbidities___17": "Parkinson",
+    "morbidities___18": "Etilismo",
+    "morbidities___19": "Tabagismo",
+    "morbidities___20": "Usuário de drogas",
+}
+
+
+def _saidas(secao, pasta_tabelas, pasta_graficos):
+    tabelas, graficos = SAIDAS[secao]
+    return ([os.path.join(pasta_tabelas, t) for t in tabelas],
+            [os.path.join(pasta_graficos, g) for g in graficos])
+
+
+def _contagem_com_proporcao(df, colunas, mapa=None):
+    """Contagem por `colunas` com a proporção (2 casas) dentro de cada ILPI, ou do total se for só a variável."""
+    tabela = df.groupby(colunas).size().reset_index(name='total')
+    if len(colunas) > 1:
+        tabela['proporcao'] = tabela['total'] / tabela.groupby(colunas[0])['total'].transform('sum')
+    else:
+        tabela['proporcao'] = tabela['total'] / tabela['total'].sum()
+    tabela['proporcao'] = tabela['proporcao'].round(2)
+    if mapa is not None:
+        tabela[colunas[-1]] = tabela[colunas[-1]].replace(mapa)
+    return tabela
+
+
+def _coluna_valida(base, coluna):
+    df = base[['institution_name', coluna]]
+    return df[df[coluna].notna()].astype({coluna: 'int64'})
+
+
+def _secao_categorica(base, coluna, mapa, tabelas, graficos, titulo, titulo_por_ilpi):
+    """Tabelas geral e por ILPI de uma variável codificada, com o gráfico geral e os por ILPI (absoluto e %)."""
+    df = _coluna_valida(base, coluna)
+    geral = _contagem_com_proporcao(df, [coluna], mapa)
+    por_ilpi = _contagem_com_proporcao(df, ['institution_name', coluna], mapa)
+
+    salvar_tabela_como_imagem(geral, tabelas[0], largura_max_coluna=25)
+    salvar_tabela_como_imagem(por_ilpi, tabelas[1], largura_max_coluna=25)
+    plot_bar_flex_unificado(geral, title=titulo, xlabel='', ylabel='Número de residentes',
+                            filename=graficos[0], orientation='v', value_format='absolute',
+                            show_values=True, show_text=False,
+                            col_categoria=coluna, col_valor='total', mostrar=False)
+    for filename, formato in [(graficos[1], 'absolute'), (graficos[2], 'percent')]:
+        plot_bar_flex_unificado(por_ilpi, title=titulo_por_ilpi, xlabel='', ylabel='Número de residentes',
+                                filename=filename, orientation='v', value_format=formato,
+                                show_values=True, show_text=False,
+                                col_categoria='institution_name', col_valor='total', mostrar=False)
+    return geral, por_ilpi
+
+# ----------------------------------------
+
+def filtrar_ilpis(df, ilpis, col_ilpi='institution_name'):
+    """
+    Mantém apenas as ILPIs informadas. Os valores são comparados como texto e, quando
+    possível, como número (ex: '2' seleciona o código 2 ou 2.0 da exportação do REDCap).
+    """
+    alvo = [str(i) for i in ilpis]
+    mascara = df[col_ilpi].astype(str).isin(alvo)
+    numeros = pd.to_numeric(pd.Series(alvo), errors='coerce').dropna()
+    if len(numeros):
+        mascara |= pd.to_numeric(df[col_ilpi], errors='coerce').isin(numeros)
+    return df[mascara]
+
+
+@etapa()
+def carregar_base(caminho, sep=';', ilpis=None, col_ilpi='institution_name'):
+    """
+    Lê a base do perfil epidemiológico (CSV gerado por `analise_ilpi.etl.ingerir`).
+
+    Parâmetros:
+    - caminho: CSV da base.
+    - sep: separador.
+    - ilpis: lista de ILPIs a manter (None mantém todas).
+
+    Exemplo de uso:
+    base = carregar_base('../../../data/SMSAp/base_perfil_epidemiologico.csv', ilpis=[2])
+    """
+    base = pd.read_csv(caminho, sep=sep)
+    if ilpis is not None:
+        base = filtrar_ilpis(base, ilpis, col_ilpi)
+    return base
+
+# ----------------------------------------
+
+def secao_genero(base, pasta_tabelas, pasta_graficos):
+    """1 - Gênero dos residentes por ILPI (absoluto e proporção)."""
+    tabelas, graficos = _saidas('genero', pasta_tabelas, pasta_graficos)
+
+    df_filtrado = base[base['sex'].isin([1, 2])].copy()
+    df_filtrado['sex'] = df_filtrado['sex'].map({1: 'Masculino', 2: 'Feminino'})
+    gender = df_filtrado.groupby(['institution_name', 'sex']).size().unstack(fill_value=0).reset_index()
+    gender.columns.name = None
+
+    colunas = [c for c in ['Feminino', 'Masculino'] if c in gender.columns]
+    gender_prop = round(gender[colunas].div(gender[colunas].sum(axis=1), axis=0), 2)
+    gender_prop.insert(0, 'institution_name', gender['institution_name'])
+    gender_prop = gender_prop.rename(columns={c: f'{c}(prop)' for c in colunas})
+
+    gender_join = gender.merge(gender_prop)
+    gender_join = gender_join[['institution_name'] + [x for c in colunas for x in (c, f'{c}(prop)')]]
+
+    salvar_tabela_como_imagem(gender_join, tabelas[0], largura_max_coluna=15)
+    plot_barh(gender.set_index('institution_name'),
+              title='Gênero dos Residentes da ILPI',
+              xlabel='Número de residentes', ylabel='ILPIs',
+              filename=graficos[0], obs=2, show_text=True, show_values=True, mostrar=False)
+    return {'genero': gender_join}
+
+
+def secao_idade(base, pasta_tabelas, pasta_graficos):
+    """2 - Idade dos residentes (geral, por ILPI e por faixa etária)."""
+    tabelas, graficos = _saidas('idade', pasta_tabelas, pasta_graficos)
+
+    df_idade = _coluna_valida(base, 'elder_age')
+    plot_idade_com_media(df_idade['elder_age'], graficos[0], mostrar=False)
+    plot_idade_por_ilpi(df_idade, graficos[1], mostrar=False)
+
+    bins = [60] + [v[1] for v in FAIXAS_IDADE.values()]
+    faixas = df_idade.assign(
+        elder_age_bin=pd.cut(df_idade['elder_age'], bins=bins, labels=list(FAIXAS_IDADE), right=False)
+    ).drop(columns=['elder_age'])
+    faixas = faixas[faixas['elder_age_bin'].notna()].value_counts().sort_index().reset_index()
+    faixas = faixas.rename(columns={'institution_name': 'ILPI', 'elder_age_bin': 'Faixa Etária',
+                                    'count': 'Número de Residentes'})
+
+    salvar_tabela_como_imagem(faixas, tabelas[0], largura_max_coluna=25)
+    pivot_df = faixas.pivot(index='ILPI', columns='Faixa Etária', values='Número de Residentes')
+    plot_percentual_por_ilpi(pivot_df, graficos[2], mostrar=False)
+    return {'media_idade': round(df_idade['elder_age'].mean(), 1), 'faixa_etaria': faixas}
+
+
+def secao_raca(base, pasta_tabelas, pasta_graficos):
+    """3 - Raça/cor dos residentes (geral e por ILPI)."""
+    tabelas, graficos = _saidas('raca', pasta_tabelas, pasta_graficos)
+
+    df_raca = _coluna_valida(base, 'race')
+    geral = _contagem_com_proporcao(df_raca, ['race'], RACA_DICT)
+    por_ilpi = _contagem_com_proporcao(df_raca, ['institution_name', 'race'], RACA_DICT)
+
+    salvar_tabela_como_imagem(geral, tabelas[0], largura_max_coluna=25)
+    salvar_tabela_como_imagem(por_ilpi, tabelas[1], largura_max_coluna=25)
+    for filename, formato, sufixo in [(graficos[0], 'absolute', ''), (graficos[1], 'percent', ' (%)')]:
+        plot_bar_flex_auto(geral,
+                           title=f'Distribuíção por Raça/Cor dos Residentes{sufixo}',
+                           xlabel='Raça/Cor', ylabel='Número de residentes',
+                           filename=filename, show_values=True, show_text=False,
+                           value_format=formato, orientation='v', xtick_rotation=0, mostrar=False)
+    for filename, formato in [(graficos[2], 'absolute'), (graficos[3], 'percent')]:
+        plot_bar_flex_unificado(por_ilpi,
+                                col_categoria='institution_name', col_valor='total', col_grupo='race',
+                                value_format=formato, orientation='v',
+                                title='Distribuição por Raça/Cor dos Residentes por ILPI',
+                                xlabel='ILPI', ylabel='Número de residentes',
+                                filename=filename, show_text=False, mostrar=False)
+    return {'raca_geral': geral, 'raca_por_ilpi': por_ilpi}
+
+
+def secao_escolaridade(base, pasta_tabelas, pasta_graficos):
+    """4 - Escolaridade dos residentes (geral e por ILPI)."""
+    tabelas, graficos = _saidas('escolaridade', pasta_tabelas, pasta_graficos)
+
+    df_escolaridade = _coluna_valida(base, 'scholarship')
+    geral = _contagem_com_proporcao(df_escolaridade, ['scholarship'], ESCOLARIDADE_DICT)
+    por_ilpi = _contagem_com_proporcao(df_escolaridade, ['institution_name', 'scholarship'], ESCOLARIDADE_DICT)
+
+    salvar_tabela_como_imagem(geral, tabelas[0], largura_max_coluna=25)
+    salvar_tabela_como_imagem(por_ilpi, tabelas[1], largura_max_coluna=25)
+    for filename, formato in [(graficos[0], 'absolute'), (graficos[1], 'percent')]:
+        plot_bar_flex_auto(geral, col_categoria='scholarship', col_valor='total',
+                           value_format=formato, orientation='v',
+                           title='Escolaridade Geral dos Residentes',
+                           xlabel='Tempo de estudo', ylabel='Número de Residentes',
+                           filename=filename, show_text=False, mostrar=False)
+    for filename, formato, titulo in [
+        (graficos[2], 'absolute', 'Distribuíção por escolaridade por instituição'),
+        (graficos[3], 'percent', 'Distribuíção percentual por escolaridade por instituição'),
+    ]:
+        plot_bar_flex_unificado(por_ilpi, col_categoria='institution_name', col_valor='total',
+                                col_grupo='scholarship', title=titulo,
+                                xlabel='Tempo de estudo', ylabel='Número de residentes',
+                                filename=filename, orientation='v', value_format=formato,
+                                show_values=True, show_text=False, mostrar=False)
+    return {'escolaridade_geral': geral, 'escolaridade_por_ilpi': por_ilpi}
+
+
+def secao_tempo_institucionalizacao(base, pasta_tabelas, pasta_graficos):
+    """5 - Tempo de institucionalização (em anos e por faixa, geral e por ILPI)."""
+    tabelas, graficos = _saidas('tempo_institucionalizacao', pasta_tabelas, pasta_graficos)
+
+    df_tempo = _coluna_valida(base, 'institut_time_years')
+    geral = _contagem_com_proporcao(df_tempo, ['institut_time_years'])
+    salvar_tabela_como_imagem(geral, tabelas[0], largura_max_coluna=25)
+    for filename, formato, sufixo in [(graficos[0], 'absolute', ''), (graficos[1], 'percent', ' Percentual')]:
+        plot_bar_flex_auto(geral, col_valor='total',
+                           title=f'Tempo de Institucionalização dos Residentes{sufixo}',
+                           xlabel='Tempo de instituíção', ylabel='Número de residentes',
+                           filename=filename, orientation='v', value_format=formato,
+                           show_values=True, show_text=False, mostrar=False)
+
+    bins = [0] + [v[1] for v in FAIXAS_TEMPO_INSTITUCIONALIZACAO.values()]
+    faixas = df_tempo.assign(
+        inst_time_bin=pd.cut(df_tempo['institut_time_years'], bins=bins,
+                             labels=list(FAIXAS_TEMPO_INSTITUCIONALIZACAO), right=False)
+    ).drop(columns=['institut_time_years'])
+    faixas = faixas[faixas['inst_time_bin'].notna()].value_counts().sort_index().reset_index()
+    faixas = faixas.rename(columns={'institution_name': 'ILPI', 'inst_time_bin': 'Faixa Tempo Instituíção',
+                                    'count': 'Número de Residentes'})
+
+    salvar_tabela_como_imagem(faixas, tabelas[1], largura_max_coluna=25)
+    for filename, formato, titulo in [
+        (graficos[2], 'absolute', 'Tempo de Institucionalização dos Residentes por ILPI'),
+        (graficos[3], 'percent', 'Tempo de Institucionalização Percentual dos Residentes por ILPI'),
+    ]:
+        plot_bar_flex_unificado(faixas, col_valor='Número de Residentes', col_grupo='Faixa Tempo Instituíção',
+                                title=titulo, xlabel='Tempo de instituíção', ylabel='Número de residentes',
+                                filename=filename, orientation='v', value_format=formato,
+                                show_values=True, show_text=False, mostrar=False)
+    return {'tempo_institucionalizacao': geral, 'faixa_tempo_institucionalizacao': faixas}
+
+
+def secao_suporte_familiar(base, pasta_tabelas, pasta_graficos):
+    """6 - Suporte familiar (geral e por ILPI)."""
+    tabelas, graficos = _saidas('suporte_familiar', pasta_tabelas, pasta_graficos)
+    geral, por_ilpi = _secao_categorica(base, 'family_support', SUPORTE_FAMILIAR_DICT, tabelas, graficos,
+                                        'Frequência do Suporte Familiar dos Residentes',
+                                        'Frequência do Suporte Familiar dos Residentes por ILPI')
+    return {'suporte_familiar_geral': geral, 'suporte_familiar_por_ilpi': por_ilpi}
+
+
+def secao_grau_dependencia(base, pasta_tabelas, pasta_graficos):
+    """7 - Grau de dependência (geral e por ILPI)."""
+    tabelas, graficos = _saidas('grau_dependencia', pasta_tabelas, pasta_graficos)
+    geral, por_ilpi = _secao_categorica(base, 'dependence_degree', GRAU_DEPENDENCIA_DICT, tabelas, graficos,
+                                        'Frequência do Grau de Dependência dos Residentes',
+                                        'Frequência do Grau de Dependência dos Residentes por ILPI')
+    return {'grau_dependencia_geral': geral, 'grau_dependencia_por_ilpi': por_ilpi}
+
+
+def secao_vinculo(base, pasta_tabelas, pasta_graficos, vinculo_dict=None):
+    """8 - Tipo de vínculo com a ILPI (múltipla resposta, geral e por ILPI)."""
+    tabelas, graficos = _saidas('vinculo', pasta_tabelas, pasta_graficos)
+
+    legenda = 'Vínculo com a ILPI'
+    vinculo_dict = vinculo_dict or VINCULO_DICT
+    colunas = ['institution_name'] + [c for c in vinculo_dict if c in base.columns]
+    # processa_multiresposta grava a legenda no DataFrame recebido: usa uma cópia das colunas
+    vinculo = processa_multiresposta(base[colunas].copy(), vinculo_dict, legenda)
+    geral = _contagem_com_proporcao(vinculo, [legenda])
+    por_ilpi = _contagem_com_proporcao(vinculo, ['ILPI', legenda])
+
+    salvar_tabela_como_imagem(geral, tabelas[0], largura_max_coluna=25)
+    salvar_tabela_como_imagem(por_ilpi, tabelas[1], largura_max_coluna=25)
+    plot_bar_flex_unificado(geral, title='Frequência do Vinculo dos Residentes',
+                            xlabel='Tipo de vínculo', ylabel='Número de residentes',
+                            filename=graficos[0], orientation='v', value_format='absolute',
+                            show_values=True, show_text=False,
+                            col_categoria=legenda, col_valor='total', mostrar=False)
+    for filename, formato in [(graficos[1], 'absolute'), (graficos[2], 'percent')]:
+        plot_bar_flex_unificado(por_ilpi, title='Frequência do Vínculo dos Residentes por ILPI',
+                                xlabel='', ylabel='Número de residentes',
+                                filename=filename, orientation='v', value_format=formato,
+                                show_values=True, show_text=False,
+                                col_categoria='ILPI', col_valor='total', mostrar=False)
+    return {'vinculo_geral': geral, 'vinculo_por_ilpi': por_ilpi}
+
+
+def secao_fonte_renda(base, pasta_tabelas, pasta_graficos):
+    """9 - Fonte de renda (geral e por ILPI)."""
+    tabelas, graficos = _saidas('fonte_renda', pasta_tabelas, pasta_graficos)
+    geral, por_ilpi = _secao_categorica(base, 'elder_income_source', FONTE_RENDA_DICT, tabelas, graficos,
+                                        'Frequência Fonte de Renda dos Residentes',
+                                        'Frequência da Fonte de Renda dos Residentes por ILPI')
+    return {'fonte_renda_geral': geral, 'fonte_renda_por_ilpi': por_ilpi}
+
+
+def secao_medicamentos(base, pasta_tabelas, pasta_graficos):
+    """10 - Registro de medicamentos (geral e por ILPI) e medicamentos por residente."""
+    tabelas, graficos = _saidas('medicamentos', pasta_tabelas, pasta_graficos)
+
+    medic_registro = base[['institution_name', 'recorded']]
+    geral = _contagem_com_proporcao(_coluna_valida(base, 'recorded'), ['recorded'])
+    geral['recorded'] = geral['recorded'].map({1: 'Sim', 0: 'Não'})
+    por_ilpi = _contagem_com_proporcao(medic_registro, ['institution_name', 'recorded'])
+
+    salvar_tabela_como_imagem(geral, tabelas[0], largura_max_coluna=25)
+    salvar_tabela_como_imagem(por_ilpi, tabelas[1], largura_max_coluna=25)
+    plot_bar_flex_unificado(geral,
+                            title='Frequência de Registro de Medicamentos do Residente',
+                            xlabel='', ylabel='Registro', filename=graficos[0],
+                            orientation='v', value_format='absolute',
+                            col_valor='total', col_categoria='recorded',
+                            show_values=True, show_text=False, mostrar=False)
+    plot_bar_flex_unificado(por_ilpi,
+                            title='Frequência do Registro de Medicamentos dos Residentes por ILPI',
+                            xlabel='', ylabel='Número de residentes', filename=graficos[1],
+                            orientation='v', value_format='percent',
+                            col_categoria='institution_name', col_valor='total', col_grupo='recorded',
+                            show_values=True, show_text=False, mostrar=False)
+
+    medic_por_residente = extrair_medicamentos(base)
+    contagem = medic_por_residente.groupby(['ILPI', 'CPF', 'Nome Completo']).size().reset_index(name='total')
+    return {'registro_geral': geral, 'registro_por_ilpi': por_ilpi,
+            'medicamentos_por_residente': medic_por_residente, 'contagem_por_residente': contagem}
+
+
+def secao_morbidades(base, pasta_tabelas, pasta_graficos, morbidades_dict=None):
+    """Morbidades binárias e textuais por residente."""
+    return {'morbidades': extrair_morbidades(base, morbidades_dict or MORBIDADES_DICT)}
+
+
+def secao_fragilidade(base, pasta_tabelas, pasta_graficos):
+    """Componentes de fragilidade: nível de risco por residente e resumo por ILPI."""
+    tabelas, _ = _saidas('fragilidade', pasta_tabelas, pasta_graficos)
+
+    resultado, resumo = classificar_risco(base, CONDICAO_CRITICA, CONDICAO_ALERTA, CONDICAO_ATENCAO)
+    salvar_tabela_como_imagem(resumo, tabelas[0],
+                              titulo='Score de Fragilidade do Residente por ILPI',
+                              largura_max_coluna=25)
+    return {'resultado': resultado, 'resumo': resumo}
+
+
+SECOES = {
+    'genero': secao_genero,
+    'idade': secao_idade,
+    'raca': secao_raca,
+    'escolaridade': secao_escolaridade,
+    'tempo_institucionalizacao': secao_tempo_institucionalizacao,
+    'suporte_familiar': secao_suporte_familiar,
+    'grau_dependencia': secao_grau_dependencia,
+    'vinculo': secao_vinculo,
+    'fonte_renda': secao_fonte_renda,
+    'medicamentos': secao_medicamentos,
+    'morbidades': secao_morbidades,
+    'fragilidade': secao_fragilidade,
+}
+
+# ----------------------------------------
+
+def _adicionar_perfil(grafo, prefixo, caminho_base, pasta_saida, sep, secoes, ilpis):
+    pasta_tabelas = os.path.join(pasta_saida, 'tables')
+    pasta_graficos = os.path.join(pasta_saida, 'plots')
+    os.makedirs(pasta_tabelas, exist_ok=True)
+    os.makedirs(pasta_graficos, exist_ok=True)
+
+    base = f'{prefixo}base'
+    grafo.adicionar(base, carregar_base, arquivos=[caminho_base],
+                    parametros={'caminho': caminho_base, 'sep': sep, 'ilpis': ilpis})
+    nomes = []
+    for nome in secoes or SECOES:
+        tabelas, graficos = _saidas(nome, pasta_tabelas, pasta_graficos)
+        grafo.adicionar(f'{prefixo}{nome}', SECOES[nome], entradas={'base': base}, saidas=tabelas + graficos,
+                        parametros={'pasta_tabelas': pasta_tabelas, 'pasta_graficos': pasta_graficos})
+        nomes.append(f'{prefixo}{nome}')
+    return nomes
+
+
+def _adicionar_resultados(grafo, secoes, prefixos, pasta_saida, formato, metadados):
+    """Tarefa final que grava os resultados de todas as seções no armazém (ver analise_ilpi.resultados)."""
+    caminho = os.path.join(pasta_saida, 'resultados.sqlite' if formato == 'sqlite' else 'resultados')
+    grafo.adicionar('resultados', gravar_resultados_secoes, entradas=secoes, arquivos=[metadados['base']],
+                    saidas=[ArmazemResultados(caminho, formato).marcador],
+                    parametros={'caminho': caminho, 'formato': formato, 'metadados': metadados,
+                                'prefixos': prefixos})
+
+
+def grafo_perfil(caminho_base, pasta_saida, sep=';', secoes=None, ilpis=None, por_ilpi=False,
+                 resultados='parquet'):
+    """
+    Monta o grafo de tarefas do perfil epidemiológico: a tarefa 'base' lê o CSV e cada
+    seção depende apenas dela, de modo que as seções rodam em paralelo e só são refeitas
+    quando a base, o código da seção ou os arquivos de saída mudam.
+
+    Parâmetros:
+    - caminho_base: CSV da base.
+    - pasta_saida: pasta com as subpastas 'tables' e 'plots' (e '.tarefas', com o estado).
+    - sep: separador do CSV.
+    - secoes: nomes das seções (padrão: todas as de SECOES).
+    - ilpis: lista de ILPIs (None usa todas).
+    - por_ilpi: se True, gera um relatório por ILPI em `<pasta_saida>/<ILPI>/`; as tarefas de
+      todas as ILPIs ficam no mesmo grafo e são distribuídas entre os processos.
+    - resultados: 'parquet' ou 'sqlite' para gravar também as tabelas calculadas pelas seções em
+      `<pasta_saida>/resultados` (ou `resultados.sqlite`), com os metadados da execução
+      (ver analise_ilpi.resultados); None não grava.
+
+    Retorna:
+    - GrafoTarefas pronto para `executar`.
+
+    Exemplo de uso:
+    grafo = grafo_perfil('../../../data/SMSAp/base_perfil_epidemiologico.csv', '..')
+    situacao = grafo.executar(workers=None)
+    ArmazemResultados('../resultados').ler('raca_por_ilpi')
+    """
+    grafo = GrafoTarefas(os.path.join(pasta_saida, '.tarefas'))
+    metadados = {'base': os.path.abspath(caminho_base), 'secoes': list(secoes or SECOES),
+                 'ilpis': ilpis, 'por_ilpi': por_ilpi}
+    if not por_ilpi:
+        tarefas = _adicionar_perfil(grafo, '', caminho_base, pasta_saida, sep, secoes, ilpis)
+        prefixos = []
+    else:
+        if ilpis is None:
+            ilpis = pd.read_csv(caminho_base, sep=sep, usecols=['institution_name'])['institution_name']
+            ilpis = sorted(ilpis.dropna().unique().tolist())
+        tarefas, prefixos = [], []
+        for ilpi in ilpis:
+            nome = _nome_arquivo(ilpi)
+            prefixos.append(f'{nome}.')
+            tarefas += _adicionar_perfil(grafo, f'{nome}.', caminho_base, os.path.join(pasta_saida, nome), sep,
+                                         secoes, [ilpi])
+
+    if resultados is not None:
+        _adicionar_resultados(grafo, tarefas, prefixos, pasta_saida, resultados, metadados)
+    return grafo
@@ -0,0 +1,126 @@
+import inspect
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+# ------------------------------
+# Renderização em lote (headless) das figuras dos relatórios
+# ------------------------------
+
+# Especificação de uma figura: função de plot + argumentos + caminho de saída (informativo)
+EspecFigura = namedtuple('EspecFigura', ['funcao', 'args', 'kwargs', 'caminho'])
+
+# Chaves do rcParams que não devem ser copiadas para os processos (backend é sempre Agg)
+_CHAVES_IGNORADAS = {'backend', 'backend_fallback', 'interactive'}
+
+
+def parametros_estilo():
+    """rcParams atuais sem as chaves de backend, para replicar o estilo em outros processos."""
+    return {chave: valor for chave, valor in matplotlib.rcParams.items() if chave not in _CHAVES_IGNORADAS}
+
+
+def _inicializar_processo(parametros):
+    """Configura cada processo do pool: backend Agg e o mesmo rcParams do processo principal."""
+    matplotlib.use('Agg', force=True)
+    matplotlib.rcParams.update(parametros)
+
+
+def _aceita_mostrar(funcao):
+    try:
+        return 'mostrar' in inspect.signature(funcao).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _renderizar(espec):
+    """
+    Executa uma especificação sem `plt.show()` e fecha as figuras que ela abriu, mesmo em caso
+    de erro; as figuras que já estavam abertas (ex: as de quem chamou) não são tocadas.
+    Retorna (caminho, mensagem de erro ou None).
+    """
+    import matplotlib.pyplot as plt
+
+    kwargs = dict(espec.kwargs)
+    if _aceita_mostrar(espec.funcao):
+        kwargs['mostrar'] = False
+    abertas = set(plt.get_fignums())
+    try:
+        espec.funcao(*espec.args, **kwargs)
+        return espec.caminho, None
+    except Exception as erro:
+        return espec.caminho, f'{type(erro).__name__}: {erro}'
+    finally:
+        for numero in set(plt.get_fignums()) - abertas:
+            plt.close(numero)
+
+
+class RenderizadorLote:
+    """
+    Coleta as figuras (dados + função de plot + caminho) e as renderiza em um pool de
+    processos com o backend Agg, sem abrir janelas e sem `plt.show()`.
+    Cada processo fecha as figuras após salvá-las.
+
+    As funções de plot precisam ser importáveis (ex: as de `analise_ilpi.graficos` e
+    `analise_ilpi.tabelas`); funções definidas dentro de notebooks ou lambdas não
+    podem ser enviadas aos processos.
+
+    Parâmetros:
+    - workers: número de processos (None usa os.cpu_count(); 1 renderiza no próprio processo, sem
+      trocar o backend nem fechar as figuras abertas por quem chamou).
+
+    Exemplo de uso:
+    lote = RenderizadorLote()
+    lote.adicionar(plot_barh, df_sexo, 'Sexo', 'Quantidade', '', '../plots/sexo.png')
+    lote.adicionar(salvar_tabela_como_imagem, tabela, '../tables/sexo.png', caminho='../tables/sexo.png')
+    lote.renderizar()
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers
+        self.especificacoes = []
+
+    def __len__(self):
+        return len(self.especificacoes)
+
+    def adicionar(self, funcao, *args, caminho=None, **kwargs):
+        """
+        Registra uma figura. `caminho` identifica a figura nos erros; se omitido,
+        usa o argumento 'filename'/'output_path' ou o primeiro argumento do tipo texto terminado em extensão.
+        """
+        if caminho is None:
+            caminho = kwargs.get('filename') or kwargs.get('output_path') or next(
+                (a for a in args if isinstance(a, str) and os.path.splitext(a)[1]), None
+            )
+        self.especificacoes.append(EspecFigura(funcao, args, kwargs, caminho))
+
+    def renderizar(self, workers=None):
+        """
+        Renderiza todas as figuras registradas e esvazia a fila.
+
+        Retorna:
+        - lista com os caminhos gerados, na ordem de registro.
+        Levanta RuntimeError listando as figuras que falharam (as demais são geradas).
+        """
+        especificacoes, self.especificacoes = self.especificacoes, []
+        workers = workers or self.workers or os.cpu_count() or 1
+        workers = min(workers, max(len(especificacoes), 1))
+
+        if workers == 1:
+            import matplotlib.pyplot as plt
+
+            # No próprio processo: sem trocar o backend de quem chamou; com o modo interativo
+            # desligado só durante o lote, as figuras não abrem janelas
+            with plt.ioff():
+                resultados = [_renderizar(espec) for espec in especificacoes]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_processo,
+                                     initargs=(parametros_estilo(),)) as executor:
+                resultados = list(executor.map(_renderizar, especificacoes, chunksize=4))
+
+        falhas = [(caminho, erro) for caminho, erro in resultados if erro is not None]
+        if falhas:
+            detalhes = '\n'.join(f'- {caminho}: {erro}' for caminho, erro in falhas)
+            raise RuntimeError(f'{len(falhas)} figura(s) não foram geradas:\n{detalhes}')
+        return [caminho for caminho, _ in resultados]
@@ -0,0 +1,320 @@
+import json
+import os
+import platform
+import re
+import sqlite3
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import etapa
+
+# ------------------------------
+# Armazém de resultados: tabelas calculadas pelas seções em Parquet ou SQLite, com metadados da execução
+# ------------------------------
+
+FORMATOS_RESULTADOS = ('parquet', 'sqlite')
+
+# Tabela/dataset com uma linha por execução; uma execução só fica visível depois de registrada nele
+EXECUCOES = '_execucoes'
+
+# Coluna que identifica a execução em todas as tabelas
+COLUNA_EXECUCAO = 'execucao'
+
+
+def _nome_valido(nome):
+    """Nome do resultado usado como pasta (Parquet) ou tabela (SQLite)."""
+    nome = re.sub(r'[^0-9A-Za-z_]+', '_', str(nome)).strip('_')
+    if not nome or nome == EXECUCOES:
+        raise ValueError(f"Nome de resultado inválido: '{nome}'")
+    return nome
+
+
+def _versao_pacote():
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('analise_ilpi')
+    except PackageNotFoundError:
+        return None
+
+
+def para_tabela(valor):
+    """
+    Converte um resultado para uma tabela que o Parquet e o SQLite aceitam:
+    - Series vira uma coluna; número/texto vira uma tabela de uma linha com a coluna 'valor';
+    - índice nomeado ou de rótulos não inteiros vira coluna (um índice inteiro sem nome, resto de
+      filtros, é descartado); colunas MultiIndex são unidas com '_';
+    - células que não são texto nem número (listas, dicts, mistura de tipos) viram texto.
+    """
+    if isinstance(valor, pd.Series):
+        valor = valor.to_frame(name=valor.name if valor.name is not None else 'valor')
+    elif not isinstance(valor, pd.DataFrame):
+        if not isinstance(valor, (int, float, str, bool, np.generic)) and valor is not None:
+            valor = str(valor)
+        valor = pd.DataFrame({'valor': [valor]})
+
+    df = valor
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.set_axis(['_'.join(str(n) for n in c if str(n)) for c in df.columns], axis=1)
+    if any(n is not None for n in df.index.names) or not pd.api.types.is_integer_dtype(df.index):
+        df = df.reset_index()
+    elif not df.index.equals(pd.RangeIndex(len(df))):
+        df = df.reset_index(drop=True)
+    df = df.set_axis([str(c) for c in df.columns], axis=1)
+
+    for coluna in df.columns:
+        serie = df[coluna]
+        if serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) not in ('string', 'empty'):
+            df[coluna] = serie.where(serie.isna(), serie.astype(str))
+    return df
+
+
+class ArmazemResultados:
+    """
+    Guarda as tabelas calculadas pelas seções dos relatórios para leitura por painéis e BI, sem
+    refazer as análises. Cada execução grava todas as suas tabelas e, por último, uma linha em
+    `_execucoes` (data, versão, base e parâmetros); `ler` só enxerga execuções registradas.
+
+    Formatos:
+    - 'parquet': uma pasta (dataset) por resultado, particionada no estilo Hive
+      (`<caminho>/<nome>/execucao=<id>/part-0.parquet`; exige pyarrow). Pode ser lida direto por
+      pd.read_parquet, DuckDB, Spark ou Power BI.
+    - 'sqlite': um arquivo com uma tabela por resultado e a coluna 'execucao'.
+
+    Parâmetros:
+    - caminho: pasta (Parquet) ou arquivo .sqlite/.db.
+    - formato: 'parquet' ou 'sqlite' (padrão: 'sqlite' para arquivos .sqlite/.db, senão 'parquet').
+
+    Exemplo de uso:
+    armazem = ArmazemResultados('../output/resultados')
+    armazem.gravar({'genero': gender_join, 'raca_por_ilpi': df_raca_inst}, base='base_perfil.csv')
+    df = armazem.ler('raca_por_ilpi')       # última execução
+    armazem.execucoes()
+    """
+
+    def __init__(self, caminho, formato=None):
+        if formato is None:
+            formato = 'sqlite' if os.path.splitext(caminho)[1].lower() in ('.sqlite', '.db') else 'parquet'
+        if formato not in FORMATOS_RESULTADOS:
+            raise ValueError(f"formato deve ser um de {FORMATOS_RESULTADOS}, recebido: '{formato}'")
+        self.caminho = caminho
+        self.formato = formato
+
+    def __repr__(self):
+        return f'ArmazemResultados({self.caminho!r}, formato={self.formato!r})'
+
+    @property
+    def marcador(self):
+        """Caminho que só existe depois da primeira execução registrada (saída das tarefas)."""
+        return os.path.join(self.caminho, EXECUCOES) if self.formato == 'parquet' else self.caminho
+
+    # --- gravação ---
+
+    @etapa('gravar_resultados')
+    def gravar(self, resultados, **metadados):
+        """
+        Grava uma execução.
+
+        Parâmetros:
+        - resultados: dict nome -> DataFrame, Series ou valor (ver `para_tabela`).
+        - metadados: informações da execução (ex: base, secoes, ilpis); valores que não são
+          texto são guardados como JSON (None vira 'null').
+
+        Retorna:
+        - identificador da execução (ordenável pela data/hora).
+        """
+        execucao = f"{datetime.now().strftime('%Y%m%dT%H%M%S%f')}_{uuid.uuid4().hex[:6]}"
+        tabelas = {_nome_valido(nome): para_tabela(valor) for nome, valor in resultados.items()}
+        registro = {
+            COLUNA_EXECUCAO: execucao,
+            'data_hora': datetime.now().isoformat(timespec='seconds'),
+            'versao_analise_ilpi': _versao_pacote(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'resultados': json.dumps(sorted(tabelas)),
+        }
+        for chave, valor in metadados.items():
+            # Sempre texto (JSON para o que não é texto, inclusive None -> 'null'): o tipo da coluna não
+            # muda entre execuções e o dataset `_execucoes` continua legível por qualquer leitor
+            registro[chave] = valor if isinstance(valor, str) else json.dumps(valor, ensure_ascii=False, default=str)
+
+        if self.formato == 'parquet':
+            self._gravar_parquet(execucao, tabelas, registro)
+        else:
+            self._gravar_sqlite(execucao, tabelas, registro)
+        return execucao
+
+    def _gravar_parquet(self, execucao, tabelas, registro):
+        for nome, df in list(tabelas.items()) + [(EXECUCOES, pd.DataFrame([registro]).drop(columns=COLUNA_EXECUCAO))]:
+            pasta = os.path.join(self.caminho, nome, f'{COLUNA_EXECUCAO}={execucao}')
+            os.makedirs(pasta, exist_ok=True)
+            caminho = os.path.join(pasta, 'part-0.parquet')
+            # Nomes iniciados por '.' são ignorados pelos leitores de datasets (pyarrow, DuckDB)
+            temporario = os.path.join(pasta, f'.part-0.{os.getpid()}.tmp')
+            df.to_parquet(temporario, index=False)
+            os.replace(temporario, caminho)
+
+    def _gravar_sqlite(self, execucao, tabelas, registro):
+        os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+        conexao = sqlite3.connect(self.caminho)
+        try:
+            # `_execucoes` é gravada por último: `ler` não enxerga execuções interrompidas
+            with conexao:
+                for nome, df in list(tabelas.items()) + [(EXECUCOES, pd.DataFrame([registro]))]:
+                    if COLUNA_EXECUCAO not in df.columns:
+                        df = df.assign(**{COLUNA_EXECUCAO: execucao})
+                        df = df[[COLUNA_EXECUCAO] + [c for c in df.columns if c != COLUNA_EXECUCAO]]
+                    self._adicionar_colunas(conexao, nome, df)
+                    df.to_sql(nome, conexao, if_exists='append', index=False)
+        finally:
+            conexao.close()
+
+    @staticmethod
+    def _adicionar_colunas(conexao, tabela, df):
+        """Colunas novas de uma tabela já existente (o resultado mudou entre versões)."""
+        existentes = {linha[1] for linha in conexao.execute(f'PRAGMA table_info("{tabela}")')}
+        if not existentes:
+            return
+        for coluna in df.columns:
+            if coluna not in existentes:
+                conexao.execute(f'ALTER TABLE "{tabela}" ADD COLUMN "{coluna.replace(chr(34), chr(34) * 2)}"')
+
+    # --- leitura ---
+
+    def execucoes(self):
+        """DataFrame com uma linha por execução registrada (mais antiga primeiro)."""
+        if self.formato == 'parquet':
+            pasta = os.path.join(self.caminho, EXECUCOES)
+            if not os.path.isdir(pasta):
+                return pd.DataFrame(columns=[COLUNA_EXECUCAO])
+            # Um arquivo por execução, lido separadamente: os metadados podem ter tipos diferentes entre
+            # execuções (ex: ilpis nulo em uma e texto em outra), o que o dataset do pyarrow não unifica
+            prefixo = f'{COLUNA_EXECUCAO}='
+            partes = [
+                pd.read_parquet(os.path.join(pasta, p, 'part-0.parquet')).assign(**{COLUNA_EXECUCAO: p[len(prefixo):]})
+                for p in sorted(os.listdir(pasta))
+                if p.startswith(prefixo) and os.path.exists(os.path.join(pasta, p, 'part-0.parquet'))
+            ]
+            if not partes:
+                return pd.DataFrame(columns=[COLUNA_EXECUCAO])
+            df = pd.concat(partes, ignore_index=True)
+            colunas = [COLUNA_EXECUCAO] + [c for c in df.columns if c != COLUNA_EXECUCAO]
+            return df[colunas].sort_values(COLUNA_EXECUCAO, ignore_index=True)
+
+        if not os.path.exists(self.caminho):
+            return pd.DataFrame(columns=[COLUNA_EXECUCAO])
+        with sqlite3.connect(self.caminho) as conexao:
+            try:
+                return pd.read_sql(f'SELECT * FROM "{EXECUCOES}" ORDER BY {COLUNA_EXECUCAO}', conexao)
+            except pd.errors.DatabaseError:
+                return pd.DataFrame(columns=[COLUNA_EXECUCAO])
+
+    def nomes(self):
+        """Nomes dos resultados já gravados."""
+        if self.formato == 'parquet':
+            if not os.path.isdir(self.caminho):
+                return []
+            return sorted(n for n in os.listdir(self.caminho)
+                          if n != EXECUCOES and os.path.isdir(os.path.join(self.caminho, n)))
+        if not os.path.exists(self.caminho):
+            return []
+        with sqlite3.connect(self.caminho) as conexao:
+            linhas = conexao.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        return sorted(n for (n,) in linhas if n != EXECUCOES)
+
+    def ler(self, nome, execucao='ultima'):
+        """
+        Lê um resultado.
+
+        Parâmetros:
+        - nome: nome do resultado.
+        - execucao: 'ultima' (última execução registrada que gravou o resultado), um identificador
+          de execução, ou None para todas as execuções (coluna 'execucao' identifica cada uma).
+
+        Retorna:
+        - DataFrame.
+        """
+        nome = _nome_valido(nome)
+        registradas = self.execucoes()[COLUNA_EXECUCAO].tolist()
+        if self.formato == 'parquet':
+            pasta = os.path.join(self.caminho, nome)
+            prefixo = f'{COLUNA_EXECUCAO}='
+            disponiveis = sorted(
+                p[len(prefixo):] for p in (os.listdir(pasta) if os.path.isdir(pasta) else [])
+                if p.startswith(prefixo) and p[len(prefixo):] in set(registradas)
+            )
+        else:
+            with sqlite3.connect(self.caminho) as conexao:
+                try:
+                    disponiveis = [e for (e,) in conexao.execute(
+                        f'SELECT DISTINCT {COLUNA_EXECUCAO} FROM "{nome}" ORDER BY {COLUNA_EXECUCAO}')]
+                except sqlite3.OperationalError:
+                    disponiveis = []
+            disponiveis = [e for e in disponiveis if e in set(registradas)]
+
+        if not disponiveis:
+            raise KeyError(f"Resultado '{nome}' não encontrado em {self.caminho}")
+        if execucao == 'ultima':
+            selecionadas = disponiveis[-1:]
+        elif execucao is None:
+            selecionadas = disponiveis
+        elif execucao in disponiveis:
+            selecionadas = [execucao]
+        else:
+            raise KeyError(f"Execução '{execucao}' não tem o resultado '{nome}'")
+
+        if self.formato == 'parquet':
+            partes = [
+                pd.read_parquet(os.path.join(self.caminho, nome, f'{COLUNA_EXECUCAO}={e}', 'part-0.parquet'))
+                .assign(**{COLUNA_EXECUCAO: e})
+                for e in selecionadas
+            ]
+            df = pd.concat(partes, ignore_index=True)
+        else:
+            marcadores = ', '.join('?' * len(selecionadas))
+            with sqlite3.connect(self.caminho) as conexao:
+                df = pd.read_sql(f'SELECT * FROM "{nome}" WHERE {COLUNA_EXECUCAO} IN ({marcadores})',
+                                 conexao, params=selecionadas)
+        if execucao is not None:
+            df = df.drop(columns=COLUNA_EXECUCAO)
+        return df
+
+# ----------------------------------------
+
+def gravar_resultados_secoes(caminho, formato=None, metadados=None, prefixos=(), **secoes):
+    """
+    Tarefa final do grafo do relatório: grava no armazém todos os resultados das seções
+    (argumentos nomeados: nome da tarefa -> dict retornado pela seção).
+
+    O resultado 'chave' da seção 'secao' recebe o nome 'chave' se começar com o nome da seção e
+    'secao_chave' caso contrário. Com `prefixos` (um relatório por ILPI), os resultados de mesmo nome
+    são empilhados com a coluna 'escopo' (o prefixo da tarefa, ex: 'ILPI_2').
+
+    Retorna:
+    - identificador da execução.
+    """
+    por_nome = {}
+    for tarefa, resultado in secoes.items():
+        escopo, secao = None, tarefa
+        for prefixo in prefixos:
+            if prefixo and tarefa.startswith(prefixo):
+                escopo, secao = prefixo.rstrip('.'), tarefa[len(prefixo):]
+                break
+        if not isinstance(resultado, dict):
+            resultado = {secao: resultado}
+        for chave, valor in resultado.items():
+            nome = chave if chave.startswith(secao) else f'{secao}_{chave}'
+            tabela = para_tabela(valor)
+            if escopo is not None:
+                tabela.insert(0, 'escopo', escopo)
+            por_nome.setdefault(nome, []).append(tabela)
+
+    resultados = {nome: pd.concat(tabelas, ignore_index=True) if len(tabelas) > 1 else tabelas[0]
+                  for nome, tabelas in por_nome.items()}
+    metadados = dict(metadados or {})
+    if isinstance(metadados.get('base'), str) and os.path.exists(metadados['base']):
+        from .tarefas import _hash_arquivo
+        metadados['sha256_base'] = _hash_arquivo(metadados['base'])
+    return ArmazemResultados(caminho, formato).gravar(resultados, **metadados)
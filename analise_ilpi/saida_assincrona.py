@@ -0,0 +1,231 @@
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from .instrumentacao import etapa
+
+# ------------------------------
+# Saída assíncrona: figuras, tabelas e CSVs codificados em memória e gravados por threads
+# ------------------------------
+
+# Limite padrão de bytes aguardando gravação (quem gera espera quando ele é atingido)
+MAX_BYTES_PENDENTES = 256 * 1024 * 1024
+
+# Saída ativa no processo (None: as gravações são feitas na hora, como antes)
+_saida = None
+
+
+class ErroGravacao(OSError):
+    """Uma ou mais gravações assíncronas falharam; `erros` tem caminho -> exceção."""
+
+    def __init__(self, erros):
+        self.erros = erros
+        lista = '\n'.join(f'- {caminho}: {type(erro).__name__}: {erro}' for caminho, erro in erros.items())
+        super().__init__(f'{len(erros)} arquivo(s) não gravado(s):\n{lista}')
+
+
+def _gravar_atomico(caminho, dados):
+    """Grava em um temporário na mesma pasta e renomeia: quem lê nunca vê o arquivo pela metade."""
+    temporario = f'{caminho}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temporario, 'wb') as f:
+            f.write(dados)
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+class SaidaAssincrona:
+    """
+    Enquanto ativa (`with SaidaAssincrona() as saida:`), as figuras e tabelas dos relatórios são
+    codificadas em memória (PNG, SVG, HTML, CSV, Parquet) por quem as gera e gravadas em disco por
+    um pool de threads, de modo que o cálculo da próxima tabela não espera pela escrita, que em
+    pastas de rede pode levar mais que o próprio desenho.
+
+    Ao sair do bloco, espera todas as gravações (`aguardar`); falhas são levantadas juntas como
+    `ErroGravacao`. Gravações para o mesmo caminho são feitas na ordem em que foram pedidas.
+
+    Parâmetros:
+    - workers: número de threads de escrita.
+    - max_bytes_pendentes: bytes aguardando gravação acima dos quais `gravar` espera.
+
+    Exemplo de uso:
+    with SaidaAssincrona(workers=4):
+        plot_barh(df_sexo, 'Sexo', 'Quantidade', '', '../plots/sexo.png', mostrar=False)
+        salvar_tabela_como_imagem(tabela, '../tables/sexo.png')
+    """
+
+    def __init__(self, workers=4, max_bytes_pendentes=MAX_BYTES_PENDENTES):
+        self.workers = workers
+        self.max_bytes_pendentes = max_bytes_pendentes
+        self._executor = None
+        self._anterior = None
+        # caminho -> gravações agendadas ainda não conferidas por `aguardar`, na ordem dos pedidos
+        self._futuros = {}
+        # caminho -> {'funcoes': [...], 'concluida': bool}, para `ao_concluir`
+        self._retornos = {}
+        self._erros = {}
+        self._bytes_pendentes = 0
+        self._condicao = threading.Condition()
+
+    def __enter__(self):
+        global _saida
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='saida_assincrona')
+        self._anterior, _saida = _saida, self
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        global _saida
+        _saida = self._anterior
+        try:
+            # Com uma exceção em andamento, apenas espera as gravações sem mascará-la
+            with etapa('aguardar_gravacoes'):
+                self.aguardar(levantar=tipo is None)
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
+    # --- gravação ---
+
+    def _tarefa(self, caminho, dados, anterior, retornos):
+        try:
+            if anterior is not None:
+                # Mesmo caminho: a gravação anterior foi enviada antes e já está em execução ou concluída
+                wait([anterior])
+            _gravar_atomico(caminho, dados)
+            # Na própria thread (e não em add_done_callback), para terminar antes de `aguardar` retornar
+            with self._condicao:
+                retornos['concluida'] = True
+                funcoes = list(retornos['funcoes'])
+            for funcao in funcoes:
+                funcao()
+        finally:
+            with self._condicao:
+                self._bytes_pendentes -= len(dados)
+                self._condicao.notify_all()
+
+    def gravar(self, caminho, dados):
+        """Agenda a gravação de `dados` (bytes) em `caminho`. Retorna o Future da gravação."""
+        if self._executor is None:
+            raise RuntimeError('SaidaAssincrona não está ativa; use `with SaidaAssincrona() as saida:`.')
+        with self._condicao:
+            # Sempre aceita ao menos uma gravação, mesmo maior que o limite
+            self._condicao.wait_for(
+                lambda: self._bytes_pendentes == 0 or self._bytes_pendentes + len(dados) <= self.max_bytes_pendentes
+            )
+            self._bytes_pendentes += len(dados)
+        # As gravações concluídas com sucesso já não precisam ser conferidas; as que falharam ficam
+        # na lista até `aguardar`, mesmo que uma gravação posterior do mesmo caminho dê certo
+        futuros = [f for f in self._futuros.get(caminho, []) if not f.done() or f.exception() is not None]
+        anterior = futuros[-1] if futuros and not futuros[-1].done() else None
+        retornos = {'funcoes': [], 'concluida': False}
+        futuro = self._executor.submit(self._tarefa, caminho, dados, anterior, retornos)
+        self._futuros[caminho] = futuros + [futuro]
+        self._retornos[caminho] = retornos
+        return futuro
+
+    def pendente(self, caminho):
+        """Future da última gravação agendada para `caminho`, ou None."""
+        futuros = self._futuros.get(caminho)
+        return futuros[-1] if futuros else None
+
+    def ao_concluir(self, caminho, funcao):
+        """Chama `funcao()` quando a última gravação de `caminho` terminar sem erro (ou já, se não houver)."""
+        retornos = self._retornos.get(caminho)
+        if retornos is not None:
+            with self._condicao:
+                if not retornos['concluida']:
+                    retornos['funcoes'].append(funcao)
+                    return
+        funcao()
+
+    def aguardar(self, levantar=True):
+        """
+        Espera todas as gravações agendadas até agora.
+
+        Retorna:
+        - lista com os caminhos gravados (todas as gravações do caminho deram certo).
+        Levanta `ErroGravacao` (com todas as falhas; a primeira de cada caminho) se alguma gravação
+        falhou e `levantar` for True.
+        """
+        futuros, self._futuros, self._retornos = self._futuros, {}, {}
+        wait([futuro for lista in futuros.values() for futuro in lista])
+        gravados = []
+        for caminho, lista in futuros.items():
+            erro = next((f.exception() for f in lista if f.exception() is not None), None)
+            if erro is None:
+                gravados.append(caminho)
+            else:
+                self._erros.setdefault(caminho, erro)
+        erros, self._erros = self._erros, {}
+        if erros and levantar:
+            raise ErroGravacao(erros)
+        return gravados
+
+
+def saida_ativa():
+    """Saída assíncrona ativa neste processo, ou None."""
+    return _saida
+
+
+def gravar_bytes(caminho, dados):
+    """Grava `dados` (bytes) pela saída ativa ou, sem saída ativa, na hora."""
+    if _saida is not None:
+        _saida.gravar(caminho, dados)
+    else:
+        with open(caminho, 'wb') as f:
+            f.write(dados)
+
+
+def gravar_texto(caminho, texto, encoding='utf-8'):
+    """Como `gravar_bytes`, para texto (SVG, HTML, JSON...)."""
+    gravar_bytes(caminho, texto.encode(encoding))
+
+
+def gravar_figura(fig, caminho, **opcoes_savefig):
+    """
+    `fig.savefig(caminho, ...)`; com saída ativa, a figura é codificada em memória (no formato da
+    extensão do arquivo) e só a escrita fica para as threads.
+    """
+    if _saida is None:
+        fig.savefig(caminho, **opcoes_savefig)
+        return
+    opcoes_savefig.setdefault('format', os.path.splitext(caminho)[1][1:].lower() or None)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **opcoes_savefig)
+    _saida.gravar(caminho, buffer.getvalue())
+
+
+def gravar_imagem_pil(imagem, caminho, **opcoes):
+    """`imagem.save(caminho, ...)` do Pillow, pela saída ativa quando houver."""
+    if _saida is None:
+        imagem.save(caminho, **opcoes)
+        return
+    from PIL import Image
+
+    extensao = os.path.splitext(caminho)[1].lower()
+    opcoes.setdefault('format', Image.registered_extensions().get(extensao, 'PNG'))
+    buffer = io.BytesIO()
+    imagem.save(buffer, **opcoes)
+    _saida.gravar(caminho, buffer.getvalue())
+
+
+def gravar_csv(df, caminho, encoding='utf-8', **opcoes_to_csv):
+    """`df.to_csv(caminho, ...)`, pela saída ativa quando houver."""
+    if _saida is None:
+        df.to_csv(caminho, encoding=encoding, **opcoes_to_csv)
+        return
+    _saida.gravar(caminho, df.to_csv(None, **opcoes_to_csv).encode(encoding))
+
+
+def gravar_parquet(df, caminho, **opcoes_to_parquet):
+    """`df.to_parquet(caminho, ...)`, pela saída ativa quando houver."""
+    if _saida is None:
+        df.to_parquet(caminho, **opcoes_to_parquet)
+        return
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, **opcoes_to_parquet)
+    _saida.gravar(caminho, buffer.getvalue())
@@ -0,0 +1,704 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Exportações sintéticas do REDCap (perfil epidemiológico SMSAp e monitoramento UFG)
+# ------------------------------
+#
+# Mesmo leiaute de colunas das exportações reais (PerfilEpidemiolgicos_DATA e
+# MonitoramentoEDiagns_DATA), com nomes, CPFs e textos inventados: servem para testes de carga
+# e podem ser compartilhadas. As proporções das respostas codificadas seguem, aproximadamente,
+# a coleta de Aparecida de Goiânia (2025).
+
+
+def _checkbox(prefixo, n, com_nan=False):
+    """Colunas de uma família de checkbox do REDCap (prefixo___1 ... prefixo___n)."""
+    return [f'{prefixo}___{i}' for i in range(1, n + 1)] + ([f'{prefixo}___nan'] if com_nan else [])
+
+
+def _profissional(quantidade, sufixo):
+    return [quantidade, f'weekly_hours_{sufixo}', f'days_per_month_{sufixo}']
+
+
+COLUNAS_PERFIL = [
+    'record_id', 'redcap_repeat_instrument', 'redcap_repeat_instance', 'redcap_survey_identifier',
+    'identificao_da_ilpi_f650_timestamp', 'visit_date', 'institution_name', 'institution_type', 'latitude',
+    'longitude', 'identificao_da_ilpi_f650_complete', 'dados_sciodemogrficos_timestamp', 'name', 'surname',
+    'full_name', 'cpf', 'sex', 'date_of_birth', 'elder_age', 'race', 'scholarship', 'admission_date',
+    'institut_time_years', 'time_months', 'institut_time_months', 'family_support', 'dependence_degree',
+    *_checkbox('link_type', 3, com_nan=True), 'elder_income_source', 'dados_sciodemogrficos_complete',
+    'medicamentos_em_uso_timestamp', 'med_name', 'dosage', 'recorded', 'combination_of_medicines',
+    'combination_1', 'combination_dosage',
+    *[c for i in range(2, 7) for c in (f'combination_{i}', f'combination_dosage_{i}')],
+    'taken_daily', 'medicamentos_em_uso_complete', 'morbidades_prvias_timestamp',
+    *_checkbox('morbidities', 21, com_nan=True), 'other_morbidities', 'morbidades_prvias_complete',
+    'estado_de_sade_timestamp', 'health_condition', 'estado_de_sade_complete',
+    'componentes_de_fragilidade_timestamp', 'elder_visitors', *_checkbox('physical_desabilities', 3, com_nan=True),
+    'weight_loss', 'amount_weight_loss', 'elder_strenght', 'elder_hospitalized', 'elder_difficulties',
+    'elder_mobility', 'basic_activities_diffic', 'falls_number', 'componentes_de_fragilidade_complete',
+    'responsvel_pelo_preenchimento_timestamp', 'interviewer_name', 'responsvel_pelo_preenchimento_complete',
+]
+
+# (coluna da quantidade, sufixo das colunas de horas semanais e dias por mês)
+PROFISSIONAIS_MONITORAMENTO = [
+    ('nurse_aux', 'na'), ('nurse_tech', 'nt'), ('nurse', 'n'), ('physiotherapist', 'physio'),
+    ('nutritionist', 'nutrit'), ('psicologist', 'psicol'), ('physician', 'physician'),
+    ('occup_therapist', 'occup'), ('caregiver', 'caregiver'),
+]
+
+COLUNAS_MONITORAMENTO = [
+    'record_id', 'visit_date', 'institution_name', 'postal_code', 'address', 'interviewed', 'residents_number',
+    'residents_bedroom', 'vehicle', 'normal_ilpi', 'caracterizao_da_ilpi_complete',
+    *[c for quantidade, sufixo in PROFISSIONAIS_MONITORAMENTO for c in _profissional(quantidade, sufixo)],
+    'other_health_prof', 'other_health_prof_1', 'other_health_prof_2', 'other_prof', 'other_prof_1', 'other_prof_2',
+    'w_h_other_health_prof', 'w_h_other_health_prof_1', 'w_h_other_health_prof_2', 'd_p_month_oth_health_prof',
+    'd_p_month_oth_health_prof1', 'd_p_month_oth_health_prof2',
+    *_profissional('housekeeping', 'housekeep'), *_profissional('staff', 'staff'),
+    *_checkbox('employment_relatioship', 3), *_checkbox('physio_program', 4), *_checkbox('activities', 2),
+    'physio_instructions', 'no_orientation', 'profissionais_da_ilpi_complete',
+    'secutiry_system', *_checkbox('security_device_type', 5), 'safety_device_availability', 'safety_device',
+    'safety_device_working', 'reason_1', 'lighting', 'ventilation', 'painting_color', *_checkbox('room_access', 3),
+    *_checkbox('bathroom_access', 3), *_checkbox('other_areas', 3), *_checkbox('cafeteria', 3), 'epi_use',
+    'segurana_e_ambiente_complete',
+    'medication_val_date', 'violeted_pakage', 'medicine_refrigerator', 'refrigerator_temp_log', 'medication_register',
+    *_checkbox('medication_register_type', 3), 'psico_drugs_segregation', 'psico_drugs_storage',
+    *_checkbox('medication_manipulation', 7), 'other_meditation_manip', 'organizao_da_farmcia_complete',
+    'dirty_clothing_segregation', 'dirty_clothing_change', 'servio_lavanderia_complete',
+    'trash_recicling', *_checkbox('trash_container', 5), 'gerenciamento_resduos_complete',
+    'sunbathing', 'visiting_area', 'social_area', 'ambient_music', 'menu', 'semanal_menu', 'recreation_list',
+    *_checkbox('recreation_type', 7),
+    *[c for prefixo in ['medical_record', 'admission_file_signed', 'patient_bath', 'imc_index', 'physical_cont_record',
+                        'mem_scale', 'mem_prev_actions', 'pain_register', 'meem_care_actions',
+                        'rehab_activities_register', 'rehab_activities']
+      for c in _checkbox(prefixo, 6)],
+    'processos_de_cuidado_complete',
+    'ubs', 'ubs_1', 'ubs_2', 'upa', 'upa_1', 'upa_2', 'internship', 'internship_institution',
+    'internship_institution_2', 'internship_institution_3', 'internship_institution_4', 'internship_course',
+    'internship_course_2', 'internship_course_3', 'internship_course_4', 'regulao_complete',
+    'comments', 'comments_type', 'encerramento_complete',
+]
+
+# Respostas codificadas (código -> proporção) das linhas do residente
+PROBABILIDADES_RESIDENTE = {
+    'sex': {1: 0.63, 2: 0.37},
+    'race': {1: 0.34, 2: 0.15, 3: 0.48, 4: 0.01, 5: 0.01, 6: 0.01},
+    'scholarship': {1: 0.16, 2: 0.08, 3: 0.20, 4: 0.24, 5: 0.32},
+    'family_support': {1: 0.81, 2: 0.15, 3: 0.04},
+    'dependence_degree': {1: 0.24, 2: 0.58, 3: 0.18},
+    'elder_income_source': {1: 0.70, 2: 0.25, 3: 0.01, 4: 0.01, 5: 0.03},
+    'health_condition': {1: 0.34, 2: 0.46, 3: 0.16, 4: 0.04},
+    'elder_visitors': {1: 0.79, 2: 0.21},
+    'weight_loss': {1: 0.22, 2: 0.78},
+    'elder_strenght': {1: 0.34, 2: 0.66},
+    'elder_hospitalized': {1: 0.71, 2: 0.21, 3: 0.04, 4: 0.04},
+    'elder_difficulties': {1: 0.38, 2: 0.38, 3: 0.24},
+    'elder_mobility': {1: 0.35, 2: 0.65},
+    'basic_activities_diffic': {1: 0.60, 2: 0.40},
+    'falls_number': {1: 0.72, 2: 0.24, 3: 0.04},
+    'institution_type': {1: 0.10, 2: 0.10, 3: 0.80},
+}
+
+# Tipo de vínculo: uma opção marcada por residente (link_type___1..3)
+PROBABILIDADES_VINCULO = {1: 0.51, 2: 0.48, 3: 0.01}
+
+PROBABILIDADES_DEFICIENCIAS = [0.04, 0.38, 0.33]
+
+# morbidities___1 ... morbidities___21, em cada linha de 'morbidades_prvias'
+PROBABILIDADES_MORBIDADES = [
+    0.54, 0.21, 0.09, 0.01, 0.04, 0.02, 0.02, 0.03, 0.005, 0.005, 0.005, 0.35, 0.01, 0.01, 0.07, 0.20, 0.07,
+    0.04, 0.005, 0.005, 0.62,
+]
+
+PROBABILIDADES_MEDICAMENTO = {
+    'recorded': {0: 0.21, 1: 0.79},
+    'combination_of_medicines': {0: 0.97, 1: 0.03},
+    'taken_daily': {1: 0.69, 2: 0.23, 3: 0.04, 4: 0.01, 5: 0.02, 6: 0.01},
+    'medicamentos_em_uso_complete': {0: 0.01, 2: 0.99},
+}
+
+# (nome genérico, dose usual em mg); o primeiro é o mais frequente
+MEDICAMENTOS = [
+    ('quetiapina', 25), ('losartana potassica', 50), ('sinvastatina', 20), ('acido acetilsalicilico', 100),
+    ('hidroclorotiazida', 25), ('carbamazepina', 200), ('metformina', 500), ('risperidona', 2),
+    ('haloperidol', 5), ('besilato de anlodipino', 5), ('omeprazol', 20), ('levotiroxina', 50),
+    ('clonazepam', 2), ('donepezila', 10), ('memantina', 10), ('sertralina', 50), ('oxalato de escitalopram', 10),
+    ('levodopa + benserazida', 100), ('furosemida', 40), ('enalapril', 10), ('atenolol', 25), ('insulina nph', 10),
+    ('glibenclamida', 5), ('fenitoina', 100), ('acido valproico', 250), ('olanzapina', 5), ('domperidona', 10),
+    ('cloridrato de hidralazina', 50), ('espironolactona', 25), ('carvedilol', 6), ('bromoprida', 10),
+    ('complexo b', 1), ('vitamina d', 1000), ('carbonato de calcio', 500), ('lactulose', 10), ('dipirona', 500),
+]
+
+COMBINACOES = ['carbidopa', 'levodopa', 'benserazida', 'valsartana', 'anlodipino', 'hidroclorotiazida']
+
+OUTRAS_MORBIDADES = [
+    'AVC', 'SEQUELAS DE AVC', 'Esquizofrenia', 'Depressão', 'epilepsia', 'DPOC', 'Hipotireoidismo', 'Glaucoma',
+    'deficiência auditiva', 'deficiência visual', 'Catarata', 'Gota', 'Hiperplasia prostática', 'Anemia',
+]
+
+NOMES_MASCULINOS = [
+    'JOSE', 'JOAO', 'ANTONIO', 'FRANCISCO', 'CARLOS', 'PAULO', 'PEDRO', 'LUCAS', 'LUIZ', 'MARCOS', 'GABRIEL',
+    'RAFAEL', 'DANIEL', 'MARCELO', 'BRUNO', 'EDUARDO', 'FELIPE', 'RAIMUNDO', 'RODRIGO', 'MANOEL', 'SEBASTIAO',
+    'GERALDO', 'SEVERINO', 'BENEDITO', 'OSVALDO', 'ALCIDES', 'WALDEMAR', 'JOAQUIM', 'ARLINDO', 'DOMINGOS',
+]
+NOMES_FEMININOS = [
+    'MARIA', 'ANA', 'FRANCISCA', 'ANTONIA', 'ADRIANA', 'JULIANA', 'MARCIA', 'FERNANDA', 'PATRICIA', 'ALINE',
+    'SANDRA', 'CAMILA', 'AMANDA', 'BRUNA', 'JESSICA', 'LETICIA', 'JULIA', 'LUCIANA', 'VANESSA', 'MARIANA',
+    'TEREZINHA', 'APARECIDA', 'BENEDITA', 'RAIMUNDA', 'SEBASTIANA', 'IRACEMA', 'ODETE', 'NAIR', 'DIVINA', 'CONCEICAO',
+]
+SOBRENOMES = [
+    'SILVA', 'SANTOS', 'OLIVEIRA', 'SOUZA', 'RODRIGUES', 'FERREIRA', 'ALVES', 'PEREIRA', 'LIMA', 'GOMES',
+    'COSTA', 'RIBEIRO', 'MARTINS', 'CARVALHO', 'ALMEIDA', 'LOPES', 'SOARES', 'FERNANDES', 'VIEIRA', 'BARBOSA',
+    'ROCHA', 'DIAS', 'NASCIMENTO', 'ANDRADE', 'MOREIRA', 'NUNES', 'MARQUES', 'MACHADO', 'MENDES', 'FREITAS',
+]
+ENTREVISTADORES = [f'Entrevistador(a) {i:02d}' for i in range(1, 13)]
+
+# Médias por residente (usadas também para converter número de linhas em residentes)
+MEDICAMENTOS_POR_RESIDENTE = 6.5
+MAX_MEDICAMENTOS = 16
+PROPORCAO_SEGUNDA_MORBIDADE = 0.09
+LINHAS_POR_RESIDENTE = 1 + MEDICAMENTOS_POR_RESIDENTE + 1 + PROPORCAO_SEGUNDA_MORBIDADE
+
+# Residentes por bloco gerado/gravado (~850 mil linhas): limita a memória em arquivos grandes
+RESIDENTES_POR_BLOCO = 100_000
+
+# Primeiro dia das visitas e centro aproximado das ILPIs (Aparecida de Goiânia)
+INICIO_VISITAS = np.datetime64('2025-06-02')
+CENTRO = (-16.82, -49.28)
+
+
+def residentes_para_linhas(linhas):
+    """Número de residentes que gera aproximadamente `linhas` linhas na exportação do perfil."""
+    return max(1, int(round(linhas / LINHAS_POR_RESIDENTE)))
+
+
+# ------------------------------
+# Auxiliares vetorizados
+# ------------------------------
+
+def _codigos(rng, n, probabilidades):
+    """`n` códigos sorteados de {código: proporção}."""
+    codigos = np.fromiter(probabilidades, dtype=np.int64)
+    pesos = np.fromiter(probabilidades.values(), dtype=float)
+    return rng.choice(codigos, size=n, p=pesos / pesos.sum())
+
+
+def _inteiros_com_ausentes(valores, ausentes):
+    return pd.arrays.IntegerArray(np.asarray(valores, dtype=np.int64), np.asarray(ausentes, dtype=bool))
+
+
+def _espalhar(valores, posicoes, total):
+    """
+    Coluna com `total` linhas: `valores` nas `posicoes` e em branco nas demais.
+    Inteiros viram Int64 (escritos sem '.0' no CSV), datas ficam datetime64 e textos, object.
+    """
+    if isinstance(valores, pd.arrays.IntegerArray):
+        dados = np.zeros(total, dtype=np.int64)
+        mascara = np.ones(total, dtype=bool)
+        dados[posicoes] = valores.to_numpy(dtype=np.int64, na_value=0)
+        mascara[posicoes] = valores.isna()
+        return pd.arrays.IntegerArray(dados, mascara)
+    valores = np.asarray(valores)
+    if valores.dtype.kind in 'iub':
+        dados = np.zeros(total, dtype=np.int64)
+        mascara = np.ones(total, dtype=bool)
+        dados[posicoes] = valores
+        mascara[posicoes] = False
+        return pd.arrays.IntegerArray(dados, mascara)
+    if valores.dtype.kind == 'M':
+        saida = np.full(total, np.datetime64('NaT'), dtype=valores.dtype)
+    elif valores.dtype.kind == 'f':
+        saida = np.full(total, np.nan)
+    else:
+        saida = np.full(total, None, dtype=object)
+    saida[posicoes] = valores
+    return saida
+
+
+def _textos(rng, n, opcoes, proporcao=1.0):
+    """Textos sorteados de `opcoes` (None em 1 - proporcao das linhas)."""
+    saida = np.asarray(opcoes, dtype=object)[rng.integers(0, len(opcoes), n)]
+    if proporcao < 1:
+        saida[rng.random(n) >= proporcao] = None
+    return saida
+
+
+def _cpfs(rng, n):
+    """CPFs com dígitos verificadores válidos, como texto de 11 dígitos."""
+    digitos = rng.integers(0, 10, (n, 9))
+    for tamanho in (9, 10):
+        resto = (digitos * np.arange(tamanho + 1, 1, -1)).sum(axis=1) % 11
+        digitos = np.column_stack([digitos, np.where(resto < 2, 0, 11 - resto)])
+    numeros = digitos @ (10 ** np.arange(10, -1, -1, dtype=np.int64))
+    return np.char.zfill(numeros.astype('U11'), 11).astype(object)
+
+
+def _segundos(valores):
+    return np.asarray(valores).astype('timedelta64[s]')
+
+
+def _ilpis(rng, n_ilpis):
+    """Atributos fixos de cada ILPI: peso (tamanho relativo), data da visita, tipo e coordenadas."""
+    peso = rng.gamma(2.0, 1.0, n_ilpis)
+    return {
+        'peso': peso / peso.sum(),
+        'visita': INICIO_VISITAS + rng.integers(0, 30 + n_ilpis // 5, n_ilpis).astype('timedelta64[D]'),
+        'tipo': _codigos(rng, n_ilpis, PROBABILIDADES_RESIDENTE['institution_type']),
+        'latitude': np.round(CENTRO[0] + rng.normal(0, 0.05, n_ilpis), 7),
+        'longitude': np.round(CENTRO[1] + rng.normal(0, 0.04, n_ilpis), 7),
+    }
+
+
+# ------------------------------
+# Perfil epidemiológico (SMSAp)
+# ------------------------------
+
+def _residentes(rng, ilpi, ilpis):
+    """Colunas das linhas do residente (uma por residente)."""
+    n = len(ilpi)
+    visita = ilpis['visita'][ilpi]
+    inicio = visita.astype('datetime64[s]') + _segundos(8 * 3600 + rng.integers(0, 9 * 3600, n))
+    # Instantes de preenchimento dos instrumentos, em sequência
+    passos = inicio[:, None] + _segundos(rng.integers(60, 900, (n, 5)).cumsum(axis=1))
+
+    colunas = {c: _codigos(rng, n, p) for c, p in PROBABILIDADES_RESIDENTE.items() if c != 'institution_type'}
+    masculino = colunas['sex'] == 1
+    nome = np.where(masculino, _textos(rng, n, NOMES_MASCULINOS), _textos(rng, n, NOMES_FEMININOS))
+    sobrenome = _textos(rng, n, SOBRENOMES) + ' ' + _textos(rng, n, SOBRENOMES)
+
+    idade = np.clip(np.rint(rng.normal(76, 10.5, n)), 55, 105).astype(np.int64)
+    nascimento = visita - (np.floor(idade * 365.25) + rng.integers(1, 365, n)).astype('timedelta64[D]')
+    meses = np.minimum(rng.geometric(1 / 60, n) - 1, (idade - 50) * 12)
+    admissao = visita - (np.floor(meses * 30.44) + rng.integers(0, 28, n)).astype('timedelta64[D]')
+
+    vinculo = _codigos(rng, n, PROBABILIDADES_VINCULO)
+    perdeu_peso = colunas['weight_loss'] == 1
+    coordenadas = rng.random(n) < 0.4
+
+    colunas.update({
+        'identificao_da_ilpi_f650_timestamp': inicio,
+        'visit_date': visita.astype('datetime64[s]'),
+        'institution_name': ilpi + 1,
+        'institution_type': ilpis['tipo'][ilpi],
+        'latitude': np.where(coordenadas, ilpis['latitude'][ilpi], np.nan),
+        'longitude': np.where(coordenadas, ilpis['longitude'][ilpi], np.nan),
+        'dados_sciodemogrficos_timestamp': passos[:, 0],
+        'name': nome,
+        'surname': sobrenome,
+        'full_name': nome + ' ' + sobrenome,
+        'cpf': _cpfs(rng, n),
+        'date_of_birth': nascimento.astype('datetime64[s]'),
+        'elder_age': idade,
+        'admission_date': admissao.astype('datetime64[s]'),
+        'institut_time_years': meses // 12,
+        'time_months': meses,
+        'institut_time_months': meses % 12,
+        'amount_weight_loss': _inteiros_com_ausentes(rng.integers(1, 3, n), ~perdeu_peso),
+        'estado_de_sade_timestamp': passos[:, 2],
+        'componentes_de_fragilidade_timestamp': passos[:, 3],
+        'responsvel_pelo_preenchimento_timestamp': passos[:, 4],
+        'interviewer_name': _textos(rng, n, ENTREVISTADORES),
+    })
+    for i in range(1, 4):
+        colunas[f'link_type___{i}'] = (vinculo == i).astype(np.int64)
+        colunas[f'physical_desabilities___{i}'] = (rng.random(n) < PROBABILIDADES_DEFICIENCIAS[i - 1]).astype(np.int64)
+    for coluna in ['link_type___nan', 'physical_desabilities___nan']:
+        colunas[coluna] = np.zeros(n, dtype=np.int64)
+    for coluna in ['identificao_da_ilpi_f650_complete', 'dados_sciodemogrficos_complete', 'estado_de_sade_complete',
+                   'componentes_de_fragilidade_complete', 'responsvel_pelo_preenchimento_complete']:
+        colunas[coluna] = np.full(n, 2, dtype=np.int64)
+    return colunas, passos[:, 1]
+
+
+def _medicamentos(rng, momento, instancia):
+    """Colunas das linhas repetidas de 'medicamentos_em_uso'."""
+    m = len(momento)
+    farmaco = rng.choice(len(MEDICAMENTOS), size=m, p=(p := 1 / np.arange(1, len(MEDICAMENTOS) + 1)) / p.sum())
+    # Cada nome aparece em maiúsculas, com inicial maiúscula ou em minúsculas, como na digitação real
+    grafias = np.asarray([g for nome, _ in MEDICAMENTOS for g in (nome.upper(), nome.capitalize(), nome)], dtype=object)
+    nome = grafias[farmaco * 3 + rng.integers(0, 3, m)]
+    nome[rng.random(m) < 0.04] = None
+    dose = np.asarray([d for _, d in MEDICAMENTOS], dtype=float)[farmaco] * np.where(rng.random(m) < 0.25, 2, 1)
+    dose[rng.random(m) < 0.04] = np.nan
+
+    colunas = {c: _codigos(rng, m, p) for c, p in PROBABILIDADES_MEDICAMENTO.items()}
+    combinado = colunas['combination_of_medicines'] == 1
+    registro = momento + _segundos(instancia * rng.integers(20, 120, m))
+    colunas.update({
+        'medicamentos_em_uso_timestamp': np.where(rng.random(m) < 0.94, registro, np.datetime64('NaT')),
+        'med_name': nome,
+        'dosage': dose,
+    })
+    for i, (coluna, coluna_dose) in enumerate([('combination_1', 'combination_dosage'),
+                                               ('combination_2', 'combination_dosage_2')]):
+        colunas[coluna] = np.where(combinado, _textos(rng, m, COMBINACOES[i::2]), None)
+        colunas[coluna_dose] = np.where(combinado, rng.choice([12.5, 25.0, 50.0, 100.0, 200.0], m), np.nan)
+    return colunas
+
+
+def _morbidades(rng, momento):
+    """Colunas das linhas repetidas de 'morbidades_prvias'."""
+    k = len(momento)
+    colunas = {
+        f'morbidities___{i}': (rng.random(k) < p).astype(np.int64)
+        for i, p in enumerate(PROBABILIDADES_MORBIDADES, start=1)
+    }
+    colunas.update({
+        'morbidades_prvias_timestamp': momento + _segundos(rng.integers(60, 600, k)),
+        'morbidities___nan': np.zeros(k, dtype=np.int64),
+        'other_morbidities': _textos(rng, k, OUTRAS_MORBIDADES, proporcao=0.6),
+        'morbidades_prvias_complete': np.full(k, 2, dtype=np.int64),
+    })
+    return colunas
+
+
+def _colunas_perfil(rng, n_residentes, ilpis, primeiro_id):
+    """Colunas (nome -> array) de um bloco de residentes e o número de linhas do bloco."""
+    # As entrevistas acontecem por visita: residentes da mesma ILPI ficam em sequência
+    ilpi = np.sort(rng.choice(len(ilpis['peso']), size=n_residentes, p=ilpis['peso']))
+    n_med = np.minimum(rng.poisson(MEDICAMENTOS_POR_RESIDENTE - 1, n_residentes) + 1, MAX_MEDICAMENTOS)
+    n_mor = 1 + (rng.random(n_residentes) < PROPORCAO_SEGUNDA_MORBIDADE)
+
+    # Linhas de cada residente: a do residente, os medicamentos e as morbidades
+    por_residente = 1 + n_med + n_mor
+    total = int(por_residente.sum())
+    inicio = np.cumsum(por_residente) - por_residente
+    residente = np.repeat(np.arange(n_residentes), por_residente)
+    posicao = np.arange(total) - inicio[residente]
+    n_med_linha = n_med[residente]
+    medicamento = np.flatnonzero((posicao >= 1) & (posicao <= n_med_linha))
+    morbidade = np.flatnonzero(posicao > n_med_linha)
+    repetida = np.flatnonzero(posicao > 0)
+
+    instrumento = np.full(total, None, dtype=object)
+    instrumento[medicamento] = 'medicamentos_em_uso'
+    instrumento[morbidade] = 'morbidades_prvias'
+    instancia = np.where(posicao > n_med_linha, posicao - n_med_linha, posicao)
+
+    colunas = {
+        'record_id': primeiro_id + residente,
+        'redcap_repeat_instrument': instrumento,
+        'redcap_repeat_instance': _espalhar(instancia[repetida], repetida, total),
+    }
+    dados_residentes, momento = _residentes(rng, ilpi, ilpis)
+    for posicoes, dados in [
+        (inicio, dados_residentes),
+        (medicamento, _medicamentos(rng, momento[residente[medicamento]], instancia[medicamento])),
+        (morbidade, _morbidades(rng, momento[residente[morbidade]])),
+    ]:
+        for coluna, valores in dados.items():
+            colunas[coluna] = _espalhar(valores, posicoes, total)
+    return colunas, total
+
+
+def _data_frame(colunas, n, ordem):
+    vazia = np.full(n, np.nan)
+    return pd.DataFrame({c: colunas[c] if c in colunas else vazia for c in ordem})
+
+
+def _planos_perfil(n_residentes, n_ilpis, semente, residentes_por_bloco):
+    """Atributos das ILPIs e (semente, residentes, primeiro record_id) de cada bloco."""
+    semente_ilpis, semente_blocos = np.random.SeedSequence(semente).spawn(2)
+    ilpis = _ilpis(np.random.default_rng(semente_ilpis), n_ilpis)
+    n_blocos = -(-n_residentes // residentes_por_bloco)
+    planos = []
+    for i, semente_bloco in enumerate(semente_blocos.spawn(n_blocos)):
+        primeiro = i * residentes_por_bloco
+        planos.append((semente_bloco, min(residentes_por_bloco, n_residentes - primeiro), primeiro + 1))
+    return ilpis, planos
+
+
+def blocos_perfil(n_residentes, n_ilpis=5, semente=0, residentes_por_bloco=RESIDENTES_POR_BLOCO):
+    """
+    Gera a exportação sintética do perfil epidemiológico em blocos (DataFrames com as colunas
+    de COLUNAS_PERFIL), para gravar arquivos maiores que a memória.
+
+    Cada residente tem uma linha própria, seguida das linhas repetidas de 'medicamentos_em_uso'
+    e 'morbidades_prvias' (com CPF, nome e ILPI em branco, como no REDCap). O resultado depende
+    de `semente` e de `residentes_por_bloco`.
+
+    Parâmetros:
+    - n_residentes: total de residentes (~8,6 linhas por residente, ver `residentes_para_linhas`).
+    - n_ilpis: número de ILPIs (códigos 1..n_ilpis em institution_name, com tamanhos variados).
+    - semente: semente do gerador aleatório.
+    - residentes_por_bloco: residentes por DataFrame gerado.
+    """
+    ilpis, planos = _planos_perfil(n_residentes, n_ilpis, semente, residentes_por_bloco)
+    for semente_bloco, tamanho, primeiro in planos:
+        colunas, total = _colunas_perfil(np.random.default_rng(semente_bloco), tamanho, ilpis, primeiro)
+        yield _data_frame(colunas, total, COLUNAS_PERFIL)
+
+
+def exportacao_perfil(n_residentes, n_ilpis=5, semente=0):
+    """
+    Exportação sintética do perfil epidemiológico (mesmas colunas de PerfilEpidemiolgicos_DATA)
+    em um único DataFrame. Para arquivos grandes, use `gravar_perfil`.
+
+    Exemplo de uso:
+    bruto = exportacao_perfil(10_000, n_ilpis=40)
+    base = preparar_base_perfil(bruto)
+    """
+    return pd.concat(list(blocos_perfil(n_residentes, n_ilpis, semente)), ignore_index=True)
+
+
+def _bytes_bloco_perfil(plano):
+    semente_bloco, tamanho, primeiro, ilpis, sep = plano
+    colunas, total = _colunas_perfil(np.random.default_rng(semente_bloco), tamanho, ilpis, primeiro)
+    return total, _csv_em_bytes([colunas.get(c) for c in COLUNAS_PERFIL], total, sep)
+
+
+def gravar_perfil(caminho, n_residentes, n_ilpis=5, semente=0, sep=';', residentes_por_bloco=RESIDENTES_POR_BLOCO,
+                  workers=1):
+    """
+    Grava a exportação sintética do perfil em CSV como o REDCap (UTF-8 com BOM, separador ';',
+    textos e data/hora entre aspas), um bloco por vez. O conteúdo é o mesmo de `blocos_perfil`
+    com os mesmos parâmetros.
+
+    Parâmetros:
+    - workers: processos que geram os blocos em paralelo (None usa todos os núcleos); a ordem
+      das linhas não muda.
+
+    Retorna:
+    - Número de linhas gravadas (sem o cabeçalho).
+
+    Exemplo de uso:
+    gravar_perfil('/tmp/perfil_10M.csv', residentes_para_linhas(10_000_000), n_ilpis=1_000, workers=None)
+    """
+    ilpis, planos = _planos_perfil(n_residentes, n_ilpis, semente, residentes_por_bloco)
+    planos = [(*plano, ilpis, sep) for plano in planos]
+    linhas = 0
+    with open(caminho, 'wb') as f:
+        f.write(_cabecalho(COLUNAS_PERFIL, sep))
+        if workers == 1:
+            for total, dados in map(_bytes_bloco_perfil, planos):
+                f.write(dados)
+                linhas += total
+            return linhas
+
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # No máximo 2 blocos por processo aguardando gravação (limita a memória)
+            pendentes = deque()
+            for plano in planos:
+                pendentes.append(executor.submit(_bytes_bloco_perfil, plano))
+                while len(pendentes) > 2 * workers or (plano is planos[-1] and pendentes):
+                    total, dados = pendentes.popleft().result()
+                    f.write(dados)
+                    linhas += total
+    return linhas
+
+
+# ------------------------------
+# Monitoramento e diagnóstico das ILPIs (UFG)
+# ------------------------------
+
+# Perguntas sim/não (1 = sim, 2 = não) e a proporção de 'sim'
+SIM_NAO_MONITORAMENTO = {
+    'vehicle': 0.5, 'normal_ilpi': 0.6, 'physio_instructions': 0.3, 'secutiry_system': 0.6,
+    'safety_device_availability': 0.3, 'lighting': 0.8, 'ventilation': 0.8, 'painting_color': 0.9, 'epi_use': 0.7,
+    'medication_val_date': 0.7, 'violeted_pakage': 0.4, 'medicine_refrigerator': 0.6,
+    'refrigerator_temp_log': 0.4, 'medication_register': 0.9, 'psico_drugs_segregation': 0.6,
+    'dirty_clothing_segregation': 0.7, 'dirty_clothing_change': 0.9, 'trash_recicling': 0.5, 'sunbathing': 0.9,
+    'visiting_area': 0.9, 'social_area': 0.9, 'ambient_music': 0.5, 'menu': 0.4, 'recreation_list': 0.8,
+    'internship': 0.6, 'comments': 0.7,
+}
+
+OUTROS_PROFISSIONAIS = ['terapeuta holístico', 'educador físico', 'fonoaudiólogo']
+
+# Proporção de opções marcadas nas famílias de checkbox do monitoramento
+PROPORCAO_CHECKBOX_MONITORAMENTO = 0.35
+
+# Quantidade de cada profissional -> (coluna de horas semanais, coluna de dias por mês,
+# quantidade máxima, horas semanais possíveis)
+EQUIPE_MONITORAMENTO = {
+    'nurse_aux': ('weekly_hours_na', 'days_per_month_na', 3, [44]),
+    'nurse_tech': ('weekly_hours_nt', 'days_per_month_nt', 6, [36, 44]),
+    'nurse': ('weekly_hours_n', 'days_per_month_n', 2, [1, 24, 40]),
+    'physiotherapist': ('weekly_hours_physio', 'days_per_month_physio', 2, [7, 20, 30]),
+    'nutritionist': ('weekly_hours_nutrit', 'days_per_month_nutrit', 2, [1, 4, 20]),
+    'psicologist': ('weekly_hours_psicol', 'days_per_month_psicol', 1, [4, 8]),
+    'physician': ('weekly_hours_physician', 'days_per_month_physician', 2, [1, 4]),
+    'occup_therapist': ('weekly_hours_occup', 'days_per_month_occup', 1, [4, 8]),
+    'caregiver': ('weekly_hours_caregiver', 'days_per_month_caregiver', 16, [44]),
+    'other_health_prof': ('w_h_other_health_prof', 'd_p_month_oth_health_prof', 1, [4, 30]),
+    'housekeeping': ('weekly_hours_housekeep', 'days_per_month_housekeep', 10, [40, 44]),
+    'staff': ('weekly_hours_staff', 'days_per_month_staff', 3, [40, 44]),
+}
+
+# Textos livres, preenchidos só quando a pergunta de origem (1 = sim) permite
+TEXTOS_MONITORAMENTO = {
+    'psico_drugs_storage': ('psico_drugs_segregation', ['Armário com chave', 'Armário com chave da farmácia']),
+    'internship_institution': ('internship', ['Escola técnica de enfermagem', 'Universidade estadual',
+                                              'Faculdade particular']),
+    'internship_course': ('internship', ['Técnico de Enfermagem', 'Enfermagem', 'Fisioterapia', 'Nutrição']),
+    'comments_type': ('comments', ['Demora na regulação de consultas.', 'Falta de transporte para exames.',
+                                   'Boa articulação com a UBS de referência.']),
+}
+
+
+def _dias_por_mes(horas_semanais):
+    """Horas semanais -> dias de 8 h por mês (4,33 semanas), arredondado a 1/8 de dia como na coleta."""
+    return np.round(horas_semanais * 4.33) / 8
+
+
+def exportacao_monitoramento(n_ilpis, semente=0):
+    """
+    Exportação sintética do monitoramento e diagnóstico das ILPIs (mesmas colunas de
+    MonitoramentoEDiagns_DATA): uma linha por ILPI, com equipe (quantidade, horas semanais e
+    dias por mês de cada profissional), famílias de checkbox e respostas sim/não.
+
+    Exemplo de uso:
+    equipe = exportacao_monitoramento(500)
+    extrair_profissionais(equipe, mapeamento)
+    """
+    rng = np.random.default_rng(semente)
+    n = n_ilpis
+    ilpis = _ilpis(rng, n)
+    visita = ilpis['visita'].astype('datetime64[m]') + rng.integers(8 * 60, 17 * 60, n).astype('timedelta64[m]')
+    residentes = np.maximum(np.rint(ilpis['peso'] * n * 40), 5).astype(np.int64)
+
+    colunas = {
+        'record_id': np.arange(1, n + 1),
+        'visit_date': pd.Series(visita).dt.strftime('%Y-%m-%d %H:%M').to_numpy(dtype=object),
+        'institution_name': np.arange(1, n + 1),
+        'postal_code': rng.integers(74_900_000, 74_990_000, n),
+        'address': np.asarray([f'Rua {r}, {q}, Setor {s}' for r, q, s in zip(
+            rng.integers(1, 300, n), rng.integers(1, 999, n), _textos(rng, n, SOBRENOMES))], dtype=object),
+        'interviewed': _textos(rng, n, NOMES_FEMININOS) + ' ' + _textos(rng, n, SOBRENOMES) + ' - responsável técnica',
+        'residents_number': residentes,
+        'residents_bedroom': rng.integers(1, 5, n),
+        'ubs': np.asarray([f'UBS {s}' for s in _textos(rng, n, SOBRENOMES)], dtype=object),
+        'upa': np.asarray([f'UPA {s}' for s in _textos(rng, n, SOBRENOMES)], dtype=object),
+    }
+    for quantidade, (coluna_horas, coluna_dias, maximo, horas) in EQUIPE_MONITORAMENTO.items():
+        qtd = np.where(rng.random(n) < 0.75, rng.integers(1, maximo + 1, n), 0)
+        semanais = np.where(qtd > 0, rng.choice(np.asarray(horas, dtype=float), n), np.nan)
+        colunas[quantidade] = qtd
+        colunas[coluna_horas] = semanais
+        colunas[coluna_dias] = _dias_por_mes(semanais)
+    colunas['other_health_prof_1'] = colunas['other_health_prof_2'] = np.zeros(n, dtype=np.int64)
+    colunas['other_prof'] = np.where(colunas['other_health_prof'] > 0, _textos(rng, n, OUTROS_PROFISSIONAIS), None)
+
+    for coluna, sim in SIM_NAO_MONITORAMENTO.items():
+        colunas[coluna] = np.where(rng.random(n) < sim, 1, 2)
+    for coluna in COLUNAS_MONITORAMENTO:
+        if '___' in coluna:
+            colunas[coluna] = (rng.random(n) < PROPORCAO_CHECKBOX_MONITORAMENTO).astype(np.int64)
+        elif coluna.endswith('_complete'):
+            colunas[coluna] = np.full(n, 2, dtype=np.int64)
+    for coluna, (origem, opcoes) in TEXTOS_MONITORAMENTO.items():
+        colunas[coluna] = np.where(colunas[origem] == 1, _textos(rng, n, opcoes), None)
+    for i in range(2, 5):
+        colunas[f'internship_institution_{i}'] = colunas[f'internship_course_{i}'] = np.where(
+            colunas['internship'] == 1, 'Não se aplica', None)
+
+    return _data_frame(colunas, n, COLUNAS_MONITORAMENTO)
+
+
+def gravar_monitoramento(caminho, n_ilpis, semente=0, sep=','):
+    """Grava a exportação sintética do monitoramento em CSV como o REDCap (UTF-8 com BOM, separador ',')."""
+    df = exportacao_monitoramento(n_ilpis, semente)
+    with open(caminho, 'wb') as f:
+        f.write(_cabecalho(COLUNAS_MONITORAMENTO, sep))
+        f.write(_csv_em_bytes([df[c].to_numpy() if df[c].notna().any() else None for c in df.columns], len(df), sep))
+    return len(df)
+
+
+# ------------------------------
+# Gravação em CSV (vetorizada)
+# ------------------------------
+#
+# DataFrame.to_csv formata célula a célula (~30 s por 100 mil residentes nesta exportação de
+# 98 colunas, quase todas vazias). Aqui cada coluna vira um array de bytes (tabela dos valores
+# distintos + índice) e os campos são copiados de uma vez para um único buffer.
+
+def _cabecalho(colunas, sep):
+    return ('\ufeff' + sep.join(colunas) + '\n').encode('utf-8')
+
+
+def _tabela_bytes(textos):
+    codificados = [t.encode('utf-8') for t in textos]
+    comprimentos = np.fromiter(map(len, codificados), dtype=np.int64, count=len(codificados))
+    return np.array(codificados, dtype=f'S{max(comprimentos.max(initial=0), 1)}'), comprimentos
+
+
+def _campos_data(valores):
+    linhas = np.flatnonzero(~np.isnat(valores))
+    valores = valores[linhas].astype('datetime64[s]')
+    dias = valores.astype('datetime64[D]')
+    codigos, unicos = pd.factorize(dias.view(np.int64))
+    datas = np.datetime_as_string(unicos.astype('datetime64[D]')).astype('S10')[codigos]
+    segundos = (valores - dias).astype(np.int64)
+    if not segundos.any():
+        return linhas, datas, np.full(len(linhas), 10)
+
+    # "AAAA-MM-DD hh:mm:ss": data pela tabela de dias, hora pelos dígitos calculados
+    saida = np.empty((len(linhas), 21), dtype=np.uint8)
+    saida[:, [0, 20]] = ord('"')
+    saida[:, 1:11] = datas.view(np.uint8).reshape(-1, 10)
+    saida[:, 11] = ord(' ')
+    saida[:, [14, 17]] = ord(':')
+    for inicio, valor in [(12, segundos // 3600), (15, segundos // 60 % 60), (18, segundos % 60)]:
+        saida[:, inicio] = ord('0') + valor // 10
+        saida[:, inicio + 1] = ord('0') + valor % 10
+    return linhas, saida.view('S21').ravel(), np.full(len(linhas), 21)
+
+
+def _campos(valores):
+    """
+    Coluna -> (linhas preenchidas, bytes de cada campo, comprimento de cada campo), no formato do
+    REDCap: textos e data/hora entre aspas, datas e números sem aspas, ausentes vazios.
+    """
+    if isinstance(valores, pd.arrays.IntegerArray):
+        linhas = np.flatnonzero(~valores.isna())
+        valores = valores.to_numpy(dtype=np.int64, na_value=0)[linhas]
+    else:
+        valores = np.asarray(valores)
+        if valores.dtype.kind == 'M':
+            return _campos_data(valores)
+        if valores.dtype.kind in 'iu':
+            linhas = np.arange(len(valores))
+        else:
+            linhas = np.flatnonzero(~pd.isna(valores))
+            valores = valores[linhas]
+
+    codigos, unicos = pd.factorize(valores)
+    if valores.dtype.kind in 'iu':
+        textos = [str(v) for v in unicos.tolist()]
+    elif valores.dtype.kind == 'f':
+        textos = [str(int(v)) if v.is_integer() else repr(v) for v in unicos.tolist()]
+    else:
+        textos = ['"' + str(v).replace('"', '""') + '"' for v in unicos]
+    tabela, comprimentos = _tabela_bytes(textos)
+    return linhas, tabela[codigos], comprimentos[codigos]
+
+
+def _csv_em_bytes(colunas, n, sep):
+    """Colunas com `n` linhas (None para coluna sempre vazia) -> linhas do CSV em bytes, sem cabeçalho."""
+    campos = [None if c is None else _campos(c) for c in colunas]
+    tamanhos = np.full(n, len(colunas), dtype=np.int64)  # separadores + '\n'
+    for campo in campos:
+        if campo is not None:
+            tamanhos[campo[0]] += campo[2]
+    fim = np.cumsum(tamanhos)
+    buffer = np.full(int(fim[-1]) if n else 0, ord(sep), dtype=np.uint8)
+
+    posicao = fim - tamanhos
+    for campo in campos:
+        if campo is not None and len(campo[0]):
+            linhas, dados, comprimentos = campo
+            largura = dados.dtype.itemsize
+            matriz = dados.view(np.uint8).reshape(-1, largura)
+            destino = posicao[linhas, None] + np.arange(largura)
+            if (comprimentos == largura).all():
+                buffer[destino.ravel()] = matriz.ravel()
+            else:
+                cabe = np.arange(largura) < comprimentos[:, None]
+                buffer[destino[cabe]] = matriz[cabe]
+            posicao[linhas] += comprimentos
+        posicao += 1
+    buffer[fim - 1] = ord('\n')
+    return buffer.tobytes()
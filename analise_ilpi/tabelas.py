@@ -0,0 +1,319 @@
+import html
+import os
+import textwrap
+
+import matplotlib.pyplot as plt
+
+from .cache_figuras import em_cache
+from .instrumentacao import etapa
+from .saida_assincrona import gravar_figura, gravar_imagem_pil, gravar_texto
+
+# ------------------------------
+# Tabelas salvas como imagem
+# ------------------------------
+
+# Cores e medidas compartilhadas pelos renderizadores
+COR_CABECALHO = '#40466e'
+COR_CELULA = '#f1f1f2'
+COR_BORDA = 'gray'
+TAMANHO_FONTE = 10
+TAMANHO_TITULO = 14
+
+BACKENDS_TABELA = ('matplotlib', 'pil', 'svg', 'html')
+
+
+@etapa()
+@em_cache('caminho_arquivo')
+def salvar_tabela_como_imagem(df, caminho_arquivo, titulo=None, largura_max_coluna=30,
+                              backend=None, linhas_por_pagina=None, dpi=150):
+    """ Salva a tabela gerada em .png.
+        Parâmetros:
+        - df: DataFrame do pandas.
+        - caminho_arquivo: define o caminho onde será gravada a imagem (Ex: '../tables/nome_arquivo.png')
+        - title: string com o título da tabela (opcional)
+        - largura_max_coluna=30: define a largura das colunas da tabela
+        - backend: 'matplotlib' (padrão para .png), 'pil' (desenho direto em raster, muito mais rápido),
+          'svg' ou 'html' (padrão para arquivos .svg/.html; texto puro, sem dependências).
+        - linhas_por_pagina: divide tabelas longas em várias imagens
+          (nome.png, nome_p02.png, ...; no HTML, quebras de página na impressão).
+        - dpi: resolução do backend 'pil'.
+
+        Retorna:
+        - lista com os caminhos dos arquivos gerados.
+    """
+    if backend is None:
+        extensao = os.path.splitext(caminho_arquivo)[1].lower()
+        backend = {'.svg': 'svg', '.html': 'html', '.htm': 'html'}.get(extensao, 'matplotlib')
+    if backend not in BACKENDS_TABELA:
+        raise ValueError(f"backend deve ser um de {BACKENDS_TABELA}, recebido: '{backend}'")
+
+    paginas = _paginar(df, linhas_por_pagina)
+    if backend == 'html':
+        _salvar_tabela_html(paginas, caminho_arquivo, titulo, largura_max_coluna)
+        caminhos = [caminho_arquivo]
+    else:
+        salvar = {
+            'matplotlib': _salvar_tabela_matplotlib,
+            'pil': lambda *a: _salvar_tabela_pil(*a, dpi=dpi),
+            'svg': _salvar_tabela_svg,
+        }[backend]
+        caminhos = []
+        for numero, pagina in enumerate(paginas, start=1):
+            caminho = _caminho_pagina(caminho_arquivo, numero)
+            titulo_pagina = titulo
+            if titulo and len(paginas) > 1:
+                titulo_pagina = f'{titulo} ({numero}/{len(paginas)})'
+            salvar(pagina, caminho, titulo_pagina, largura_max_coluna)
+            caminhos.append(caminho)
+    _remover_paginas_antigas(caminho_arquivo, len(caminhos))
+
+    for caminho in caminhos:
+        print(f"✅ Tabela salva como imagem em {caminho}")
+    return caminhos
+
+
+def _paginar(df, linhas_por_pagina):
+    if not linhas_por_pagina or len(df) <= linhas_por_pagina:
+        return [df]
+    return [df.iloc[inicio:inicio + linhas_por_pagina] for inicio in range(0, len(df), linhas_por_pagina)]
+
+
+def _caminho_pagina(caminho_arquivo, numero):
+    """A primeira página usa o próprio caminho; as seguintes recebem o sufixo _p02, _p03..."""
+    if numero == 1:
+        return caminho_arquivo
+    base, extensao = os.path.splitext(caminho_arquivo)
+    return f'{base}_p{numero:02d}{extensao}'
+
+
+def _remover_paginas_antigas(caminho_arquivo, total):
+    """Apaga as páginas _pNN além de `total` deixadas por uma versão mais longa da tabela."""
+    numero = max(total, 1) + 1
+    while os.path.exists(_caminho_pagina(caminho_arquivo, numero)):
+        os.remove(_caminho_pagina(caminho_arquivo, numero))
+        numero += 1
+
+
+def _quebrar_celulas(df, largura_max_coluna):
+    """
+    Cabeçalho e células como listas de linhas já quebradas em `largura_max_coluna`.
+    Cada valor distinto é quebrado uma única vez.
+    """
+    memo = {}
+
+    def quebrar(valor):
+        texto = str(valor)
+        if texto not in memo:
+            memo[texto] = (textwrap.wrap(texto, largura_max_coluna) or ['']) if len(texto) > largura_max_coluna else [texto]
+        return memo[texto]
+
+    cabecalho = [[str(c)] for c in df.columns]
+    linhas = [[quebrar(v) for v in linha] for linha in df.itertuples(index=False, name=None)]
+    return cabecalho, linhas
+
+
+def figura_tabela(df, titulo=None, largura_max_coluna=30):
+    """
+    Monta a figura do matplotlib com a tabela (mesmo visual de `salvar_tabela_como_imagem`)
+    e a retorna sem salvar; usada também pelo relatório em PDF.
+    """
+
+    # Copiar DataFrame e aplicar quebra de linha
+    df_wrapped = df.copy()
+    for col in df_wrapped.columns:
+        # map(str) converte ausentes em 'nan' também no pandas 3 (onde astype(str) os mantém ausentes)
+        df_wrapped[col] = df_wrapped[col].map(str).apply(
+            lambda x: "\n".join(textwrap.wrap(x, largura_max_coluna)) if len(x) > largura_max_coluna else x
+        )
+
+    # Calcular largura ideal por coluna com base no maior item (linha ou cabeçalho)
+    col_widths = [
+        max(
+            df_wrapped[col].apply(lambda x: len(max(str(x).split("\n"), key=len))).max(),
+            len(str(col))
+        ) * 0.12
+        for col in df_wrapped.columns
+    ]
+    total_width = sum(col_widths) + 1
+
+    # Altura baseada no número de linhas
+    row_height = 0.6
+    fig_height = df.shape[0] * row_height + (1.5 if titulo else 1)
+
+    fig, ax = plt.subplots(figsize=(total_width, fig_height))
+    ax.axis('off')
+
+    tabela = ax.table(
+        cellText=df_wrapped.values,
+        colLabels=df_wrapped.columns,
+        cellLoc='center',
+        loc='center'
+    )
+
+    tabela.auto_set_font_size(False)
+    tabela.set_fontsize(10)
+    tabela.scale(1, 1.5)
+
+    for (row, col), cell in tabela.get_celld().items():
+        if row == 0:
+            cell.set_text_props(weight='bold', color='white')
+            cell.set_facecolor('#40466e')
+        else:
+            cell.set_facecolor('#f1f1f2')
+        cell.set_edgecolor('gray')
+
+    if titulo:
+        ax.set_title(titulo, fontsize=14, weight='bold', pad=20)
+
+    fig.tight_layout()
+    return fig
+
+
+def _salvar_tabela_matplotlib(df, caminho_arquivo, titulo, largura_max_coluna):
+    fig = figura_tabela(df, titulo, largura_max_coluna)
+    gravar_figura(fig, caminho_arquivo, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+def _fontes_pil(tamanho):
+    """Fontes DejaVu distribuídas com o matplotlib (normal e negrito)."""
+    from PIL import ImageFont
+    from matplotlib import font_manager
+
+    normal = font_manager.findfont(font_manager.FontProperties(family='DejaVu Sans'))
+    negrito = font_manager.findfont(font_manager.FontProperties(family='DejaVu Sans', weight='bold'))
+    return ImageFont.truetype(normal, tamanho), ImageFont.truetype(negrito, tamanho)
+
+
+def _salvar_tabela_pil(df, caminho_arquivo, titulo, largura_max_coluna, dpi=150):
+    """Desenha a tabela diretamente em um raster com o Pillow (sem figura do matplotlib)."""
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        raise ImportError("O backend 'pil' requer o Pillow: pip install pillow")
+
+    escala = dpi / 72
+    fonte, fonte_negrito = _fontes_pil(round(TAMANHO_FONTE * escala))
+    _, fonte_titulo = _fontes_pil(round(TAMANHO_TITULO * escala))
+    altura_linha = round(TAMANHO_FONTE * escala * 1.35)
+    margem = round(6 * escala)
+
+    cabecalho, linhas = _quebrar_celulas(df, largura_max_coluna)
+    todas = [cabecalho] + linhas
+
+    # Largura de cada coluna = maior linha de texto (cabeçalho em negrito); cada texto é medido uma vez
+    medidas = {}
+
+    def medir(texto):
+        if texto not in medidas:
+            medidas[texto] = fonte.getlength(texto)
+        return medidas[texto]
+
+    larguras = []
+    for j in range(len(cabecalho)):
+        maior = fonte_negrito.getlength(cabecalho[j][0])
+        for linha in linhas:
+            maior = max(maior, max(medir(t) for t in linha[j]))
+        larguras.append(int(maior) + 2 * margem)
+    alturas = [max((len(c) for c in linha), default=1) * altura_linha + 2 * margem for linha in todas]
+
+    altura_titulo = round(TAMANHO_TITULO * escala * 2.2) if titulo else 0
+    largura_total = max(sum(larguras), int(fonte_titulo.getlength(titulo)) if titulo else 0) + 2 * margem
+    imagem = Image.new('RGB', (largura_total, altura_titulo + sum(alturas) + 2 * margem), 'white')
+    desenho = ImageDraw.Draw(imagem)
+
+    if titulo:
+        desenho.text((largura_total / 2, altura_titulo / 2), titulo, font=fonte_titulo, fill='black', anchor='mm')
+
+    y = altura_titulo + margem
+    for i, (linha, altura) in enumerate(zip(todas, alturas)):
+        x = margem + (largura_total - 2 * margem - sum(larguras)) // 2
+        fundo, cor, f = (COR_CABECALHO, 'white', fonte_negrito) if i == 0 else (COR_CELULA, 'black', fonte)
+        for textos, largura in zip(linha, larguras):
+            desenho.rectangle([x, y, x + largura, y + altura], fill=fundo, outline=COR_BORDA)
+            desenho.multiline_text((x + largura / 2, y + altura / 2), '\n'.join(textos), font=f, fill=cor,
+                                   anchor='mm', align='center', spacing=altura_linha - f.size)
+            x += largura
+        y += altura
+
+    # Compressão PNG mínima: o custo de gravar é maior que o de desenhar
+    gravar_imagem_pil(imagem, caminho_arquivo, dpi=(dpi, dpi), compress_level=1)
+
+
+def _salvar_tabela_svg(df, caminho_arquivo, titulo, largura_max_coluna):
+    """Escreve a tabela como SVG (texto), com larguras estimadas pelo número de caracteres."""
+    largura_caractere = TAMANHO_FONTE * 0.62
+    altura_linha = TAMANHO_FONTE * 1.35
+    margem = 6
+
+    cabecalho, linhas = _quebrar_celulas(df, largura_max_coluna)
+    todas = [cabecalho] + linhas
+    larguras = [
+        max(len(t) for linha in todas for t in linha[j]) * largura_caractere + 2 * margem
+        for j in range(len(cabecalho))
+    ]
+    alturas = [max((len(c) for c in linha), default=1) * altura_linha + 2 * margem for linha in todas]
+    altura_titulo = TAMANHO_TITULO * 2.2 if titulo else 0
+    largura_total = sum(larguras) + 2 * margem
+    altura_total = altura_titulo + sum(alturas) + 2 * margem
+
+    partes = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{largura_total:.0f}" height="{altura_total:.0f}" '
+        f'font-family="DejaVu Sans, sans-serif" font-size="{TAMANHO_FONTE}">',
+        f'<rect width="100%" height="100%" fill="white"/>'
+    ]
+    if titulo:
+        partes.append(f'<text x="{largura_total / 2:.1f}" y="{altura_titulo / 2:.1f}" font-size="{TAMANHO_TITULO}" '
+                      f'font-weight="bold" text-anchor="middle" dominant-baseline="middle">{html.escape(titulo)}</text>')
+
+    y = altura_titulo + margem
+    for i, (linha, altura) in enumerate(zip(todas, alturas)):
+        fundo, estilo = (COR_CABECALHO, ' fill="white" font-weight="bold"') if i == 0 else (COR_CELULA, '')
+        x = margem
+        for textos, largura in zip(linha, larguras):
+            partes.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{largura:.1f}" height="{altura:.1f}" '
+                          f'fill="{fundo}" stroke="{COR_BORDA}"/>')
+            topo = y + (altura - len(textos) * altura_linha) / 2 + altura_linha / 2
+            tspans = ''.join(
+                f'<tspan x="{x + largura / 2:.1f}" y="{topo + k * altura_linha:.1f}">{html.escape(t)}</tspan>'
+                for k, t in enumerate(textos)
+            )
+            partes.append(f'<text text-anchor="middle" dominant-baseline="middle"{estilo}>{tspans}</text>')
+            x += largura
+        y += altura
+    partes.append('</svg>')
+
+    gravar_texto(caminho_arquivo, '\n'.join(partes))
+
+
+def _salvar_tabela_html(paginas, caminho_arquivo, titulo, largura_max_coluna):
+    """Escreve todas as páginas em um único HTML, com quebra de página entre elas na impressão."""
+    estilo = (
+        '<style>'
+        f'body{{font-family:"DejaVu Sans",sans-serif;font-size:{TAMANHO_FONTE}pt}}'
+        f'h3{{font-size:{TAMANHO_TITULO}pt;text-align:center}}'
+        'table{border-collapse:collapse;margin:auto}'
+        f'th{{background:{COR_CABECALHO};color:white}}'
+        f'td{{background:{COR_CELULA}}}'
+        f'th,td{{border:1px solid {COR_BORDA};padding:4px 8px;text-align:center;'
+        f'max-width:{largura_max_coluna}ch;white-space:pre-wrap}}'
+        '.pagina{page-break-after:always}.pagina:last-child{page-break-after:auto}'
+        '</style>'
+    )
+    corpo = []
+    for numero, pagina in enumerate(paginas, start=1):
+        cabecalho, linhas = _quebrar_celulas(pagina, largura_max_coluna)
+        partes = ['<div class="pagina">']
+        if titulo:
+            sufixo = f' ({numero}/{len(paginas)})' if len(paginas) > 1 else ''
+            partes.append(f'<h3>{html.escape(titulo + sufixo)}</h3>')
+        partes.append('<table><thead><tr>')
+        partes.extend(f'<th>{html.escape(c[0])}</th>' for c in cabecalho)
+        partes.append('</tr></thead><tbody>')
+        for linha in linhas:
+            partes.append('<tr>' + ''.join(f'<td>{html.escape(chr(10).join(t))}</td>' for t in linha) + '</tr>')
+        partes.append('</tbody></table></div>')
+        corpo.append(''.join(partes))
+
+    gravar_texto(caminho_arquivo, f'<!DOCTYPE html><html><head><meta charset="utf-8">{estilo}</head><body>'
+                 + '\n'.join(corpo) + '</body></html>')
@@ -0,0 +1,287 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from graphlib import TopologicalSorter
+
+from .hashing import atualizar_hash
+from .instrumentacao import Perfil, etapa, perfil_ativo
+from .saida_assincrona import SaidaAssincrona
+
+# ------------------------------
+# Grafo de tarefas dos relatórios (execução paralela e incremental)
+# ------------------------------
+
+# Situação de cada tarefa ao final de `GrafoTarefas.executar`
+EXECUTADA = 'executada'
+PULADA = 'pulada'
+FALHOU = 'falhou'
+BLOQUEADA = 'bloqueada'
+
+
+class Tarefa:
+    """
+    Uma seção do relatório declarada com suas entradas e saídas.
+
+    Parâmetros:
+    - nome: identificador único da tarefa.
+    - funcao: função importável; recebe o resultado de cada tarefa de `entradas` como argumento
+      nomeado (nome da tarefa) e os `parametros`. O valor retornado fica disponível para as
+      tarefas seguintes.
+    - entradas: nomes das tarefas das quais esta depende, ou dict argumento -> tarefa quando o
+      nome do argumento da função é diferente do nome da tarefa.
+    - arquivos: arquivos lidos pela tarefa (o conteúdo entra na assinatura).
+    - saidas: arquivos gerados (a tarefa é refeita se algum não existir).
+    - parametros: argumentos fixos da função.
+    """
+
+    def __init__(self, nome, funcao, entradas=(), arquivos=(), saidas=(), parametros=None):
+        self.nome = nome
+        self.funcao = funcao
+        if not isinstance(entradas, dict):
+            entradas = {e: e for e in entradas}
+        # argumento da função -> tarefa de entrada
+        self.argumentos = dict(entradas)
+        self.entradas = tuple(self.argumentos.values())
+        self.arquivos = tuple(arquivos)
+        self.saidas = tuple(saidas)
+        self.parametros = dict(parametros or {})
+
+    def __repr__(self):
+        return f'Tarefa({self.nome!r}, entradas={list(self.entradas)})'
+
+
+def _hash_arquivo(caminho, tamanho_bloco=1 << 20):
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _executar_tarefa(nome, funcao, parametros, caminhos_entradas, caminho_resultado, escritores=0, memoria=None):
+    """
+    Executa uma tarefa (no processo atual ou em um processo do pool) e grava o resultado em disco.
+    Retorna (traceback ou None, registros de instrumentação). Com `memoria` diferente de None,
+    a tarefa é medida em um `Perfil` próprio (processos do pool) e os registros são devolvidos.
+    Com `escritores` > 0, figuras e tabelas são gravadas por uma `SaidaAssincrona` com esse número
+    de threads, esperada antes de a tarefa terminar (uma falha de gravação faz a tarefa falhar).
+    """
+    perfil = Perfil(memoria=memoria) if memoria is not None else None
+    try:
+        if perfil is not None:
+            perfil.__enter__()
+        with etapa(nome):
+            argumentos = {}
+            for argumento, caminho in caminhos_entradas.items():
+                with open(caminho, 'rb') as f:
+                    argumentos[argumento] = pickle.load(f)
+            with SaidaAssincrona(escritores) if escritores else nullcontext():
+                resultado = funcao(**argumentos, **parametros)
+
+            temporario = f'{caminho_resultado}.{os.getpid()}.tmp'
+            with open(temporario, 'wb') as f:
+                pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, caminho_resultado)
+        erro = None
+    except Exception:
+        erro = traceback.format_exc()
+    finally:
+        if perfil is not None:
+            perfil.__exit__(None, None, None)
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close('all')
+    return erro, perfil.registros if perfil is not None else []
+
+
+class GrafoTarefas:
+    """
+    Executa as seções de um relatório como um grafo de tarefas: tarefas independentes rodam
+    em paralelo e tarefas cujas entradas não mudaram são puladas.
+
+    A assinatura de cada tarefa combina o código da função, os parâmetros, o conteúdo dos
+    arquivos lidos e as assinaturas das tarefas de entrada; ela é guardada em
+    `<pasta_estado>/estado.json` junto com o resultado de cada tarefa (`<nome>.pkl`).
+    Mudanças em funções auxiliares chamadas pela tarefa (de outros módulos) não entram na
+    assinatura; nesse caso use `executar(forcar=True)`.
+    Uma falha não interrompe as demais tarefas; apenas as que dependem dela ficam bloqueadas.
+
+    Parâmetros:
+    - pasta_estado: pasta com o estado da última execução.
+
+    Exemplo de uso:
+    grafo = GrafoTarefas('../output/.tarefas')
+    grafo.adicionar('base', carregar_base, arquivos=[CAMINHO_BASE], parametros={'caminho': CAMINHO_BASE})
+    grafo.adicionar('genero', secao_genero, entradas=['base'], saidas=['../tables/01_tabela_genero_abs_prop.png'])
+    situacao = grafo.executar(workers=4)
+    """
+
+    def __init__(self, pasta_estado='.tarefas'):
+        self.pasta_estado = pasta_estado
+        self.tarefas = {}
+        self.erros = {}
+
+    def adicionar(self, nome, funcao, entradas=(), arquivos=(), saidas=(), parametros=None):
+        if nome in self.tarefas:
+            raise ValueError(f"Tarefa '{nome}' já foi declarada.")
+        self.tarefas[nome] = Tarefa(nome, funcao, entradas, arquivos, saidas, parametros)
+        return self.tarefas[nome]
+
+    def tarefa(self, nome=None, entradas=(), arquivos=(), saidas=(), **parametros):
+        """Decorador equivalente a `adicionar` (o nome padrão é o nome da função)."""
+        def decorador(funcao):
+            self.adicionar(nome or funcao.__name__, funcao, entradas, arquivos, saidas, parametros)
+            return funcao
+        return decorador
+
+    # --- estado em disco ---
+
+    def _caminho_resultado(self, nome):
+        return os.path.join(self.pasta_estado, f'{nome}.pkl')
+
+    def _ler_estado(self):
+        caminho = os.path.join(self.pasta_estado, 'estado.json')
+        if not os.path.exists(caminho):
+            return {}
+        with open(caminho, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _gravar_estado(self, estado):
+        caminho = os.path.join(self.pasta_estado, 'estado.json')
+        temporario = f'{caminho}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(estado, f, indent=1, sort_keys=True)
+        os.replace(temporario, caminho)
+
+    def resultado(self, nome):
+        """Resultado da última execução bem-sucedida da tarefa."""
+        with open(self._caminho_resultado(nome), 'rb') as f:
+            return pickle.load(f)
+
+    # --- execução ---
+
+    def _ordem(self, alvos=None):
+        faltando = {e for t in self.tarefas.values() for e in t.entradas} - set(self.tarefas)
+        if faltando:
+            raise KeyError(f'Entradas sem tarefa declarada: {sorted(faltando)}')
+
+        selecionadas = set(self.tarefas)
+        if alvos is not None:
+            selecionadas, pendentes = set(), list(alvos)
+            while pendentes:
+                nome = pendentes.pop()
+                if nome not in selecionadas:
+                    selecionadas.add(nome)
+                    pendentes.extend(self.tarefas[nome].entradas)
+        return TopologicalSorter({n: self.tarefas[n].entradas for n in selecionadas})
+
+    def _assinatura(self, tarefa, assinaturas):
+        h = hashlib.sha256()
+        # Código da função (funções nativas entram só pelo nome)
+        # (decoradores como `etapa` são desfeitos para chegar ao código da seção)
+        atualizar_hash(h, getattr(inspect.unwrap(tarefa.funcao), '__code__', None))
+        atualizar_hash(h, tarefa.funcao)
+        atualizar_hash(h, tarefa.parametros)
+        atualizar_hash(h, list(tarefa.argumentos))
+        atualizar_hash(h, [assinaturas[e] for e in tarefa.entradas])
+        atualizar_hash(h, [_hash_arquivo(a) if os.path.exists(a) else None for a in tarefa.arquivos])
+        atualizar_hash(h, list(tarefa.saidas))
+        return h.hexdigest()
+
+    def _atualizada(self, tarefa, assinatura, estado):
+        return (
+            estado.get(tarefa.nome) == assinatura
+            and os.path.exists(self._caminho_resultado(tarefa.nome))
+            and all(os.path.exists(s) for s in tarefa.saidas)
+        )
+
+    def executar(self, alvos=None, workers=1, forcar=False, escritores=0):
+        """
+        Executa o grafo (ou apenas `alvos` e suas dependências).
+
+        Parâmetros:
+        - alvos: lista de nomes de tarefas (None executa todas).
+        - workers: número de processos (1 executa no próprio processo, None usa todos os núcleos).
+        - forcar: se True, ignora o estado e refaz todas as tarefas.
+        - escritores: threads de gravação por tarefa (ver analise_ilpi.saida_assincrona); 0 grava na hora.
+
+        Retorna:
+        - dict nome -> 'executada', 'pulada', 'falhou' ou 'bloqueada'.
+          As mensagens de erro ficam em `self.erros`.
+        """
+        os.makedirs(self.pasta_estado, exist_ok=True)
+        ordem = self._ordem(alvos)
+        ordem.prepare()
+        estado = self._ler_estado()
+        assinaturas, situacao, self.erros = {}, {}, {}
+
+        workers = workers or os.cpu_count() or 1
+        executor = None
+        if workers > 1:
+            from .renderizacao import _inicializar_processo, parametros_estilo
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_processo,
+                                           initargs=(parametros_estilo(),))
+
+        def concluir(nome, resultado):
+            situacao[nome] = resultado
+            if resultado in (EXECUTADA, PULADA):
+                estado[nome] = assinaturas[nome]
+                if resultado == EXECUTADA:
+                    self._gravar_estado(estado)
+            else:
+                estado.pop(nome, None)
+            ordem.done(nome)
+
+        # Com um Perfil ativo, os processos do pool medem as tarefas e devolvem os registros
+        coletor = perfil_ativo()
+        memoria = coletor.memoria if coletor is not None and executor is not None else None
+
+        em_andamento = {}
+        try:
+            while ordem.is_active():
+                for nome in ordem.get_ready():
+                    tarefa = self.tarefas[nome]
+                    if any(situacao[e] in (FALHOU, BLOQUEADA) for e in tarefa.entradas):
+                        concluir(nome, BLOQUEADA)
+                        continue
+                    assinaturas[nome] = self._assinatura(tarefa, assinaturas)
+                    if not forcar and self._atualizada(tarefa, assinaturas[nome], estado):
+                        concluir(nome, PULADA)
+                        continue
+
+                    argumentos = (nome, tarefa.funcao, tarefa.parametros,
+                                  {a: self._caminho_resultado(e) for a, e in tarefa.argumentos.items()},
+                                  self._caminho_resultado(nome), escritores)
+                    if executor is None:
+                        erro, _ = _executar_tarefa(*argumentos)
+                        if erro:
+                            self.erros[nome] = erro
+                        concluir(nome, FALHOU if erro else EXECUTADA)
+                    else:
+                        em_andamento[executor.submit(_executar_tarefa, *argumentos, memoria)] = nome
+
+                if em_andamento:
+                    prontas, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                    for futuro in prontas:
+                        nome = em_andamento.pop(futuro)
+                        try:
+                            erro, registros = futuro.result()
+                        except Exception:
+                            # Ex: função ou parâmetros que não podem ser enviados ao processo
+                            erro, registros = traceback.format_exc(), []
+                        if coletor is not None:
+                            coletor.incorporar(registros)
+                        if erro:
+                            self.erros[nome] = erro
+                        concluir(nome, FALHOU if erro else EXECUTADA)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self._gravar_estado(estado)
+
+        return situacao
@@ -0,0 +1,212 @@
+import difflib
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# ------------------------------
+# Vinculação de registros (record linkage) entre bases de residentes
+# ------------------------------
+
+COLUNAS_VINCULO = ['id_a', 'id_b', 'ilpi', 'date_of_birth', 'nome_a', 'nome_b', 'similaridade']
+
+
+def normalizar_nome(serie):
+    """
+    Normaliza nomes para comparação: caixa alta, sem acentos, sem pontuação
+    e com espaços simples.
+
+    Parâmetros:
+    - serie: pd.Series com os nomes.
+
+    Retorna:
+    - pd.Series com os nomes normalizados (vazios viram NaN).
+    """
+    return (
+        serie.astype('string')
+        .str.normalize('NFKD')
+        .str.encode('ascii', errors='ignore')
+        .str.decode('ascii')
+        .str.upper()
+        .str.replace(r'[^A-Z ]', ' ', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+        .replace('', pd.NA)
+    )
+
+
+def _chave_ilpi(serie):
+    """Padroniza o código/nome da ILPI (1.0, '1' e 1 viram '1')."""
+    numerico = pd.to_numeric(serie, errors='coerce')
+    if numerico.notna().sum() == serie.notna().sum():
+        return numerico.astype('Int64').astype('string')
+    return normalizar_nome(serie)
+
+
+def preparar_registros(df, col_nome, col_ilpi='institution_name',
+                       col_nascimento='date_of_birth', col_id=None):
+    """
+    Monta a base mínima usada na vinculação: identificador, ILPI, data de nascimento
+    e nome normalizado. Linhas sem nome, ILPI ou nascimento (ex: linhas de
+    instrumentos repetidos do REDCap) são descartadas.
+
+    Parâmetros:
+    - df: DataFrame original (survey01, perfil epidemiológico, UFG...).
+    - col_nome: coluna com o nome do residente (ex: 'elder_name', 'full_name').
+    - col_ilpi: coluna da ILPI.
+    - col_nascimento: coluna da data de nascimento.
+    - col_id: coluna identificadora (se None, usa o índice do DataFrame).
+
+    Retorna:
+    - DataFrame com as colunas 'id', 'ilpi', 'date_of_birth', 'nome', 'nome_norm'.
+    """
+    base = pd.DataFrame({
+        'id': df[col_id] if col_id else df.index.to_series(),
+        'ilpi': _chave_ilpi(df[col_ilpi]),
+        'date_of_birth': pd.to_datetime(df[col_nascimento], errors='coerce').dt.strftime('%Y-%m-%d'),
+        'nome': df[col_nome],
+        'nome_norm': normalizar_nome(df[col_nome]),
+    })
+    base = base.dropna(subset=['ilpi', 'date_of_birth', 'nome_norm'])
+    # Um residente pode aparecer em várias linhas (ex: medicamentos); mantém a primeira
+    return base.drop_duplicates(subset=['ilpi', 'date_of_birth', 'nome_norm']).reset_index(drop=True)
+
+
+def similaridade_nomes(nomes_a, nomes_b):
+    """
+    Calcula a matriz de similaridade (0 a 1) entre duas listas de nomes normalizados.
+    Usa rapidfuzz (token_sort_ratio vetorizado) quando instalado e difflib caso contrário.
+
+    Parâmetros:
+    - nomes_a, nomes_b: listas de strings.
+
+    Retorna:
+    - lista de listas com len(nomes_a) linhas e len(nomes_b) colunas.
+    """
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        return [
+            [difflib.SequenceMatcher(None, ' '.join(sorted(a.split())), ' '.join(sorted(b.split()))).ratio()
+             for b in nomes_b]
+            for a in nomes_a
+        ]
+    return (process.cdist(nomes_a, nomes_b, scorer=fuzz.token_sort_ratio) / 100).tolist()
+
+
+def _comparar_bloco(bloco):
+    """
+    Compara todos os pares de um bloco (mesma ILPI e nascimento) e retorna os
+    pares acima do limiar, pareando 1:1 pela maior similaridade.
+    Função de nível de módulo para poder ser enviada ao pool de processos.
+    """
+    (ilpi, nascimento), ids_a, nomes_a, ids_b, nomes_b, limiar = bloco
+    matriz = similaridade_nomes(nomes_a, nomes_b)
+
+    candidatos = sorted(
+        ((matriz[i][j], i, j) for i in range(len(ids_a)) for j in range(len(ids_b)) if matriz[i][j] >= limiar),
+        reverse=True
+    )
+
+    usados_a, usados_b, pares = set(), set(), []
+    for score, i, j in candidatos:
+        if i in usados_a or j in usados_b:
+            continue
+        usados_a.add(i)
+        usados_b.add(j)
+        pares.append((ids_a[i], ids_b[j], ilpi, nascimento, nomes_a[i], nomes_b[j], round(score, 4)))
+    return pares
+
+
+def gerar_blocos(base_a, base_b, limiar=0.85):
+    """
+    Gera os blocos de comparação: apenas registros com a mesma ILPI e a mesma data
+    de nascimento são comparados entre si, evitando o custo quadrático da base inteira.
+
+    Parâmetros:
+    - base_a, base_b: DataFrames retornados por `preparar_registros`.
+    - limiar: similaridade mínima para aceitar um par.
+
+    Retorna:
+    - lista de tuplas prontas para `_comparar_bloco`.
+    """
+    chaves = ['ilpi', 'date_of_birth']
+    grupos_b = {chave: grupo for chave, grupo in base_b.groupby(chaves, sort=False)}
+
+    blocos = []
+    for chave, grupo_a in base_a.groupby(chaves, sort=False):
+        grupo_b = grupos_b.get(chave)
+        if grupo_b is None:
+            continue
+        blocos.append((
+            chave,
+            grupo_a['id'].tolist(), grupo_a['nome_norm'].tolist(),
+            grupo_b['id'].tolist(), grupo_b['nome_norm'].tolist(),
+            limiar
+        ))
+    return blocos
+
+
+def vincular_registros(base_a, base_b, limiar=0.85, workers=None):
+    """
+    Vincula residentes de duas bases já preparadas com `preparar_registros`.
+
+    Os blocos (ILPI + data de nascimento) são comparados em um pool de processos
+    quando `workers` > 1; com `workers` None ou 1 a comparação é feita no processo atual.
+
+    Parâmetros:
+    - base_a, base_b: DataFrames preparados.
+    - limiar: similaridade mínima entre nomes (0 a 1).
+    - workers: número de processos.
+
+    Retorna:
+    - DataFrame com 'id_a', 'id_b', 'ilpi', 'date_of_birth', 'nome_a', 'nome_b', 'similaridade'.
+
+    Exemplo de uso:
+    survey = preparar_registros(df_survey01, 'elder_name', col_id='record_id')
+    perfil = preparar_registros(df_perfil, 'full_name', col_id='cpf')
+    vinculos = vincular_registros(survey, perfil, workers=4)
+    """
+    blocos = gerar_blocos(base_a, base_b, limiar)
+
+    if workers and workers > 1 and len(blocos) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultados = list(executor.map(_comparar_bloco, blocos, chunksize=max(1, len(blocos) // (workers * 4))))
+    else:
+        resultados = [_comparar_bloco(bloco) for bloco in blocos]
+
+    pares = [par for resultado in resultados for par in resultado]
+    return pd.DataFrame(pares, columns=COLUNAS_VINCULO)
+
+
+def atribuir_id_residente(vinculos_por_base):
+    """
+    Consolida vínculos par-a-par entre várias bases em um identificador único de residente,
+    permitindo acompanhar a mesma pessoa entre survey01, perfil epidemiológico e UFG.
+
+    Parâmetros:
+    - vinculos_por_base: dict {(nome_base_a, nome_base_b): DataFrame de `vincular_registros`}.
+
+    Retorna:
+    - DataFrame com 'base', 'id' e 'id_residente'.
+    """
+    pai = {}
+
+    def raiz(no):
+        pai.setdefault(no, no)
+        while pai[no] != no:
+            pai[no] = pai[pai[no]]
+            no = pai[no]
+        return no
+
+    for (base_a, base_b), vinculos in vinculos_por_base.items():
+        for id_a, id_b in zip(vinculos['id_a'], vinculos['id_b']):
+            ra, rb = raiz((base_a, id_a)), raiz((base_b, id_b))
+            if ra != rb:
+                pai[rb] = ra
+
+    nos = sorted(pai, key=str)
+    raizes = {r: i for i, r in enumerate(dict.fromkeys(raiz(no) for no in nos), start=1)}
+    return pd.DataFrame(
+        [(base, id_, raizes[raiz((base, id_))]) for base, id_ in nos],
+        columns=['base', 'id', 'id_residente']
+    )
@@ -0,0 +1,85 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from analise_ilpi.graficos import plot_bar_flex_unificado, plot_barh  # noqa: E402
+
+from .dados import contagens_por_ilpi  # noqa: E402
+from .importacao import ORCAMENTO_IMPORT_MS, modulos_carregados_no_import, tempo_import_ms  # noqa: E402
+
+# ------------------------------
+# Orçamentos: memória estável em relatórios longos e tempo de `import analise_ilpi`
+# Os benchmarks `track_*` falham (AssertionError) quando o orçamento é ultrapassado.
+# ------------------------------
+
+GRAFICOS_SEGUIDOS = 500
+
+# Crescimento máximo do pico de memória (RSS) entre o 50º e o 500º gráfico
+ORCAMENTO_CRESCIMENTO_KIB = 16 * 1024
+
+
+def _pico_rss_kib():
+    import resource
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é em bytes no macOS e em KiB no Linux
+    return pico / 1024 if sys.platform == 'darwin' else pico
+
+
+class MemoriaGraficosSeguidos:
+    """Gera 500 gráficos seguidos (como um relatório longo) e mede o que sobra em memória."""
+    timeout = 900
+    unit = 'KiB'
+
+    def setup(self):
+        self.pasta = tempfile.mkdtemp(prefix='bench_estabilidade_')
+        self.contagens = contagens_por_ilpi(5)
+        self.longo = self.contagens.reset_index().melt(id_vars='institution_name', var_name='sexo',
+                                                       value_name='total')
+
+    def teardown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def _grafico(self, i):
+        caminho = os.path.join(self.pasta, f'grafico_{i % 10}.png')
+        if i % 2:
+            plot_barh(self.contagens, 'Gênero', 'Residentes', 'ILPIs', caminho, mostrar=False, usar_cache=False)
+        else:
+            plot_bar_flex_unificado(self.longo, 'Gênero', 'ILPI', 'Residentes', caminho, orientation='v',
+                                    col_categoria='institution_name', col_valor='total', col_grupo='sexo',
+                                    show_text=False, mostrar=False, usar_cache=False)
+
+    def track_crescimento_memoria(self):
+        # Pico de RSS em vez de tracemalloc, que deixaria os 500 gráficos ~3x mais lentos
+        for i in range(GRAFICOS_SEGUIDOS):
+            if i == 50:
+                referencia = _pico_rss_kib()
+            self._grafico(i)
+        crescimento = _pico_rss_kib() - referencia
+        assert not plt.get_fignums(), f'{len(plt.get_fignums())} figuras continuam abertas'
+        assert crescimento <= ORCAMENTO_CRESCIMENTO_KIB, (
+            f'memória cresceu {crescimento:.0f} KiB em {GRAFICOS_SEGUIDOS} gráficos '
+            f'(orçamento: {ORCAMENTO_CRESCIMENTO_KIB} KiB)'
+        )
+        return crescimento
+
+
+class TempoImport:
+    unit = 'ms'
+
+    def track_import_analise_ilpi(self):
+        ms = tempo_import_ms()
+        assert ms <= ORCAMENTO_IMPORT_MS, f'import levou {ms:.0f} ms (orçamento: {ORCAMENTO_IMPORT_MS} ms)'
+        return ms
+
+    def track_modulos_pesados_no_import(self):
+        carregados = len(modulos_carregados_no_import())
+        assert carregados == 0, f'{carregados} dependência(s) pesada(s) carregada(s) no import'
+        return carregados
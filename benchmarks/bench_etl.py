@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+from analise_ilpi import sintetico
+from analise_ilpi.etl import CAMPOS_PROPAGADOS, etl_df_redcap, preparar_base_perfil
+
+from .dados import TAMANHOS, exportacao_perfil
+
+# ------------------------------
+# ETL da exportação do REDCap
+# ------------------------------
+
+
+class ETL:
+    params = [TAMANHOS]
+    param_names = ['linhas']
+    timeout = 600
+
+    def setup(self, linhas):
+        self.bruto = exportacao_perfil(linhas)
+
+    def time_etl_df_redcap(self, linhas):
+        etl_df_redcap(self.bruto, CAMPOS_PROPAGADOS)
+
+    def time_preparar_base_perfil(self, linhas):
+        preparar_base_perfil(self.bruto)
+
+    def peakmem_preparar_base_perfil(self, linhas):
+        preparar_base_perfil(self.bruto)
+
+
+class GeradorSintetico:
+    params = [TAMANHOS]
+    param_names = ['linhas']
+    timeout = 600
+
+    def setup(self, linhas):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.residentes = sintetico.residentes_para_linhas(linhas)
+
+    def teardown(self, linhas):
+        self.pasta.cleanup()
+
+    def time_exportacao_perfil(self, linhas):
+        sintetico.exportacao_perfil(self.residentes, n_ilpis=50)
+
+    def time_gravar_perfil(self, linhas):
+        sintetico.gravar_perfil(os.path.join(self.pasta.name, 'perfil.csv'), self.residentes, n_ilpis=50)
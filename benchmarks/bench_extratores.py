@@ -0,0 +1,74 @@
+from analise_ilpi.core import extrair_profissionais
+from analise_ilpi.esparso import colunas_por_prefixo, contagem_por_grupo, coocorrencia
+from analise_ilpi.etl import preparar_base_perfil
+from analise_ilpi.fragilidade import CONDICAO_ALERTA, CONDICAO_ATENCAO, CONDICAO_CRITICA, classificar_risco
+from analise_ilpi.perfil import extrair_medicamentos, extrair_morbidades, processa_multiresposta
+from analise_ilpi.relatorio_perfil import MORBIDADES_DICT
+
+from .dados import PROFISSIONAIS, TAMANHOS, base_perfil, equipe_ilpis, exportacao_perfil
+
+# ------------------------------
+# Extratores e classificação de risco sobre a base do perfil
+# ------------------------------
+
+
+class Extratores:
+    params = [TAMANHOS]
+    param_names = ['linhas']
+    # As versões linha a linha (apply/iterrows) levam minutos com 1M de linhas
+    timeout = 1800
+
+    def setup(self, linhas):
+        self.base = base_perfil(linhas)
+
+    def time_processa_multiresposta(self, linhas):
+        processa_multiresposta(self.base, MORBIDADES_DICT, 'Morbidades')
+
+    def time_extrair_morbidades(self, linhas):
+        extrair_morbidades(self.base, MORBIDADES_DICT)
+
+    def time_extrair_medicamentos(self, linhas):
+        extrair_medicamentos(self.base)
+
+    def time_classificar_risco(self, linhas):
+        classificar_risco(self.base, CONDICAO_CRITICA, CONDICAO_ALERTA, CONDICAO_ATENCAO)
+
+    def peakmem_extrair_medicamentos(self, linhas):
+        extrair_medicamentos(self.base)
+
+    def peakmem_classificar_risco(self, linhas):
+        classificar_risco(self.base, CONDICAO_CRITICA, CONDICAO_ALERTA, CONDICAO_ATENCAO)
+
+
+class Profissionais:
+    params = [TAMANHOS]
+    param_names = ['ilpis']
+
+    def setup(self, ilpis):
+        self.equipe = equipe_ilpis(ilpis)
+
+    def time_extrair_profissionais(self, ilpis):
+        extrair_profissionais(self.equipe, PROFISSIONAIS)
+
+
+class BlocosCheckbox:
+    """Contagens por ILPI e coocorrência das morbidades, com os blocos densos (Int64) ou esparsos."""
+    params = [TAMANHOS, [False, True]]
+    param_names = ['linhas', 'esparso']
+    timeout = 600
+    unit = 'bytes'
+
+    def setup(self, linhas, esparso):
+        self.base = preparar_base_perfil(exportacao_perfil(linhas), esparso=esparso)
+
+    def time_contagem_por_grupo(self, linhas, esparso):
+        contagem_por_grupo(self.base, 'morbidities___')
+
+    def time_coocorrencia(self, linhas, esparso):
+        coocorrencia(self.base, 'morbidities___')
+
+    def time_extrair_morbidades(self, linhas, esparso):
+        extrair_morbidades(self.base, MORBIDADES_DICT)
+
+    def track_memoria_blocos(self, linhas, esparso):
+        return int(self.base[colunas_por_prefixo(self.base)].memory_usage(deep=True).sum())
@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+from analise_ilpi.graficos import (  # noqa: E402
+    plot_bar_flex_unificado,
+    plot_barh,
+    plot_idade_com_media,
+    plot_idade_por_ilpi,
+    plot_percentual_por_ilpi,
+)
+from analise_ilpi.tabelas import salvar_tabela_como_imagem  # noqa: E402
+
+from .dados import TAMANHOS, base_perfil, contagens_por_ilpi  # noqa: E402
+
+# ------------------------------
+# Gráficos e tabelas-imagem (sempre redesenhados: usar_cache=False)
+# ------------------------------
+
+
+class _PastaTemporaria:
+    def setup(self, *params):
+        self.pasta = tempfile.mkdtemp(prefix='bench_graficos_')
+
+    def teardown(self, *params):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def caminho(self, nome):
+        return os.path.join(self.pasta, nome)
+
+
+class GraficosPorILPI(_PastaTemporaria):
+    """Gráficos de barras: o custo cresce com o número de barras (ILPIs x categorias)."""
+    params = [[5, 50, 500]]
+    param_names = ['ilpis']
+
+    def setup(self, ilpis):
+        super().setup(ilpis)
+        self.contagens = contagens_por_ilpi(ilpis)
+        self.faixas = contagens_por_ilpi(ilpis, categorias=[f'{i} a {i + 4} anos' for i in range(61, 101, 5)])
+        self.longo = self.contagens.reset_index().melt(id_vars='institution_name', var_name='sexo',
+                                                       value_name='total')
+
+    def time_plot_barh(self, ilpis):
+        plot_barh(self.contagens, 'Gênero', 'Residentes', 'ILPIs', self.caminho('barh.png'),
+                  mostrar=False, usar_cache=False)
+
+    def time_plot_percentual_por_ilpi(self, ilpis):
+        plot_percentual_por_ilpi(self.faixas, self.caminho('percentual.png'), mostrar=False, usar_cache=False)
+
+    def time_plot_bar_flex_unificado(self, ilpis):
+        plot_bar_flex_unificado(self.longo, 'Gênero', 'ILPI', 'Residentes', self.caminho('unificado.png'),
+                                orientation='v', col_categoria='institution_name', col_valor='total',
+                                col_grupo='sexo', show_text=False, mostrar=False, usar_cache=False)
+
+
+class GraficosIdade(_PastaTemporaria):
+    """Idade por residente: pontos até LIMIAR_PONTOS, visões agregadas acima."""
+    params = [TAMANHOS]
+    param_names = ['linhas']
+    timeout = 600
+
+    def setup(self, linhas):
+        super().setup(linhas)
+        base = base_perfil(linhas, n_ilpis=20)
+        self.idades = base.loc[base['elder_age'].notna(), ['institution_name', 'elder_age']].astype('int64')
+
+    def time_plot_idade_com_media(self, linhas):
+        plot_idade_com_media(self.idades['elder_age'], self.caminho('idade.png'), mostrar=False)
+
+    def time_plot_idade_por_ilpi(self, linhas):
+        plot_idade_por_ilpi(self.idades, self.caminho('idade_ilpi.png'), mostrar=False)
+
+    def peakmem_plot_idade_por_ilpi(self, linhas):
+        plot_idade_por_ilpi(self.idades, self.caminho('idade_ilpi.png'), mostrar=False)
+
+
+class Tabelas(_PastaTemporaria):
+    params = [[25, 250], ['matplotlib', 'pil']]
+    param_names = ['linhas', 'backend']
+
+    def setup(self, linhas, backend):
+        super().setup(linhas, backend)
+        self.tabela = base_perfil(linhas * 3)[['institution_name', 'full_name', 'elder_age', 'race']].head(linhas)
+
+    def time_salvar_tabela_como_imagem(self, linhas, backend):
+        salvar_tabela_como_imagem(self.tabela, self.caminho('tabela.png'), titulo='Residentes',
+                                  backend=backend, usar_cache=False)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from analise_ilpi import sintetico
+from analise_ilpi.etl import preparar_base_perfil
+
+# ------------------------------
+# Dados sintéticos (vetorizados) para os benchmarks
+# ------------------------------
+
+# Tamanhos usados nos benchmarks que variam com o número de linhas
+TAMANHOS = [1_000, 100_000, 1_000_000]
+
+PROFISSIONAIS = [
+    ('Aux.Enfermagem', 'nurse_aux', 'days_per_month_na'),
+    ('Téc.Enfermagem', 'nurse_tech', 'days_per_month_nt'),
+    ('Enfermeiro(a)', 'nurse', 'days_per_month_n'),
+    ('Fisio', 'physiotherapist', 'days_per_month_physio'),
+    ('Nutricionista', 'nutritionist', 'days_per_month_nutrit'),
+    ('Psicologo(a)', 'psicologist', 'days_per_month_psicol'),
+    ('Médico(a)', 'physician', 'days_per_month_physician'),
+    ('Ter.Ocupacional', 'occup_therapist', 'days_per_month_occup'),
+    ('Cuidador(a)', 'caregiver', 'days_per_month_caregiver'),
+    ('Outros_prof_saúde', 'other_health_prof', 'd_p_month_oth_health_prof'),
+    ('Serv.Gerais', 'housekeeping', 'days_per_month_housekeep'),
+    ('Administrativo', 'staff', 'days_per_month_staff'),
+]
+
+
+def exportacao_perfil(n, n_ilpis=5, semente=0):
+    """
+    Exportação bruta (formato REDCap, ver analise_ilpi.sintetico) com aproximadamente `n` linhas:
+    linha do residente seguida das linhas repetidas de medicamentos e morbidades.
+    """
+    return sintetico.exportacao_perfil(sintetico.residentes_para_linhas(n), n_ilpis, semente)
+
+
+def base_perfil(n, n_ilpis=5, semente=0):
+    """
+    Base do perfil com `n` linhas, com os tipos que as seções recebem ao ler o CSV gerado
+    pelo ETL (colunas codificadas como float, sem o Int64 do ETL em memória).
+    """
+    base = preparar_base_perfil(exportacao_perfil(n, n_ilpis, semente))
+    inteiras = base.select_dtypes('Int64').columns
+    return base.astype({c: 'float64' for c in inteiras})
+
+
+def equipe_ilpis(n, semente=0):
+    """Uma linha por ILPI (monitoramento UFG) com quantidade e dias/mês de cada profissional."""
+    rng = np.random.default_rng(semente)
+    df = pd.DataFrame({'institution_name': np.arange(1, n + 1)})
+    for _, col_quantidade, col_dias in PROFISSIONAIS:
+        df[col_quantidade] = np.where(rng.random(n) < 0.7, rng.integers(1, 10, n), 0)
+        df[col_dias] = rng.integers(1, 31, n).astype(float)
+    return df
+
+
+def contagens_por_ilpi(n_ilpis, categorias=('Feminino', 'Masculino'), semente=0):
+    """Tabela ILPI x categoria com contagens (formato usado por plot_barh/plot_percentual_por_ilpi)."""
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame(rng.integers(1, 80, (n_ilpis, len(categorias))), columns=list(categorias),
+                        index=pd.Index([f'ILPI {i:03d}' for i in range(1, n_ilpis + 1)], name='institution_name'))
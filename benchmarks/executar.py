@@ -0,0 +1,175 @@
+"""
+Executor simples dos benchmarks (sem o asv), para rodar localmente e comparar commits.
+
+Os benchmarks seguem as convenções do asv (classes com `params`, `setup`, `time_*`,
+`peakmem_*` e `track_*`) e também rodam com `asv run` / `asv compare` (ver asv.conf.json).
+Aqui `peakmem_*` mede o pico de memória alocada pelo Python (tracemalloc), não o RSS do processo.
+
+Exemplo de uso (na raiz do repositório):
+python -m benchmarks.executar --max-linhas 100000
+python -m benchmarks.executar --filtro extrair_medicamentos --repeticoes 5
+python -m benchmarks.executar --comparar 1a2b3c4 5d6e7f8
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+PASTA_RESULTADOS = '.benchmarks'
+
+# Parâmetros limitados por --max-linhas
+_PARAMETROS_TAMANHO = {'linhas', 'ilpis'}
+
+# Razão (novo / antigo) acima da qual a comparação marca regressão
+LIMIAR_REGRESSAO = 1.2
+
+
+def _commit():
+    try:
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=raiz).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'sem_git'
+
+
+def _benchmarks():
+    """(nome, classe, método) de todos os benchmarks dos módulos bench_*."""
+    import benchmarks
+
+    for modulo in sorted(m.name for m in pkgutil.iter_modules(benchmarks.__path__) if m.name.startswith('bench_')):
+        modulo = importlib.import_module(f'benchmarks.{modulo}')
+        for nome_classe, classe in inspect.getmembers(modulo, inspect.isclass):
+            if classe.__module__ != modulo.__name__ or nome_classe.startswith('_'):
+                continue
+            for nome_metodo in sorted(vars(classe)):
+                if nome_metodo.startswith(('time_', 'peakmem_', 'track_')):
+                    yield f'{modulo.__name__.split(".")[-1]}.{nome_classe}.{nome_metodo}', classe, nome_metodo
+
+
+def _combinacoes(classe, max_linhas):
+    params = getattr(classe, 'params', [])
+    nomes = getattr(classe, 'param_names', [])
+    if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+    for combinacao in itertools.product(*params):
+        if max_linhas is not None and any(
+                n in _PARAMETROS_TAMANHO and isinstance(v, int) and v > max_linhas for n, v in zip(nomes, combinacao)):
+            continue
+        yield combinacao
+
+
+def _medir(classe, metodo, combinacao, repeticoes):
+    tipo = metodo.split('_', 1)[0]
+    instancia = classe()
+    valores = []
+    for _ in range(1 if tipo != 'time' else repeticoes):
+        if hasattr(instancia, 'setup'):
+            instancia.setup(*combinacao)
+        try:
+            funcao = getattr(instancia, metodo)
+            if tipo == 'time':
+                inicio = time.perf_counter()
+                funcao(*combinacao)
+                valores.append(time.perf_counter() - inicio)
+            elif tipo == 'peakmem':
+                tracemalloc.start()
+                try:
+                    funcao(*combinacao)
+                    valores.append(tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+            else:
+                valores.append(funcao(*combinacao))
+        finally:
+            if hasattr(instancia, 'teardown'):
+                instancia.teardown(*combinacao)
+    return min(valores), {'time': 's', 'peakmem': 'bytes'}.get(tipo, getattr(classe, 'unit', ''))
+
+
+def executar(filtro=None, max_linhas=None, repeticoes=3):
+    resultados = {}
+    for nome, classe, metodo in _benchmarks():
+        if filtro and not re.search(filtro, nome):
+            continue
+        for combinacao in _combinacoes(classe, max_linhas):
+            chave = f"{nome}({', '.join(map(str, combinacao))})" if combinacao else nome
+            try:
+                valor, unidade = _medir(classe, metodo, combinacao, repeticoes)
+                resultados[chave] = {'valor': valor, 'unidade': unidade}
+                print(f'{chave:<85} {valor:>14.4g} {unidade}', flush=True)
+            except Exception as erro:
+                resultados[chave] = {'valor': None, 'erro': f'{type(erro).__name__}: {erro}'}
+                print(f'{chave:<85} {"FALHOU":>14} {type(erro).__name__}: {erro}', flush=True)
+    return resultados
+
+
+def salvar(resultados, pasta=PASTA_RESULTADOS):
+    import matplotlib
+    import numpy
+    import pandas
+
+    commit = _commit()
+    os.makedirs(pasta, exist_ok=True)
+    caminho = os.path.join(pasta, f'{commit}.json')
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({
+            'commit': commit,
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'maquina': {'python': platform.python_version(), 'sistema': platform.platform(),
+                        'cpus': os.cpu_count()},
+            'versoes': {'pandas': pandas.__version__, 'numpy': numpy.__version__,
+                        'matplotlib': matplotlib.__version__},
+            'resultados': resultados,
+        }, f, ensure_ascii=False, indent=1)
+    return caminho
+
+
+def comparar(antigo, novo, pasta=PASTA_RESULTADOS):
+    """Imprime novo/antigo para cada benchmark presente nos dois commits. Retorna o número de regressões."""
+    dados = []
+    for commit in (antigo, novo):
+        with open(os.path.join(pasta, f'{commit}.json'), encoding='utf-8') as f:
+            dados.append(json.load(f)['resultados'])
+    regressoes = 0
+    for chave in sorted(set(dados[0]) & set(dados[1])):
+        a, b = dados[0][chave]['valor'], dados[1][chave]['valor']
+        if not a or b is None:
+            continue
+        razao = b / a
+        marca = ''
+        if razao > LIMIAR_REGRESSAO:
+            marca, regressoes = '  <- regressão', regressoes + 1
+        elif razao < 1 / LIMIAR_REGRESSAO:
+            marca = '  <- melhora'
+        print(f'{chave:<85} {a:>12.4g} {b:>12.4g} {razao:>7.2f}x{marca}')
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filtro', help='expressão regular sobre o nome do benchmark')
+    parser.add_argument('--max-linhas', type=int, help='ignora tamanhos (linhas/ILPIs) acima deste valor')
+    parser.add_argument('--repeticoes', type=int, default=3, help='repetições dos time_* (vale o menor tempo)')
+    parser.add_argument('--comparar', nargs=2, metavar=('ANTIGO', 'NOVO'), help='compara dois commits já medidos')
+    args = parser.parse_args(argv)
+
+    if args.comparar:
+        return 1 if comparar(*args.comparar) else 0
+    resultados = executar(args.filtro, args.max_linhas, args.repeticoes)
+    print(f'\nResultados gravados em {salvar(resultados)}')
+    return 1 if any(r['valor'] is None for r in resultados.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
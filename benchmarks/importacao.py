@@ -0,0 +1,41 @@
+import subprocess
+import sys
+import time
+
+# ------------------------------
+# Medição do `import analise_ilpi` em processos novos (usada por bench_estabilidade e tests/test_import.py)
+# ------------------------------
+
+# Tempo máximo de `import analise_ilpi` em um processo novo (não deve carregar pandas/matplotlib)
+ORCAMENTO_IMPORT_MS = 150
+
+# Dependências que o import do pacote não deve carregar
+MODULOS_PESADOS = ('pandas', 'matplotlib', 'matplotlib.pyplot', 'seaborn')
+
+
+def _executar(codigo):
+    return subprocess.run([sys.executable, '-c', codigo], check=True, capture_output=True, text=True)
+
+
+def tempo_import_ms(codigo='import analise_ilpi', repeticoes=5):
+    """
+    Tempo (ms) de `codigo` em um processo novo, descontado o início do interpretador
+    (`python -c pass`). Retorna o menor de `repeticoes` processos, que descarta o ruído de disco/cache.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        _executar(codigo)
+        meio = time.perf_counter()
+        _executar('pass')
+        tempos.append((meio - inicio) - (time.perf_counter() - meio))
+    return max(min(tempos), 0) * 1000
+
+
+def modulos_carregados_no_import(modulos=MODULOS_PESADOS):
+    """Módulos de `modulos` presentes em sys.modules após `import analise_ilpi` em um processo novo."""
+    saida = _executar(
+        'import sys, analise_ilpi; '
+        f'print(",".join(m for m in {tuple(modulos)!r} if m in sys.modules))'
+    )
+    return [m for m in saida.stdout.strip().split(',') if m]
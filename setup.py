@@ -11,5 +11,16 @@ setup(
         'matplotlib',
         'seaborn'
     ],
-    python_requires='=>3.13',
+    extras_require={
+        'vinculacao': ['rapidfuzz'],
+        'duckdb': ['duckdb'],
+        'geoespacial': ['scikit-learn'],
+        'esparso': ['scipy'],
+        'benchmarks': ['asv'],
+        'testes': ['pytest'],
+    },
+    entry_points={
+        'console_scripts': ['analise-ilpi=analise_ilpi.cli:main'],
+    },
+    python_requires='>=3.11',
 )
@@ -5,38 +5,9 @@ import pandas as pd
 ## Função para facilitar a análise baseada em CPF, considerando que o DF tem colunas vazias ou NA.
 ## ----------------------
 
-def etl_df_redcap(df, campos_chave, campo_discriminador='institution_name'):
-    """
-    Executa o pré-processamento (ETL) no DataFrame exportado do REDCap para análise posterior.
-    Propaga campos-chave (ex: cpf, full_name) a partir de linhas onde há valor no campo_discriminador 
-    (ex: institution_name).
-    Substitui as colunas originais pelas propagadas sem sufixo.
-
-    Uso: 
-    campos_para_propagar = ['cpf', 'full_name', 'institution_name']
-    df_corrigido = etl_df_redcap(df, campos_para_propagar)
-    """
-    # Copia o data frame para segurança
-    df = df.copy()
-    # Identifica início de novos grupos
-    novo_grupo = df[campo_discriminador].notna() & (df[campo_discriminador] != 0)
-    df['_grupo'] = novo_grupo.cumsum()
-
-    for campo in campos_chave:
-        # Cria coluna propagada
-        coluna_propagada = df.groupby('_grupo')[campo].transform('first')
-
-        ## Padroniza em caixa alta se for string
-        #if pd.api.types.is_string_dtype(propagado):
-        #    propagado = propagado.str.upper()
-        
-        # Remove coluna original e substitui pela propagada sem o sufixo
-        df.drop(columns=[campo], inplace=True)
-        df[campo] = coluna_propagada
-
-    df.drop(columns=['_grupo'], inplace=True)
-   
-    return df
+from analise_ilpi.etl import etl_df_redcap
+
+# Pipeline completo (propagação, tipos, colunas): analise_ilpi.etl.ingerir ou `analise-ilpi ingest`
 # %%
 # Ajustar a exibição do pandas para mostrar mais caracteres
 #pd.set_option('display.max_rows', None) #para mostrar todas as linhas. 
@@ -11,7 +11,7 @@ from matplotlib.backends.backend_pdf import PdfPages # Salvar como PDF
 from matplotlib.ticker import MaxNLocator # Limitar número de ticks
 # %%
 
-df = pd.read_csv("/Users/mjrs/Library/CloudStorage/OneDrive-Pessoal/UFG/Projeto_VIDAEPAUTA/Códigos/SMSAp/VIDAEPAUTA/data/survey01.csv")
+df = pd.read_csv("../../../data/SMSAp/survey01.csv")
 df.head()
 # %%
 
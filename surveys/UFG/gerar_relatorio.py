@@ -0,0 +1,17 @@
+# %%
+# --------------------
+# Monitoramento das ILPIs (UFG)
+# --------------------
+# A análise passo a passo (tabelas e gráficos 01 a 54) está em src/analise_ilpi_ufg.py; as seções
+# ficam em analise_ilpi.relatorio_monitoramento. Este script gera o relatório completo como um
+# grafo de tarefas: seções independentes rodam em paralelo e as que não mudaram são puladas.
+# As tabelas vão para ./tables e os gráficos para ./plots.
+# (Antes chamado analise_ilpi.py, nome que encobria o pacote analise_ilpi ao rodar desta pasta.)
+from analise_ilpi.relatorio_monitoramento import grafo_monitoramento
+
+# %%
+# ---------------------
+# Execução
+grafo = grafo_monitoramento('../../data/UFG/base_ilpi.csv', '.')
+situacao = grafo.executar(workers=None)
+situacao
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from analise_ilpi.agregacao import frequencia
+
+pytest.importorskip('duckdb')
+
+
+@pytest.fixture
+def base_csv(tmp_path):
+    # ILPI 1: 1 x raça 1 e 7 x raça 2 (proporções 0.125 / 0.875); raça ausente em uma linha
+    df = pd.DataFrame({
+        'institution_name': [1] * 8 + [2, 2, None],
+        'race': [1] + [2] * 7 + [1, None, 3],
+    })
+    caminho = tmp_path / 'base.csv'
+    df.to_csv(caminho, sep=';', index=False)
+    return str(caminho)
+
+
+@pytest.mark.parametrize('por', [None, 'institution_name'])
+def test_backends_iguais_no_mesmo_csv(base_csv, por):
+    pandas = frequencia(base_csv, 'race', por=por, sep=';', backend='pandas')
+    duckdb = frequencia(base_csv, 'race', por=por, sep=';', backend='duckdb')
+    pd.testing.assert_frame_equal(duckdb, pandas)
+
+
+def test_backends_iguais_no_mesmo_dataframe(base_csv):
+    df = pd.read_csv(base_csv, sep=';')
+    pd.testing.assert_frame_equal(
+        frequencia(df, 'race', por='institution_name', backend='duckdb'),
+        frequencia(df, 'race', por='institution_name', backend='pandas'),
+    )
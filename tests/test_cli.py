@@ -0,0 +1,19 @@
+import os
+
+from analise_ilpi import cli
+from analise_ilpi.cache_figuras import VARIAVEL_DESATIVAR
+
+
+def test_bench_restaura_variavel_do_cache(monkeypatch):
+    vistos = []
+    monkeypatch.setattr(cli, 'comando_report', lambda config, forcar=False: vistos.append(os.environ.get(VARIAVEL_DESATIVAR)))
+    config = {'entrada': {'bruto': None, 'base': 'base.csv'}, 'saida': {'pasta': 'x'}, 'execucao': {'workers': 1}}
+
+    monkeypatch.delenv(VARIAVEL_DESATIVAR, raising=False)
+    assert cli.comando_bench(config, repeticoes=2) == 0
+    assert vistos == ['1', '1']
+    assert VARIAVEL_DESATIVAR not in os.environ
+
+    monkeypatch.setenv(VARIAVEL_DESATIVAR, '0')
+    cli.comando_bench(config, repeticoes=1)
+    assert os.environ[VARIAVEL_DESATIVAR] == '0'
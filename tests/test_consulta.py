@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi.consulta import Consulta, ExecutorConsultas
+
+
+@pytest.fixture
+def base():
+    rng = np.random.default_rng(0)
+    n = 500
+    return pd.DataFrame({
+        'institution_name': rng.integers(1, 6, n),
+        'sex': rng.choice([1.0, 2.0, np.nan], n),
+        'race': rng.choice([1.0, 2.0, 3.0, np.nan], n),
+        'elder_age': rng.integers(55, 105, n),
+    })
+
+
+@pytest.fixture(params=['dataframe', 'csv', 'parquet'])
+def fonte(request, base, tmp_path):
+    if request.param == 'dataframe':
+        return base
+    if request.param == 'csv':
+        caminho = tmp_path / 'base.csv'
+        base.to_csv(caminho, sep=';', index=False)
+        return str(caminho)
+    pytest.importorskip('pyarrow')
+    caminho = tmp_path / 'base.parquet'
+    base.to_parquet(caminho, index=False)
+    return str(caminho)
+
+
+def _igual(preguicoso, ansioso):
+    pd.testing.assert_frame_equal(preguicoso.reset_index(drop=True), ansioso.reset_index(drop=True),
+                                  check_dtype=False)
+
+
+def test_consulta_preguicosa_igual_ao_pandas(fonte, base):
+    consulta = Consulta(fonte, sep=';')
+    # tamanho_bloco pequeno: o CSV é lido e filtrado em vários blocos
+    resultados = ExecutorConsultas(tamanho_bloco=64).executar({
+        'genero': consulta.filtrar('sex', 'in', [1, 2]).agrupar('institution_name', 'sex'),
+        'raca': consulta.filtrar('race', 'notna').agrupar('race', nome='n'),
+        'idosos': consulta.filtrar('elder_age', '>=', 80).filtrar('sex', '==', 2).selecionar('institution_name',
+                                                                                              'elder_age'),
+    })
+
+    genero = base[base['sex'].isin([1, 2])].groupby(['institution_name', 'sex']).size().reset_index(name='total')
+    raca = base[base['race'].notna()].groupby(['race']).size().reset_index(name='n')
+    idosos = base[(base['elder_age'] >= 80) & (base['sex'] == 2)][['institution_name', 'elder_age']]
+    _igual(resultados['genero'], genero)
+    _igual(resultados['raca'], raca)
+    _igual(resultados['idosos'], idosos)
+
+
+def test_plano_le_so_as_colunas_usadas():
+    consulta = Consulta('base.csv').filtrar('race', 'notna').agrupar('institution_name', 'race')
+    plano = consulta.plano()
+    assert plano['colunas'] == ('race', 'institution_name')
+    assert plano['filtros_na_leitura'] == (('race', 'notna', None),)
+    assert plano['passos_em_memoria'] == [('agrupar', (('institution_name', 'race'), 'total'))]
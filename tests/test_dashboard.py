@@ -0,0 +1,27 @@
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from analise_ilpi.dashboard import Painel
+
+
+def test_painel_agrega_uma_vez_e_embute_os_mesmos_dados(tmp_path):
+    df = pd.DataFrame({'institution_name': [1, 1, 2, 2, 2], 'race': [1, 2, 1, 1, np.nan]})
+    painel = Painel('Perfil <ILPIs>')
+    painel.adicionar_variavel(df, 'race', titulo='Raça/cor', mapa={1: 'Branca', 2: 'Preta'})
+    painel.adicionar_tabela('total', df['institution_name'].value_counts().sort_index(), titulo='Residentes')
+    caminho = painel.salvar(str(tmp_path))
+
+    dados = json.loads((tmp_path / 'painel.json').read_text(encoding='utf-8'))
+    raca, total = dados['variaveis']
+    contagens = dict(zip(raca['categorias'], raca['contagens']))
+    assert raca['ilpis'] == ['1', '2']
+    assert contagens == {'Branca': [1, 2], 'Preta': [1, 0]}
+    assert total['ilpis'] == ['Total'] and total['contagens'] == [[2], [3]]
+
+    html = open(caminho, encoding='utf-8').read()
+    assert '<title>Perfil &lt;ILPIs&gt;</title>' in html
+    embutido = re.search(r'const DADOS = (.*?);\n', html)
+    assert json.loads(embutido.group(1).replace('<\\/', '</')) == dados
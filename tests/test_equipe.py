@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi.equipe import HORAS_CUIDADOR_POR_GRAU, minimo_cuidador_por_ilpi, tabela_equipe, verificar_razoes
+
+
+def _base():
+    # ILPI 3 não informou nenhum profissional
+    return pd.DataFrame({
+        'institution_name': [1, 2, 3],
+        'residents_number': [20, 10, 12],
+        'caregiver': [2, 1, np.nan],
+        'weekly_hours_caregiver': [44, 40, np.nan],
+        'nurse': [1, 0, np.nan],
+        'weekly_hours_n': [40, 0, np.nan],
+    })
+
+
+def test_tabela_equipe_horas_por_residente():
+    equipe = tabela_equipe(_base())
+    cuidadores = equipe[equipe['profissional'] == 'Cuidador(a)'].set_index('ILPI')
+    assert cuidadores['horas_por_residente'].to_dict() == {1: 4.4, 2: 4.0}
+    assert set(equipe['ILPI']) == {1, 2}
+
+
+def test_verificar_razoes_inclui_ilpis_sem_profissionais():
+    base = _base()
+    razoes = verificar_razoes(tabela_equipe(base), residentes=base.set_index('institution_name')['residents_number'])
+    assert razoes['ILPI'].tolist() == [1, 2, 3]
+    sem_equipe = razoes.set_index('ILPI').loc[3]
+    assert not sem_equipe['atende']
+    assert sem_equipe['deficit_horas_semana'] == pytest.approx(12 * HORAS_CUIDADOR_POR_GRAU[1], abs=0.05)
+
+    # Sem `residentes`, só as ILPIs que aparecem na tabela de equipe
+    assert verificar_razoes(tabela_equipe(base))['ILPI'].tolist() == [1, 2]
+
+
+def test_minimo_de_cuidadores_segue_o_grau_de_dependencia():
+    perfil = pd.DataFrame({
+        'institution_name': [1] * 4 + [2] * 2,
+        'dependence_degree': [1.0, 1.0, 3.0, 3.0, 2.0, np.nan],
+    })
+    dependencia = pd.crosstab(perfil['institution_name'], perfil['dependence_degree'])
+    minimos = minimo_cuidador_por_ilpi(dependencia)
+    assert minimos[1] == pytest.approx((HORAS_CUIDADOR_POR_GRAU[1] + HORAS_CUIDADOR_POR_GRAU[3]) / 2)
+    assert minimos[2] == pytest.approx(HORAS_CUIDADOR_POR_GRAU[2])
+
+    base = _base()
+    razoes = verificar_razoes(tabela_equipe(base), residentes=base.set_index('institution_name')['residents_number'],
+                              dependencia=dependencia).set_index('ILPI')
+    # ILPI 1 atende o Grau I (4,4 h >= 2,8 h), mas não a sua composição (Grau I e III)
+    assert not razoes.loc[1, 'atende']
+    assert razoes.loc[3, 'minimo_por_residente'] == HORAS_CUIDADOR_POR_GRAU[1]
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi.esparso import coocorrencia, contagem_por_grupo, esparsificar
+from analise_ilpi.etl import preparar_base_perfil
+from analise_ilpi.perfil import extrair_morbidades
+from analise_ilpi.relatorio_perfil import MORBIDADES_DICT
+from analise_ilpi.sintetico import exportacao_perfil
+
+pytest.importorskip('scipy')
+
+
+@pytest.fixture(scope='module')
+def bases():
+    bruto = exportacao_perfil(300)
+    return preparar_base_perfil(bruto), preparar_base_perfil(bruto, esparso=True)
+
+
+def test_esparsificar_guarda_so_as_marcacoes(bases):
+    densa, esparsa = bases
+    colunas = [c for c in densa.columns if c.startswith('morbidities___')]
+    assert all(isinstance(t, pd.SparseDtype) for t in esparsa[colunas].dtypes)
+    assert esparsa[colunas].memory_usage(deep=True).sum() < densa[colunas].memory_usage(deep=True).sum() / 5
+    pd.testing.assert_frame_equal(esparsificar(densa), esparsa)
+
+
+def test_extrair_morbidades_densa_igual_a_esparsa(bases):
+    densa, esparsa = bases
+    resultado_densa = extrair_morbidades(densa, MORBIDADES_DICT)
+    resultado_esparsa = extrair_morbidades(esparsa, MORBIDADES_DICT)
+    pd.testing.assert_frame_equal(resultado_densa, resultado_esparsa)
+    assert resultado_densa['soma_morbidities'].dtype == np.int64
+
+
+def test_contagem_e_coocorrencia_iguais_ao_calculo_denso(bases):
+    densa, esparsa = bases
+    colunas = [c for c in densa.columns if c.startswith('morbidities___')]
+    # Residente marcado em alguma de suas linhas
+    por_residente = densa[['institution_name', 'cpf'] + colunas].assign(
+        **{c: densa[c].eq(1).fillna(False) for c in colunas}
+    ).groupby(['institution_name', 'cpf']).any()
+
+    esperado = por_residente.groupby(level='institution_name').sum()
+    pd.testing.assert_frame_equal(contagem_por_grupo(esparsa, 'morbidities___'), esperado, check_dtype=False,
+                                  check_index_type=False)
+
+    matriz = por_residente.groupby(level='cpf').any().to_numpy(dtype=np.int64)
+    np.testing.assert_array_equal(coocorrencia(esparsa, 'morbidities___').to_numpy(), matriz.T @ matriz)
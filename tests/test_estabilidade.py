@@ -0,0 +1,56 @@
+import gc
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from analise_ilpi.graficos import plot_bar_flex_unificado, plot_barh
+
+GRAFICOS_SEGUIDOS = 500
+
+# Gráficos medidos com o tracemalloc ao final da série (ele deixa cada gráfico ~3x mais lento)
+GRAFICOS_MEDIDOS = 50
+
+# Crescimento máximo entre o 50º e o 500º gráfico (objetos vivos) e nos últimos gráficos (bytes alocados)
+ORCAMENTO_OBJETOS = 2000
+ORCAMENTO_CRESCIMENTO_BYTES = 1024 * 1024
+
+
+def test_memoria_estavel_em_500_graficos_seguidos():
+    contagens = pd.DataFrame({'Feminino': [30, 42, 17], 'Masculino': [21, 12, 9]},
+                             index=pd.Index([1, 2, 3], name='institution_name'))
+    longo = contagens.reset_index().melt(id_vars='institution_name', var_name='sexo', value_name='total')
+
+    def grafico(i):
+        # Sem arquivo: a gravação do PNG não guarda estado e só deixaria o teste mais lento
+        if i % 2:
+            plot_barh(contagens, 'Gênero', 'Residentes', 'ILPIs', None, mostrar=False)
+        else:
+            plot_bar_flex_unificado(longo, 'Gênero', 'ILPI', 'Residentes', None, orientation='v',
+                                    col_categoria='institution_name', col_valor='total', col_grupo='sexo',
+                                    show_text=False, mostrar=False)
+
+    inicio_medicao = GRAFICOS_SEGUIDOS - GRAFICOS_MEDIDOS
+    try:
+        for i in range(GRAFICOS_SEGUIDOS):
+            if i == 50:
+                gc.collect()
+                objetos = len(gc.get_objects())
+            if i == inicio_medicao:
+                gc.collect()
+                tracemalloc.start()
+            grafico(i)
+            assert not plt.get_fignums(), f'figura aberta após o gráfico {i}'
+        gc.collect()
+        crescimento = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert len(gc.get_objects()) - objetos <= ORCAMENTO_OBJETOS
+    assert crescimento <= ORCAMENTO_CRESCIMENTO_BYTES, (
+        f'{crescimento} bytes continuam alocados após {GRAFICOS_MEDIDOS} gráficos'
+    )
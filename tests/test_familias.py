@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi.familias import RegistroFamilias, criar_df_com_soma_por_prefixo
+from analise_ilpi.perfil import processa_multiresposta
+
+
+def _base():
+    return pd.DataFrame({
+        'institution_name': [1, 1, 2],
+        'm___1': [1, 0, 1],
+        'm___2': [0, 0, 1],
+        'link_type___1': [1, 0, 0],
+        'link_type___2': [1, 0, 1],
+    })
+
+
+def test_soma_acompanha_alteracoes_do_dataframe():
+    df = _base()
+    assert criar_df_com_soma_por_prefixo(df, 'm___')['soma_m'].tolist() == [1, 0, 2]
+
+    df.loc[1, 'm___2'] = 1
+    assert criar_df_com_soma_por_prefixo(df, 'm___')['soma_m'].tolist() == [1, 1, 2]
+
+
+def test_registro_explicito_e_igual_ao_calculo_direto():
+    df = _base()
+    df.loc[2, 'm___2'] = np.nan
+    registro = RegistroFamilias(df)
+
+    for prefixo in ['m___', 'link_type___']:
+        pd.testing.assert_frame_equal(
+            criar_df_com_soma_por_prefixo(df, prefixo, registro=registro),
+            criar_df_com_soma_por_prefixo(df, prefixo),
+        )
+    assert registro.contagem('link_type___').tolist() == [2, 0, 1]
+    with pytest.raises(KeyError):
+        registro.bloco('combination_')
+
+
+def test_processa_multiresposta():
+    resultado = processa_multiresposta(_base(), {'link_type___1': 'Privado', 'link_type___2': 'Filantrópico'}, 'Vínculo')
+    assert resultado['Vínculo'].tolist() == ['Privado, Filantrópico', 'Filantrópico']
+    assert resultado['ILPI'].tolist() == [1, 2]
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi.geoespacial import IndiceEspacial, separar_unidades, unidade_mais_proxima
+
+REFERENCIA = pd.DataFrame({
+    'nome': ['UPA Buriti', 'UPA Brasicom', 'UBS Centro'],
+    'tipo': ['UPA', 'UPA', 'UBS'],
+    'latitude': [-16.82, -16.75, -16.80],
+    'longitude': [-49.24, -49.30, -49.25],
+})
+ILPIS = pd.DataFrame({'institution_name': [1, 1, 2], 'latitude': [-16.81, -16.81, -16.76],
+                      'longitude': [-49.24, -49.24, -49.29]})
+
+
+def test_separar_unidades_descarta_partes_vazias():
+    serie = pd.Series(['UPA Buriti/ UPA Brasicom; UPA Flamboyant', 'UBS Centro/', None])
+    assert separar_unidades(serie).tolist() == [['UPA Buriti', 'UPA Brasicom', 'UPA Flamboyant'], ['UBS Centro'], []]
+
+
+@pytest.mark.parametrize('balltree', [True, False])
+def test_mais_proximas_com_e_sem_balltree(balltree):
+    indice = IndiceEspacial(REFERENCIA['latitude'], REFERENCIA['longitude'])
+    if not balltree:
+        indice.arvore = None
+    dist, pos = indice.mais_proximas([-16.81, -16.76], [-49.24, -49.29], k=2)
+    assert pos[:, 0].tolist() == [0, 1]
+    assert (np.diff(dist, axis=1) >= 0).all()
+    assert sorted(indice.dentro_do_raio([-16.81], [-49.24], 2.0)[0].tolist()) == [0, 2]
+
+
+def test_unidade_mais_proxima():
+    resultado = unidade_mais_proxima(ILPIS, REFERENCIA, tipo='UPA')
+    assert resultado['unidade'].tolist() == ['UPA Buriti', 'UPA Brasicom']
+    assert (resultado['distancia_km'] < 2).all()
+
+
+@pytest.mark.parametrize('referencia', [
+    REFERENCIA.iloc[:0],
+    REFERENCIA.assign(latitude=np.nan),
+])
+def test_referencia_sem_coordenadas_retorna_nan(referencia):
+    resultado = unidade_mais_proxima(ILPIS, referencia)
+    assert resultado['ILPI'].tolist() == [1, 2]
+    assert resultado['unidade'].isna().all() and resultado['distancia_km'].isna().all()
@@ -0,0 +1,58 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi.graficos import plot_idade_com_media, plot_idade_por_ilpi
+
+# Idades fora de 60-110 aparecem nas bases reais (ex: 0 em survey01.csv)
+IDADES = [0, 45, 59.5, 60, 75, 88, 110, 111, 118]
+
+
+@pytest.mark.parametrize('bins', [None, np.arange(60, 111, 1)])
+def test_histograma_de_idade_conta_todos_os_residentes(bins):
+    ax = plot_idade_com_media(IDADES, None, modo='histograma', bins=bins, mostrar=False)
+    assert sum(p.get_height() for p in ax.patches) == len(IDADES)
+
+
+@pytest.mark.parametrize('bins', [None, np.arange(60, 111, 1)])
+def test_histograma_por_ilpi_conta_todos_os_residentes(bins):
+    df = pd.DataFrame({'institution_name': [1, 2] * 4 + [1], 'elder_age': IDADES})
+    ax = plot_idade_por_ilpi(df, None, modo='histograma', bins=bins, mostrar=False)
+    assert ax.collections[0].get_array().sum() == len(IDADES)
+
+
+def test_faixas_informadas_sao_ampliadas_em_vez_de_cortar_as_idades():
+    ax = plot_idade_com_media(IDADES, None, modo='histograma', bins=np.arange(60, 111, 5), mostrar=False)
+    barras = {p.get_x(): p.get_height() for p in ax.patches if p.get_height()}
+    # 0, 45 e 59.5 ficam nas suas faixas em vez de somados à de 60-65; 110, 111 e 118 acima de 110
+    assert barras == {0: 1, 45: 1, 55: 1, 60: 1, 75: 1, 85: 1, 110: 2, 115: 1}
+
+
+def test_acerto_do_cache_retorna_axes_e_desenha_no_ax_recebido(tmp_path):
+    import matplotlib.pyplot as plt
+
+    from analise_ilpi.graficos import plot_barh
+
+    dados = pd.DataFrame({'Feminino': [3, 4], 'Masculino': [2, 1]}, index=['ILPI 1', 'ILPI 2'])
+    caminho = str(tmp_path / 'sexo.png')
+    plot_barh(dados, 'Sexo', 'Quantidade', '', caminho, mostrar=False)
+
+    ax = plot_barh(dados, 'Sexo', 'Quantidade', '', caminho, mostrar=False)
+    assert ax is not None and ax.images
+
+    fig, ax_proprio = plt.subplots()
+    assert plot_barh(dados, 'Sexo', 'Quantidade', '', caminho, mostrar=False, ax=ax_proprio) is ax_proprio
+    assert ax_proprio.containers
+    plt.close(fig)
+
+
+def test_sem_arquivo_nao_anuncia_gravacao(capsys):
+    from analise_ilpi.graficos import plot_bar_flex_auto
+
+    df = pd.DataFrame({'Sexo': ['Feminino', 'Masculino'], 'Quantidade': [3, 2]})
+    plot_bar_flex_auto(df, 'Sexo', 'Quantidade', '', None, mostrar=False)
+    assert 'salvo' not in capsys.readouterr().out
@@ -0,0 +1,50 @@
+import hashlib
+
+import pandas as pd
+
+from analise_ilpi.hashing import atualizar_hash
+
+
+def _hash(valor):
+    h = hashlib.sha256()
+    atualizar_hash(h, valor)
+    return h.hexdigest()
+
+
+def test_funcoes_que_diferem_so_no_nome_chamado():
+    def rotulo_x(ax):
+        ax.set_xlabel('Idade')
+
+    def rotulo_y(ax):
+        ax.set_xlabel('Idade')
+
+    def rotulo_y_editado(ax):
+        ax.set_ylabel('Idade')
+
+    assert _hash(rotulo_x.__code__) == _hash(rotulo_y.__code__)
+    assert _hash(rotulo_x.__code__) != _hash(rotulo_y_editado.__code__)
+    # Lambdas dos dicts de regras: pd.isna x pd.notna, x.real x x.imag
+    assert _hash({'a': lambda x: pd.isna(x)}) != _hash({'a': lambda x: pd.notna(x)})
+    assert _hash({'a': lambda x: x.real > 2}) != _hash({'a': lambda x: x.imag > 2})
+
+
+def test_funcoes_internas_entram_no_hash():
+    def externa_a():
+        def interna(ax):
+            return ax.real
+        return interna
+
+    def externa_b():
+        def interna(ax):
+            return ax.imag
+        return interna
+
+    assert _hash(externa_a.__code__) != _hash(externa_b.__code__)
+
+
+def test_dicts_em_ordem_estavel_e_conteudo_dos_dataframes():
+    assert _hash({'a': 1, 'b': 2}) == _hash({'b': 2, 'a': 1})
+    df = pd.DataFrame({'cpf': ['1', '2'], 'idade': [70, 80]})
+    assert _hash(df) == _hash(df.copy())
+    assert _hash(df) != _hash(df.assign(idade=[70, 81]))
+    assert _hash(df) != _hash(df.astype({'idade': 'float64'}))
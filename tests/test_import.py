@@ -0,0 +1,10 @@
+from benchmarks.importacao import ORCAMENTO_IMPORT_MS, modulos_carregados_no_import, tempo_import_ms
+
+
+def test_import_dentro_do_orcamento():
+    ms = tempo_import_ms()
+    assert ms <= ORCAMENTO_IMPORT_MS, f'import levou {ms:.0f} ms (orçamento: {ORCAMENTO_IMPORT_MS} ms)'
+
+
+def test_import_nao_carrega_dependencias_pesadas():
+    assert modulos_carregados_no_import() == []
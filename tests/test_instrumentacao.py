@@ -0,0 +1,21 @@
+import time
+
+from analise_ilpi.instrumentacao import Perfil, etapa
+
+
+def test_tarefas_incorporadas_saem_do_tempo_proprio():
+    # Registros como os devolvidos por dois processos do pool (tarefas em paralelo)
+    registros = [
+        {'etapa': nome, 'pilha': nome, 'wall_s': 0.05, 'cpu_s': 0.05, 'proprio_s': 0.05,
+         'pico_memoria_bytes': None, 'linhas_entrada': None, 'linhas_saida': None, 'pid': 1, 'erro': None}
+        for nome in ('genero', 'raca')
+    ]
+    with Perfil(memoria=False) as perfil:
+        with etapa('report'):
+            time.sleep(0.08)
+            perfil.incorporar(registros)
+
+    report = next(r for r in perfil.registros if r['etapa'] == 'report')
+    assert report['wall_s'] >= 0.08
+    assert report['proprio_s'] == round(max(report['wall_s'] - 0.1, 0.0), 6)
+    assert {r['pilha'] for r in perfil.registros} == {'report', 'report;genero', 'report;raca'}
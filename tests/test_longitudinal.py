@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analise_ilpi import longitudinal
+from analise_ilpi.longitudinal import COLUNAS_ACOMPANHADAS, HistoricoResidentes
+
+
+def _base(linhas):
+    """Base com uma linha por residente: dicts cpf -> componentes (os ausentes ficam 2)."""
+    registros = []
+    for cpf, componentes in linhas.items():
+        registro = {coluna: 2 for coluna in COLUNAS_ACOMPANHADAS}
+        registro.update(institution_name=1, cpf=cpf, **componentes)
+        registros.append(registro)
+    return pd.DataFrame(registros)
+
+
+def _espionar(monkeypatch):
+    chamadas = []
+    original = longitudinal.nivel_risco_por_residente
+
+    def espiao(df, *args, **kwargs):
+        chamadas.append(len(df))
+        return original(df, *args, **kwargs)
+
+    monkeypatch.setattr(longitudinal, 'nivel_risco_por_residente', espiao)
+    return chamadas
+
+
+def test_incremental_so_reclassifica_residentes_alterados(tmp_path, monkeypatch):
+    chamadas = _espionar(monkeypatch)
+    historico = HistoricoResidentes(str(tmp_path), sal='teste')
+    historico.atualizar(_base({'11111111111': {}, '22222222222': {}}), snapshot='1')
+
+    # Um residente novo com componentes vazios: as colunas passam de int64 a float64
+    historico = HistoricoResidentes(str(tmp_path), sal='teste')
+    eventos = historico.atualizar(
+        _base({'11111111111': {}, '22222222222': {}, '33333333333': {'falls_number': np.nan}}), snapshot='2'
+    )
+
+    assert chamadas == [2, 1]
+    assert eventos['evento'].tolist() == ['novo_residente']
+
+
+def test_valor_ausente_ou_nenhuma_nao_gera_evento(tmp_path):
+    historico = HistoricoResidentes(str(tmp_path), sal='teste')
+    historico.atualizar(_base({
+        '11111111111': {'falls_number': np.nan, 'elder_hospitalized': np.nan},
+        '22222222222': {'falls_number': 1, 'elder_hospitalized': 1},
+    }), snapshot='1')
+
+    eventos = historico.atualizar(_base({
+        '11111111111': {'falls_number': 1, 'elder_hospitalized': 1},
+        '22222222222': {'falls_number': 3, 'elder_hospitalized': 2},
+    }), snapshot='2')
+
+    eventos = eventos[eventos['evento'].isin(['nova_queda', 'nova_hospitalizacao'])]
+    assert sorted(eventos['evento']) == ['nova_hospitalizacao', 'nova_queda']
+    assert eventos['id_residente'].nunique() == 1
+    assert eventos['para'].tolist() == [3, 2]
+
+
+def test_pseudonimizar_cpf_exige_sal(monkeypatch):
+    monkeypatch.delenv(longitudinal.VARIAVEL_SAL, raising=False)
+    cpfs = pd.Series(['111.111.111-11'])
+    with pytest.raises(ValueError):
+        longitudinal.pseudonimizar_cpf(cpfs)
+    with pytest.raises(ValueError):
+        longitudinal.pseudonimizar_cpf(cpfs, sal='')
+
+    monkeypatch.setenv(longitudinal.VARIAVEL_SAL, 'segredo')
+    assert longitudinal.pseudonimizar_cpf(cpfs).equals(longitudinal.pseudonimizar_cpf(cpfs, sal='segredo'))
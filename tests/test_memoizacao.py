@@ -0,0 +1,94 @@
+import pandas as pd
+
+
+def test_extrair_morbidades_nao_altera_a_entrada():
+    from analise_ilpi.perfil import extrair_morbidades
+
+    df = pd.DataFrame({
+        'institution_name': [1, None], 'full_name': ['A', None], 'cpf': ['1', None],
+        'morbidities___1': [1, 1], 'other_morbidities': [None, 'asma'],
+    })
+    original = df.copy()
+    extrair_morbidades(df, {'morbidities___1': 'Hipertensão'})
+    pd.testing.assert_frame_equal(df, original)
+
+
+def _contador(chamadas):
+    from analise_ilpi.memoizacao import memoizar
+
+    @memoizar()
+    def dobrar(df, fator=2):
+        chamadas.append(1)
+        return df * fator
+    return dobrar
+
+
+def test_memoizacao_le_do_disco_e_invalida_por_argumento_e_codigo(tmp_path, monkeypatch):
+    from analise_ilpi.memoizacao import memoizar
+
+    monkeypatch.delenv('ANALISE_ILPI_SEM_CACHE', raising=False)
+    monkeypatch.setenv('ANALISE_ILPI_MEMO', str(tmp_path))
+    df = pd.DataFrame({'x': [1, 2, 3]})
+    chamadas = []
+    dobrar = _contador(chamadas)
+
+    pd.testing.assert_frame_equal(dobrar(df), df * 2)
+    # Mesma entrada, nova "sessão" (outra instância da função): lê do disco
+    pd.testing.assert_frame_equal(_contador(chamadas)(df.copy()), df * 2)
+    assert len(chamadas) == 1
+
+    dobrar(df.assign(x=[1, 2, 4]))
+    dobrar(df, fator=3)
+    assert len(chamadas) == 3
+
+    @memoizar()
+    def dobrar(df, fator=2):  # noqa: F811 (mesmo nome, código diferente)
+        chamadas.append(1)
+        return df * fator + 1
+    pd.testing.assert_frame_equal(dobrar(df), df * 2 + 1)
+    assert len(chamadas) == 4
+
+
+def test_podar_apaga_os_usados_ha_mais_tempo(tmp_path):
+    import os
+
+    from analise_ilpi.memoizacao import _gravar, _ler, podar
+
+    caminhos = [str(tmp_path / 'f' / f'{i}.pkl') for i in range(3)]
+    for i, caminho in enumerate(caminhos):
+        _gravar(caminho, b'x' * 1000)
+        os.utime(caminho, (i, i))
+    _ler(caminhos[0])  # o mais antigo passa a ser o usado mais recentemente
+
+    assert podar(str(tmp_path), 2500) == 1
+    assert [os.path.exists(c) for c in caminhos] == [True, False, True]
+
+
+def test_poda_so_quando_a_pasta_passa_do_maximo(tmp_path, monkeypatch):
+    import os
+
+    from analise_ilpi import memoizacao
+
+    monkeypatch.delenv('ANALISE_ILPI_SEM_CACHE', raising=False)
+    percorridas = []
+    arquivos = memoizacao._arquivos
+    monkeypatch.setattr(memoizacao, '_arquivos', lambda pasta: percorridas.append(pasta) or arquivos(pasta))
+    dobrar = _contador([])
+    try:
+        # Abaixo do máximo: só a contagem inicial, nenhuma a cada gravação
+        memoizacao.ativar_memoizacao(str(tmp_path / 'grande'), tamanho_maximo=10 ** 9)
+        for i in range(5):
+            dobrar(pd.DataFrame({'x': range(i * 10, i * 10 + 60)}))
+        assert len(percorridas) == 1
+
+        memoizacao.ativar_memoizacao(str(tmp_path / 'pequena'), tamanho_maximo=3000)
+        for i in range(5):
+            dobrar(pd.DataFrame({'x': range(i * 10, i * 10 + 60)}))
+        tamanho = sum(
+            os.path.getsize(os.path.join(raiz, nome))
+            for raiz, _, nomes in os.walk(tmp_path / 'pequena') for nome in nomes
+        )
+        assert 0 < tamanho <= 3000
+    finally:
+        memoizacao.desativar_memoizacao()
+        memoizacao.limpar_memoizacao(str(tmp_path))
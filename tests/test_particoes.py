@@ -0,0 +1,25 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from analise_ilpi.particoes import PARTICAO_NULA, gravar_particionado, ler_particionado
+
+
+def test_ida_e_volta_mantem_linhas_sem_ilpi(tmp_path):
+    df = pd.DataFrame({
+        'institution_name': [1, 1, 2, np.nan],
+        'municipio': ['Aparecida', 'Aparecida', None, 'Aparecida'],
+        'cpf': ['1', '2', '3', '4'],
+    })
+    caminhos = gravar_particionado(df, str(tmp_path), 'municipio', '2025-06-24')
+    assert any(f'ilpi={PARTICAO_NULA}' in c for c in caminhos)
+    assert any(f'municipality={PARTICAO_NULA}' in c for c in caminhos)
+    assert all(os.path.exists(c) for c in caminhos)
+
+    lido = ler_particionado(str(tmp_path))
+    assert len(lido) == len(df)
+    assert sorted(lido['cpf'].astype(str)) == ['1', '2', '3', '4']
+    assert lido.loc[lido['cpf'].astype(str) == '3', 'municipality'].isna().all()
+
+    assert len(ler_particionado(str(tmp_path), {'institution_name': 2})) == 1
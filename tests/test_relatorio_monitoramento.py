@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from analise_ilpi.relatorio_monitoramento import (
+    QUESTOES,
+    SECOES,
+    grafo_monitoramento,
+    processa_multiresposta_com_nenhum,
+    saidas_secao,
+)
+from analise_ilpi.relatorio_perfil import secao_grau_dependencia
+from analise_ilpi.sintetico import exportacao_monitoramento
+
+
+def _multiresposta_por_linha(df, colunas_dict, legenda):
+    # Versão por linha (df.apply) que ficava no script da UFG
+    return (
+        df.assign(**{
+            legenda: df.apply(
+                lambda row: ', '.join(
+                    [desc for col, desc in colunas_dict.items() if row[col] == 1]
+                ) if any(row[col] == 1 for col in colunas_dict) else 'Nenhum',
+                axis=1
+            )
+        })[['institution_name', legenda]]
+        .rename(columns={'institution_name': 'ILPI'})
+    )
+
+
+def test_multiresposta_com_nenhum_igual_a_versao_por_linha():
+    df = pd.DataFrame({
+        'institution_name': [1, 2, 3, 4],
+        'v___1': [1, 0, np.nan, 1],
+        'v___2': [1, 0, 0, 0],
+        'v___3': [0, 0, 1, 1],
+    })
+    colunas = {'v___1': 'CLT', 'v___2': 'Contrato', 'v___3': 'Voluntário'}
+    pd.testing.assert_frame_equal(
+        processa_multiresposta_com_nenhum(df, colunas, 'Vínculo'),
+        _multiresposta_por_linha(df, colunas, 'Vínculo'),
+        check_dtype=False,
+    )
+
+
+def test_grafo_monitoramento_gera_as_saidas_declaradas(tmp_path):
+    caminho = tmp_path / 'base_ilpi.csv'
+    exportacao_monitoramento(3).to_csv(caminho, index=False)
+
+    situacao = grafo_monitoramento(str(caminho), str(tmp_path), secoes=['estrutura', 'prontuarios']).executar(workers=1)
+    assert set(situacao.values()) == {'executada'}
+    for secao in ['estrutura', 'prontuarios']:
+        tabelas, graficos = saidas_secao(secao, str(tmp_path / 'tables'), str(tmp_path / 'plots'))
+        assert tabelas and all(os.path.exists(c) for c in tabelas + graficos)
+
+    situacao = grafo_monitoramento(str(caminho), str(tmp_path), secoes=['estrutura', 'prontuarios']).executar(workers=1)
+    assert set(situacao.values()) == {'pulada'}
+
+
+def test_secoes_e_questoes():
+    assert set(QUESTOES) <= set(SECOES)
+    nomes = [q['nome'] for questoes in QUESTOES.values() for q in questoes]
+    assert len(nomes) == len(set(nomes))
+
+
+def test_grau_dependencia_por_ilpi_usa_os_rotulos_de_dependencia(tmp_path):
+    base = pd.DataFrame({'institution_name': [1, 1, 2, 2], 'dependence_degree': [1, 2, 3, np.nan]})
+    resultado = secao_grau_dependencia(base, str(tmp_path), str(tmp_path))
+    assert resultado['grau_dependencia_por_ilpi']['dependence_degree'].tolist() == [
+        'Independente', 'Parcialmente dependente', 'Totalmente dependente']
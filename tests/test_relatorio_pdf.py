@@ -0,0 +1,19 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import pandas as pd
+
+from analise_ilpi.graficos import plot_barh
+from analise_ilpi.relatorio_pdf import RelatorioPDF
+
+
+def test_grafico_em_cache_entra_no_pdf(tmp_path):
+    dados = pd.DataFrame({'Feminino': [3, 4], 'Masculino': [2, 1]}, index=['ILPI 1', 'ILPI 2'])
+    png = str(tmp_path / 'sexo.png')
+
+    for numero in range(2):
+        # Na segunda vez o PNG e a assinatura já existem (acerto do cache de figuras)
+        with RelatorioPDF(str(tmp_path / f'relatorio{numero}.pdf')) as relatorio:
+            relatorio.adicionar_grafico(plot_barh, dados, 'Sexo', 'Quantidade', '', png)
+        assert relatorio.paginas == 1
@@ -0,0 +1,24 @@
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from analise_ilpi.graficos import plot_barh_contagens
+from analise_ilpi.renderizacao import RenderizadorLote
+
+
+def test_lote_serial_preserva_figuras_e_backend_de_quem_chamou(tmp_path):
+    figura = plt.figure()
+    backend = matplotlib.get_backend()
+    abertas = plt.get_fignums()
+
+    lote = RenderizadorLote(workers=1)
+    caminho = str(tmp_path / 'contagens.png')
+    lote.adicionar(plot_barh_contagens, pd.Series({'Sim': 3, 'Não': 2}), 'Título', 'ILPIs', caminho,
+                   usar_cache=False)
+    assert lote.renderizar() == [caminho]
+
+    assert (tmp_path / 'contagens.png').exists()
+    assert plt.fignum_exists(figura.number)
+    assert plt.get_fignums() == abertas
+    assert matplotlib.get_backend() == backend
+    plt.close(figura)
@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+
+from analise_ilpi.resultados import ArmazemResultados
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.mark.parametrize('formato', ['parquet', 'sqlite'])
+def test_duas_execucoes_com_metadados_diferentes(tmp_path, formato):
+    caminho = str(tmp_path / ('resultados' if formato == 'parquet' else 'resultados.sqlite'))
+    armazem = ArmazemResultados(caminho, formato)
+
+    # Como `report` sem filtro e depois `report --ilpi 2`
+    primeira = armazem.gravar({'genero': pd.DataFrame({'sexo': ['F', 'M'], 'n': [3, 2]})}, ilpis=None, workers=1)
+    segunda = armazem.gravar({'genero': pd.DataFrame({'sexo': ['F'], 'n': [1]})}, ilpis=[2], workers='2')
+
+    execucoes = armazem.execucoes()
+    assert execucoes['execucao'].tolist() == sorted([primeira, segunda])
+    assert execucoes.set_index('execucao').loc[primeira, 'ilpis'] == 'null'
+    assert execucoes.set_index('execucao').loc[segunda, 'ilpis'] == '[2]'
+
+    assert armazem.ler('genero')['n'].tolist() == [1]
+    assert armazem.ler('genero', primeira)['n'].tolist() == [3, 2]
+    assert len(armazem.ler('genero', execucao=None)) == 3
@@ -0,0 +1,43 @@
+from concurrent.futures import wait
+
+import pytest
+
+from analise_ilpi import saida_assincrona
+from analise_ilpi.saida_assincrona import ErroGravacao, SaidaAssincrona, gravar_bytes
+
+
+def test_gravacoes_do_mesmo_caminho_na_ordem_dos_pedidos(tmp_path):
+    caminho = str(tmp_path / 'a.txt')
+    with SaidaAssincrona(workers=4):
+        for i in range(50):
+            gravar_bytes(caminho, str(i).encode() * 1000)
+    assert open(caminho, 'rb').read() == b'49' * 1000
+
+
+def test_falhas_sao_levantadas_juntas(tmp_path):
+    caminhos = [str(tmp_path / 'nao_existe' / f'{i}.png') for i in range(2)]
+    with pytest.raises(ErroGravacao) as erro:
+        with SaidaAssincrona(workers=2):
+            for caminho in caminhos:
+                gravar_bytes(caminho, b'x')
+            gravar_bytes(str(tmp_path / 'ok.png'), b'x')
+    assert sorted(erro.value.erros) == caminhos
+    assert (tmp_path / 'ok.png').exists()
+
+
+def test_falha_anterior_do_mesmo_caminho_nao_se_perde(tmp_path, monkeypatch):
+    original = saida_assincrona._gravar_atomico
+
+    def gravar(caminho, dados):
+        if dados == b'falha':
+            raise OSError('disco cheio')
+        original(caminho, dados)
+
+    monkeypatch.setattr(saida_assincrona, '_gravar_atomico', gravar)
+    caminho = str(tmp_path / 'a.txt')
+    with pytest.raises(ErroGravacao) as erro:
+        with SaidaAssincrona(workers=2) as saida:
+            wait([saida.gravar(caminho, b'falha')])
+            saida.gravar(caminho, b'ok')
+    assert list(erro.value.erros) == [caminho]
+    assert open(caminho, 'rb').read() == b'ok'
@@ -0,0 +1,38 @@
+import os
+
+import pandas as pd
+import pytest
+
+from analise_ilpi.sintetico import exportacao_monitoramento, exportacao_perfil, gravar_monitoramento, gravar_perfil
+
+DADOS = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+def _cabecalho(caminho, sep):
+    # As exportações do REDCap começam com BOM
+    return list(pd.read_csv(caminho, sep=sep, nrows=0, encoding='utf-8-sig').columns)
+
+
+@pytest.mark.parametrize('exportacao, arquivo, sep', [
+    (exportacao_perfil, os.path.join('SMSAp', 'PerfilEpidemiolgicos_DATA_2025-06-24_1507.csv'), ';'),
+    (exportacao_monitoramento, os.path.join('UFG', 'MonitoramentoEDiagns_DATA_2024-11-27_1052.csv'), ','),
+])
+def test_colunas_iguais_as_da_exportacao_real(exportacao, arquivo, sep):
+    caminho = os.path.join(DADOS, arquivo)
+    if not os.path.exists(caminho):
+        pytest.skip(f'{arquivo} não está disponível')
+    assert list(exportacao(3).columns) == _cabecalho(caminho, sep)
+
+
+@pytest.mark.parametrize('gravar, exportacao, sep', [
+    (gravar_perfil, exportacao_perfil, ';'),
+    (gravar_monitoramento, exportacao_monitoramento, ','),
+])
+def test_csv_gravado_igual_a_exportacao_em_memoria(tmp_path, gravar, exportacao, sep):
+    caminho = str(tmp_path / 'exportacao.csv')
+    gravar(caminho, 40)
+    esperado = exportacao(40)
+    datas = [c for c in esperado.columns if pd.api.types.is_datetime64_any_dtype(esperado[c])]
+    lido = pd.read_csv(caminho, sep=sep, parse_dates=datas, dtype={'cpf': str})
+    lido = lido.astype({c: esperado[c].dtype for c in datas})
+    pd.testing.assert_frame_equal(lido, esperado, check_dtype=False)
@@ -0,0 +1,36 @@
+import os
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import pandas as pd
+import pytest
+
+from analise_ilpi.tabelas import salvar_tabela_como_imagem
+
+
+@pytest.fixture
+def tabela():
+    return pd.DataFrame({'ILPI': [f'ILPI {i}' for i in range(5)], 'Residentes': range(5)})
+
+
+def test_acerto_do_cache_retorna_todas_as_paginas(tmp_path, tabela):
+    caminho = str(tmp_path / 'tabela.png')
+    primeira = salvar_tabela_como_imagem(tabela, caminho, backend='pil', linhas_por_pagina=2)
+    assert len(primeira) == 3
+    assert salvar_tabela_como_imagem(tabela, caminho, backend='pil', linhas_por_pagina=2) == primeira
+
+    # Uma página apagada faz a tabela ser refeita
+    os.remove(primeira[-1])
+    assert salvar_tabela_como_imagem(tabela, caminho, backend='pil', linhas_por_pagina=2) == primeira
+    assert os.path.exists(primeira[-1])
+
+
+def test_paginas_de_uma_versao_mais_longa_sao_apagadas(tmp_path, tabela):
+    caminho = str(tmp_path / 'tabela.png')
+    antigas = salvar_tabela_como_imagem(tabela, caminho, backend='pil', linhas_por_pagina=2)
+    novas = salvar_tabela_como_imagem(tabela.head(3), caminho, backend='pil', linhas_por_pagina=2)
+    assert len(novas) == 2
+    assert sorted(os.listdir(tmp_path)) == sorted(['.cache_figuras'] + [os.path.basename(c) for c in novas])
+    assert not os.path.exists(antigas[-1])
@@ -0,0 +1,54 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from analise_ilpi.vinculacao import atribuir_id_residente, preparar_registros, vincular_registros
+
+SURVEY = pd.DataFrame({
+    'record_id': [10, 11, 12, 13],
+    'elder_name': ['José da Silva', 'Maria Aparecida Souza', 'Ana Lima', 'Pedro Rocha'],
+    'institution_name': [1, 1, 2, 2],
+    'date_of_birth': ['1940-01-02', '1938-05-06', '1945-07-08', '1950-01-01'],
+})
+PERFIL = pd.DataFrame({
+    'cpf': ['a', 'b', 'c', 'd'],
+    'full_name': ['JOSE DA SILVA', 'Souza, Maria Aparecida', 'Ana Lima', 'Paulo Souza'],
+    'institution_name': [1.0, 1.0, 3.0, 2.0],
+    'date_of_birth': ['1940-01-02', '1938-05-06', '1945-07-08', '1950-01-01'],
+})
+
+
+def _vincular(workers=None):
+    survey = preparar_registros(SURVEY, 'elder_name', col_id='record_id')
+    perfil = preparar_registros(PERFIL, 'full_name', col_id='cpf')
+    return vincular_registros(survey, perfil, workers=workers).sort_values('id_a').reset_index(drop=True)
+
+
+def _verificar(vinculos):
+    # Acentos, caixa e ordem das palavras não importam; ILPI (Ana Lima) e nome (Pedro x Paulo) diferentes sim
+    assert vinculos[['id_a', 'id_b']].values.tolist() == [[10, 'a'], [11, 'b']]
+    assert (vinculos['similaridade'] >= 0.85).all()
+
+
+def test_vinculacao_com_rapidfuzz():
+    pytest.importorskip('rapidfuzz')
+    _verificar(_vincular())
+
+
+def test_vinculacao_sem_rapidfuzz(monkeypatch):
+    # None em sys.modules faz o import levantar ImportError (caminho do difflib)
+    monkeypatch.setitem(sys.modules, 'rapidfuzz', None)
+    _verificar(_vincular())
+
+
+def test_vinculacao_em_processos_igual_a_serial():
+    pd.testing.assert_frame_equal(_vincular(workers=2), _vincular())
+
+
+def test_atribuir_id_residente_une_as_bases():
+    ids = atribuir_id_residente({
+        ('survey01', 'perfil'): pd.DataFrame({'id_a': [10], 'id_b': ['a']}),
+        ('perfil', 'ufg'): pd.DataFrame({'id_a': ['a'], 'id_b': [7]}),
+    })
+    assert ids['id_residente'].nunique() == 1 and len(ids) == 3